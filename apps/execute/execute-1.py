@@ -36,6 +36,7 @@
 ##########################################################################
 
 import sys
+import json
 import pathlib
 import traceback
 
@@ -44,6 +45,7 @@ import imath
 import IECore
 
 import Gaffer
+import GafferDispatch
 
 class execute( Gaffer.Application ) :
 
@@ -62,6 +64,11 @@ class execute( Gaffer.Application ) :
 			```
 			gaffer execute -script comp.gfr -nodes ImageWriter -frames 1-10
 			```
+
+			When the `-worker` flag is given, the script is loaded once and
+			then batches are read from standard input, one per line, until
+			the input is closed. This is used by the LocalDispatcher to keep
+			worker processes warm between batches.
 			"""
 		)
 
@@ -111,6 +118,17 @@ class execute( Gaffer.Application ) :
 					},
 				),
 
+				IECore.BoolParameter(
+					name = "worker",
+					description = "Runs as a persistent worker process, reading batches "
+						"to execute from standard input. Each line of input is a JSON "
+						"object with \"nodes\", \"frames\" and \"context\" entries, "
+						"equivalent to the command line parameters of the same name. "
+						"After each batch, a line starting with \"" + GafferDispatch.LocalDispatcher.workerResultPrefix + "\" "
+						"and followed by the result code is written to standard output.",
+					defaultValue = False,
+				),
+
 			]
 
 		)
@@ -133,9 +151,35 @@ class execute( Gaffer.Application ) :
 
 		self.root()["scripts"].addChild( scriptNode )
 
+		if not args["worker"].value :
+			return self.__execute(
+				scriptNode, args["nodes"], self.parameters()["frames"].getFrameListValue().asList(), args["context"]
+			)
+
+		for line in sys.stdin :
+
+			if not line.strip() :
+				continue
+
+			try :
+				batch = json.loads( line )
+				frames = IECore.FrameList.parse( batch.get( "frames", "" ) ).asList()
+			except Exception as exception :
+				IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Invalid batch \"{}\" : {}".format( line.strip(), exception ) )
+				result = 1
+			else :
+				result = self.__execute( scriptNode, batch.get( "nodes", [] ), frames, batch.get( "context", [] ) )
+
+			sys.stdout.write( "{}{}\n".format( GafferDispatch.LocalDispatcher.workerResultPrefix, result ) )
+			sys.stdout.flush()
+
+		return 0
+
+	def __execute( self, scriptNode, nodeNames, frames, contextArgs ) :
+
 		nodes = []
-		if len( args["nodes"] ) :
-			for nodeName in args["nodes"] :
+		if len( nodeNames ) :
+			for nodeName in nodeNames :
 				node = scriptNode.descendant( nodeName )
 				if node is None :
 					IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Node \"%s\" does not exist" % nodeName )
@@ -152,16 +196,15 @@ class execute( Gaffer.Application ) :
 				IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Script has no executable nodes" )
 				return 1
 
-		if len(args["context"]) % 2 :
+		if len( contextArgs ) % 2 :
 			IECore.msg( IECore.Msg.Level.Error, "gaffer execute", "Context parameter must have matching entry/value pairs" )
 			return 1
 
 		context = Gaffer.Context( scriptNode.context() )
-		for i in range( 0, len(args["context"]), 2 ) :
-			entry = args["context"][i].lstrip( "-" )
-			context[entry] = eval( args["context"][i+1] )
+		for i in range( 0, len( contextArgs ), 2 ) :
+			entry = contextArgs[i].lstrip( "-" )
+			context[entry] = eval( contextArgs[i+1] )
 
-		frames = self.parameters()["frames"].getFrameListValue().asList()
 		if not frames :
 			frames = [ scriptNode.context().getFrame() ]
 
@@ -171,7 +214,9 @@ class execute( Gaffer.Application ) :
 
 		with context :
 			for node in nodes :
-				node.errorSignal().connect( Gaffer.WeakMethod( self.__error ) )
+				# Scoped, so that we don't accumulate duplicate connections
+				# when executing many batches in worker mode.
+				errorConnection = node.errorSignal().connect( Gaffer.WeakMethod( self.__error ), scoped = True )
 				try :
 					node["task"].executeSequence( frames )
 				except Exception as exception :
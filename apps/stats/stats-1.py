@@ -197,6 +197,27 @@ class stats( Gaffer.Application ) :
 					defaultValue = False,
 				),
 
+				IECore.FileNameParameter(
+					name = "performanceTimeline",
+					description = "Filename used to save a timeline of every hash and "
+						"compute process, in the Chrome Trace Event format. This can be "
+						"viewed using Perfetto or chrome://tracing to diagnose threading "
+						"problems. Implies -performanceMonitor.",
+					defaultValue = "",
+					allowEmptyString = True,
+					extensions = "json",
+				),
+
+				IECore.BoolParameter(
+					name = "criticalPath",
+					description = "Outputs the chain of hash and compute processes which "
+						"limited the overall time taken, along with the inclusive and exclusive "
+						"time spent in each node. Unlike the performance monitor's summed "
+						"durations, this accounts for work performed in parallel. Implies "
+						"-performanceMonitor.",
+					defaultValue = False,
+				),
+
 				IECore.IntParameter(
 					name = "maxLinesPerMetric",
 					description = "The maximum number of plugs to list for each metric "
@@ -267,6 +288,14 @@ class stats( Gaffer.Application ) :
 					defaultValue = 0,
 				),
 
+				IECore.BoolParameter(
+					name = "cacheStatistics",
+					description = "Collects statistics about the usage of the compute and hash "
+						"caches, broken down by node type and plug. The number of plugs listed "
+						"is limited by the maxLinesPerMetric parameter.",
+					defaultValue = False,
+				),
+
 			]
 
 		)
@@ -283,6 +312,10 @@ class stats( Gaffer.Application ) :
 			Gaffer.ValuePlug.setCacheMemoryLimit( 1024 * 1024 * args["cacheMemoryLimit"].value )
 		if args["hashCacheSizeLimit"].value :
 			Gaffer.ValuePlug.setHashCacheSizeLimit( args["hashCacheSizeLimit"].value )
+		if args["cacheStatistics"].value :
+			Gaffer.ValuePlug.resetCacheStatistics()
+			Gaffer.ValuePlug.resetPlugCacheStatistics()
+			Gaffer.ValuePlug.setCacheIntrospectionEnabled( True )
 
 		self.__timers = collections.OrderedDict()
 		self.__memory = collections.OrderedDict()
@@ -308,8 +341,9 @@ class stats( Gaffer.Application ) :
 					postLoadScriptExecutionContext, postLoadScriptExecutionContext
 				)
 
-		if args["performanceMonitor"].value :
-			self.__performanceMonitor = Gaffer.PerformanceMonitor()
+		recordTimeline = args["criticalPath"].value or bool( args["performanceTimeline"].value )
+		if args["performanceMonitor"].value or recordTimeline :
+			self.__performanceMonitor = Gaffer.PerformanceMonitor( recordTimeline = recordTimeline )
 		else :
 			self.__performanceMonitor = None
 
@@ -376,6 +410,8 @@ class stats( Gaffer.Application ) :
 
 		self.__output.write( "\n" )
 
+		self.__writeCache( args )
+
 		self.__writePerformance( script, args )
 
 		self.__output.write( "\n" )
@@ -386,12 +422,17 @@ class stats( Gaffer.Application ) :
 
 		self.__output.close()
 
+		if args["performanceTimeline"].value :
+			Gaffer.MonitorAlgo.saveTimeline( self.__performanceMonitor, args["performanceTimeline"].value )
+
 		if args["annotatedScript"].value :
 
 			if self.__performanceMonitor is not None :
 				Gaffer.MonitorAlgo.annotate( script, self.__performanceMonitor, Gaffer.MonitorAlgo.PerformanceMetric.TotalDuration )
 				Gaffer.MonitorAlgo.annotate( script, self.__performanceMonitor, Gaffer.MonitorAlgo.PerformanceMetric.HashCount )
 				Gaffer.MonitorAlgo.annotate( script, self.__performanceMonitor, Gaffer.MonitorAlgo.PerformanceMetric.ComputeCount )
+				if self.__performanceMonitor.getRecordTimeline() :
+					Gaffer.MonitorAlgo.annotateCriticalPath( script, self.__performanceMonitor )
 			if self.__contextMonitor is not None :
 				Gaffer.MonitorAlgo.annotate( script, self.__contextMonitor )
 
@@ -681,6 +722,51 @@ class stats( Gaffer.Application ) :
 		self.__output.write( "Memory :\n\n" )
 		self.__writeItems( items )
 
+	def __writeCache( self, args ) :
+
+		if not args["cacheStatistics"].value :
+			return
+
+		Gaffer.ValuePlug.setCacheIntrospectionEnabled( False )
+
+		statistics = Gaffer.ValuePlug.cacheStatistics()
+
+		self.__output.write( "Cache :\n\n" )
+		self.__writeItems( [
+			( "Hits", statistics.hits ),
+			( "Misses", statistics.misses ),
+			( "Evictions", statistics.evictions ),
+		] )
+
+		plugStatistics = Gaffer.ValuePlug.plugCacheStatistics()
+		plugStatistics.sort(
+			key = lambda s : ( s.computeCache.misses, s.hashCache.misses ),
+			reverse = True
+		)
+
+		rows = [ ( "Node type", "Plug", "Hits", "Misses", "Evictions", "Usage", "Hash hits", "Hash misses" ) ]
+		for s in plugStatistics[:args["maxLinesPerMetric"].value] :
+			rows.append( (
+				s.nodeType, s.plugName,
+				s.computeCache.hits, s.computeCache.misses, s.computeCache.evictions, _Memory( s.computeCache.memoryUsage ),
+				s.hashCache.hits, s.hashCache.misses,
+			) )
+
+		if len( rows ) == 1 :
+			self.__output.write( "\n" )
+			return
+
+		rows = [ [ str( x ) for x in row ] for row in rows ]
+		widths = [ max( len( row[i] ) for row in rows ) + 4 for i in range( 0, len( rows[0] ) ) ]
+
+		self.__output.write( "\n" )
+		for row in rows :
+			self.__output.write(
+				"  " + "".join( "{value:<{width}}".format( value = value, width = width ) for value, width in zip( row, widths ) ).rstrip() + "\n"
+			)
+
+		self.__output.write( "\n" )
+
 	def __writeStatisticsItems( self, script, stats, key, n ) :
 
 		stats.sort( key = key, reverse = True )
@@ -700,6 +786,14 @@ class stats( Gaffer.Application ) :
 					)
 				)
 
+			if args["criticalPath"].value :
+				self.__output.write(
+					"\n" + Gaffer.MonitorAlgo.formatCriticalPath(
+						self.__performanceMonitor,
+						maxLines = args["maxLinesPerMetric"].value
+					)
+				)
+
 	def __writeContext( self, script, args ) :
 
 			if self.__contextMonitor is None :
@@ -37,6 +37,10 @@
 #pragma once
 
 #include "Gaffer/Export.h"
+#include "Gaffer/PerformanceMonitor.h"
+
+#include "boost/chrono.hpp"
+#include "boost/unordered_map.hpp"
 
 #include <string>
 
@@ -44,8 +48,7 @@ namespace Gaffer
 {
 
 class ContextMonitor;
-class Node;
-class PerformanceMonitor;
+IE_CORE_FORWARDDECLARE( Node )
 
 namespace MonitorAlgo
 {
@@ -69,9 +72,61 @@ enum PerformanceMetric
 GAFFER_API std::string formatStatistics( const PerformanceMonitor &monitor, size_t maxLinesPerMetric = 50 );
 GAFFER_API std::string formatStatistics( const PerformanceMonitor &monitor, PerformanceMetric metric, size_t maxLines = 50 );
 
+/// Returns the timeline recorded by `monitor` in the Chrome Trace Event
+/// JSON format, suitable for viewing in Perfetto or `chrome://tracing`.
+/// Each thread is shown as a separate track, and flow arrows connect
+/// processes to parents running on other threads. The monitor must have
+/// been constructed with `recordTimeline = true`.
+GAFFER_API std::string formatTimeline( const PerformanceMonitor &monitor );
+/// As above, but writing the result to a file.
+GAFFER_API void saveTimeline( const PerformanceMonitor &monitor, const std::string &fileName );
+
+/// Critical path analysis
+/// ======================
+///
+/// Summed durations overcount work performed in parallel, so don't
+/// reveal which processes actually limited the wall-clock time. The
+/// following functions analyse the timeline recorded by a monitor
+/// constructed with `recordTimeline = true`, using the parent/child
+/// relationships between processes.
+
+struct GAFFER_API NodeDurations
+{
+	/// Time spent in processes for the node's plugs, including
+	/// time spent waiting for upstream processes. Processes nested
+	/// inside another process for the same node are not counted
+	/// twice.
+	boost::chrono::nanoseconds inclusiveDuration = boost::chrono::nanoseconds( 0 );
+	/// Time spent in processes for the node's plugs, excluding
+	/// any time during which child processes were running.
+	boost::chrono::nanoseconds exclusiveDuration = boost::chrono::nanoseconds( 0 );
+	/// True if any of the node's processes are on the critical path.
+	bool criticalPath = false;
+};
+
+struct GAFFER_API CriticalPath
+{
+	/// The events on the critical path, ordered by start time. The path
+	/// is traced backwards from the end of the longest top-level process,
+	/// at each level following the child process that finished last, then
+	/// the one that finished last before that child started, and so on.
+	PerformanceMonitor::Timeline events;
+	using NodeDurationsMap = boost::unordered_map<ConstNodePtr, NodeDurations>;
+	/// Durations for every node with a recorded process.
+	NodeDurationsMap nodeDurations;
+};
+
+GAFFER_API CriticalPath criticalPath( const PerformanceMonitor &monitor );
+GAFFER_API std::string formatCriticalPath( const PerformanceMonitor &monitor, size_t maxLines = 50 );
+
+/// Annotates nodes with all metrics. If the monitor recorded a
+/// timeline, nodes on the critical path are also annotated.
 GAFFER_API void annotate( Node &root, const PerformanceMonitor &monitor, bool persistent = true );
 GAFFER_API void annotate( Node &root, const PerformanceMonitor &monitor, PerformanceMetric metric, bool persistent = true );
 GAFFER_API void annotate( Node &root, const ContextMonitor &monitor, bool persistent = true );
+/// Annotates the nodes on the critical path, along with the boxes
+/// that contain them.
+GAFFER_API void annotateCriticalPath( Node &root, const PerformanceMonitor &monitor, bool persistent = true );
 
 GAFFER_API void removePerformanceAnnotations( Node &root );
 GAFFER_API void removeContextAnnotations( Node &root );
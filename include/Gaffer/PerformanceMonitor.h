@@ -38,14 +38,19 @@
 
 #include "Gaffer/Monitor.h"
 
+#include "IECore/MurmurHash.h"
 #include "IECore/RefCounted.h"
 
 #include "boost/chrono.hpp"
 #include "boost/unordered_map.hpp"
 
+#include "tbb/concurrent_hash_map.h"
 #include "tbb/enumerable_thread_specific.h"
 
+#include <atomic>
+#include <limits>
 #include <stack>
+#include <vector>
 
 namespace Gaffer
 {
@@ -59,7 +64,13 @@ class GAFFER_API PerformanceMonitor : public Monitor
 
 	public :
 
-		PerformanceMonitor();
+		/// If `recordTimeline` is true, then in addition to the per-plug
+		/// statistics, the monitor records an individual `Event` for every
+		/// hash and compute process. This allows the interaction of processes
+		/// over time to be examined, but has a higher overhead. Recording
+		/// stops once `maxTimelineEvents` events have been recorded, to bound
+		/// the memory used by long-running monitors.
+		PerformanceMonitor( bool recordTimeline = false, size_t maxTimelineEvents = std::numeric_limits<size_t>::max() );
 		~PerformanceMonitor() override;
 
 		IE_CORE_DECLAREMEMBERPTR( PerformanceMonitor )
@@ -92,6 +103,36 @@ class GAFFER_API PerformanceMonitor : public Monitor
 		const Statistics &plugStatistics( const Plug *plug ) const;
 		const Statistics &combinedStatistics() const;
 
+		/// Timeline
+		/// ========
+
+		/// Records a single hash or compute process.
+		struct GAFFER_API Event
+		{
+			/// Either "computeNode:hash" or "computeNode:compute".
+			IECore::InternedString type;
+			ConstPlugPtr plug;
+			IECore::MurmurHash contextHash;
+			/// As returned by `ThreadMonitor::thisThreadId()`.
+			int threadId;
+			/// Unique identifier for the event, starting at 1.
+			size_t id;
+			/// The `id` of the event for the closest ancestor process
+			/// that was also recorded, or 0 if there is none. The parent
+			/// may have been run on a different thread.
+			size_t parentId;
+			/// Measured relative to the construction of the monitor.
+			boost::chrono::nanoseconds startTime;
+			boost::chrono::nanoseconds endTime;
+		};
+
+		using Timeline = std::vector<Event>;
+
+		bool getRecordTimeline() const;
+		size_t getMaxTimelineEvents() const;
+		/// Returns all events recorded so far, sorted by `startTime`. Must
+		/// only be called when the monitor is not active.
+		const Timeline &timeline() const;
 
 	protected :
 
@@ -113,14 +154,29 @@ class GAFFER_API PerformanceMonitor : public Monitor
 			DurationStack durationStack;
 			// The last time measurement we made.
 			boost::chrono::high_resolution_clock::time_point then;
+			// Timeline events captured by this thread, and a stack
+			// of indices for the events which are still running.
+			Timeline events;
+			std::stack<size_t> eventStack;
 		};
 
 		tbb::enumerable_thread_specific<ThreadData, tbb::cache_aligned_allocator<ThreadData>, tbb::ets_key_per_instance> m_threadData;
 
+		// State used only when recording the timeline. We map from
+		// the currently running processes to their event ids, so that
+		// child processes on other threads can find their parent.
+		const bool m_recordTimeline;
+		const size_t m_maxTimelineEvents;
+		const boost::chrono::high_resolution_clock::time_point m_startTime;
+		std::atomic_size_t m_nextEventId;
+		using RunningEvents = tbb::concurrent_hash_map<const Process *, size_t>;
+		RunningEvents m_runningEvents;
+
 		// Then when we want to query it, we collate it into m_statistics.
 		void collate() const;
 		mutable StatisticsMap m_statistics;
 		mutable Statistics m_combinedStatistics;
+		mutable Timeline m_timeline;
 
 };
 
@@ -40,6 +40,8 @@
 #include "boost/noncopyable.hpp"
 #include "boost/variant.hpp"
 
+#include <atomic>
+#include <chrono>
 #include <optional>
 
 namespace IECorePreview
@@ -101,6 +103,33 @@ class LRUCache : private boost::noncopyable
 		using Cost = size_t;
 		using KeyType = Key;
 
+		/// Determines how items are chosen for removal when the
+		/// cache exceeds its maximum cost.
+		enum class EvictionPolicy
+		{
+			/// Items are removed in least-recently-used order. Note that
+			/// the Parallel and TaskParallel policies only approximate
+			/// this order, using a second-chance algorithm.
+			LeastRecentlyUsed,
+			/// A GreedyDual-Size variant, which weighs the time taken to
+			/// compute an item against its cost. Items which are expensive
+			/// to recompute relative to their cost survive additional
+			/// eviction passes, and are therefore retained for longer than
+			/// cheap items accessed equally recently.
+			CostAware
+		};
+
+		/// Statistics describing the usage of the cache.
+		struct Statistics
+		{
+			/// Number of lookups which found a cached item.
+			size_t hits = 0;
+			/// Number of lookups which did not find a cached item.
+			size_t misses = 0;
+			/// Number of items removed to satisfy the maximum cost.
+			size_t evictions = 0;
+		};
+
 		/// The GetterFunction is responsible for computing the value and cost for a cache entry
 		/// when given the key. It should throw a descriptive exception if it can't get the data for
 		/// any reason. Cancellation support requires that `IECore::Canceller::check( canceller )`
@@ -122,22 +151,26 @@ class LRUCache : private boost::noncopyable
 		Value get( const GetterKey &key, const IECore::Canceller *canceller = nullptr );
 
 		/// Retrieves an item from the cache if it has been computed or set
-		/// previously. Throws if a previous call to `get()` failed.
-		std::optional<Value> getIfCached( const Key &key );
+		/// previously. Throws if a previous call to `get()` failed. Pass
+		/// `recordStatistics = false` to omit the lookup from `statistics()`,
+		/// for instance when repeating a lookup that has already been recorded.
+		std::optional<Value> getIfCached( const Key &key, bool recordStatistics = true );
 
 		/// Adds an item to the cache directly, bypassing the GetterFunction.
 		/// Returns true for success and false on failure - failure can occur
 		/// if the cost exceeds the maximum cost for the cache. Note that even
 		/// when true is returned, the item may be removed from the cache by a
-		/// subsequent (or concurrent) operation.
-		bool set( const Key &key, const Value &value, Cost cost );
+		/// subsequent (or concurrent) operation. The `computeTime` is the time
+		/// taken to compute the value, and is used by the `CostAware` eviction
+		/// policy.
+		bool set( const Key &key, const Value &value, Cost cost, std::chrono::nanoseconds computeTime = std::chrono::nanoseconds( 0 ) );
 		/// As above, but only if the item is not cached already. This avoids
 		/// calling a potentially expensive cost function in the case that the
 		/// item is cached already.
 		/// \todo Ideally we wouldn't need the cost calculation to be duplicated
 		/// between CostFunction and GetterFunction.
 		template<typename CostFunction>
-		bool setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction );
+		bool setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction, std::chrono::nanoseconds computeTime = std::chrono::nanoseconds( 0 ) );
 
 		/// Returns true if the object is in the cache. Note that the
 		/// return value may be invalidated immediately by operations performed
@@ -163,6 +196,18 @@ class LRUCache : private boost::noncopyable
 		/// Returns the current cost of all cached items.
 		Cost currentCost() const;
 
+		/// Sets the policy used to choose items for eviction. The
+		/// statistics are reset, so that they reflect only the new
+		/// policy. Items already in the cache retain the priority they
+		/// were given by the previous policy.
+		void setEvictionPolicy( EvictionPolicy evictionPolicy );
+		EvictionPolicy getEvictionPolicy() const;
+
+		/// Returns statistics accumulated since construction or
+		/// the last call to `resetStatistics()`.
+		Statistics statistics() const;
+		void resetStatistics();
+
 	private :
 
 		// Data
@@ -198,6 +243,11 @@ class LRUCache : private boost::noncopyable
 
 			State state;
 			Cost cost; // the cost for this item
+			// Number of additional eviction passes this item is allowed
+			// to survive, as determined by the `CostAware` policy, and
+			// the number remaining since it was last used.
+			uint8_t retention;
+			uint8_t credits;
 
 			Status status() const;
 
@@ -210,12 +260,19 @@ class LRUCache : private boost::noncopyable
 		Cost m_maxCost;
 		bool m_cacheErrors;
 
+		std::atomic<EvictionPolicy> m_evictionPolicy;
+		std::atomic_size_t m_evictions;
+
 		// Methods
 		// =======
 
 		// Updates the cached value and updates the current
 		// total cost.
-		bool setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost );
+		bool setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost, std::chrono::nanoseconds computeTime );
+
+		// Returns the retention for an item, according to the
+		// current eviction policy.
+		uint8_t retention( Cost cost, std::chrono::nanoseconds computeTime ) const;
 
 		// Removes any cached value and updates the current total
 		// cost.
@@ -49,7 +49,9 @@
 #include "tbb/spin_mutex.h"
 #include "tbb/spin_rw_mutex.h"
 
+#include <algorithm>
 #include <cassert>
+#include <cmath>
 #include <iostream>
 #include <tuple>
 #include <vector>
@@ -130,7 +132,7 @@ class Serial
 		using List = typename MapAndList::template nth_index<1>::type;
 
 		Serial()
-			:	currentCost( 0 )
+			:	currentCost( 0 ), m_hits( 0 ), m_misses( 0 )
 		{
 		}
 
@@ -238,17 +240,20 @@ class Serial
 		}
 
 		// Marks the CacheEntry referred to by the handle as recently
-		// used.
+		// used, restoring any credits it has used up in `pop()`.
 		void push( Handle &handle )
 		{
 			List &list = m_mapAndList.template get<1>();
 			list.relocate( list.end(), list.iterator_to( *(handle.m_it) ) );
+			handle.m_it->cacheEntry.credits = handle.m_it->cacheEntry.retention;
 		}
 
 		// Pops a copy of the least recently used CacheEntry from the policy,
-		// removing it from the internal storage. Returns true for success
-		// and false for failure.
-		bool pop( Key &key, CacheEntry &cacheEntry )
+		// removing it from the internal storage. Unless `ignoreCredits` is
+		// true, entries with remaining `credits` are given another chance
+		// instead, at the cost of one credit. Returns true for success and
+		// false for failure.
+		bool pop( Key &key, CacheEntry &cacheEntry, bool ignoreCredits = false )
 		{
 			List &list = m_mapAndList.template get<1>();
 
@@ -259,9 +264,23 @@ class Serial
 			// to `get( someOtherKey )`, and this inner call has
 			// then entered `limitCost()`.
 			typename List::iterator it = list.begin();
-			while( it != list.end() && it->handleCount )
+			while( it != list.end() && ( it->handleCount || ( it->cacheEntry.credits && !ignoreCredits ) ) )
 			{
-				++it;
+				if( it->handleCount )
+				{
+					++it;
+				}
+				else
+				{
+					// Move to the back of the list, so the item is
+					// considered again after everything else. This
+					// terminates because credits are only restored
+					// by `push()`.
+					it->cacheEntry.credits--;
+					typename List::iterator next = std::next( it );
+					list.relocate( list.end(), it );
+					it = next;
+				}
 			}
 
 			if( it == list.end() )
@@ -279,11 +298,38 @@ class Serial
 			return true;
 		}
 
+		// Records the result of a lookup for `key`, for
+		// use in `LRUCache::statistics()`.
+		void recordLookup( const Key &key, bool hit )
+		{
+			if( hit )
+			{
+				m_hits++;
+			}
+			else
+			{
+				m_misses++;
+			}
+		}
+
+		void lookupStatistics( size_t &hits, size_t &misses ) const
+		{
+			hits = m_hits;
+			misses = m_misses;
+		}
+
+		void resetLookupStatistics()
+		{
+			m_hits = m_misses = 0;
+		}
+
 		typename LRUCache::Cost currentCost;
 
 	private :
 
 		MapAndList m_mapAndList;
+		size_t m_hits;
+		size_t m_misses;
 
 };
 
@@ -345,12 +391,16 @@ class Parallel
 
 		struct Bin
 		{
-			Bin() {}
-			Bin( const Bin &other ) : map( other.map ) {}
+			Bin() : hits( 0 ), misses( 0 ) {}
+			Bin( const Bin &other ) : map( other.map ), hits( 0 ), misses( 0 ) {}
 			Bin &operator = ( const Bin &other ) { map = other.map; return *this; }
 			Map map;
 			using Mutex = tbb::spin_rw_mutex;
 			Mutex mutex;
+			// Lookup statistics. These are stored per-bin
+			// rather than globally to avoid contention.
+			std::atomic_size_t hits;
+			std::atomic_size_t misses;
 		};
 
 		using Bins = std::vector<Bin>;
@@ -510,7 +560,7 @@ class Parallel
 			handle.m_item->recentlyUsed.store( true, std::memory_order_release );
 		}
 
-		bool pop( Key &key, CacheEntry &cacheEntry )
+		bool pop( Key &key, CacheEntry &cacheEntry, bool ignoreCredits = false )
 		{
 			// Popping works by iterating the map until an item
 			// that has not been recently used is found. We store
@@ -563,7 +613,26 @@ class Parallel
 
 				if( itemLock.try_acquire( m_popIterator->mutex ) )
 				{
-					if( !m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					if( m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					{
+						// Item has been used recently. Flag it so we
+						// can consider it for popping next time round,
+						// unless another thread resets the flag. Restore
+						// the credits it may have used up on previous
+						// passes.
+						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
+						m_popIterator->cacheEntry.credits = m_popIterator->cacheEntry.retention;
+						itemLock.release();
+					}
+					else if( m_popIterator->cacheEntry.credits && !ignoreCredits )
+					{
+						// Item hasn't been used recently, but is valuable
+						// enough to survive another pass. We hold a write
+						// lock so are free to modify the entry.
+						m_popIterator->cacheEntry.credits--;
+						itemLock.release();
+					}
+					else
 					{
 						// Pop this item.
 						key = m_popIterator->key;
@@ -579,14 +648,6 @@ class Parallel
 						m_popIterator = bin->map.erase( m_popIterator );
 						return true;
 					}
-					else
-					{
-						// Item has been used recently. Flag it so we
-						// can pop it next time round, unless another
-						// thread resets the flag.
-						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
-						itemLock.release();
-					}
 				}
 				else
 				{
@@ -599,6 +660,32 @@ class Parallel
 			}
 		}
 
+		template<typename K>
+		void recordLookup( const K &key, bool hit )
+		{
+			Bin &b = bin( key );
+			( hit ? b.hits : b.misses ).fetch_add( 1, std::memory_order_relaxed );
+		}
+
+		void lookupStatistics( size_t &hits, size_t &misses ) const
+		{
+			hits = misses = 0;
+			for( const auto &b : m_bins )
+			{
+				hits += b.hits.load( std::memory_order_relaxed );
+				misses += b.misses.load( std::memory_order_relaxed );
+			}
+		}
+
+		void resetLookupStatistics()
+		{
+			for( auto &b : m_bins )
+			{
+				b.hits.store( 0, std::memory_order_relaxed );
+				b.misses.store( 0, std::memory_order_relaxed );
+			}
+		}
+
 		AtomicCost currentCost;
 
 	private :
@@ -691,12 +778,16 @@ class TaskParallel
 
 		struct Bin
 		{
-			Bin() {}
-			Bin( const Bin &other ) : map( other.map ) {}
+			Bin() : hits( 0 ), misses( 0 ) {}
+			Bin( const Bin &other ) : map( other.map ), hits( 0 ), misses( 0 ) {}
 			Bin &operator = ( const Bin &other ) { map = other.map; return *this; }
 			Map map;
 			using Mutex = tbb::spin_rw_mutex;
 			Mutex mutex;
+			// Lookup statistics. These are stored per-bin
+			// rather than globally to avoid contention.
+			std::atomic_size_t hits;
+			std::atomic_size_t misses;
 		};
 
 		using Bins = std::vector<Bin>;
@@ -895,7 +986,7 @@ class TaskParallel
 			handle.m_item->recentlyUsed.store( true, std::memory_order_release );
 		}
 
-		bool pop( Key &key, CacheEntry &cacheEntry )
+		bool pop( Key &key, CacheEntry &cacheEntry, bool ignoreCredits = false )
 		{
 			// Popping works by iterating the map until an item
 			// that has not been recently used is found. We store
@@ -948,7 +1039,26 @@ class TaskParallel
 
 				if( itemLock.tryAcquire( m_popIterator->mutex ) )
 				{
-					if( !m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					if( m_popIterator->recentlyUsed.load( std::memory_order_acquire ) )
+					{
+						// Item has been used recently. Flag it so we
+						// can consider it for popping next time round,
+						// unless another thread resets the flag. Restore
+						// the credits it may have used up on previous
+						// passes.
+						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
+						m_popIterator->cacheEntry.credits = m_popIterator->cacheEntry.retention;
+						itemLock.release();
+					}
+					else if( m_popIterator->cacheEntry.credits && !ignoreCredits )
+					{
+						// Item hasn't been used recently, but is valuable
+						// enough to survive another pass. We hold a write
+						// lock so are free to modify the entry.
+						m_popIterator->cacheEntry.credits--;
+						itemLock.release();
+					}
+					else
 					{
 						// Pop this item.
 						key = m_popIterator->key;
@@ -964,14 +1074,6 @@ class TaskParallel
 						m_popIterator = bin->map.erase( m_popIterator );
 						return true;
 					}
-					else
-					{
-						// Item has been used recently. Flag it so we
-						// can pop it next time round, unless another
-						// thread resets the flag.
-						m_popIterator->recentlyUsed.store( false, std::memory_order_release );
-						itemLock.release();
-					}
 				}
 				else
 				{
@@ -984,6 +1086,32 @@ class TaskParallel
 			}
 		}
 
+		template<typename K>
+		void recordLookup( const K &key, bool hit )
+		{
+			Bin &b = bin( key );
+			( hit ? b.hits : b.misses ).fetch_add( 1, std::memory_order_relaxed );
+		}
+
+		void lookupStatistics( size_t &hits, size_t &misses ) const
+		{
+			hits = misses = 0;
+			for( const auto &b : m_bins )
+			{
+				hits += b.hits.load( std::memory_order_relaxed );
+				misses += b.misses.load( std::memory_order_relaxed );
+			}
+		}
+
+		void resetLookupStatistics()
+		{
+			for( auto &b : m_bins )
+			{
+				b.hits.store( 0, std::memory_order_relaxed );
+				b.misses.store( 0, std::memory_order_relaxed );
+			}
+		}
+
 		AtomicCost currentCost;
 
 	private :
@@ -1012,7 +1140,7 @@ class TaskParallel
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::CacheEntry::CacheEntry()
-	:	cost( 0 )
+	:	cost( 0 ), retention( 0 ), credits( 0 )
 {
 }
 
@@ -1027,7 +1155,8 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Status LRUCache<Key, Value, Po
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 LRUCache<Key, Value, Policy, GetterKey>::LRUCache( GetterFunction getter, Cost maxCost, RemovalCallback removalCallback, bool cacheErrors )
-	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost ), m_cacheErrors( cacheErrors )
+	:	m_getter( getter ), m_removalCallback( removalCallback ), m_maxCost( maxCost ), m_cacheErrors( cacheErrors ),
+		m_evictionPolicy( EvictionPolicy::LeastRecentlyUsed ), m_evictions( 0 )
 {
 }
 
@@ -1041,7 +1170,9 @@ void LRUCache<Key, Value, Policy, GetterKey>::clear()
 {
 	Key key;
 	CacheEntry cacheEntry;
-	while( m_policy.pop( key, cacheEntry ) )
+	// Clearing is unconditional, so retention credits from the
+	// `CostAware` policy must not delay it.
+	while( m_policy.pop( key, cacheEntry, /* ignoreCredits = */ true ) )
 	{
 		eraseInternal( key, cacheEntry );
 	}
@@ -1074,6 +1205,35 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Cost LRUCache<Key, Value, Poli
 	return m_policy.currentCost;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::setEvictionPolicy( EvictionPolicy evictionPolicy )
+{
+	m_evictionPolicy = evictionPolicy;
+	resetStatistics();
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::EvictionPolicy LRUCache<Key, Value, Policy, GetterKey>::getEvictionPolicy() const
+{
+	return m_evictionPolicy;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+typename LRUCache<Key, Value, Policy, GetterKey>::Statistics LRUCache<Key, Value, Policy, GetterKey>::statistics() const
+{
+	Statistics result;
+	m_policy.lookupStatistics( result.hits, result.misses );
+	result.evictions = m_evictions;
+	return result;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::resetStatistics()
+{
+	m_policy.resetLookupStatistics();
+	m_evictions = 0;
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const IECore::Canceller *canceller )
 {
@@ -1084,12 +1244,23 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const
 
 	if( status==Uncached )
 	{
+		m_policy.recordLookup( key, /* hit = */ false );
 		assert( handle.isWritable() );
 		Value value = Value();
 		Cost cost = 0;
+		std::chrono::nanoseconds computeTime( 0 );
 		try
 		{
-			handle.execute( [this, &value, &key, &cost, canceller] { value = m_getter( key, cost, canceller ); } );
+			if( m_evictionPolicy == EvictionPolicy::CostAware )
+			{
+				const auto startTime = std::chrono::steady_clock::now();
+				handle.execute( [this, &value, &key, &cost, canceller] { value = m_getter( key, cost, canceller ); } );
+				computeTime = std::chrono::steady_clock::now() - startTime;
+			}
+			else
+			{
+				handle.execute( [this, &value, &key, &cost, canceller] { value = m_getter( key, cost, canceller ); } );
+			}
 		}
 		catch( IECore::Cancelled const & )
 		{
@@ -1107,7 +1278,7 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const
 		assert( cacheEntry.status() != Cached ); // this would indicate that another thread somehow
 		assert( cacheEntry.status() != Failed ); // loaded the same thing as us, which is not the intention.
 
-		setInternal( key, handle.writable(), value, cost );
+		setInternal( key, handle.writable(), value, cost, computeTime );
 		m_policy.push( handle );
 
 		handle.release();
@@ -1117,21 +1288,27 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key, const
 	}
 	else if( status==Cached )
 	{
+		m_policy.recordLookup( key, /* hit = */ true );
 		m_policy.push( handle );
 		return boost::get<Value>( cacheEntry.state );
 	}
 	else
 	{
+		m_policy.recordLookup( key, /* hit = */ true );
 		std::rethrow_exception( boost::get<std::exception_ptr>( cacheEntry.state ) );
 	}
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
-std::optional<Value> LRUCache<Key, Value, Policy, GetterKey>::getIfCached( const Key &key )
+std::optional<Value> LRUCache<Key, Value, Policy, GetterKey>::getIfCached( const Key &key, bool recordStatistics )
 {
 	typename Policy<LRUCache>::Handle handle;
 	if( !m_policy.acquire( key, handle, LRUCachePolicy::FindReadable, /* canceller = */ nullptr ) )
 	{
+		if( recordStatistics )
+		{
+			m_policy.recordLookup( key, /* hit = */ false );
+		}
 		return std::nullopt;
 	}
 
@@ -1140,26 +1317,38 @@ std::optional<Value> LRUCache<Key, Value, Policy, GetterKey>::getIfCached( const
 
 	if( status==Uncached )
 	{
+		if( recordStatistics )
+		{
+			m_policy.recordLookup( key, /* hit = */ false );
+		}
 		return std::nullopt;
 	}
 	else if( status==Cached )
 	{
+		if( recordStatistics )
+		{
+			m_policy.recordLookup( key, /* hit = */ true );
+		}
 		m_policy.push( handle );
 		return boost::get<Value>( cacheEntry.state );
 	}
 	else
 	{
+		if( recordStatistics )
+		{
+			m_policy.recordLookup( key, /* hit = */ true );
+		}
 		std::rethrow_exception( boost::get<std::exception_ptr>( cacheEntry.state ) );
 	}
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
-bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &value, Cost cost )
+bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &value, Cost cost, std::chrono::nanoseconds computeTime )
 {
 	typename Policy<LRUCache>::Handle handle;
 	m_policy.acquire( key, handle, LRUCachePolicy::InsertWritable, /* canceller = */ nullptr );
 	assert( handle.isWritable() );
-	bool result = setInternal( key, handle.writable(), value, cost );
+	bool result = setInternal( key, handle.writable(), value, cost, computeTime );
 	m_policy.push( handle );
 	handle.release();
 	limitCost( m_maxCost );
@@ -1168,7 +1357,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::set( const Key &key, const Value &
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 template<typename CostFunction>
-bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction )
+bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, const Value &value, CostFunction &&costFunction, std::chrono::nanoseconds computeTime )
 {
 	typename Policy<LRUCache>::Handle handle;
 	m_policy.acquire( key, handle, LRUCachePolicy::Insert, /* canceller = */ nullptr );
@@ -1179,7 +1368,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, con
 	if( status == Uncached )
 	{
 		assert( handle.isWritable() );
-		result = setInternal( key, handle.writable(), value, costFunction( value ) );
+		result = setInternal( key, handle.writable(), value, costFunction( value ), computeTime );
 		m_policy.push( handle );
 
 		handle.release();
@@ -1189,7 +1378,7 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setIfUncached( const Key &key, con
 }
 
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
-bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost )
+bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, CacheEntry &cacheEntry, const Value &value, Cost cost, std::chrono::nanoseconds computeTime )
 {
 	eraseInternal( key, cacheEntry );
 
@@ -1200,12 +1389,34 @@ bool LRUCache<Key, Value, Policy, GetterKey>::setInternal( const Key &key, Cache
 
 	cacheEntry.state = value;
 	cacheEntry.cost = cost;
+	cacheEntry.retention = cacheEntry.credits = retention( cost, computeTime );
 
 	m_policy.currentCost += cost;
 
 	return true;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+uint8_t LRUCache<Key, Value, Policy, GetterKey>::retention( Cost cost, std::chrono::nanoseconds computeTime ) const
+{
+	if( m_evictionPolicy != EvictionPolicy::CostAware )
+	{
+		return 0;
+	}
+
+	// GreedyDual-Size ranks items by the ratio of the cost of recomputing
+	// them to the cost of storing them. We don't maintain a priority queue,
+	// so instead we quantise the logarithm of that ratio into a small
+	// number of additional passes the item can survive in `pop()`. The
+	// maximum is kept low so that the policies can always make progress.
+	const double ratio = static_cast<double>( computeTime.count() ) / static_cast<double>( std::max<Cost>( cost, 1 ) );
+	if( ratio < 1.0 )
+	{
+		return 0;
+	}
+	return static_cast<uint8_t>( std::min( 1.0 + std::floor( std::log2( ratio ) ), 7.0 ) );
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 bool LRUCache<Key, Value, Policy, GetterKey>::cached( const Key &key ) const
 {
@@ -1275,7 +1486,10 @@ void LRUCache<Key, Value, Policy, GetterKey>::limitCost( Cost cost )
 			break;
 		}
 
-		eraseInternal( key, cacheEntry );
+		if( eraseInternal( key, cacheEntry ) )
+		{
+			m_evictions++;
+		}
 	}
 }
 
@@ -39,6 +39,7 @@
 #include "tbb/task_arena.h"
 #include "tbb/task_group.h"
 
+#include <chrono>
 #include <unordered_set>
 #include <variant>
 
@@ -379,8 +380,10 @@ typename ProcessType::ResultType Process::acquireCollaborativeResult(
 	// No suitable in-flight collaborations, so we'll create one of our own.
 	// First though, check the cache one more time, in case another thread has
 	// started and finished an equivalent collaboration since we first checked.
+	// This lookup isn't recorded in the cache statistics, because our caller
+	// will already have recorded the first one.
 
-	if( auto result = ProcessType::g_cache.getIfCached( cacheKey ) )
+	if( auto result = ProcessType::g_cache.getIfCached( cacheKey, /* recordStatistics = */ false ) )
 	{
 		return *result;
 	}
@@ -406,13 +409,18 @@ typename ProcessType::ResultType Process::acquireCollaborativeResult(
 					{
 						ProcessType process( std::forward<ProcessArguments>( args )... );
 						process.m_collaboration = collaboration.get();
+						// Only time the process if the cache will make use of
+						// the result, to avoid unnecessary overhead.
+						const bool timed = ProcessType::g_cache.getEvictionPolicy() == ProcessType::CacheType::EvictionPolicy::CostAware;
+						const auto startTime = timed ? std::chrono::steady_clock::now() : std::chrono::steady_clock::time_point();
 						collaboration->result = process.run();
+						const std::chrono::nanoseconds computeTime = timed ? std::chrono::steady_clock::now() - startTime : std::chrono::nanoseconds( 0 );
 						// Publish result to cache before we remove ourself from
 						// `g_pendingCollaborations`, so that other threads will
 						// be able to get the result one way or the other.
 						ProcessType::g_cache.setIfUncached(
 							cacheKey, std::get<typename ProcessType::ResultType>( collaboration->result ),
-							ProcessType::cacheCostFunction
+							ProcessType::cacheCostFunction, computeTime
 						);
 					}
 					catch( ... )
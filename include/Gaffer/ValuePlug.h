@@ -41,6 +41,9 @@
 
 #include "IECore/Object.h"
 
+#include <string>
+#include <vector>
+
 namespace Gaffer
 {
 
@@ -141,7 +144,14 @@ class GAFFER_API ValuePlug : public Plug
 			Default,
 			/// Deprecated synonym for Default. Will be removed in a future
 			/// release.
-			Legacy = Default
+			Legacy = Default,
+			/// As for TaskCollaboration, but results are also stored in the
+			/// persistent cache on disk, if one has been configured using
+			/// `setPersistentCacheDirectory()`. This allows results to be
+			/// reused by other processes. Only suitable for processes whose
+			/// results are serialisable, and whose hashes are stable between
+			/// processes (they must not include memory addresses).
+			Persistent
 		};
 
 		/// @name Cache management
@@ -158,6 +168,65 @@ class GAFFER_API ValuePlug : public Plug
 		static size_t cacheMemoryUsage();
 		/// Clears the cache.
 		static void clearCache();
+
+		/// Determines which values are removed from the cache when
+		/// it reaches the memory limit.
+		enum class CacheEvictionPolicy
+		{
+			/// The least recently used values are removed first.
+			LeastRecentlyUsed,
+			/// Values which took a long time to compute relative to
+			/// their memory usage are retained for longer than those
+			/// which were quick to compute.
+			CostAware
+		};
+		/// Sets the eviction policy for the cache. This resets the
+		/// cache statistics, so that they describe only the new policy.
+		static void setCacheEvictionPolicy( CacheEvictionPolicy policy );
+		static CacheEvictionPolicy getCacheEvictionPolicy();
+
+		struct CacheStatistics
+		{
+			/// Number of lookups that found a cached value.
+			size_t hits = 0;
+			/// Number of lookups that did not find a cached value.
+			size_t misses = 0;
+			/// Number of values removed to stay within the memory limit.
+			size_t evictions = 0;
+			/// Memory used by the values currently in the cache, in bytes.
+			size_t memoryUsage = 0;
+		};
+		/// Returns statistics accumulated since the last call to
+		/// `resetCacheStatistics()` or `setCacheEvictionPolicy()`.
+		static CacheStatistics cacheStatistics();
+		static void resetCacheStatistics();
+		//@}
+
+		/// @name Cache introspection
+		/// Statistics may also be collected for individual plugs, to show
+		/// which nodes make heavy use of the caches. This adds overhead
+		/// to every cache lookup, so is disabled by default.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		struct PlugCacheStatistics
+		{
+			/// The type name of the node the plug belongs to.
+			std::string nodeType;
+			/// The name of the plug, relative to the node.
+			std::string plugName;
+			/// Statistics for the compute cache.
+			CacheStatistics computeCache;
+			/// Statistics for the hash cache. Only hits and misses are
+			/// recorded.
+			CacheStatistics hashCache;
+		};
+		static void setCacheIntrospectionEnabled( bool enabled );
+		static bool getCacheIntrospectionEnabled();
+		/// Returns statistics for all plugs used since introspection was
+		/// enabled. Statistics for plugs with the same name on nodes of the
+		/// same type are combined.
+		static std::vector<PlugCacheStatistics> plugCacheStatistics();
+		static void resetPlugCacheStatistics();
 		//@}
 
 		/// @name Hash cache management
@@ -196,6 +265,34 @@ class GAFFER_API ValuePlug : public Plug
 
 		//@}
 
+		/// @name Persistent cache management
+		/// Results computed with `CachePolicy::Persistent` may additionally be
+		/// stored in a cache on disk, allowing them to be shared between
+		/// processes. This cache is disabled by default, and is enabled by
+		/// specifying a directory for it.
+		////////////////////////////////////////////////////////////////////
+		//@{
+		/// Returns the directory used for the persistent cache, or an empty
+		/// string if it is disabled.
+		static std::string getPersistentCacheDirectory();
+		/// Sets the directory used for the persistent cache. Pass an empty
+		/// string to disable it. The directory is created if necessary.
+		static void setPersistentCacheDirectory( const std::string &directory );
+		/// Returns the maximum size of the persistent cache in bytes.
+		static size_t getPersistentCacheSizeLimit();
+		/// Sets the maximum size of the persistent cache in bytes. When the
+		/// limit is exceeded, the least recently used entries are removed.
+		static void setPersistentCacheSizeLimit( size_t bytes );
+		/// Returns the current size of the persistent cache in bytes. This
+		/// is tracked as entries are written and evicted, and resynchronised
+		/// with the contents of the directory whenever it is scanned for
+		/// eviction, so does not immediately reflect writes made by other
+		/// processes.
+		static size_t persistentCacheUsage();
+		/// Removes all entries from the persistent cache.
+		static void clearPersistentCache();
+		//@}
+
 		/// Returns a counter that increments when this plug is been dirtied
 		/// ( but doesn't necessarily start at 0 ). This is used internally
 		/// for cache invalidation but may also be useful for debugging and
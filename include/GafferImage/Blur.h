@@ -39,6 +39,7 @@
 #include "GafferImage/FlatImageProcessor.h"
 
 #include "Gaffer/CompoundNumericPlug.h"
+#include "Gaffer/TypedPlug.h"
 
 namespace GafferImage
 {
@@ -54,6 +55,17 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 
 		GAFFER_NODE_DECLARE_TYPE( GafferImage::Blur, BlurTypeId, FlatImageProcessor );
 
+		enum Mode
+		{
+			/// Filters the input directly with a gaussian, so the cost per pixel
+			/// grows linearly with the radius.
+			Accurate,
+			/// Downsamples the input, blurs it and upsamples it again, so the cost
+			/// per pixel is independent of the radius. The result closely
+			/// approximates `Accurate` mode.
+			Fast
+		};
+
 		Gaffer::V2fPlug *radiusPlug();
 		const Gaffer::V2fPlug *radiusPlug() const;
 
@@ -63,6 +75,9 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 		Gaffer::BoolPlug *expandDataWindowPlug();
 		const Gaffer::BoolPlug *expandDataWindowPlug() const;
 
+		Gaffer::IntPlug *modePlug();
+		const Gaffer::IntPlug *modePlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -83,6 +98,39 @@ class GAFFERIMAGE_API Blur : public FlatImageProcessor
 		Resample *resample();
 		const Resample *resample() const;
 
+		// Output plugs to compute the matrices used to downsample and upsample
+		// the image in `Fast` mode.
+		Gaffer::M33fPlug *downsampleMatrixPlug();
+		const Gaffer::M33fPlug *downsampleMatrixPlug() const;
+
+		Gaffer::M33fPlug *upsampleMatrixPlug();
+		const Gaffer::M33fPlug *upsampleMatrixPlug() const;
+
+		// Output plug to compute the filter width used when downsampling and
+		// upsampling in `Fast` mode.
+		Gaffer::V2fPlug *pyramidResampleFilterScalePlug();
+		const Gaffer::V2fPlug *pyramidResampleFilterScalePlug() const;
+
+		// Output plug to compute the filter width used to blur the downsampled
+		// image in `Fast` mode.
+		Gaffer::V2fPlug *pyramidFilterScalePlug();
+		const Gaffer::V2fPlug *pyramidFilterScalePlug() const;
+
+		// Input plug to receive the blurred channel data from the internal
+		// upsampling Resample.
+		Gaffer::FloatVectorDataPlug *pyramidChannelDataPlug();
+		const Gaffer::FloatVectorDataPlug *pyramidChannelDataPlug() const;
+
+		// Internal resample nodes used in `Fast` mode.
+		Resample *downsample();
+		const Resample *downsample() const;
+
+		Resample *pyramidBlur();
+		const Resample *pyramidBlur() const;
+
+		Resample *upsample();
+		const Resample *upsample() const;
+
 		void hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const override;
 		void compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const override;
 
@@ -44,6 +44,7 @@
 
 #include "IECore/CompoundObject.h"
 #include "IECore/Export.h"
+#include "IECore/VectorTypedData.h"
 
 IECORE_PUSH_DEFAULT_VISIBILITY
 #include "Imath/ImathBox.h"
@@ -207,6 +208,22 @@ GAFFERIMAGE_API IECore::ConstCompoundObjectPtr tiles( const ImagePlug *imagePlug
 GAFFERIMAGE_API void throwIfSampleOffsetsMismatch( const IECore::IntVectorData* sampleOffsetsA, const IECore::IntVectorData* sampleOffsetsB, const Imath::V2i &tileOrigin, const std::string &message );
 
 
+/// Tile Utils
+/// ==============================
+
+/// Returns `ImagePlug::blackTile()` if every value in `tile` is 0,
+/// `ImagePlug::whiteTile()` if every value is 1, and `tile` otherwise.
+/// Nodes may use this to share a single instance of these common tiles
+/// rather than caching many identical copies, and downstream nodes can
+/// then recognise them cheaply by comparing pointers.
+///
+/// > Note : Callers must not pass deep tiles. A deep tile can't be
+/// > distinguished from a flat one by its data alone, so one that happens
+/// > to hold exactly `ImagePlug::tilePixels()` samples of 0 or 1 would be
+/// > replaced, and downstream nodes recognising the shared tile would then
+/// > treat it as flat.
+GAFFERIMAGE_API IECore::ConstFloatVectorDataPtr shareConstantTile( const IECore::ConstFloatVectorDataPtr &tile );
+
 /// Multi-View Utils
 /// ==============================
 
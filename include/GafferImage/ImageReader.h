@@ -126,6 +126,9 @@ class GAFFERIMAGE_API ImageReader : public ImageNode
 		Gaffer::IntPlug *channelInterpretationPlug();
 		const Gaffer::IntPlug *channelInterpretationPlug() const;
 
+		Gaffer::IntPlug *mipLevelPlug();
+		const Gaffer::IntPlug *mipLevelPlug() const;
+
 		Gaffer::IntVectorDataPlug *availableFramesPlug();
 		const Gaffer::IntVectorDataPlug *availableFramesPlug() const;
 
@@ -41,6 +41,8 @@
 
 #include "Gaffer/NumericPlug.h"
 
+#include <memory>
+
 namespace Gaffer
 {
 
@@ -87,11 +89,44 @@ class GAFFERIMAGE_API OpenImageIOReader : public ImageNode
 		Gaffer::IntPlug *channelInterpretationPlug();
 		const Gaffer::IntPlug *channelInterpretationPlug() const;
 
+		/// The MIP level to read, where 0 is the full resolution image. Values
+		/// greater than the coarsest level in the file are clamped.
+		Gaffer::IntPlug *mipLevelPlug();
+		const Gaffer::IntPlug *mipLevelPlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 		static void setOpenFilesLimit( size_t maxOpenFiles );
 		static size_t getOpenFilesLimit();
 
+		/// Sets the number of subsequent frames to read ahead. When
+		/// non-zero, each tile batch read for frame N also schedules
+		/// background reads of the same batch for frames N+1 onwards,
+		/// so that they are already in the compute cache when playback
+		/// reaches them. Reads are made on a small dedicated thread pool,
+		/// and are cancelled by any edit to the node graph. Read-ahead is
+		/// launched via `ParallelAlgo::callOnUIThread()`, so it only takes
+		/// place in the GUI. Defaults to 0, disabling read-ahead.
+		static void setReadAheadFrames( int frames );
+		static int getReadAheadFrames();
+
+		struct ReadAheadStatistics
+		{
+			/// Number of reads cancelled by edits to the node graph or by
+			/// destruction of the node. Cancelled reads are counted when
+			/// their tasks are discarded on the UI thread.
+			size_t cancelled = 0;
+			/// Number of reads that completed after the node had been
+			/// edited, producing results that can never be used. Edits
+			/// cancel reads and wait for them, so this should be zero
+			/// for nodes in a ScriptNode.
+			size_t stale = 0;
+		};
+		/// Returns statistics accumulated since the last call to
+		/// `resetReadAheadStatistics()`.
+		static ReadAheadStatistics readAheadStatistics();
+		static void resetReadAheadStatistics();
+
 		static size_t supportedExtensions( std::vector<std::string> &extensions );
 
 	protected :
@@ -129,6 +164,13 @@ class GAFFERIMAGE_API OpenImageIOReader : public ImageNode
 
 		void plugSet( Gaffer::Plug *plug );
 
+		void readAhead( const Gaffer::Context *context, const std::string &channelName, const Imath::V2i &tileOrigin, const Imath::V3i &tileBatchOrigin ) const;
+		void launchReadAheads() const;
+		void readAheadTileBatch( const Gaffer::Context *context, const std::string &channelName, const Imath::V2i &tileOrigin ) const;
+
+		struct ReadAheadTasks;
+		std::unique_ptr<ReadAheadTasks> m_readAheadTasks;
+
 		static size_t g_firstPlugIndex;
 
 };
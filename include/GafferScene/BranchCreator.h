@@ -201,6 +201,43 @@ class GAFFERSCENE_API BranchCreator : public FilteredSceneProcessor
 		void hashMapping( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		IECore::ConstDataPtr computeMapping( const Gaffer::Context *context ) const;
 
+		/// Returns true if branches are being created at their source
+		/// locations, which is the case when `destinationPlug()` is at its
+		/// default of `${scene:path}` and a filter is connected. In this case
+		/// all the information needed to classify a location can be found
+		/// by visiting its ancestors, and `locationPlug()` is used instead
+		/// of `branchesPlug()`, so that we don't need to visit the entire
+		/// scene up front.
+		bool localBranches() const;
+		/// Must be evaluated in a context where "scene:path" is the location
+		/// in question. Provides the depth of the deepest destination or
+		/// ancestor of a destination at or above the location, packed with
+		/// the filter result for it. Only valid when `localBranches()` is true.
+		Gaffer::IntPlug *locationPlug();
+		const Gaffer::IntPlug *locationPlug() const;
+
+		void hashLocation( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		int computeLocation( const Gaffer::Context *context ) const;
+
+		/// Must be evaluated in a context where "scene:path" is the location
+		/// in question. Returns true if there is a destination somewhere below
+		/// the location. This is needed because the filter may report a
+		/// DescendantMatch for locations without any matching descendants
+		/// (for instance, when it contains `...`), and unlike `locationPlug()`
+		/// it requires a search of the location's descendants. It is therefore
+		/// only used where it is essential : to avoid merging child bounds at
+		/// locations which only look like ancestors of destinations. Only valid
+		/// when `localBranches()` is true.
+		Gaffer::BoolPlug *hasBranchDescendantsPlug();
+		const Gaffer::BoolPlug *hasBranchDescendantsPlug() const;
+
+		void hashHasBranchDescendants( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		bool computeHasBranchDescendants( const Gaffer::Context *context ) const;
+
+		/// Returns the source paths for `destination`, using either
+		/// `locationPlug()` or `branchesPlug()` as appropriate.
+		std::vector<ScenePlug::ScenePath> sourcePaths( const ScenePlug::ScenePath &destination ) const;
+
 		// Returns `branches()` if it should be used to compute a set, otherwise `nullptr`.
 		ConstBranchesDataPtr branchesForSet( const IECore::InternedString &setName, const Gaffer::Context *context ) const;
 		bool affectsBranchesForSet( const Gaffer::Plug *input ) const;
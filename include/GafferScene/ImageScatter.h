@@ -74,6 +74,9 @@ class GAFFERSCENE_API ImageScatter : public ObjectSource
 		Gaffer::StringPlug *widthChannelPlug();
 		const Gaffer::StringPlug *widthChannelPlug() const;
 
+		Gaffer::BoolPlug *parallelPlug();
+		const Gaffer::BoolPlug *parallelPlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -129,11 +129,18 @@ class GAFFERSCENE_API InteractiveRender : public Gaffer::ComputeNode
 		void update();
 		Gaffer::ConstContextPtr effectiveContext();
 		void stop();
+		void cancelStreaming();
 
 		IECoreScenePreview::RendererPtr m_renderer;
 		std::unique_ptr<RenderController> m_controller;
 		State m_state;
 
+		// Used when streaming the initial scene to the renderer. The flag
+		// is shared with the progress callback, and is cleared when we cancel
+		// the task ourselves, so that it knows not to request another update.
+		std::shared_ptr<Gaffer::BackgroundTask> m_streamingTask;
+		std::shared_ptr<std::atomic_bool> m_streamingResumable;
+
 		Gaffer::ContextPtr m_context;
 
 		IE_CORE_FORWARDDECLARE( RenderMessageHandler )
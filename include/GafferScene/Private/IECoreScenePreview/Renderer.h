@@ -41,11 +41,15 @@
 #include "IECoreScene/Camera.h"
 #include "IECoreScene/Output.h"
 
+#include "IECore/Canceller.h"
 #include "IECore/CompoundObject.h"
 #include "IECore/MessageHandler.h"
 
 #include "boost/unordered_set.hpp"
 
+#include <functional>
+#include <memory>
+
 namespace IECoreScenePreview
 {
 
@@ -313,6 +317,24 @@ class GAFFERSCENE_API Renderer : public IECore::RefCounted
 		/// Performs an arbitrary renderer-specific action.
 		virtual IECore::DataPtr command( const IECore::InternedString name, const IECore::CompoundDataMap &parameters = IECore::CompoundDataMap() );
 
+		/// Shared data
+		/// ===========
+		///
+		/// Clients may register data with the renderer, so that it can be shared
+		/// between independent calls which target the same renderer. For instance,
+		/// Capsules which output the same prototypes can share the work and memory
+		/// needed to prepare them.
+
+		using SharedDataCreator = std::function<IECore::ConstRefCountedPtr ()>;
+		/// Returns the data registered for `key`, calling `creator` to make and
+		/// register it if necessary. Concurrent calls for the same key share a
+		/// single call to `creator`. Data is held until `clearSharedData()` is
+		/// called or the renderer is destroyed, so must not reference anything
+		/// created by the renderer itself, such as an AttributesInterface.
+		IECore::ConstRefCountedPtr sharedData( const IECore::MurmurHash &key, const SharedDataCreator &creator, const IECore::Canceller *canceller = nullptr );
+		/// Releases all shared data.
+		void clearSharedData();
+
 		using Creator = std::function<Ptr ( RenderType, const std::string &, const IECore::MessageHandlerPtr & )>;
 		static void registerType( const IECore::InternedString &typeName, Creator creator );
 		static void deregisterType( const IECore::InternedString &typeName );
@@ -343,6 +365,11 @@ class GAFFERSCENE_API Renderer : public IECore::RefCounted
 
 		};
 
+	private :
+
+		struct SharedDataCache;
+		std::unique_ptr<SharedDataCache> m_sharedDataCache;
+
 };
 
 IE_CORE_DECLAREPTR( Renderer )
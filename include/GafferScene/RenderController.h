@@ -95,6 +95,18 @@ class GAFFERSCENE_API RenderController : public Gaffer::Signals::Trackable
 
 		void updateMatchingPaths( const IECore::PathMatcher &pathsToUpdate, const ProgressCallback &callback = ProgressCallback() );
 
+		/// Updates the renderer in two phases, to minimise the time taken for
+		/// an interactive render to produce its first pixels. First, the globals,
+		/// cameras, lights and light filters are output synchronously, along
+		/// with up to `maxPriorityLocations` locations that are visible to the
+		/// render camera (within the crop window), chosen in order of their
+		/// distance from the camera. `Renderer::render()` is then called, and
+		/// the remainder of the scene is output by the returned background
+		/// task. This pauses the renderer while making its edits, and calls
+		/// `render()` again when it completes. If the task is cancelled, the
+		/// renderer is left paused and a further update is required.
+		std::shared_ptr<Gaffer::BackgroundTask> updateStreaming( const ProgressCallback &callback = ProgressCallback(), size_t maxPriorityLocations = 10000 );
+
 		// ID queries
 		// ==========
 		//
@@ -51,6 +51,7 @@ IECORE_PUSH_DEFAULT_VISIBILITY
 #include "Imath/ImathVec.h"
 IECORE_POP_DEFAULT_VISIBILITY
 
+#include <unordered_map>
 #include <unordered_set>
 
 namespace IECore
@@ -126,6 +127,39 @@ GAFFERSCENE_API IECore::MurmurHash matchingPathsHash( const IECore::PathMatcher
 template <class ThreadableFunctor>
 void parallelProcessLocations( const GafferScene::ScenePlug *scene, ThreadableFunctor &f, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
 
+/// As for `parallelProcessLocations()`, but additionally passing results
+/// from child locations to their parents, allowing a result to be built
+/// recursively for the whole scene without needing thread-local storage.
+///
+/// Functor should be of the following form.
+///
+/// ```
+/// struct ThreadableFunctor
+/// {
+///
+///     /// The type of the result computed for each location.
+///     /// Must be default constructible and movable.
+///     using Result = ...;
+///
+///     /// As for `parallelProcessLocations()`.
+///     ThreadableFunctor( const ThreadableFunctor &parent );
+///
+///     /// As for `parallelProcessLocations()`.
+///     bool operator()( const ScenePlug *scene, const ScenePlug::ScenePath &path );
+///
+///     /// Called once all children have been processed, with
+///     /// their results in the same order as the child names.
+///     /// If `operator()` returned false, `childResults` will be
+///     /// empty. Returns the result for this location.
+///     Result gatherChildren( const ScenePlug::ScenePath &path, std::vector<Result> &childResults );
+///
+/// };
+/// ```
+///
+/// Returns the result for `root`.
+template <class ThreadableFunctor>
+typename ThreadableFunctor::Result parallelReduceLocations( const GafferScene::ScenePlug *scene, ThreadableFunctor &f, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
+
 /// Calls a functor on all locations in the scene. This differs from `parallelProcessLocations()` in that a single instance
 /// of the functor is used for all locations.
 /// The functor must take `( const ScenePlug *, const ScenePlug::ScenePath & )`, and can return false to prune traversal.
@@ -153,6 +187,19 @@ IECore::PathMatcher findAll( const ScenePlug *scene, Predicate &&predicate, cons
 /// returns locations where the attribute has that value.
 GAFFERSCENE_API IECore::PathMatcher findAllWithAttribute( const ScenePlug *scene, IECore::InternedString name, const IECore::Object *value = nullptr, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
 
+/// Hashing
+/// =======
+
+/// Returns a hash of the entire hierarchy below `root`, combining the object, attributes,
+/// transform, bound and child names of every location. Two hierarchies with equal hashes
+/// are guaranteed to be identical, so this may be used to avoid redundant work such as
+/// rewriting an unchanged scene to disk. The hash is computed in parallel, and the result
+/// is cached until the scene is next dirtied, unless `ValuePlug::getHashCacheMode()` is
+/// not `Standard`, in which case it is recomputed on every call.
+///
+/// > Note : Sets and globals are not included in the hash.
+GAFFERSCENE_API IECore::MurmurHash hierarchyHash( const ScenePlug *scene, const ScenePlug::ScenePath &root = ScenePlug::ScenePath() );
+
 /// Globals
 /// =======
 
@@ -175,6 +222,46 @@ GAFFERSCENE_API IECore::ConstCompoundDataPtr sets( const ScenePlug *scene );
 /// As above, but returning only the requested sets.
 GAFFERSCENE_API IECore::ConstCompoundDataPtr sets( const ScenePlug *scene, const std::vector<IECore::InternedString> &setNames );
 
+/// An inverted index of the sets returned by `sets()`, mapping from each
+/// location to the names of the sets it belongs to. This allows the set
+/// membership of many locations to be queried without needing to match each
+/// location against every set.
+class GAFFERSCENE_API SetMemberships : public IECore::RefCounted
+{
+
+	public :
+
+		IE_CORE_DECLAREMEMBERPTR( SetMemberships )
+
+		/// Builds the index in parallel from `sets`, which is expected to
+		/// contain PathMatcherData as returned by `sets()`. Throws if any
+		/// other type of data is found.
+		explicit SetMemberships( const IECore::CompoundData *sets );
+		~SetMemberships() override;
+
+		using SetNames = std::vector<IECore::InternedString>;
+
+		/// Returns the names of the sets containing `path`, in the order
+		/// they are stored in `sets`. Only exact matches are considered.
+		const SetNames &setNames( const ScenePlug::ScenePath &path ) const;
+
+	private :
+
+		struct PathHash
+		{
+			size_t operator()( const ScenePlug::ScenePath &path ) const;
+		};
+
+		// Many locations typically share the same combination of sets,
+		// so each distinct combination is stored only once, and locations
+		// store the index of their combination.
+		std::vector<SetNames> m_combinations;
+		std::unordered_map<ScenePlug::ScenePath, size_t, PathHash> m_locations;
+
+};
+
+IE_CORE_DECLAREPTR( SetMemberships )
+
 /// History
 /// =======
 ///
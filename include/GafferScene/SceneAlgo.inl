@@ -87,6 +87,46 @@ void parallelProcessLocationsWalk( const GafferScene::ScenePlug *scene, const Ga
 	}
 }
 
+template<typename ThreadableFunctor>
+typename ThreadableFunctor::Result parallelReduceLocationsWalk( const GafferScene::ScenePlug *scene, const Gaffer::ThreadState &threadState, const ScenePlug::ScenePath &path, ThreadableFunctor &f, tbb::task_group_context &taskGroupContext )
+{
+	ScenePlug::PathScope pathScope( threadState, &path );
+
+	std::vector<typename ThreadableFunctor::Result> childResults;
+	if( f( scene, path ) )
+	{
+		IECore::ConstInternedStringVectorDataPtr childNamesData = scene->childNamesPlug()->getValue();
+		const std::vector<IECore::InternedString> &childNames = childNamesData->readable();
+		childResults.resize( childNames.size() );
+
+		using ChildIndexRange = tbb::blocked_range<size_t>;
+		const ChildIndexRange loopRange( 0, childNames.size() );
+
+		auto loopBody = [&] ( const ChildIndexRange &range ) {
+			ScenePlug::ScenePath childPath = path;
+			childPath.push_back( IECore::InternedString() ); // Space for the child name
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				ThreadableFunctor childFunctor( f );
+				childPath.back() = childNames[i];
+				childResults[i] = parallelReduceLocationsWalk( scene, threadState, childPath, childFunctor, taskGroupContext );
+			}
+		};
+
+		if( childNames.size() > 1 )
+		{
+			tbb::parallel_for( loopRange, loopBody, taskGroupContext );
+		}
+		else if( childNames.size() == 1 )
+		{
+			// Serial execution
+			loopBody( loopRange );
+		}
+	}
+
+	return f.gatherChildren( path, childResults );
+}
+
 template <class ThreadableFunctor>
 struct ThreadableFilteredFunctor
 {
@@ -154,6 +194,13 @@ void parallelProcessLocations( const GafferScene::ScenePlug *scene, ThreadableFu
 	Detail::parallelProcessLocationsWalk( scene, Gaffer::ThreadState::current(), root, f, taskGroupContext );
 }
 
+template <class ThreadableFunctor>
+typename ThreadableFunctor::Result parallelReduceLocations( const GafferScene::ScenePlug *scene, ThreadableFunctor &f, const ScenePlug::ScenePath &root )
+{
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated ); // Prevents outer tasks silently cancelling our tasks
+	return Detail::parallelReduceLocationsWalk( scene, Gaffer::ThreadState::current(), root, f, taskGroupContext );
+}
+
 template <class ThreadableFunctor>
 void parallelTraverse( const ScenePlug *scene, ThreadableFunctor &f, const ScenePlug::ScenePath &root )
 {
@@ -68,6 +68,11 @@ class GAFFERSCENE_API SceneWriter : public GafferDispatch::TaskNode
 		ScenePlug *outPlug();
 		const ScenePlug *outPlug() const;
 
+		/// The hash is computed using `SceneAlgo::hierarchyHash()`, so that
+		/// unchanged scenes need not be rewritten. This requires a traversal
+		/// of the entire scene for each context hashed, which is significantly
+		/// more expensive than hashing the source node alone, but is typically
+		/// small in comparison to the cost of writing the scene.
 		IECore::MurmurHash hash( const Gaffer::Context *context ) const override;
 
 	protected :
@@ -75,7 +80,11 @@ class GAFFERSCENE_API SceneWriter : public GafferDispatch::TaskNode
 		void execute() const override;
 
 		/// Re-implemented to open the file for writing, then iterate through the
-		/// frames, modifying the current Context and calling writeLocation().
+		/// frames, modifying the current Context and computing every location.
+		/// Writing is performed by a dedicated thread, so that locations for the
+		/// next frame may be computed while the current frame is being written.
+		/// The maximum number of locations waiting to be written is specified
+		/// by the `GAFFERSCENE_SCENEWRITER_QUEUEDEPTH` environment variable.
 		void executeSequence( const std::vector<float> &frames ) const override;
 
 		/// Re-implemented to return true, since the entire file must be written at once.
@@ -0,0 +1,180 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import threading
+
+import psutil
+
+import Gaffer
+
+## Adjusts the limits of the ValuePlug compute and hash caches in response
+# to memory pressure. When the system's available memory falls below
+# `reservedMemory`, or the memory used by the process exceeds the optional
+# `processMemoryLimit`, the caches are shrunk to release the shortfall. When
+# available memory exceeds twice `reservedMemory` and the compute cache is
+# full, the caches are grown again, up to the specified maximums. Nothing is
+# changed between those two thresholds, so that the limits settle rather than
+# oscillating under steady load.
+#
+# The compute cache maximum defaults to the limit in effect at construction,
+# so the caches are only grown beyond the configured limit if a larger
+# `maximumCacheMemoryLimit` is given explicitly. The hash cache limit is moved
+# towards its minimum or maximum by `hashCacheStep`, a fraction of the
+# distance remaining, rather than jumping straight there.
+#
+# Adjustments are made by calling `update()`, which is done periodically
+# on a background thread between calls to `start()` and `stop()`.
+#
+# > Note : While running, any limits set manually via `ValuePlug.setCacheMemoryLimit()`
+# > and `ValuePlug.setHashCacheSizeLimit()` will be overridden.
+class AdaptiveCacheLimits( object ) :
+
+	def __init__(
+		self,
+		minimumCacheMemoryLimit = 1024**3 // 4,
+		maximumCacheMemoryLimit = None,
+		minimumHashCacheSizeLimit = 16000,
+		maximumHashCacheSizeLimit = None,
+		reservedMemory = None,
+		processMemoryLimit = None,
+		hashCacheStep = 0.25,
+		interval = 1.0,
+	) :
+
+		totalMemory = psutil.virtual_memory().total
+
+		self.__minimumCacheMemoryLimit = minimumCacheMemoryLimit
+		self.__maximumCacheMemoryLimit = maximumCacheMemoryLimit if maximumCacheMemoryLimit is not None else Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__minimumHashCacheSizeLimit = minimumHashCacheSizeLimit
+		self.__maximumHashCacheSizeLimit = maximumHashCacheSizeLimit if maximumHashCacheSizeLimit is not None else Gaffer.ValuePlug.getHashCacheSizeLimit()
+		self.__reservedMemory = reservedMemory if reservedMemory is not None else totalMemory // 10
+		self.__processMemoryLimit = processMemoryLimit
+		self.__hashCacheStep = hashCacheStep
+		self.__interval = interval
+
+		self.__thread = None
+		self.__stopEvent = threading.Event()
+
+	def start( self ) :
+
+		if self.__thread is not None :
+			return
+
+		self.__stopEvent.clear()
+		self.__thread = threading.Thread( target = self.__run, name = "adaptiveCacheLimits", daemon = True )
+		self.__thread.start()
+
+	def stop( self ) :
+
+		if self.__thread is None :
+			return
+
+		self.__stopEvent.set()
+		self.__thread.join()
+		self.__thread = None
+
+	def running( self ) :
+
+		return self.__thread is not None
+
+	## Adjusts the cache limits once, based on the current memory usage.
+	def update( self ) :
+
+		availableMemory = self._availableMemory()
+
+		# Memory we're short of, if positive, or memory we could use
+		# comfortably, if negative.
+		shortfall = self.__reservedMemory - availableMemory
+		headroom = availableMemory - 2 * self.__reservedMemory
+		if self.__processMemoryLimit is not None :
+			processMemory = self._processMemory()
+			shortfall = max( shortfall, processMemory - self.__processMemoryLimit )
+			headroom = min( headroom, self.__processMemoryLimit - processMemory )
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		hashCacheSizeLimit = Gaffer.ValuePlug.getHashCacheSizeLimit()
+		cacheMemoryUsage = Gaffer.ValuePlug.cacheMemoryUsage()
+
+		if shortfall > 0 :
+
+			# Under pressure. Shrink the compute cache to free up the
+			# shortfall, and step the hash caches towards their minimum.
+
+			cacheMemoryLimit = min( cacheMemoryLimit, cacheMemoryUsage - shortfall )
+			hashCacheSizeLimit = self.__step( hashCacheSizeLimit, self.__minimumHashCacheSizeLimit )
+
+		elif headroom > 0 and cacheMemoryUsage >= cacheMemoryLimit * 0.9 :
+
+			# Plenty of headroom, and the cache is full, so it is
+			# probably evicting useful entries. Grow into half the
+			# headroom, leaving the rest for everything else.
+
+			cacheMemoryLimit += headroom // 2
+			hashCacheSizeLimit = self.__step( hashCacheSizeLimit, self.__maximumHashCacheSizeLimit )
+
+		cacheMemoryLimit = max( self.__minimumCacheMemoryLimit, min( cacheMemoryLimit, self.__maximumCacheMemoryLimit ) )
+		hashCacheSizeLimit = max( self.__minimumHashCacheSizeLimit, min( hashCacheSizeLimit, self.__maximumHashCacheSizeLimit ) )
+
+		if cacheMemoryLimit != Gaffer.ValuePlug.getCacheMemoryLimit() :
+			Gaffer.ValuePlug.setCacheMemoryLimit( int( cacheMemoryLimit ) )
+		if hashCacheSizeLimit != Gaffer.ValuePlug.getHashCacheSizeLimit() :
+			Gaffer.ValuePlug.setHashCacheSizeLimit( int( hashCacheSizeLimit ) )
+
+	## Returns the memory available to the process. Protected so it may
+	# be overridden for testing.
+	def _availableMemory( self ) :
+
+		return psutil.virtual_memory().available
+
+	## Returns the memory used by the process. Protected so it may
+	# be overridden for testing.
+	def _processMemory( self ) :
+
+		return psutil.Process().memory_info().rss
+
+	def __step( self, value, target ) :
+
+		# Always move by at least 1, so that we eventually reach the target.
+		step = int( ( target - value ) * self.__hashCacheStep )
+		if step == 0 :
+			step = max( -1, min( 1, target - value ) )
+
+		return value + step
+
+	def __run( self ) :
+
+		while not self.__stopEvent.wait( self.__interval ) :
+			self.update()
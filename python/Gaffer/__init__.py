@@ -64,6 +64,7 @@ from .SequencePath import SequencePath
 from .GraphComponentPath import GraphComponentPath
 from .OutputRedirection import OutputRedirection
 from .Monitor import Monitor
+from .AdaptiveCacheLimits import AdaptiveCacheLimits
 
 from . import NodeAlgo
 from . import ExtensionAlgo
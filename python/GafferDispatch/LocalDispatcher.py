@@ -39,7 +39,9 @@ import collections
 import datetime
 import enum
 import functools
+import json
 import os
+import queue
 import re
 import signal
 import shlex
@@ -57,6 +59,10 @@ import GafferDispatch
 
 class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
+	## Prefix for the lines written by `gaffer execute -worker` to report
+	# the result of each batch.
+	workerResultPrefix = "gaffer execute : worker result : "
+
 	def __init__( self, name = "LocalDispatcher", jobPool = None ) :
 
 		GafferDispatch.Dispatcher.__init__( self, name )
@@ -64,6 +70,9 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 		self["executeInBackground"] = Gaffer.BoolPlug( defaultValue = False )
 		self["ignoreScriptLoadErrors"] = Gaffer.BoolPlug( defaultValue = False )
 		self["environmentCommand"] = Gaffer.StringPlug()
+		self["maximumConcurrentBatches"] = Gaffer.IntPlug( defaultValue = 1, minValue = 1 )
+		self["memoryLimit"] = Gaffer.IntPlug( defaultValue = 0, minValue = 0 )
+		self["useWorkerProcesses"] = Gaffer.BoolPlug( defaultValue = False )
 
 		self.__jobPool = jobPool if jobPool else LocalDispatcher.defaultJobPool()
 
@@ -92,6 +101,9 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__ignoreScriptLoadErrors = dispatcher["ignoreScriptLoadErrors"].getValue()
 			self.__environmentCommand = dispatcher["environmentCommand"].getValue()
 			self.__executeInBackground = dispatcher["executeInBackground"].getValue()
+			self.__maximumConcurrentBatches = max( dispatcher["maximumConcurrentBatches"].getValue(), 1 )
+			self.__memoryLimit = dispatcher["memoryLimit"].getValue() * 1024 * 1024
+			self.__useWorkerProcesses = dispatcher["useWorkerProcesses"].getValue()
 
 			if self.__executeInBackground :
 				application = script.ancestor( Gaffer.ApplicationRoot )
@@ -110,11 +122,16 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			self.__messagesChangedSignal = Gaffer.Signal1()
 			self.__messageHandler.messagesChangedSignal().connect( Gaffer.WeakMethod( self.__messagesChanged, fallbackResult = None ) )
 
+			# Batches in the order that a serial depth-first traversal
+			# would execute them.
+			self.__batches = []
 			self.__initBatchWalk( batch )
 
 			self.__statusChangedSignal = Gaffer.Signal1()
 
-			self.__currentProcess = None
+			self.__currentProcesses = []
+			self.__currentProcessesMutex = threading.Lock()
+			self.__idleWorkers = []
 			self.__status = self.Status.Waiting
 			self.__backgroundTask = None
 
@@ -149,29 +166,29 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			else :
 				return datetime.datetime.now( datetime.timezone.utc ) - self.__startTime
 
+		# Returns the ID of the oldest process currently executing a batch,
+		# or `None` if no process is running. Use `processIDs()` to query all
+		# processes when running more than one batch concurrently.
 		def processID( self ) :
 
-			return self.__currentProcess.pid if self.__currentProcess is not None else None
+			processIDs = self.processIDs()
+			return processIDs[0] if processIDs else None
 
-		def memoryUsage( self ) :
+		def processIDs( self ) :
 
-			if self.__currentProcess is None :
-				return None
+			return [ p.pid for p in self.__processes() ]
 
-			try :
-				return self.__currentProcess.memory_info().rss
-			except psutil.NoSuchProcess :
-				return None
+		# Returns the combined memory usage of all processes currently
+		# executing batches.
+		def memoryUsage( self ) :
 
-		def cpuUsage( self ) :
+			return self.__sumProcessStatistic( lambda p : p.memory_info().rss )
 
-			if self.__currentProcess is None :
-				return None
+		# Returns the combined CPU usage of all processes currently
+		# executing batches.
+		def cpuUsage( self ) :
 
-			try :
-				return self.__currentProcess.cpu_percent()
-			except psutil.NoSuchProcess :
-				return None
+			return self.__sumProcessStatistic( lambda p : p.cpu_percent() )
 
 		def status( self ) :
 
@@ -217,7 +234,10 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			with self.__messageHandler :
 				self.__updateStatus( self.Status.Running )
 				try :
-					self.__executeWalk( self.__rootBatch, canceller )
+					try :
+						self.__executeWalk( canceller )
+					finally :
+						self.__closeWorkers()
 				except IECore.Cancelled :
 					self.__updateStatus( self.Status.Killed )
 				except :
@@ -227,26 +247,100 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 				else :
 					self.__updateStatus( self.Status.Complete )
 
-		def __executeWalk( self, batch, canceller ) :
-
-			if "localDispatcher:executed" in batch.blindData() :
-				# Visited this batch by another path
-				return
-
-			for upstreamBatch in batch.preTasks() :
-				self.__executeWalk( upstreamBatch, canceller )
-
-			if batch.plug() is None :
-				assert( batch is self.__rootBatch )
-				return
-
-			if len( batch.frames() ) == 0 :
-				# This case occurs for nodes like TaskList and
-				# TaskContextProcessors, because they don't do anything in
-				# execute (they have empty hashes). Their batches exist only to
-				# depend on upstream batches, so we don't need to do any work
-				# here.
-				return
+		def __executeWalk( self, canceller ) :
+
+			# Batches are launched in the order of a serial depth-first traversal,
+			# as soon as all their upstream batches have completed. When
+			# `maximumConcurrentBatches` is 1, this gives exactly the same order
+			# as a serial traversal, but otherwise allows independent branches
+			# of the graph to execute concurrently.
+
+			waiting = [ b for b in self.__batches if "localDispatcher:executed" not in b.blindData() ]
+			numRunning = 0
+			finished = []
+			finishedCondition = threading.Condition()
+			error = None
+
+			def executeBatch( batch ) :
+
+				# Called on a separate thread when executing concurrently, so we
+				# need to install our message handler again.
+				with self.__messageHandler :
+					try :
+						self.__executeBatchWithMessages( batch, canceller )
+					except Exception as e :
+						result = e
+					else :
+						result = None
+
+				with finishedCondition :
+					finished.append( ( batch, result ) )
+					finishedCondition.notify()
+
+			while True :
+
+				with finishedCondition :
+					for batch, result in finished :
+						numRunning -= 1
+						if result is None :
+							batch.blindData()["localDispatcher:executed"] = IECore.BoolData( True )
+						elif error is None :
+							error = result
+					del finished[:]
+
+				if error is None and canceller is not None and canceller.cancelled() :
+					error = IECore.Cancelled()
+
+				# Launch everything that is ready, subject to our limits.
+
+				i = 0
+				while error is None and i < len( waiting ) and numRunning < self.__maximumConcurrentBatches :
+
+					batch = waiting[i]
+					if not all( "localDispatcher:executed" in p.blindData() for p in batch.preTasks() ) :
+						i += 1
+						continue
+
+					if batch.plug() is None or len( batch.frames() ) == 0 :
+						# This case occurs for the root batch, and for nodes like
+						# TaskList and TaskContextProcessors, because they don't do
+						# anything in execute (they have empty hashes). Their batches
+						# exist only to depend on upstream batches, so we don't need
+						# to do any work here. Since completing them may unblock
+						# batches we've already skipped, we restart the search.
+						del waiting[i]
+						batch.blindData()["localDispatcher:executed"] = IECore.BoolData( True )
+						i = 0
+						continue
+
+					if numRunning and self.__memoryLimit and ( self.memoryUsage() or 0 ) >= self.__memoryLimit :
+						# Wait for running batches to complete before launching more.
+						break
+
+					del waiting[i]
+					numRunning += 1
+					if self.__maximumConcurrentBatches == 1 :
+						executeBatch( batch )
+						break
+					else :
+						threading.Thread(
+							target = executeBatch, args = [ batch ],
+							name = "localDispatcherBatch",
+						).start()
+
+				if not numRunning :
+					break
+
+				with finishedCondition :
+					if not finished :
+						finishedCondition.wait( 0.1 )
+
+			if error is not None :
+				raise error
+
+			assert( not waiting )
+
+		def __executeBatchWithMessages( self, batch, canceller ) :
 
 			IECore.Canceller.check( canceller )
 
@@ -270,7 +364,6 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 						time = datetime.timedelta( seconds = int( 0.5 + time.perf_counter() - startTime ) )
 					)
 				)
-				batch.blindData()["localDispatcher:executed"] = IECore.BoolData( True )
 			except Exception as e :
 				IECore.msg( IECore.MessageHandler.Level.Debug, batch.blindData()["nodeName"].value, traceback.format_exc().strip() )
 				IECore.msg(
@@ -292,45 +385,39 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			taskContext = batch.context()
 			frames = str( IECore.frameListFromList( [ int(x) for x in batch.frames() ] ) )
-
-			args = shlex.split( self.__environmentCommand ) + [
-				str( Gaffer.executablePath() ),
-				"execute",
-				"-script", str( self.__scriptFile ),
-				"-nodes", batch.blindData()["nodeName"].value,
-				"-frames", frames,
-			]
-
-			if self.__ignoreScriptLoadErrors :
-				args.append( "-ignoreScriptLoadErrors" )
+			nodeName = batch.blindData()["nodeName"].value
 
 			contextArgs = []
 			for entry in [ k for k in taskContext.keys() if k != "frame" and not k.startswith( "ui:" ) ] :
 				if entry not in self.__context.keys() or taskContext[entry] != self.__context[entry] :
 					contextArgs.extend( [ "-" + entry, IECore.repr( taskContext[entry] ) ] )
 
-			if contextArgs :
-				args.extend( [ "-context" ] + contextArgs )
+			if self.__useWorkerProcesses :
+				self.__executeBatchInWorker( nodeName, frames, contextArgs, canceller )
+				return
 
-			# Build environment. We want to enable all Cortex message levels so
-			# we can capture everything and then let the LocalJobs UI filter
-			# it dynamically.
+			args = self.__executeArgs() + [
+				"-nodes", nodeName,
+				"-frames", frames,
+			]
 
-			env = os.environ.copy()
-			env["IECORE_LOG_LEVEL"] = "DEBUG"
+			if contextArgs :
+				args.extend( [ "-context" ] + contextArgs )
 
 			# Launch process.
 
-			IECore.msg( IECore.Msg.Level.Debug, batch.blindData()["nodeName"].value, "Executing `{}`".format( " ".join( args ) ) )
+			IECore.msg( IECore.Msg.Level.Debug, nodeName, "Executing `{}`".format( " ".join( args ) ) )
 
 			platformKW = { "start_new_session" : True } if os.name != "nt" else {}
 			process = subprocess.Popen(
 				args,
 				text = True, stdout = subprocess.PIPE, stderr = subprocess.STDOUT,
-				shell = os.name == "nt" and self.__environmentCommand, env = env,
+				shell = os.name == "nt" and self.__environmentCommand, env = self.__executeEnvironment(),
 				**platformKW,
 			)
-			self.__currentProcess = psutil.Process( process.pid )
+			currentProcess = psutil.Process( process.pid )
+			with self.__currentProcessesMutex :
+				self.__currentProcesses.append( currentProcess )
 
 			# Launch a thread to monitor the output stream and feed it into a
 			# our message handler. We must do this on a thread because reading
@@ -350,7 +437,7 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			outputHandler = threading.Thread(
 				target = handleOutput,
-				args = [ process.stdout, str( batch.blindData()["nodeName"] ), self.__messageHandler ],
+				args = [ process.stdout, nodeName, self.__messageHandler ],
 				name = "localDispatcherOutputHandler",
 			)
 			outputHandler.start()
@@ -363,11 +450,7 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 				while process.poll() is None :
 
 					if canceller is not None and canceller.cancelled() :
-						if os.name == "nt" :
-							for toKill in self.__currentProcess.children( recursive = True ) + [ self.__currentProcess ] :
-								toKill.kill()
-						else :
-							os.killpg( process.pid, signal.SIGTERM )
+						_killProcess( currentProcess )
 						raise IECore.Cancelled()
 
 					time.sleep( 0.01 )
@@ -380,9 +463,75 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 
 			finally :
 
-				self.__currentProcess = None
+				with self.__currentProcessesMutex :
+					self.__currentProcesses.remove( currentProcess )
 				outputHandler.join()
 
+		def __executeBatchInWorker( self, nodeName, frames, contextArgs, canceller ) :
+
+			worker = None
+			with self.__currentProcessesMutex :
+				while self.__idleWorkers and worker is None :
+					worker = self.__idleWorkers.pop()
+					if not worker.running() :
+						worker.close()
+						worker = None
+
+			if worker is None :
+				args = self.__executeArgs() + [ "-worker" ]
+				IECore.msg( IECore.Msg.Level.Debug, nodeName, "Launching worker `{}`".format( " ".join( args ) ) )
+				worker = _WorkerProcess(
+					args, self.__executeEnvironment(), os.name == "nt" and self.__environmentCommand,
+					self.__messageHandler
+				)
+			else :
+				IECore.msg( IECore.Msg.Level.Debug, nodeName, "Reusing worker process {}".format( worker.process().pid ) )
+
+			with self.__currentProcessesMutex :
+				self.__currentProcesses.append( worker.process() )
+
+			try :
+				worker.execute( nodeName, frames, contextArgs, canceller )
+			finally :
+				with self.__currentProcessesMutex :
+					self.__currentProcesses.remove( worker.process() )
+					if worker.running() :
+						self.__idleWorkers.append( worker )
+
+		def __closeWorkers( self ) :
+
+			with self.__currentProcessesMutex :
+				workers = self.__idleWorkers
+				self.__idleWorkers = []
+
+			for worker in workers :
+				worker.close()
+
+		# Returns the arguments used to launch `gaffer execute`, without any
+		# of the arguments specific to a particular batch.
+		def __executeArgs( self ) :
+
+			result = shlex.split( self.__environmentCommand ) + [
+				str( Gaffer.executablePath() ),
+				"execute",
+				"-script", str( self.__scriptFile ),
+			]
+
+			if self.__ignoreScriptLoadErrors :
+				result.append( "-ignoreScriptLoadErrors" )
+
+			return result
+
+		def __executeEnvironment( self ) :
+
+			# We want to enable all Cortex message levels so we can capture
+			# everything and then let the LocalJobs UI filter it dynamically.
+
+			result = os.environ.copy()
+			result["IECORE_LOG_LEVEL"] = "DEBUG"
+
+			return result
+
 		def __initBatchWalk( self, batch ) :
 
 			if "nodeName" in batch.blindData() :
@@ -397,6 +546,28 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			for upstreamBatch in batch.preTasks() :
 				self.__initBatchWalk( upstreamBatch )
 
+			self.__batches.append( batch )
+
+		def __processes( self ) :
+
+			with self.__currentProcessesMutex :
+				return list( self.__currentProcesses )
+
+		def __sumProcessStatistic( self, f ) :
+
+			processes = self.__processes()
+			if not processes :
+				return None
+
+			result = 0
+			for process in processes :
+				try :
+					result += f( process )
+				except psutil.NoSuchProcess :
+					pass
+
+			return result
+
 		def __updateStatus( self, status ) :
 
 			if status == self.__status :
@@ -558,6 +729,116 @@ class _MessageHandler( IECore.MessageHandler ) :
 
 		self.__messagesChangedSignal()
 
+# A long-lived `gaffer execute -worker` process, which loads the script once
+# and then executes batches sent to it over a pipe. This avoids the startup
+# cost of a new process per batch, and allows cached computes to be reused
+# between batches.
+class _WorkerProcess :
+
+	def __init__( self, args, env, shell, messageHandler ) :
+
+		platformKW = { "start_new_session" : True } if os.name != "nt" else {}
+		self.__process = subprocess.Popen(
+			args,
+			text = True, stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.STDOUT,
+			shell = shell, env = env,
+			**platformKW,
+		)
+		self.__psutilProcess = psutil.Process( self.__process.pid )
+		self.__args = args
+
+		self.__messageHandler = messageHandler
+		self.__messageContext = ""
+		self.__results = queue.Queue()
+
+		# See `LocalDispatcher.Job.__executeBatch()` for why we
+		# read output on a separate thread.
+		self.__outputHandler = threading.Thread(
+			target = self.__handleOutput,
+			name = "localDispatcherWorkerOutputHandler",
+		)
+		self.__outputHandler.start()
+
+	def process( self ) :
+
+		return self.__psutilProcess
+
+	def running( self ) :
+
+		return self.__process.poll() is None
+
+	def execute( self, nodeName, frames, contextArgs, canceller ) :
+
+		self.__messageContext = nodeName
+
+		try :
+			self.__process.stdin.write(
+				json.dumps( { "nodes" : [ nodeName ], "frames" : frames, "context" : contextArgs } ) + "\n"
+			)
+			self.__process.stdin.flush()
+		except OSError :
+			# Process has exited. The output handler will
+			# report this via `__results`.
+			pass
+
+		while True :
+
+			try :
+				result = self.__results.get( timeout = 0.01 )
+			except queue.Empty :
+				if canceller is not None and canceller.cancelled() :
+					self.kill()
+					raise IECore.Cancelled()
+				continue
+
+			if result is None :
+				raise subprocess.CalledProcessError( self.__process.wait(), " ".join( self.__args ) )
+			elif result :
+				raise subprocess.CalledProcessError( result, " ".join( self.__args ) )
+
+			return
+
+	def kill( self ) :
+
+		try :
+			_killProcess( self.__psutilProcess )
+		except psutil.NoSuchProcess :
+			pass
+
+		self.__process.wait()
+		self.__outputHandler.join()
+
+	def close( self ) :
+
+		try :
+			self.__process.stdin.close()
+		except OSError :
+			pass
+
+		self.__process.wait()
+		self.__outputHandler.join()
+
+	def __handleOutput( self ) :
+
+		for line in iter( self.__process.stdout.readline, "" ) :
+			if line.startswith( LocalDispatcher.workerResultPrefix ) :
+				self.__results.put( int( line[len(LocalDispatcher.workerResultPrefix):] ) )
+			else :
+				message, level = _messageLevel( line[:-1] )
+				self.__messageHandler.handle( level, self.__messageContext, message )
+
+		self.__process.stdout.close()
+		# Signal that the process has exited.
+		self.__results.put( None )
+
+def _killProcess( process ) :
+
+	if os.name == "nt" :
+		for toKill in process.children( recursive = True ) + [ process ] :
+			toKill.kill()
+	else :
+		os.killpg( process.pid, signal.SIGTERM )
+
 __messageLevelRE = re.compile(
 	r"(DEBUG|INFO|WARNING|ERROR) +[:|] ",
 )
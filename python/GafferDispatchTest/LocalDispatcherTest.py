@@ -1292,5 +1292,146 @@ class LocalDispatcherTest( GafferTest.TestCase ) :
 
 		self.assertTrue( fileToCreate.is_file() )
 
+	def testConcurrentBatches( self ) :
+
+		# Two independent branches, and a downstream task that depends on both.
+
+		script = Gaffer.ScriptNode()
+
+		for name in [ "a", "b", "c" ] :
+			script[name] = GafferDispatch.PythonCommand()
+			script[name]["command"].setValue( inspect.cleandoc(
+				f"""
+				import time
+				start = time.time()
+				time.sleep( 1 )
+				with open( {repr( str( self.temporaryDirectory() / name ) )}, "a" ) as f :
+					f.write( "{{}} {{}}\\n".format( start, time.time() ) )
+				"""
+			) )
+
+		script["c"]["preTasks"][0].setInput( script["a"]["task"] )
+		script["c"]["preTasks"][1].setInput( script["b"]["task"] )
+
+		for executeInBackground in ( False, True ) :
+			for maximumConcurrentBatches in ( 1, 2 ) :
+				with self.subTest( executeInBackground = executeInBackground, maximumConcurrentBatches = maximumConcurrentBatches ) :
+
+					for name in [ "a", "b", "c" ] :
+						( self.temporaryDirectory() / name ).unlink( missing_ok = True )
+
+					script["dispatcher"] = self.__createLocalDispatcher()
+					script["dispatcher"]["executeInBackground"].setValue( executeInBackground )
+					script["dispatcher"]["maximumConcurrentBatches"].setValue( maximumConcurrentBatches )
+					script["dispatcher"]["tasks"][0].setInput( script["c"]["task"] )
+					script["dispatcher"]["task"].execute()
+					script["dispatcher"].jobPool().waitForAll()
+
+					job = script["dispatcher"].jobPool().jobs()[0]
+					self.assertEqual( job.status(), GafferDispatch.LocalDispatcher.Job.Status.Complete )
+					self.assertIsNone( job.processID() )
+					self.assertEqual( job.processIDs(), [] )
+
+					intervals = {}
+					for name in [ "a", "b", "c" ] :
+						with open( self.temporaryDirectory() / name, encoding = "utf-8" ) as f :
+							intervals[name] = [ float( x ) for x in f.read().split() ]
+
+					# Downstream task must always wait for both upstream tasks.
+					self.assertGreaterEqual( intervals["c"][0], intervals["a"][1] )
+					self.assertGreaterEqual( intervals["c"][0], intervals["b"][1] )
+
+					# Upstream tasks only overlap when we allow concurrency.
+					overlap = intervals["a"][0] < intervals["b"][1] and intervals["b"][0] < intervals["a"][1]
+					self.assertEqual( overlap, maximumConcurrentBatches > 1 )
+
+	def testConcurrentBatchFailure( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["failing"] = GafferDispatch.PythonCommand()
+		script["failing"]["command"].setValue( "a = nonExistentVariable" )
+
+		script["succeeding"] = GafferDispatch.PythonCommand()
+		script["succeeding"]["command"].setValue( "import time; time.sleep( 0.5 )" )
+
+		script["downstream"] = GafferDispatch.PythonCommand()
+		script["downstream"]["command"].setValue( "raise RuntimeError( 'Should not execute' )" )
+		script["downstream"]["preTasks"][0].setInput( script["failing"]["task"] )
+		script["downstream"]["preTasks"][1].setInput( script["succeeding"]["task"] )
+
+		script["dispatcher"] = self.__createLocalDispatcher()
+		script["dispatcher"]["executeInBackground"].setValue( True )
+		script["dispatcher"]["maximumConcurrentBatches"].setValue( 4 )
+		script["dispatcher"]["tasks"][0].setInput( script["downstream"]["task"] )
+
+		script["dispatcher"]["task"].execute()
+		script["dispatcher"].jobPool().waitForAll()
+
+		job = script["dispatcher"].jobPool().jobs()[0]
+		self.assertEqual( job.status(), GafferDispatch.LocalDispatcher.Job.Status.Failed )
+		self.assertIn( "Execution failed", "\n".join( m.message for m in job.messages() ) )
+		self.assertNotIn( "Should not execute", "\n".join( m.message for m in job.messages() ) )
+
+	def testWorkerProcesses( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		previousTask = None
+		for name in [ "a", "b", "c" ] :
+			script[name] = GafferDispatch.PythonCommand()
+			script[name]["command"].setValue( inspect.cleandoc(
+				f"""
+				import os
+				with open( {repr( str( self.temporaryDirectory() / "pids" ) )}, "a" ) as f :
+					f.write( "{{}} {{}} {{}}\\n".format( "{name}", context.getFrame(), os.getpid() ) )
+				"""
+			) )
+			if previousTask is not None :
+				script[name]["preTasks"][0].setInput( previousTask )
+			previousTask = script[name]["task"]
+
+		script["dispatcher"] = self.__createLocalDispatcher()
+		script["dispatcher"]["executeInBackground"].setValue( True )
+		script["dispatcher"]["useWorkerProcesses"].setValue( True )
+		script["dispatcher"]["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CustomRange )
+		script["dispatcher"]["frameRange"].setValue( "1-2" )
+		script["dispatcher"]["tasks"][0].setInput( script["c"]["task"] )
+		script["dispatcher"]["task"].execute()
+		script["dispatcher"].jobPool().waitForAll()
+
+		job = script["dispatcher"].jobPool().jobs()[0]
+		self.assertEqual( job.status(), GafferDispatch.LocalDispatcher.Job.Status.Complete )
+
+		with open( self.temporaryDirectory() / "pids", encoding = "utf-8" ) as f :
+			lines = [ l.split() for l in f.readlines() ]
+
+		self.assertEqual(
+			sorted( ( l[0], float( l[1] ) ) for l in lines ),
+			[ ( "a", 1 ), ( "a", 2 ), ( "b", 1 ), ( "b", 2 ), ( "c", 1 ), ( "c", 2 ) ]
+		)
+
+		# All batches executed by a single worker process.
+		self.assertEqual( len( { l[2] for l in lines } ), 1 )
+
+	def testWorkerProcessFailure( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["pythonCommand"] = GafferDispatch.PythonCommand()
+		script["pythonCommand"]["command"].setValue( "a = nonExistentVariable" )
+
+		script["dispatcher"] = self.__createLocalDispatcher()
+		script["dispatcher"]["executeInBackground"].setValue( True )
+		script["dispatcher"]["useWorkerProcesses"].setValue( True )
+		script["dispatcher"]["tasks"][0].setInput( script["pythonCommand"]["task"] )
+
+		script["dispatcher"]["task"].execute()
+		script["dispatcher"].jobPool().waitForAll()
+
+		job = script["dispatcher"].jobPool().jobs()[0]
+		self.assertEqual( job.status(), GafferDispatch.LocalDispatcher.Job.Status.Failed )
+		self.assertIn( "nonExistentVariable", "\n".join( m.message for m in job.messages() ) )
+
 if __name__ == "__main__":
 	unittest.main()
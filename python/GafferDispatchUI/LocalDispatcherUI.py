@@ -97,6 +97,46 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"maximumConcurrentBatches" : (
+
+			"description",
+			"""
+			The maximum number of batches to execute at the same time. Batches
+			are only executed concurrently when they don't depend on each other,
+			for instance when they are on independent branches of a TaskList.
+			""",
+
+		),
+
+		"memoryLimit" : (
+
+			"description",
+			"""
+			The combined memory usage (in megabytes) of background processes
+			above which no further batches will be launched until running
+			batches have completed. A value of 0 means no limit. Only applies
+			when executing in the background.
+			""",
+
+			"layout:activator", "executeInBackgroundIsOn",
+
+		),
+
+		"useWorkerProcesses" : (
+
+			"description",
+			"""
+			Executes background batches in long-lived worker processes,
+			which load the script once and are then reused for all the
+			batches in the job. This avoids the cost of starting a new
+			process for each batch, and allows computed values to be
+			reused from the cache when batches share upstream nodes.
+			""",
+
+			"layout:activator", "executeInBackgroundIsOn",
+
+		),
+
 	}
 
 )
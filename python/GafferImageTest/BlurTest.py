@@ -41,6 +41,7 @@ import pathlib
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferImage
 import GafferImageTest
 import os
@@ -198,5 +199,51 @@ class BlurTest( GafferImageTest.ImageTestCase ) :
 
 		self.assertImagesEqual( finalCrop["out"], expectedReader["out"], maxDifference = 0.00001, ignoreMetadata = True )
 
+	def testFastMode( self ) :
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 512, 384 ) )
+		checkerboard["size"].setValue( imath.V2f( 64 ) )
+
+		accurate = GafferImage.Blur()
+		accurate["in"].setInput( checkerboard["out"] )
+		accurate["expandDataWindow"].setValue( True )
+
+		fast = GafferImage.Blur()
+		fast["in"].setInput( checkerboard["out"] )
+		fast["radius"].setInput( accurate["radius"] )
+		fast["expandDataWindow"].setValue( True )
+		fast["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		for radius in [ imath.V2f( 0 ), imath.V2f( 1.5 ), imath.V2f( 4 ) ] :
+
+			# Small radii don't benefit from downsampling, so the result
+			# is identical.
+			accurate["radius"].setValue( radius )
+			self.assertImageHashesEqual( fast["out"], accurate["out"] )
+			self.assertImagesEqual( fast["out"], accurate["out"] )
+
+		for radius in [ imath.V2f( 12 ), imath.V2f( 30.5 ), imath.V2f( 100 ), imath.V2f( 60, 2 ) ] :
+
+			with self.subTest( radius = radius ) :
+				accurate["radius"].setValue( radius )
+				self.assertImagesEqual( fast["out"], accurate["out"], maxDifference = 0.01 )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testFastModePerformance( self ) :
+
+		checkerboard = GafferImage.Checkerboard()
+		checkerboard["format"].setValue( GafferImage.Format( 2048, 2048 ) )
+
+		blur = GafferImage.Blur()
+		blur["in"].setInput( checkerboard["out"] )
+		blur["radius"].setValue( imath.V2f( 300 ) )
+		blur["mode"].setValue( GafferImage.Blur.Mode.Fast )
+
+		GafferImageTest.processTiles( checkerboard["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( blur["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
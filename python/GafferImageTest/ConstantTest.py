@@ -236,5 +236,18 @@ class ConstantTest( GafferImageTest.ImageTestCase ) :
 			self.assertImagesEqual( a["out"], b["out"], maxDifference = ( -0.25, 0.0 ) )
 
 
+	def testSharedTiles( self ) :
+
+		constant = GafferImage.Constant()
+		constant["color"].setValue( imath.Color4f( 0, 1, 0.5, 1 ) )
+
+		def channelData( channelName ) :
+			return constant["out"].channelData( channelName, imath.V2i( 0 ), _copy = False )
+
+		self.assertTrue( channelData( "R" ).isSame( GafferImage.ImagePlug.blackTile( _copy = False ) ) )
+		self.assertTrue( channelData( "G" ).isSame( GafferImage.ImagePlug.whiteTile( _copy = False ) ) )
+		self.assertTrue( channelData( "A" ).isSame( GafferImage.ImagePlug.whiteTile( _copy = False ) ) )
+		self.assertEqual( channelData( "B" ), IECore.FloatVectorData( [ 0.5 ] * GafferImage.ImagePlug.tilePixels() ) )
+
 if __name__ == "__main__":
 	unittest.main()
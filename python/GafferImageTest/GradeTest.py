@@ -306,3 +306,31 @@ class GradeTest( GafferImageTest.ImageTestCase ) :
 		defaultGrade["gamma"].setValue( imath.Color4f( 2, 2, 2, 1.0 ) )
 
 		self.assertImagesEqual( unpremultipliedGrade["out"], defaultGrade["out"] )
+
+	def testBlackTilePassThrough( self ) :
+
+		constant = GafferImage.Constant()
+		constant["color"].setValue( imath.Color4f( 0, 0, 0, 0.5 ) )
+
+		grade = GafferImage.Grade()
+		grade["in"].setInput( constant["out"] )
+		grade["gain"].setValue( imath.Color4f( 2 ) )
+		grade["gamma"].setValue( imath.Color4f( 0.5 ) )
+
+		def channelData() :
+			return grade["out"].channelData( "R", imath.V2i( 0 ), _copy = False )
+
+		# Grades which leave black unchanged pass through the shared black tile.
+
+		blackTile = GafferImage.ImagePlug.blackTile( _copy = False )
+		self.assertTrue( channelData().isSame( blackTile ) )
+
+		grade["processUnpremultiplied"].setValue( True )
+		self.assertTrue( channelData().isSame( blackTile ) )
+
+		# Others must still process it.
+
+		grade["processUnpremultiplied"].setValue( False )
+		grade["offset"].setValue( imath.Color4f( 0.25 ) )
+		self.assertFalse( channelData().isSame( blackTile ) )
+		self.assertEqual( channelData(), IECore.FloatVectorData( [ 0.25 ** 2 ] * GafferImage.ImagePlug.tilePixels() ) )
@@ -397,6 +397,51 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 			self.assertAlmostEqual( sampler["color"]["b"].getValue(), expected[2], msg=operation )
 			self.assertAlmostEqual( sampler["color"]["a"].getValue(), expected[3], msg=operation )
 
+	def testConstantAlpha( self ) :
+
+		# Operations may take shortcuts when an alpha is 0 or 1 for a whole
+		# tile. Check that these give the same results as operating on every
+		# pixel would.
+
+		b = GafferImage.Constant()
+		a = GafferImage.Constant()
+
+		merge = GafferImage.Merge()
+		merge["in"][0].setInput( b["out"] )
+		merge["in"][1].setInput( a["out"] )
+
+		sampler = GafferImage.ImageSampler()
+		sampler["image"].setInput( merge["out"] )
+		sampler["pixel"].setValue( imath.V2f( 10 ) )
+
+		operations = {
+			"Atop" : lambda A, B, a, b : A * b + B * ( 1 - a ),
+			"In" : lambda A, B, a, b : A * b,
+			"Out" : lambda A, B, a, b : A * ( 1 - b ),
+			"Mask" : lambda A, B, a, b : B * a,
+			"Matte" : lambda A, B, a, b : A * a + B * ( 1 - a ),
+			"Over" : lambda A, B, a, b : A + B * ( 1 - a ),
+			"Under" : lambda A, B, a, b : A * ( 1 - b ) + B,
+		}
+
+		self.longMessage = True
+		for operationName, operation in operations.items() :
+			for alphaA in ( 0, 0.5, 1 ) :
+				for alphaB in ( 0, 0.5, 1 ) :
+
+					colorB = imath.Color4f( 0.1, 0.2, 0.3, alphaB )
+					colorA = imath.Color4f( 1, 0.3, 0.1, alphaA )
+					b["color"].setValue( colorB )
+					a["color"].setValue( colorA )
+					merge["operation"].setValue( getattr( GafferImage.Merge.Operation, operationName ) )
+
+					result = sampler["color"].getValue()
+					for i in range( 0, 4 ) :
+						self.assertAlmostEqual(
+							result[i], operation( colorA[i], colorB[i], alphaA, alphaB ),
+							msg = "{} {} {} {}".format( operationName, alphaA, alphaB, "RGBA"[i] )
+						)
+
 	def testDifferenceExceptionalValues( self ) :
 
 		black = GafferImage.Constant()
@@ -957,6 +1002,69 @@ class MergeTest( GafferImageTest.ImageTestCase ) :
 		with GafferTest.TestRunner.PerformanceScope() :
 			GafferImageTest.processTiles( merge["out"] )
 
+	def mergeConstantAlphaPerf( self, operation, alpha ):
+
+		b = GafferImage.Checkerboard()
+		b["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
+		b["size"].setValue( imath.V2f( 64.01 ) )
+
+		alphaShuffle = GafferImage.Shuffle()
+		alphaShuffle["in"].setInput( b["out"] )
+		alphaShuffle["shuffles"].addChild( Gaffer.ShufflePlug( "R", "A" ) )
+
+		a = GafferImage.Checkerboard()
+		a["format"].setValue( GafferImage.Format( 4096, 3112, 1.000 ) )
+		a["size"].setValue( imath.V2f( 31.01 ) )
+		a["colorA"]["a"].setValue( alpha )
+		a["colorB"]["a"].setValue( alpha )
+
+		merge = GafferImage.Merge()
+		merge["operation"].setValue( operation )
+		merge["in"][0].setInput( alphaShuffle["out"] )
+		merge["in"][1].setInput( a["out"] )
+
+		GafferImageTest.processTiles( alphaShuffle["out"] )
+		GafferImageTest.processTiles( a["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( merge["out"] )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5)
+	def testOverOpaquePerf( self ):
+		self.mergeConstantAlphaPerf( GafferImage.Merge.Operation.Over, 1 )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5)
+	def testMatteTransparentPerf( self ):
+		self.mergeConstantAlphaPerf( GafferImage.Merge.Operation.Matte, 0 )
+
+	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5)
+	def testManyLayersPerf( self ):
+
+		# Representative of a layered comp, where many layers are merged
+		# over each other in a single node.
+
+		merge = GafferImage.Merge()
+		merge["operation"].setValue( GafferImage.Merge.Operation.Over )
+
+		layers = []
+		for i in range( 0, 30 ) :
+
+			checkerboard = GafferImage.Checkerboard()
+			checkerboard["format"].setValue( GafferImage.Format( 2048, 1556, 1.000 ) )
+			checkerboard["size"].setValue( imath.V2f( 16.01 + i ) )
+			checkerboard["colorA"].setValue( imath.Color4f( 0.1, 0.2, 0.3, 0.4 ) )
+			checkerboard["colorB"].setValue( imath.Color4f( 0.5, 0.4, 0.3, 0.6 ) )
+			merge["in"][-1].setInput( checkerboard["out"] )
+
+			GafferImageTest.processTiles( checkerboard["out"] )
+			layers.append( checkerboard )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferImageTest.processTiles( merge["out"] )
+
 	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
 	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 5)
 	def testAddPerf( self ):
@@ -38,12 +38,14 @@
 import os
 import pathlib
 import shutil
+import time
 import unittest
 import imath
 import random
 
 import IECore
 import IECoreImage
+import OpenImageIO
 
 import Gaffer
 import GafferTest
@@ -573,6 +575,46 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 
 				self.assertImagesEqual( r["out"], offsetIn["out"], ignoreMetadata = True )
 
+	def testBlackTilesShared( self ) :
+
+		# Simulate a sparse render, with a small element on an
+		# otherwise black background.
+
+		background = GafferImage.Constant()
+		background["format"].setValue( GafferImage.Format( 512, 512 ) )
+		background["color"].setValue( imath.Color4f( 0 ) )
+
+		element = GafferImage.Constant()
+		element["format"].setValue( GafferImage.Format( 512, 512 ) )
+		element["color"].setValue( imath.Color4f( 0.25, 0.5, 0.75, 1 ) )
+
+		crop = GafferImage.Crop()
+		crop["in"].setInput( element["out"] )
+		crop["area"].setValue( imath.Box2i( imath.V2i( 10 ), imath.V2i( 100 ) ) )
+		crop["affectDisplayWindow"].setValue( False )
+
+		merge = GafferImage.Merge()
+		merge["in"][0].setInput( background["out"] )
+		merge["in"][1].setInput( crop["out"] )
+
+		writer = GafferImage.ImageWriter()
+		writer["in"].setInput( merge["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "sparse.exr" )
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( writer["fileName"].getValue() )
+
+		blackTile = GafferImage.ImagePlug.blackTile( _copy = False )
+		for mode in [ GafferImage.ImageWriter.Mode.Scanline, GafferImage.ImageWriter.Mode.Tile ] :
+
+			writer["openexr"]["mode"].setValue( mode )
+			writer["task"].execute()
+			reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
+
+			self.assertImagesEqual( reader["out"], merge["out"], ignoreMetadata = True )
+			self.assertFalse( reader["out"].channelData( "R", imath.V2i( 0 ), _copy = False ).isSame( blackTile ) )
+			self.assertTrue( reader["out"].channelData( "R", imath.V2i( 256 ), _copy = False ).isSame( blackTile ) )
+
 	def testFileNameContext( self ) :
 
 		s = Gaffer.ScriptNode()
@@ -738,6 +780,135 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 		finally :
 			GafferImage.OpenImageIOReader.setOpenFilesLimit( l )
 
+	def testReadAhead( self ) :
+
+		testSequence = IECore.FileSequence( str( self.temporaryDirectory() / "readAhead.####.exr" ) )
+		for frame in range( 1, 4 ) :
+			shutil.copyfile( self.fileName, testSequence.fileNameForFrame( frame ) )
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( pathlib.Path( testSequence.fileName ) )
+
+		def tileBatchMisses() :
+
+			s = [ x for x in Gaffer.ValuePlug.plugCacheStatistics() if x.nodeType == "GafferImage::OpenImageIOReader" and x.plugName == "__tileBatch" ]
+			return s[0].computeCache.misses if s else 0
+
+		self.assertEqual( GafferImage.OpenImageIOReader.getReadAheadFrames(), 0 )
+
+		Gaffer.ValuePlug.resetPlugCacheStatistics()
+		Gaffer.ValuePlug.setCacheIntrospectionEnabled( True )
+		try :
+
+			GafferImage.OpenImageIOReader.setReadAheadFrames( 2 )
+			self.assertEqual( GafferImage.OpenImageIOReader.getReadAheadFrames(), 2 )
+
+			# Read-ahead is launched from the UI thread, so we must emulate
+			# the handler that the GUI would usually install.
+
+			with GafferTest.ParallelAlgoTest.UIThreadCallHandler() as handler :
+
+				context = Gaffer.Context()
+				context.setFrame( 1 )
+				with context :
+					frame1 = GafferImage.ImageAlgo.image( reader["out"] )
+
+				frame1Misses = tileBatchMisses()
+				self.assertGreater( frame1Misses, 0 )
+
+				# Frames 2 and 3 should be read in the background.
+
+				timeout = time.time() + 10
+				while tileBatchMisses() < frame1Misses * 3 :
+					self.assertLess( time.time(), timeout )
+					handler.waitFor( 0.01 )
+
+				# So reading them now should be served entirely from the cache.
+				# Frames 4 and 5 don't exist, so reading ahead to them should
+				# fail silently.
+
+				for frame in ( 2, 3 ) :
+					context.setFrame( frame )
+					with context :
+						self.assertEqual( GafferImage.ImageAlgo.image( reader["out"] ), frame1 )
+
+				self.assertEqual( tileBatchMisses(), frame1Misses * 3 )
+
+		finally :
+			GafferImage.OpenImageIOReader.setReadAheadFrames( 0 )
+			Gaffer.ValuePlug.setCacheIntrospectionEnabled( False )
+
+	def testEditsDuringReadAhead( self ) :
+
+		sequences = []
+		for name, fileName in [ ( "a", self.fileName ), ( "b", self.circlesExrFileName ) ] :
+			sequence = IECore.FileSequence( str( self.temporaryDirectory() / "{}.####.exr".format( name ) ) )
+			for frame in range( 1, 21 ) :
+				shutil.copyfile( fileName, sequence.fileNameForFrame( frame ) )
+			sequences.append( sequence )
+
+		script = Gaffer.ScriptNode()
+		script["reader"] = GafferImage.OpenImageIOReader()
+
+		try :
+
+			GafferImage.OpenImageIOReader.setReadAheadFrames( 19 )
+			GafferImage.OpenImageIOReader.resetReadAheadStatistics()
+
+			with GafferTest.ParallelAlgoTest.UIThreadCallHandler() as handler :
+
+				context = Gaffer.Context( script.context() )
+				context.setFrame( 1 )
+
+				# Repeatedly start reading ahead, and then edit the reader
+				# while the reads are in progress. The edits must cancel the
+				# reads and wait for them before being made.
+
+				for i in range( 0, 10 ) :
+
+					Gaffer.ValuePlug.clearCache()
+					sequence = sequences[i % 2]
+					script["reader"]["fileName"].setValue( pathlib.Path( sequence.fileName ) )
+					script["reader"]["refreshCount"].setValue( i )
+
+					with context :
+						GafferImage.ImageAlgo.image( script["reader"]["out"] )
+
+					handler.waitFor( 0.01 )
+
+				# The edits must have cancelled reads, and no read may
+				# have completed after an edit was made.
+
+				statistics = GafferImage.OpenImageIOReader.readAheadStatistics()
+				self.assertGreater( statistics.cancelled, 0 )
+				self.assertEqual( statistics.stale, 0 )
+
+				# Results must reflect the final edit.
+
+				expected = GafferImage.OpenImageIOReader()
+				expected["fileName"].setValue( self.circlesExrFileName )
+
+				for frame in ( 1, 10 ) :
+					context.setFrame( frame )
+					with context :
+						self.assertImagesEqual( script["reader"]["out"], expected["out"], ignoreMetadata = True )
+
+				# Deleting the node must also cancel the reads.
+
+				context.setFrame( 1 )
+				with context :
+					GafferImage.ImageAlgo.image( script["reader"]["out"] )
+				handler.waitFor( 0.01 )
+				cancelled = GafferImage.OpenImageIOReader.readAheadStatistics().cancelled
+				del script["reader"]
+
+				statistics = GafferImage.OpenImageIOReader.readAheadStatistics()
+				self.assertGreater( statistics.cancelled, cancelled )
+				self.assertEqual( statistics.stale, 0 )
+
+		finally :
+			GafferImage.OpenImageIOReader.setReadAheadFrames( 0 )
+
 	def testSubimageMetadataNotLoaded( self ) :
 
 		reader = GafferImage.ImageReader()
@@ -748,6 +919,47 @@ class OpenImageIOReaderTest( GafferImageTest.ImageTestCase ) :
 		self.assertNotIn( "oiio:subimagename", metadata )
 		self.assertNotIn( "oiio:subimages", metadata )
 
+	def testMipLevel( self ) :
+
+		source = OpenImageIO.ImageBuf( OpenImageIO.ImageSpec( 256, 128, 4, "float" ) )
+		OpenImageIO.ImageBufAlgo.fill( source, ( 0.25, 0.5, 0.75, 1.0 ) )
+
+		fileName = self.temporaryDirectory() / "mipMapped.exr"
+		self.assertTrue(
+			OpenImageIO.ImageBufAlgo.make_texture( OpenImageIO.MakeTxTexture, source, str( fileName ), OpenImageIO.ImageSpec() )
+		)
+
+		reader = GafferImage.OpenImageIOReader()
+		reader["fileName"].setValue( fileName )
+
+		stats = GafferImage.ImageStats()
+		stats["in"].setInput( reader["out"] )
+
+		for mipLevel, size in [
+			( 0, imath.V2i( 256, 128 ) ),
+			( 1, imath.V2i( 128, 64 ) ),
+			( 2, imath.V2i( 64, 32 ) ),
+			( 8, imath.V2i( 1, 1 ) ),
+			# Levels beyond the coarsest are clamped.
+			( 20, imath.V2i( 1, 1 ) ),
+		] :
+			with self.subTest( mipLevel = mipLevel ) :
+
+				reader["mipLevel"].setValue( mipLevel )
+				self.assertEqual( reader["out"].format().getDisplayWindow(), imath.Box2i( imath.V2i( 0 ), size ) )
+				self.assertEqual( reader["out"].dataWindow(), imath.Box2i( imath.V2i( 0 ), size ) )
+
+				stats["area"].setValue( reader["out"].dataWindow() )
+				self.assertEqual( stats["average"].getValue(), imath.Color4f( 0.25, 0.5, 0.75, 1.0 ) )
+
+		# Files without MIP levels are read at full resolution.
+
+		reader["fileName"].setValue( self.fileName )
+		reader["mipLevel"].setValue( 0 )
+		fullResolution = GafferImage.ImageAlgo.image( reader["out"] )
+		reader["mipLevel"].setValue( 2 )
+		self.assertEqual( GafferImage.ImageAlgo.image( reader["out"] ), fullResolution )
+
 	@unittest.skipIf( GafferTest.inCI(), "Performance not relevant on CI platform" )
 	@GafferTest.TestRunner.PerformanceTestMethod()
 	def testImageOpenPerformance( self ):
@@ -91,7 +91,30 @@ Gaffer.Metadata.registerNode(
 			which the blur will bleed onto.
 			"""
 
-		]
+		],
+
+		"mode" : [
+
+			"description",
+			"""
+			The method used to compute the blur.
+
+			- Accurate : Filters the image directly with a gaussian. The
+			  cost per pixel increases with the radius, so this can be slow
+			  for large radii.
+			- Fast : For large radii, the image is downsampled, blurred
+			  and then upsampled again. The cost per pixel is then independent
+			  of the radius, and the result is a close approximation to the
+			  Accurate mode. For small radii this is identical to the Accurate
+			  mode.
+			""",
+
+			"preset:Accurate", GafferImage.Blur.Mode.Accurate,
+			"preset:Fast", GafferImage.Blur.Mode.Fast,
+
+			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
+
+		],
 
 	}
 
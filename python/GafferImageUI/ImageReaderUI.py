@@ -257,6 +257,23 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"mipLevel" : [
+
+			"description",
+			"""
+			The MIP level to read from files that contain them, such as tiled
+			EXR textures made by `maketx`. Level 0 is the full resolution image,
+			and each subsequent level is half the resolution of the previous one.
+			The format and data window of the output are reduced to match, so
+			only a fraction of the pixels are read and cached. This is useful for
+			reviewing very large images interactively.
+
+			Values beyond the coarsest level in the file are clamped, and files
+			without MIP levels are always read at full resolution.
+			""",
+
+		],
+
 		"availableFrames" : [
 
 			"description",
@@ -127,6 +127,11 @@ Gaffer.Metadata.registerNode(
 			"Documented in ImageReader, where it is exposed to users."
 		],
 
+		"mipLevel" : [
+			"description",
+			"Documented in ImageReader, where it is exposed to users."
+		],
+
 		"fileValid" : [
 
 			"description",
@@ -125,6 +125,23 @@ class CapturingRendererTest( GafferTest.TestCase ) :
 		self.assertEqual( mh.messages[0].message, "Object named \"o\" already exists" )
 		del o
 
+	def testPauseWarnings( self ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer()
+
+		renderer.render()
+		with IECore.CapturingMessageHandler() as mh :
+			renderer.pause()
+		self.assertEqual( len( mh.messages ), 0 )
+
+		with IECore.CapturingMessageHandler() as mh :
+			renderer.pause()
+
+		self.assertEqual( len( mh.messages ), 1 )
+		self.assertEqual( mh.messages[0].level, IECore.Msg.Level.Warning )
+		self.assertEqual( mh.messages[0].context, "CapturingRenderer::pause" )
+		self.assertEqual( mh.messages[0].message, "Not rendering" )
+
 	def testObjects( self ) :
 
 		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer()
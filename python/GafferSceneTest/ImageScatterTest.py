@@ -41,6 +41,7 @@ import IECore
 import IECoreScene
 
 import Gaffer
+import GafferTest
 import GafferImage
 import GafferScene
 import GafferSceneTest
@@ -180,5 +181,64 @@ class ImageScatterTest( GafferSceneTest.SceneTestCase ) :
 			)
 		)
 
+	def testParallelDeterministic( self ) :
+
+		# Big enough to be split into many buckets, which will
+		# be processed in parallel.
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 2000, 1000 ) )
+		constant["color"]["r"].setValue( 0.5 )
+
+		scatter = GafferScene.ImageScatter()
+		scatter["image"].setInput( constant["out"] )
+		scatter["density"].setValue( 0.1 )
+		scatter["parallel"].setValue( True )
+
+		points = scatter["out"].object( "/points" )
+		self.assertAlmostEqual( points.numPoints, 2000 * 1000 * 0.05, delta = 2000 * 1000 * 0.05 * 0.07 )
+
+		positions = points["P"].data
+		bound = imath.Box3f( imath.V3f( 0 ), imath.V3f( 2000, 1000, 0 ) )
+		for p in positions :
+			self.assertTrue( bound.intersects( p ) )
+
+		# Points on the boundaries between buckets must not be output twice.
+		self.assertEqual( len( { tuple( p ) for p in positions } ), len( positions ) )
+
+		# Repeated computes must give identical results, including the
+		# order of the points.
+
+		for i in range( 0, 10 ) :
+			Gaffer.ValuePlug.clearCache()
+			self.assertEqual( scatter["out"].object( "/points" )["P"].data, positions )
+
+		# The parallel mode generates the same points as the serial mode,
+		# just in a different order.
+
+		scatter["parallel"].setValue( False )
+		serialPositions = scatter["out"].object( "/points" )["P"].data
+		self.assertNotEqual( serialPositions, positions )
+		self.assertEqual( len( serialPositions ), len( positions ) )
+		self.assertEqual( { tuple( p ) for p in serialPositions }, { tuple( p ) for p in positions } )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testParallelPerformance( self ) :
+
+		constant = GafferImage.Constant()
+		constant["format"].setValue( GafferImage.Format( 4000, 4000 ) )
+		constant["color"]["r"].setValue( 1 )
+
+		scatter = GafferScene.ImageScatter()
+		scatter["image"].setInput( constant["out"] )
+		scatter["density"].setValue( 0.5 )
+		scatter["parallel"].setValue( True )
+
+		# Ensure the image is computed outside of the timed section.
+		GafferImage.ImageAlgo.image( constant["out"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			scatter["out"].object( "/points" )
+
 if __name__ == "__main__":
 	unittest.main()
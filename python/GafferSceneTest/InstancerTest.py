@@ -3123,6 +3123,67 @@ parent["radius"] = ( 2 + context.getFrame() ) * 15
 			else:
 				rootsByHash[ co.hash() ] = co.root()
 
+	def testEncapsulatedPrototypesAreShared( self ) :
+
+		plane = GafferScene.Plane()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		# Two instancers with identical prototypes, named differently so that
+		# their instances don't clash when rendered to the same renderer.
+
+		spheres = []
+		instancers = []
+		for name in [ "sphere", "ball" ] :
+			sphere = GafferScene.Sphere()
+			sphere["name"].setValue( name )
+			spheres.append( sphere )
+			instancer = GafferScene.Instancer()
+			instancer["in"].setInput( plane["out"] )
+			instancer["prototypes"].setInput( sphere["out"] )
+			instancer["filter"].setInput( planeFilter["out"] )
+			instancer["encapsulate"].setValue( True )
+			instancers.append( instancer )
+
+		def render( instancer, renderer ) :
+
+			# Clear the compute cache, so that the prototype can't be shared via that.
+			Gaffer.ValuePlug.clearCache()
+			instancer["out"].object( "/plane/instances" ).render( renderer )
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer( GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Batch )
+		for instancer in instancers :
+			render( instancer, renderer )
+
+		names = [ "{}/{}".format( p, i ) for p in [ "sphere", "ball" ] for i in range( 0, 4 ) ]
+		self.assertEqual( set( renderer.capturedObjectNames() ), set( names ) )
+
+		# All instances in both capsules should reference the same prototype object,
+		# registered with the renderer.
+
+		prototype = renderer.capturedObject( names[0] ).capturedSamples()[0]
+		for name in names :
+			self.assertTrue( renderer.capturedObject( name ).capturedSamples()[0].isSame( prototype ) )
+
+		# Prototypes are not shared between renderers.
+
+		renderer2 = GafferScene.Private.IECoreScenePreview.CapturingRenderer( GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Batch )
+		render( instancers[0], renderer2 )
+		unshared = renderer2.capturedObject( names[0] ).capturedSamples()[0]
+		self.assertFalse( unshared.isSame( prototype ) )
+		self.assertEqual( unshared, prototype )
+
+		# And editing the prototype must give us a new one, even within
+		# the same renderer.
+
+		spheres[1]["name"].setValue( "edited" )
+		spheres[1]["radius"].setValue( 2 )
+		render( instancers[1], renderer )
+		edited = renderer.capturedObject( "edited/0" ).capturedSamples()[0]
+		self.assertFalse( edited.isSame( prototype ) )
+		self.assertEqual( edited.radius(), 2 )
+
 	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 10 )
 	def testBoundPerformance( self ) :
 
@@ -3236,6 +3297,24 @@ parent["radius"] = ( 2 + context.getFrame() ) * 15
 			self.assertEqual( nodes["instancer"]["out"].childNames( "/plane/instances" ), IECore.InternedStringVectorData( [ "sphere", "cube" ] ) )
 
 
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testVariationsPerf( self ):
+		nodes = self.initSimpleInstancer( withPrototypes = True )
+		nodes["instancer"]["contextVariables"].addChild( GafferScene.Instancer.ContextVariablePlug( "context" ) )
+		nodes["instancer"]["contextVariables"][0]["name"].setValue( "P" )
+		nodes["instancer"]["contextVariables"][0]["quantize"].setValue( 0.01 )
+		nodes["instancer"]["seedEnabled"].setValue( True )
+		nodes["instancer"]["seeds"].setValue( 100 )
+
+		# Pre-evaluate the engine, so we just measure the time to count variations
+		nodes["instancer"]["out"].childNames( "/plane/instances" )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			variations = nodes["instancer"]["variations"].getValue()
+
+		self.assertEqual( variations["seed"].value, 100 )
+		self.assertEqual( variations["P"].value, 201 * 201 )
+
 	@GafferTest.TestRunner.PerformanceTestMethod()
 	def testChildNamesPerf( self ):
 		nodes = self.initSimpleInstancer()
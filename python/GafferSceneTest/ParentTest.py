@@ -1245,5 +1245,215 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 			parentCTask.wait()
 			parentA1Task.wait()
 
+	def __manyDestinationsScene( self, numDestinations ) :
+
+		# Instances of a cube, each of which will be a destination
+		# for a Parent node, parenting a sphere in set "A".
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( numDestinations // 2 - 1, 1 ) )
+
+		cube = GafferScene.Cube()
+		cube["sets"].setValue( "B" )
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( cube["out"] )
+		instancer["filter"].setInput( planeFilter["out"] )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "A" )
+
+		instanceFilter = GafferScene.PathFilter()
+		instanceFilter["paths"].setValue( IECore.StringVectorData( [ "/plane/instances/cube/*" ] ) )
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( instancer["out"] )
+		parent["children"][0].setInput( sphere["out"] )
+		parent["filter"].setInput( instanceFilter["out"] )
+
+		return parent, [ plane, cube, planeFilter, instancer, sphere, instanceFilter ]
+
+	def testSetsWithManyDestinations( self ) :
+
+		parent, upstream = self.__manyDestinationsScene( 1000 )
+
+		self.assertEqual(
+			parent["out"].set( "A" ).value,
+			IECore.PathMatcher( [ "/plane/instances/cube/{}/sphere".format( i ) for i in range( 0, 1000 ) ] )
+		)
+		self.assertEqual(
+			parent["out"].set( "B" ).value,
+			IECore.PathMatcher( [ "/plane/instances/cube/{}".format( i ) for i in range( 0, 1000 ) ] )
+		)
+
+		# Hash must be stable, regardless of the order in
+		# which the destinations are visited.
+
+		h = parent["out"].setHash( "A" )
+		for i in range( 0, 10 ) :
+			Gaffer.ValuePlug.clearHashCache()
+			self.assertEqual( parent["out"].setHash( "A" ), h )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSetPerformanceWithManyDestinations( self ) :
+
+		parent, upstream = self.__manyDestinationsScene( 100000 )
+
+		# Compute the branches up front, so that we only measure
+		# the set computation.
+		parent["out"].setNames()
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			parent["out"].set( "A" )
+
+	def testLocalBranchesComputedLazily( self ) :
+
+		parent, upstream = self.__manyDestinationsScene( 1000 )
+
+		# Querying a single destination shouldn't require all the
+		# other destinations to be found.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			self.assertEqual( parent["out"].childNames( "/plane/instances/cube/10" ), IECore.InternedStringVectorData( [ "sphere" ] ) )
+			self.assertEqual( parent["out"].childNames( "/plane/instances/cube/10/sphere" ), IECore.InternedStringVectorData() )
+			self.assertEqual( parent["out"].childNames( "/plane/instances" ), IECore.InternedStringVectorData( [ "cube" ] ) )
+
+		self.assertEqual( monitor.plugStatistics( parent["__branches"] ).hashCount, 0 )
+		self.assertEqual( monitor.plugStatistics( parent["__branches"] ).computeCount, 0 )
+
+		# And we should get the same result as when the destination
+		# isn't the default, and the branches must be computed up front.
+
+		node = Gaffer.Node()
+		node["user"]["destination"] = Gaffer.StringPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		node["user"]["destination"].setValue( "${scene:path}" )
+
+		parent2 = GafferScene.Parent()
+		parent2["in"].setInput( parent["in"].getInput() )
+		parent2["children"][0].setInput( parent["children"][0].getInput() )
+		parent2["filter"].setInput( parent["filter"].getInput() )
+		parent2["destination"].setInput( node["user"]["destination"] )
+
+		self.assertScenesEqual( parent["out"], parent2["out"] )
+
+	def testLocalBranchesWithNestedDestinations( self ) :
+
+		plane = GafferScene.Plane()
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( plane["out"] )
+
+		outerGroup = GafferScene.Group()
+		outerGroup["in"][0].setInput( group["out"] )
+
+		sphere = GafferScene.Sphere()
+
+		filter = GafferScene.PathFilter()
+		filter["paths"].setValue( IECore.StringVectorData( [ "/group", "/group/group/plane" ] ) )
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( outerGroup["out"] )
+		parent["children"][0].setInput( sphere["out"] )
+		parent["filter"].setInput( filter["out"] )
+
+		self.assertEqual( parent["out"].childNames( "/group" ), IECore.InternedStringVectorData( [ "group", "sphere" ] ) )
+		self.assertEqual( parent["out"].childNames( "/group/group" ), IECore.InternedStringVectorData( [ "plane" ] ) )
+		self.assertEqual( parent["out"].childNames( "/group/group/plane" ), IECore.InternedStringVectorData( [ "sphere" ] ) )
+		self.assertEqual( parent["out"].childNames( "/group/sphere" ), IECore.InternedStringVectorData() )
+		self.assertEqual( parent["out"].childNames( "/group/group/plane/sphere" ), IECore.InternedStringVectorData() )
+		self.assertSceneValid( parent["out"] )
+
+	def __deepScene( self, depth ) :
+
+		# A binary tree of groups `depth` levels deep, with a single
+		# `target` location alongside it. Filtering with `/.../target`
+		# means that every location in the tree might have a matching
+		# descendant as far as the filter is concerned, but none do.
+
+		sphere = GafferScene.Sphere()
+		upstream = [ sphere ]
+
+		tree = sphere["out"]
+		for i in range( 0, depth ) :
+			group = GafferScene.Group()
+			group["in"][0].setInput( tree )
+			group["in"][1].setInput( tree )
+			upstream.append( group )
+			tree = group["out"]
+
+		target = GafferScene.Sphere()
+		target["name"].setValue( "target" )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( tree )
+		group["in"][1].setInput( target["out"] )
+
+		cube = GafferScene.Cube()
+		cube["transform"]["translate"]["y"].setValue( 100 )
+
+		filter = GafferScene.PathFilter()
+		filter["paths"].setValue( IECore.StringVectorData( [ "/.../target" ] ) )
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( group["out"] )
+		parent["children"][0].setInput( cube["out"] )
+		parent["filter"].setInput( filter["out"] )
+
+		return parent, upstream + [ target, group, cube, filter ]
+
+	def testLocalBranchesBoundWithEllipsisFilter( self ) :
+
+		parent, upstream = self.__deepScene( 6 )
+
+		# Only the true ancestors of `/group/target` should need to
+		# merge child bounds. The rest of the tree can pass through the
+		# input bounds.
+
+		with Gaffer.PerformanceMonitor() as monitor :
+			bound = parent["out"].bound( "/" )
+
+		self.assertLess( monitor.plugStatistics( parent["out"]["childBounds"] ).computeCount, 10 )
+		self.assertEqual( parent["out"].bound( "/group/group" ), parent["in"].bound( "/group/group" ) )
+		self.assertGreater( bound.max().y, 99 )
+
+		# And we should get the same result as when the destination
+		# isn't the default, and the branches must be computed up front.
+
+		node = Gaffer.Node()
+		node["user"]["destination"] = Gaffer.StringPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		node["user"]["destination"].setValue( "${scene:path}" )
+
+		parent2 = GafferScene.Parent()
+		parent2["in"].setInput( parent["in"].getInput() )
+		parent2["children"][0].setInput( parent["children"][0].getInput() )
+		parent2["filter"].setInput( parent["filter"].getInput() )
+		parent2["destination"].setInput( node["user"]["destination"] )
+
+		self.assertScenesEqual( parent["out"], parent2["out"] )
+		self.assertSceneValid( parent["out"] )
+
+		# Moving the target into the tree must be reflected in the bounds.
+
+		upstream[0]["name"].setValue( "target" )
+		self.assertEqual( parent["out"].bound( "/group/group/group/group/group/group/group/target" ).max().y, 100.5 )
+		self.assertGreater( parent["out"].bound( "/group/group" ).max().y, 99 )
+		self.assertScenesEqual( parent["out"], parent2["out"] )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testLocalBranchesBoundPerformanceWithEllipsisFilter( self ) :
+
+		parent, upstream = self.__deepScene( 14 )
+
+		# Compute the input scene up front, so that we only measure
+		# the overhead of the Parent node.
+		GafferSceneTest.traverseScene( parent["in"] )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			parent["out"].bound( "/" )
+
 if __name__ == "__main__":
 	unittest.main()
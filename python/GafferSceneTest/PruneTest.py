@@ -361,6 +361,30 @@ class PruneTest( GafferSceneTest.SceneTestCase ) :
 					else :
 						self.assertTrue( inputSetPath in outputSet )
 
+	def testUnmodifiedSetIsShared( self ) :
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "A" )
+
+		cube = GafferScene.Cube()
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+		group["in"][1].setInput( cube["out"] )
+
+		cubeFilter = GafferScene.PathFilter()
+		cubeFilter["paths"].setValue( IECore.StringVectorData( [ "/group/cube" ] ) )
+
+		prune = GafferScene.Prune()
+		prune["in"].setInput( group["out"] )
+		prune["filter"].setInput( cubeFilter["out"] )
+
+		self.assertTrue( prune["out"].set( "A", _copy = False ).isSame( group["out"].set( "A", _copy = False ) ) )
+
+		cubeFilter["paths"].setValue( IECore.StringVectorData( [ "/group/sphere" ] ) )
+		self.assertEqual( prune["out"].set( "A" ).value, IECore.PathMatcher() )
+		self.assertEqual( group["out"].set( "A" ).value, IECore.PathMatcher( [ "/group/sphere" ] ) )
+
 	def testNameChangeUpdatesBounds( self ) :
 
 		plane = GafferScene.Plane()
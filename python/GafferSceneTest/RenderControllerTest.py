@@ -34,6 +34,8 @@
 #
 ##########################################################################
 
+import inspect
+import threading
 import unittest
 
 import imath
@@ -377,6 +379,62 @@ class RenderControllerTest( GafferSceneTest.SceneTestCase ) :
 		with GafferTest.TestRunner.PerformanceScope() :
 			controller.update()
 
+	def __millionLocationScene( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 999 ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		editedSphere = GafferScene.Sphere()
+		editedSphere["name"].setValue( "edited" )
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( instancer["out"] )
+		group["in"][1].setInput( editedSphere["out"] )
+
+		return group, editedSphere
+
+	@GafferTest.TestRunner.PerformanceTestMethod( repeat = 1 )
+	def testFullUpdatePerformance( self ) :
+
+		group, editedSphere = self.__millionLocationScene()
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer()
+		controller = GafferScene.RenderController( group["out"], Gaffer.Context(), renderer )
+		controller.setMinimumExpansionDepth( 10 )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			controller.update()
+
+		self.assertIsNotNone( renderer.capturedObject( "/group/plane/instances/sphere/999999" ) )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testIncrementalUpdatePerformance( self ) :
+
+		group, editedSphere = self.__millionLocationScene()
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer()
+		controller = GafferScene.RenderController( group["out"], Gaffer.Context(), renderer )
+		controller.setMinimumExpansionDepth( 10 )
+		controller.update()
+
+		# Edit a single location. This requires a traversal of the
+		# whole scene to find the changes, but only a single object
+		# should be sent to the renderer.
+
+		editedSphere["radius"].setValue( editedSphere["radius"].getValue() + 1 )
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			controller.update()
+
+		self.assertEqual( renderer.capturedObject( "/group/edited" ).capturedSamples()[0].radius(), editedSphere["radius"].getValue() )
+
 	def testCapsuleNoBogusRegenerate( self ) :
 
 		sphere = GafferScene.Sphere()
@@ -1039,6 +1097,84 @@ class RenderControllerTest( GafferSceneTest.SceneTestCase ) :
 		task.wait()
 		self.assertEqual( statuses, [ Status.Running ] * 4 + [ Status.Completed ] )
 
+	def testUpdateStreaming( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		script["camera"] = GafferScene.Camera()
+
+		script["near"] = GafferScene.Sphere()
+		script["near"]["name"].setValue( "near" )
+		script["near"]["transform"]["translate"]["z"].setValue( -10 )
+
+		script["far"] = GafferScene.Sphere()
+		script["far"]["name"].setValue( "far" )
+		script["far"]["transform"]["translate"]["z"].setValue( -100 )
+
+		script["behind"] = GafferScene.Sphere()
+		script["behind"]["name"].setValue( "behind" )
+		script["behind"]["transform"]["translate"]["z"].setValue( 10 )
+
+		script["group"] = GafferScene.Group()
+		for i, name in enumerate( [ "camera", "near", "far", "behind" ] ) :
+			script["group"]["in"][i].setInput( script[name]["out"] )
+
+		# Block the computation of attributes for every location that isn't
+		# output in the synchronous phase until we're ready, so that we can
+		# inspect the state of the renderer before the background phase can
+		# output anything.
+
+		script["backgroundFilter"] = GafferScene.PathFilter()
+		script["backgroundFilter"]["paths"].setValue( IECore.StringVectorData( [ "/group/far", "/group/behind" ] ) )
+
+		script["attributes"] = GafferScene.CustomAttributes()
+		script["attributes"]["in"].setInput( script["group"]["out"] )
+		script["attributes"]["filter"].setInput( script["backgroundFilter"]["out"] )
+		script["attributes"]["attributes"].addChild( Gaffer.NameValuePlug( "test", 1, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic ) )
+
+		script["expression"] = Gaffer.Expression()
+		script["expression"].setExpression( inspect.cleandoc(
+			"""
+			import GafferSceneTest
+			GafferSceneTest.RenderControllerTest.streamingEvent.wait()
+			parent["attributes"]["attributes"]["NameValuePlug"]["value"] = 2
+			"""
+		) )
+
+		script["options"] = GafferScene.StandardOptions()
+		script["options"]["in"].setInput( script["attributes"]["out"] )
+		script["options"]["options"]["render:camera"]["enabled"].setValue( True )
+		script["options"]["options"]["render:camera"]["value"].setValue( "/group/camera" )
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer(
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+		controller = GafferScene.RenderController( script["options"]["out"], Gaffer.Context(), renderer )
+		controller.setMinimumExpansionDepth( 10 )
+
+		RenderControllerTest.streamingEvent = threading.Event()
+		try :
+
+			# The camera counts as a location, so by allowing only two locations
+			# in the synchronous phase we expect just the camera and the nearest
+			# sphere to have been output.
+			task = controller.updateStreaming( maxPriorityLocations = 2 )
+			self.assertIsNotNone( renderer.capturedObject( "/group/camera" ) )
+			self.assertIsNotNone( renderer.capturedObject( "/group/near" ) )
+			self.assertIsNone( renderer.capturedObject( "/group/far" ) )
+			self.assertIsNone( renderer.capturedObject( "/group/behind" ) )
+
+		finally :
+			RenderControllerTest.streamingEvent.set()
+
+		# The rest of the scene is output in the background.
+
+		task.wait()
+		self.assertEqual( task.status(), Gaffer.BackgroundTask.Status.Completed )
+		for name in [ "camera", "near", "far", "behind" ] :
+			self.assertIsNotNone( renderer.capturedObject( "/group/" + name ) )
+		self.assertFalse( controller.updateRequired() )
+
 	def testLightMute( self ) :
 
 		#   Light					light:mute	Muted Result
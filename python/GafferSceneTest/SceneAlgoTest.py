@@ -180,6 +180,46 @@ class SceneAlgoTest( GafferSceneTest.SceneTestCase ) :
 		for n in someSets.keys() :
 			self.assertTrue( someSets[n].isSame( light["out"].set( n, _copy = False ) ) )
 
+	def testSetMemberships( self ) :
+
+		sets = IECore.CompoundData( {
+			"A" : IECore.PathMatcherData( IECore.PathMatcher( [ "/a", "/a/b", "/c" ] ) ),
+			"B" : IECore.PathMatcherData( IECore.PathMatcher( [ "/a/b", "/c" ] ) ),
+			"C" : IECore.PathMatcherData( IECore.PathMatcher( [ "/", "/d" ] ) ),
+			"D" : IECore.PathMatcherData(),
+		} )
+
+		memberships = GafferScene.SceneAlgo.SetMemberships( sets )
+
+		for path in [ "/", "/a", "/a/b", "/c", "/d", "/e", "/a/b/c" ] :
+			self.assertEqual(
+				memberships.setNames( path ),
+				# Expected order is the order of the keys in `sets`.
+				[ n for n in sets.keys() if sets[n].value.match( path ) & IECore.PathMatcher.Result.ExactMatch ]
+			)
+
+	def testSetMembershipsWithInvalidData( self ) :
+
+		sets = IECore.CompoundData( {
+			"A" : IECore.PathMatcherData( IECore.PathMatcher( [ "/a" ] ) ),
+			"B" : IECore.IntData( 10 ),
+		} )
+
+		with self.assertRaisesRegex( Exception, 'Set "B" has type "IntData" but should be "PathMatcherData"' ) :
+			GafferScene.SceneAlgo.SetMemberships( sets )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testSetMembershipsPerformance( self ) :
+
+		sets = IECore.CompoundData()
+		for i in range( 0, 1000 ) :
+			sets["set{}".format( i )] = IECore.PathMatcherData(
+				IECore.PathMatcher( [ "/location{}".format( j ) for j in range( i % 10, 10000, 10 ) ] )
+			)
+
+		with GafferTest.TestRunner.PerformanceScope() :
+			GafferScene.SceneAlgo.SetMemberships( sets )
+
 	def testMatchingPathsWithPathMatcher( self ) :
 
 		s = GafferScene.Sphere()
@@ -2197,6 +2237,174 @@ class SceneAlgoTest( GafferSceneTest.SceneTestCase ) :
 			result = IECore.PathMatcher()
 			GafferScene.SceneAlgo.matchingPaths( pathMatcher, scene, result )
 
+	def testHierarchyHash( self ) :
+
+		sphere = GafferScene.Sphere()
+		cube = GafferScene.Cube()
+
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+		group["in"][1].setInput( cube["out"] )
+
+		hashes = set()
+		def assertHashChanged() :
+			h = GafferScene.SceneAlgo.hierarchyHash( group["out"] )
+			self.assertNotIn( h, hashes )
+			hashes.add( h )
+
+		assertHashChanged()
+
+		# Hash is stable.
+
+		self.assertIn( GafferScene.SceneAlgo.hierarchyHash( group["out"] ), hashes )
+
+		# Hash changes with every property of every location.
+
+		sphere["radius"].setValue( 2 )
+		assertHashChanged()
+
+		cube["transform"]["translate"]["x"].setValue( 1 )
+		assertHashChanged()
+
+		cube["name"].setValue( "box" )
+		assertHashChanged()
+
+		group["transform"]["rotate"]["y"].setValue( 90 )
+		assertHashChanged()
+
+		attributes = GafferScene.CustomAttributes()
+		attributes["in"].setInput( group["out"] )
+		attributes["attributes"].addChild( Gaffer.NameValuePlug( "test", 1 ) )
+
+		self.assertNotEqual(
+			GafferScene.SceneAlgo.hierarchyHash( attributes["out"] ),
+			GafferScene.SceneAlgo.hierarchyHash( group["out"] )
+		)
+
+		# Hash doesn't depend on sets.
+
+		sphere["sets"].setValue( "A" )
+		self.assertIn( GafferScene.SceneAlgo.hierarchyHash( group["out"] ), hashes )
+
+		# Hash with root only depends on the subtree.
+
+		sphereHash = GafferScene.SceneAlgo.hierarchyHash( group["out"], "/group/sphere" )
+		self.assertNotIn( sphereHash, hashes )
+		cube["dimensions"]["x"].setValue( 2 )
+		self.assertEqual( GafferScene.SceneAlgo.hierarchyHash( group["out"], "/group/sphere" ), sphereHash )
+
+		# Identical hierarchies from different nodes have identical hashes.
+
+		sphere2 = GafferScene.Sphere()
+		sphere2["radius"].setValue( 2 )
+		self.assertEqual(
+			GafferScene.SceneAlgo.hierarchyHash( group["out"], "/group/sphere" ),
+			GafferScene.SceneAlgo.hierarchyHash( sphere2["out"], "/sphere" )
+		)
+
+		# Hash depends on context.
+
+		sphere2["name"].setValue( "${name}" )
+		with Gaffer.Context() as c :
+			c["name"] = "a"
+			h1 = GafferScene.SceneAlgo.hierarchyHash( sphere2["out"] )
+			c["name"] = "b"
+			h2 = GafferScene.SceneAlgo.hierarchyHash( sphere2["out"] )
+			self.assertNotEqual( h1, h2 )
+
+	def testParallelReduceLocations( self ) :
+
+		sphere = GafferScene.Sphere()
+		cube = GafferScene.Cube()
+		plane = GafferScene.Plane()
+
+		innerGroup = GafferScene.Group()
+		innerGroup["name"].setValue( "inner" )
+		innerGroup["in"][0].setInput( cube["out"] )
+		innerGroup["in"][1].setInput( plane["out"] )
+
+		group = GafferScene.Group()
+		for i, scene in enumerate( [ sphere, innerGroup, plane, cube ] ) :
+			group["in"][i].setInput( scene["out"] )
+
+		# Results are gathered in depth-first order, matching the
+		# child names, regardless of the order the locations are
+		# visited in. The helper throws if functors aren't copied
+		# independently for each location.
+
+		expected = [
+			"/",
+			"/group",
+			"/group/sphere",
+			"/group/inner",
+			"/group/inner/cube",
+			"/group/inner/plane",
+			"/group/plane",
+			"/group/cube",
+		]
+
+		for i in range( 0, 10 ) :
+			self.assertEqual( list( GafferSceneTest.parallelReduceLocationPaths( group["out"] ) ), expected )
+
+		# Subtrees can be reduced independently.
+
+		self.assertEqual(
+			list( GafferSceneTest.parallelReduceLocationPaths( group["out"], root = "/group/inner" ) ),
+			[ "/group/inner", "/group/inner/cube", "/group/inner/plane" ]
+		)
+
+		# Returning false from the functor prunes the traversal,
+		# but the pruned location is still gathered.
+
+		self.assertEqual(
+			list( GafferSceneTest.parallelReduceLocationPaths( group["out"], IECore.PathMatcher( [ "/group/inner" ] ) ) ),
+			[ p for p in expected if not p.startswith( "/group/inner/" ) ]
+		)
+
+		self.assertEqual(
+			list( GafferSceneTest.parallelReduceLocationPaths( group["out"], IECore.PathMatcher( [ "/" ] ) ) ),
+			[ "/" ]
+		)
+
+	def testParallelReduceLocationsCancellation( self ) :
+
+		sphere = GafferScene.Sphere()
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+
+		canceller = IECore.Canceller()
+		canceller.cancel()
+
+		with Gaffer.Context( Gaffer.Context(), canceller ) :
+			with self.assertRaises( IECore.Cancelled ) :
+				GafferSceneTest.parallelReduceLocationPaths( group["out"] )
+
+		# Cancellation must not leave anything behind that affects
+		# a subsequent uncancelled reduction.
+
+		self.assertEqual(
+			list( GafferSceneTest.parallelReduceLocationPaths( group["out"] ) ),
+			[ "/", "/group", "/group/sphere" ]
+		)
+
+	def testHierarchyHashWithNonStandardHashCacheModes( self ) :
+
+		sphere = GafferScene.Sphere()
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+
+		defaultHashCacheMode = Gaffer.ValuePlug.getHashCacheMode()
+		try :
+			for mode in ( Gaffer.ValuePlug.HashCacheMode.Checked, Gaffer.ValuePlug.HashCacheMode.Legacy ) :
+				with self.subTest( mode = mode ) :
+					Gaffer.ValuePlug.setHashCacheMode( mode )
+					h = GafferScene.SceneAlgo.hierarchyHash( group["out"] )
+					self.assertEqual( GafferScene.SceneAlgo.hierarchyHash( group["out"] ), h )
+					sphere["radius"].setValue( sphere["radius"].getValue() + 1 )
+					self.assertNotEqual( GafferScene.SceneAlgo.hierarchyHash( group["out"] ), h )
+		finally :
+			Gaffer.ValuePlug.setHashCacheMode( defaultHashCacheMode )
+
 	def testRenderAdaptors( self ) :
 
 		sphere = GafferScene.Sphere()
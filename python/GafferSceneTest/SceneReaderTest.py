@@ -34,7 +34,9 @@
 #
 ##########################################################################
 
+import os
 import pathlib
+import subprocess
 import unittest
 import inspect
 import imath
@@ -826,5 +828,51 @@ class SceneReaderTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( len( mh.messages ), 1 )
 		self.assertEqual( mh.messages[0].message, 'No file found for "/volume"' )
 
+	def testPersistentCacheAcrossProcesses( self ) :
+
+		def writeFile( radius ) :
+
+			sc = IECoreScene.SceneCache( str( self.__testFile ), IECore.IndexedIO.OpenMode.Write )
+			s = sc.createChild( "sphere" )
+			s.writeObject( IECoreScene.SpherePrimitive( radius ), 0.0 )
+			del sc, s
+
+		def readRadius() :
+
+			env = os.environ.copy()
+			env["GAFFERSCENE_SCENEREADER_OBJECT_CACHEPOLICY"] = "Persistent"
+
+			return float( subprocess.check_output(
+				[
+					str( Gaffer.executablePath() ), "env", "python", "-c",
+					"import Gaffer, GafferScene; "
+					"Gaffer.ValuePlug.setPersistentCacheDirectory( {cacheDirectory!r} ); "
+					"reader = GafferScene.SceneReader(); "
+					"reader['fileName'].setValue( {fileName!r} ); "
+					"print( reader['out'].object( '/sphere' ).radius() )".format(
+						cacheDirectory = str( self.temporaryDirectory() / "persistentCache" ),
+						fileName = str( self.__testFile )
+					)
+				],
+				env = env, universal_newlines = True
+			).strip().split( "\n" )[-1] )
+
+		writeFile( 1 )
+		self.assertEqual( readRadius(), 1 )
+
+		# Sneakily edit the file without changing its modification time. The
+		# result computed by the first process should be reused by the second.
+
+		modificationTime = os.stat( self.__testFile ).st_mtime_ns
+		writeFile( 2 )
+		os.utime( self.__testFile, ns = ( modificationTime, modificationTime ) )
+		self.assertEqual( readRadius(), 1 )
+
+		# Once the modification time has changed, the stale result must not be
+		# used.
+
+		os.utime( self.__testFile, ns = ( modificationTime + 10**9, modificationTime + 10**9 ) )
+		self.assertEqual( readRadius(), 2 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -238,14 +238,26 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 		writer["fileName"].setValue( self.temporaryDirectory() / "test2.scc" )
 		self.assertNotEqual( writer.hash( c ), current )
 
-		# output varies by new Context entries
+		# output doesn't vary by Context entries that don't affect the scene
 		current = writer.hash( c )
 		c["renderDirectory"] = ( self.temporaryDirectory() / "sceneWriterTest" ).as_posix()
+		self.assertEqual( writer.hash( c ), current )
+
+		# but does vary by Context entries that do
+		c["planeName"] = "a"
+		plane["name"].setValue( "${planeName}" )
+		current = writer.hash( c )
+		c["planeName"] = "b"
+		self.assertNotEqual( writer.hash( c ), current )
+
+		# output varies by changes to the scene
+		current = writer.hash( c )
+		plane["divisions"].setValue( imath.V2i( 2 ) )
 		self.assertNotEqual( writer.hash( c ), current )
 
-		# output varies by changed Context entries
+		# and by changes to the sets
 		current = writer.hash( c )
-		c["renderDirectory"] = ( self.temporaryDirectory() / "sceneWriterTest2" ).as_posix()
+		plane["sets"].setValue( "A" )
 		self.assertNotEqual( writer.hash( c ), current )
 
 		# output doesn't vary by ui Context entries
@@ -498,5 +510,136 @@ class SceneWriterTest( GafferSceneTest.SceneTestCase ) :
 				context.setFrame( frame )
 				self.assertPathsEqual( reader["out"], "/_1", sphere["out"], "/1" )
 
+	def testWriteManyLocationsOverManyFrames( self ) :
+
+		# Exercises the pipelining of location computes for one frame
+		# with the writing of previous frames.
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 10 ) )
+
+		frame = Gaffer.ContextQuery()
+		frame.addQuery( Gaffer.FloatPlug(), "frame" )
+		plane["transform"]["translate"]["y"].setInput( frame["out"][0]["value"] )
+
+		sphere = GafferScene.Sphere()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["filter"].setInput( planeFilter["out"] )
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( instancer["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+
+		frames = list( range( 1, 21 ) )
+		with Gaffer.Context() :
+			writer["task"].executeSequence( frames )
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		with Gaffer.Context() as context :
+			for f in frames :
+				context.setFrame( f )
+				self.assertScenesEqual( reader["out"], instancer["out"], checks = { "transform", "bound", "childNames" } )
+
+	def testWriterThreadFailure( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 10 ) )
+
+		sphere = GafferScene.Sphere()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["filter"].setInput( planeFilter["out"] )
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( instancer["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+
+		# SceneCache requires samples to be written in increasing time order,
+		# so writing the frames backwards causes the writer thread to throw
+		# part-way through. This should be reported as an error, without
+		# deadlocking the compute threads that are still queueing writes.
+
+		with Gaffer.Context() :
+			with self.assertRaises( Exception ) :
+				writer["task"].executeSequence( [ 2, 1 ] )
+
+		# And we should be able to write successfully afterwards.
+
+		writer["fileName"].setValue( self.temporaryDirectory() / "test2.scc" )
+		with Gaffer.Context() :
+			writer["task"].executeSequence( [ 1, 2 ] )
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setInput( writer["fileName"] )
+
+		with Gaffer.Context() as context :
+			for frame in ( 1, 2 ) :
+				context.setFrame( frame )
+				self.assertScenesEqual( reader["out"], instancer["out"], checks = { "transform", "bound", "childNames" } )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testWriteAnimationPerformance( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 100 ) )
+
+		sphere = GafferScene.Sphere()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["filter"].setInput( planeFilter["out"] )
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( instancer["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+
+		with Gaffer.Context(), GafferTest.TestRunner.PerformanceScope() :
+			writer["task"].executeSequence( list( range( 1, 11 ) ) )
+
+	@GafferTest.TestRunner.PerformanceTestMethod()
+	def testHashPerformance( self ) :
+
+		# The hash traverses the whole scene, so is paid for every
+		# frame a dispatcher considers.
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 300 ) )
+
+		sphere = GafferScene.Sphere()
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["prototypes"].setInput( sphere["out"] )
+		instancer["filter"].setInput( planeFilter["out"] )
+
+		writer = GafferScene.SceneWriter()
+		writer["in"].setInput( instancer["out"] )
+		writer["fileName"].setValue( self.temporaryDirectory() / "test.scc" )
+
+		with Gaffer.Context() as c, GafferTest.TestRunner.PerformanceScope() :
+			for frame in range( 1, 11 ) :
+				c.setFrame( frame )
+				writer.hash( c )
+
 if __name__ == "__main__":
 	unittest.main()
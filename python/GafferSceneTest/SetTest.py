@@ -515,5 +515,35 @@ class SetTest( GafferSceneTest.SceneTestCase ) :
 		setNode["mode"].setValue( setNode.Mode.Create )
 		self.assertEqual( { str( x ) for x in setNode["out"].setNames() }, { "test1", "test2", "test3", "test4" } )
 
+	def testUnmodifiedSetIsShared( self ) :
+
+		plane = GafferScene.Plane()
+		plane["sets"].setValue( "A" )
+
+		planeFilter = GafferScene.PathFilter()
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		setNode = GafferScene.Set()
+		setNode["in"].setInput( plane["out"] )
+		setNode["filter"].setInput( planeFilter["out"] )
+		setNode["name"].setValue( "A" )
+
+		# Adding paths that are already in the set, or removing paths
+		# that aren't, should give us the input set rather than a copy.
+
+		for mode, paths in [
+			( setNode.Mode.Add, [ "/plane" ] ),
+			( setNode.Mode.Remove, [ "/sphere" ] ),
+		] :
+			setNode["mode"].setValue( mode )
+			planeFilter["paths"].setValue( IECore.StringVectorData( paths ) )
+			self.assertTrue( setNode["out"].set( "A", _copy = False ).isSame( plane["out"].set( "A", _copy = False ) ) )
+
+		# But genuine edits must still be made.
+
+		planeFilter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+		self.assertEqual( setNode["out"].set( "A" ).value, IECore.PathMatcher() )
+		self.assertEqual( plane["out"].set( "A" ).value, IECore.PathMatcher( [ "/plane" ] ) )
+
 if __name__ == "__main__":
 	unittest.main()
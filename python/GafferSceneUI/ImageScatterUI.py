@@ -156,6 +156,21 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"parallel" : [
+
+			"description",
+			"""
+			Generates the points in parallel, by dividing the image into
+			buckets and scattering each one independently. This is faster,
+			but the points are ordered by bucket rather than following the
+			progressive order in which they are generated across the whole
+			image. Since the order determines the point indices, and therefore
+			the ids of any instances created from the points, it is not
+			recommended to toggle this for existing scenes.
+			""",
+
+		],
+
 	}
 
 )
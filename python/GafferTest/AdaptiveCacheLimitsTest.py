@@ -0,0 +1,220 @@
+##########################################################################
+#
+#  Copyright (c) 2026, Cinesite VFX Ltd. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##########################################################################
+
+import unittest
+
+import Gaffer
+import GafferTest
+
+class AdaptiveCacheLimitsTest( GafferTest.TestCase ) :
+
+	class __TestLimits( Gaffer.AdaptiveCacheLimits ) :
+
+		def __init__( self, **kw ) :
+
+			Gaffer.AdaptiveCacheLimits.__init__( self, **kw )
+			self.availableMemory = 0
+			self.processMemory = 0
+
+		def _availableMemory( self ) :
+
+			return self.availableMemory
+
+		def _processMemory( self ) :
+
+			return self.processMemory
+
+	def testShrinkUnderPressure( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 1024**3 )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 128000 )
+
+		limits = self.__TestLimits(
+			minimumCacheMemoryLimit = 1024**2, maximumCacheMemoryLimit = 1024**3,
+			minimumHashCacheSizeLimit = 1000, maximumHashCacheSizeLimit = 128000,
+			reservedMemory = 1024**3
+		)
+
+		# Plenty of memory, and an empty cache, so nothing should change.
+
+		limits.availableMemory = 4 * 1024**3
+		limits.update()
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), 1024**3 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 128000 )
+
+		# Under pressure. We should shrink, but not below the minimums.
+
+		limits.availableMemory = 0
+		limits.update()
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), 1024**2 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 128000 - 127000 // 4 )
+
+		for i in range( 0, 100 ) :
+			limits.update()
+
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), 1024**2 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 1000 )
+
+	def testProcessMemoryLimit( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.setCacheMemoryLimit( 1024**3 )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 128000 )
+
+		limits = self.__TestLimits(
+			minimumCacheMemoryLimit = 1024**2, maximumCacheMemoryLimit = 1024**3,
+			minimumHashCacheSizeLimit = 1000, maximumHashCacheSizeLimit = 128000,
+			reservedMemory = 1024**3, processMemoryLimit = 2 * 1024**3
+		)
+
+		limits.availableMemory = 16 * 1024**3
+		limits.processMemory = 4 * 1024**3
+		limits.update()
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), 1024**2 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 128000 - 127000 // 4 )
+
+	def testGrowWithHeadroom( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "a" )
+		n["out"].getValue()
+		usage = Gaffer.ValuePlug.cacheMemoryUsage()
+		self.assertGreater( usage, 0 )
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( usage )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 1000 )
+
+		limits = self.__TestLimits(
+			minimumCacheMemoryLimit = 0, maximumCacheMemoryLimit = usage + 1024**2,
+			minimumHashCacheSizeLimit = 1000, maximumHashCacheSizeLimit = 128000,
+			reservedMemory = 1024**3
+		)
+
+		# Cache is full and we have plenty of headroom, so we should
+		# grow, but not beyond the maximums.
+
+		limits.availableMemory = 16 * 1024**3
+		limits.update()
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), usage + 1024**2 )
+		self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 1000 + 127000 // 4 )
+
+	def testNoChangeBetweenThresholds( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "a" )
+		n["out"].getValue()
+		usage = Gaffer.ValuePlug.cacheMemoryUsage()
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( usage )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( 64000 )
+
+		limits = self.__TestLimits(
+			minimumCacheMemoryLimit = 0, maximumCacheMemoryLimit = usage + 1024**3,
+			minimumHashCacheSizeLimit = 1000, maximumHashCacheSizeLimit = 128000,
+			reservedMemory = 1024**3
+		)
+
+		# Available memory is above the reserve, but below the threshold
+		# for growing, so the limits should be left alone, however full
+		# the cache is.
+
+		limits.availableMemory = int( 1.5 * 1024**3 )
+		for i in range( 0, 10 ) :
+			limits.update()
+			self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), usage )
+			self.assertEqual( Gaffer.ValuePlug.getHashCacheSizeLimit(), 64000 )
+
+		# Alternating between pressure and the neutral band should only
+		# ever shrink the hash cache, and by a fraction each time rather
+		# than halving it.
+
+		previous = 64000
+		for i in range( 0, 10 ) :
+			limits.availableMemory = 0 if i % 2 == 0 else int( 1.5 * 1024**3 )
+			limits.update()
+			current = Gaffer.ValuePlug.getHashCacheSizeLimit()
+			self.assertLessEqual( current, previous )
+			self.assertGreater( current, previous // 2 )
+			previous = current
+
+	def testDefaultMaximumIsConfiguredLimit( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		n = GafferTest.CachingTestNode()
+		n["in"].setValue( "a" )
+		n["out"].getValue()
+		usage = Gaffer.ValuePlug.cacheMemoryUsage()
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( usage )
+
+		# Without an explicit maximum, we shouldn't grow beyond
+		# the limit that was configured when we were constructed.
+
+		limits = self.__TestLimits( minimumCacheMemoryLimit = 0, reservedMemory = 1024**3 )
+		limits.availableMemory = 16 * 1024**3
+		limits.update()
+		self.assertEqual( Gaffer.ValuePlug.getCacheMemoryLimit(), usage )
+
+	def testStartStop( self ) :
+
+		limits = Gaffer.AdaptiveCacheLimits( interval = 0.01 )
+		self.assertFalse( limits.running() )
+
+		limits.start()
+		self.assertTrue( limits.running() )
+
+		limits.stop()
+		self.assertFalse( limits.running() )
+
+	def setUp( self ) :
+
+		GafferTest.TestCase.setUp( self )
+
+		self.__originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__originalHashCacheSizeLimit = Gaffer.ValuePlug.getHashCacheSizeLimit()
+
+	def tearDown( self ) :
+
+		GafferTest.TestCase.tearDown( self )
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		Gaffer.ValuePlug.setHashCacheSizeLimit( self.__originalHashCacheSizeLimit )
+
+if __name__ == "__main__":
+	unittest.main()
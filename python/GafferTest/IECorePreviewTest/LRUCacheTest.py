@@ -228,5 +228,17 @@ class LRUCacheTest( GafferTest.TestCase ) :
 			with self.subTest( policy = policy ) :
 				GafferTest.testLRUCacheSetIfUncached( policy )
 
+	def testCostAwareEviction( self ) :
+
+		for policy in [ "serial", "parallel", "taskParallel" ] :
+			with self.subTest( policy = policy ) :
+				GafferTest.testLRUCacheCostAwareEviction( policy )
+
+	def testStatistics( self ) :
+
+		for policy in [ "serial", "parallel", "taskParallel" ] :
+			with self.subTest( policy = policy ) :
+				GafferTest.testLRUCacheStatistics( policy )
+
 if __name__ == "__main__":
 	unittest.main()
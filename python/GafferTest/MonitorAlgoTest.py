@@ -98,5 +98,86 @@ class MonitorAlgoTest( GafferTest.TestCase ) :
 				[]
 			)
 
+	def testCriticalPath( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["b"] = Gaffer.Box()
+		s["b"]["n1"] = GafferTest.AddNode()
+		s["b"]["n2"] = GafferTest.AddNode()
+		s["b"]["n2"]["op1"].setInput( s["b"]["n1"]["sum"] )
+		s["n3"] = GafferTest.AddNode()
+		s["n3"]["op1"].setInput( s["b"]["n2"]["sum"] )
+		s["n4"] = GafferTest.AddNode()
+
+		# Without a timeline, there is no path.
+
+		with Gaffer.PerformanceMonitor() as m :
+			s["n3"]["sum"].getValue()
+
+		path = Gaffer.MonitorAlgo.criticalPath( m )
+		self.assertEqual( path.events, [] )
+		self.assertEqual( path.nodeDurations, {} )
+		self.assertEqual( Gaffer.MonitorAlgo.formatCriticalPath( m ), "" )
+
+		# With a timeline, the path runs through the whole chain.
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.clearHashCache()
+
+		with Gaffer.PerformanceMonitor( recordTimeline = True ) as m :
+			with Gaffer.Context() :
+				s["n3"]["sum"].getValue()
+
+		path = Gaffer.MonitorAlgo.criticalPath( m )
+		self.assertEqual(
+			{ e.plug.node() for e in path.events },
+			{ s["b"]["n1"], s["b"]["n2"], s["n3"] }
+		)
+		self.assertTrue( path.events[0].plug.isSame( s["n3"]["sum"] ) )
+		self.assertEqual(
+			[ e.startTime for e in path.events ],
+			sorted( e.startTime for e in path.events )
+		)
+
+		self.assertEqual( set( path.nodeDurations.keys() ), { s["b"]["n1"], s["b"]["n2"], s["n3"] } )
+		for node, durations in path.nodeDurations.items() :
+			self.assertTrue( durations.criticalPath )
+			self.assertLessEqual( durations.exclusiveDuration, durations.inclusiveDuration )
+
+		self.assertGreaterEqual( path.nodeDurations[s["n3"]].inclusiveDuration, path.nodeDurations[s["b"]["n2"]].inclusiveDuration )
+		self.assertGreaterEqual( path.nodeDurations[s["b"]["n2"]].inclusiveDuration, path.nodeDurations[s["b"]["n1"]].inclusiveDuration )
+
+		self.assertIn( "Critical Path", Gaffer.MonitorAlgo.formatCriticalPath( m ) )
+
+		# Nodes on the path, and the boxes containing them,
+		# are annotated.
+
+		Gaffer.MonitorAlgo.annotate( s, m )
+		for node in ( s["b"], s["b"]["n1"], s["b"]["n2"], s["n3"] ) :
+			self.assertTrue(
+				Gaffer.MetadataAlgo.getAnnotation( node, "performanceMonitor:criticalPath" ).text().startswith( "Critical path" )
+			)
+		self.assertIsNone( Gaffer.MetadataAlgo.getAnnotation( s["n4"], "performanceMonitor:criticalPath" ) )
+
+		# Annotating with a different path removes the stale annotations.
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.clearHashCache()
+
+		with Gaffer.PerformanceMonitor( recordTimeline = True ) as m2 :
+			s["n4"]["sum"].getValue()
+
+		Gaffer.MonitorAlgo.annotate( s, m2 )
+		self.assertIsNotNone( Gaffer.MetadataAlgo.getAnnotation( s["n4"], "performanceMonitor:criticalPath" ) )
+		for node in ( s["b"], s["b"]["n1"], s["b"]["n2"], s["n3"] ) :
+			self.assertIsNone( Gaffer.MetadataAlgo.getAnnotation( node, "performanceMonitor:criticalPath" ) )
+
+		Gaffer.MonitorAlgo.removePerformanceAnnotations( s )
+		for node in Gaffer.Node.RecursiveRange( s ) :
+			self.assertEqual(
+				Gaffer.Metadata.registeredValues( node, Gaffer.Metadata.RegistrationTypes.Instance ),
+				[]
+			)
+
 if __name__ == "__main__":
 	unittest.main()
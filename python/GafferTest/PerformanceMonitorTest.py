@@ -36,6 +36,7 @@
 
 import os
 import gc
+import json
 import time
 import unittest
 
@@ -249,5 +250,102 @@ class PerformanceMonitorTest( GafferTest.TestCase ) :
 		# to capture any.
 		self.assertEqual( len( m.allStatistics() ), 0 )
 
+	def testTimeline( self ) :
+
+		a1 = GafferTest.AddNode()
+		a2 = GafferTest.AddNode()
+		a2["op1"].setInput( a1["sum"] )
+		a1["op1"].setValue( 1 )
+		a2["op2"].setValue( 2 )
+
+		m = Gaffer.PerformanceMonitor()
+		self.assertFalse( m.getRecordTimeline() )
+		with m :
+			self.assertEqual( a2["sum"].getValue(), 3 )
+		self.assertEqual( m.timeline(), [] )
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.clearHashCache()
+
+		m = Gaffer.PerformanceMonitor( recordTimeline = True )
+		self.assertTrue( m.getRecordTimeline() )
+		with m :
+			with Gaffer.Context() as c :
+				c["test"] = 1
+				self.assertEqual( a2["sum"].getValue(), 3 )
+				contextHash = c.hash()
+
+		# One hash and one compute for each plug.
+		timeline = m.timeline()
+		self.assertEqual( len( timeline ), 4 )
+		self.assertEqual(
+			sorted( ( e.plug.fullName(), e.type ) for e in timeline ),
+			sorted( [
+				( a1["sum"].fullName(), "computeNode:hash" ),
+				( a1["sum"].fullName(), "computeNode:compute" ),
+				( a2["sum"].fullName(), "computeNode:hash" ),
+				( a2["sum"].fullName(), "computeNode:compute" ),
+			] )
+		)
+
+		events = { e.id : e for e in timeline }
+		self.assertEqual( len( events ), 4 )
+		for e in timeline :
+			self.assertEqual( e.contextHash, contextHash )
+			self.assertLessEqual( e.startTime, e.endTime )
+			if e.plug.isSame( a2["sum"] ) :
+				self.assertEqual( e.parentId, 0 )
+			else :
+				# Upstream processes are nested within the
+				# downstream process of the same type.
+				parent = events[e.parentId]
+				self.assertTrue( parent.plug.isSame( a2["sum"] ) )
+				self.assertEqual( parent.type, e.type )
+				self.assertGreaterEqual( e.startTime, parent.startTime )
+				self.assertLessEqual( e.endTime, parent.endTime )
+
+		self.assertEqual(
+			[ e.startTime for e in timeline ],
+			sorted( e.startTime for e in timeline )
+		)
+
+		trace = json.loads( Gaffer.MonitorAlgo.formatTimeline( m ) )
+		processEvents = [ e for e in trace["traceEvents"] if e["ph"] == "X" ]
+		self.assertEqual( len( processEvents ), 4 )
+		self.assertEqual(
+			{ e["cat"] for e in processEvents },
+			{ "hash", "compute" }
+		)
+		for e in processEvents :
+			self.assertEqual( e["args"]["nodeType"], "GafferTest::AddNode" )
+			self.assertEqual( e["args"]["context"], str( contextHash ) )
+
+		fileName = self.temporaryDirectory() / "timeline.json"
+		Gaffer.MonitorAlgo.saveTimeline( m, str( fileName ) )
+		with open( fileName, encoding = "utf-8" ) as f :
+			self.assertEqual( json.load( f ), trace )
+
+	def testMaxTimelineEvents( self ) :
+
+		n1 = GafferTest.AddNode()
+		n2 = GafferTest.AddNode()
+		n2["op1"].setInput( n1["sum"] )
+
+		self.assertEqual( Gaffer.PerformanceMonitor().getMaxTimelineEvents(), Gaffer.PerformanceMonitor( recordTimeline = True ).getMaxTimelineEvents() )
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.clearHashCache()
+
+		with Gaffer.PerformanceMonitor( recordTimeline = True, maxTimelineEvents = 2 ) as m :
+			n2["sum"].getValue()
+
+		self.assertEqual( m.getMaxTimelineEvents(), 2 )
+		self.assertEqual( len( m.timeline() ), 2 )
+		self.assertEqual( { e.id for e in m.timeline() }, { 1, 2 } )
+
+		# Statistics are still recorded in full.
+		self.assertEqual( m.plugStatistics( n1["sum"] ).computeCount, 1 )
+		self.assertEqual( m.plugStatistics( n2["sum"] ).computeCount, 1 )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -35,6 +35,7 @@
 ##########################################################################
 
 import re
+import json
 import unittest
 import os
 import subprocess
@@ -70,5 +71,39 @@ class StatsApplicationTest( GafferTest.TestCase ) :
 		self.assertTrue( re.search( r"Box\s*1", o ) )
 		self.assertTrue( re.search( r"Total\s*3", o ) )
 
+	def testCacheStatistics( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["n"] = GafferTest.AddNode()
+		script["fileName"].setValue( self.temporaryDirectory() / "script.gfr" )
+		script.save()
+
+		o = subprocess.check_output( [ str( Gaffer.executablePath() ), "stats", script["fileName"].getValue() ], universal_newlines = True )
+		self.assertNotIn( "Cache :", o )
+
+		o = subprocess.check_output( [ str( Gaffer.executablePath() ), "stats", script["fileName"].getValue(), "-cacheStatistics" ], universal_newlines = True )
+		self.assertIn( "Cache :", o )
+		self.assertTrue( re.search( r"Hits\s*[0-9]+", o ) )
+		self.assertTrue( re.search( r"Misses\s*[0-9]+", o ) )
+		self.assertTrue( re.search( r"Evictions\s*[0-9]+", o ) )
+
+	def testPerformanceTimeline( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["n"] = GafferTest.AddNode()
+		script["fileName"].setValue( self.temporaryDirectory() / "script.gfr" )
+		script.save()
+
+		timelineFileName = self.temporaryDirectory() / "timeline.json"
+		o = subprocess.check_output(
+			[ str( Gaffer.executablePath() ), "stats", script["fileName"].getValue(), "-performanceTimeline", str( timelineFileName ) ],
+			universal_newlines = True
+		)
+
+		# Timeline implies the performance monitor.
+		self.assertIn( "PerformanceMonitor Summary", o )
+		with open( timelineFileName, encoding = "utf-8" ) as f :
+			self.assertIn( "traceEvents", json.load( f ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -1067,17 +1067,235 @@ class ValuePlugTest( GafferTest.TestCase ) :
 					node["in"].setValue( i )
 					self.assertEqual( node["out"].getValue(), i )
 
+	def testPersistentCache( self ) :
+
+		class PersistentAddNode( GafferTest.AddNode ) :
+
+			def computeCachePolicy( self, plug ) :
+
+				return Gaffer.ValuePlug.CachePolicy.Persistent
+
+		IECore.registerRunTimeTyped( PersistentAddNode )
+
+		node = PersistentAddNode()
+		node["op1"].setValue( 1 )
+		node["op2"].setValue( 2 )
+
+		# Persistent cache is disabled by default, so we behave just like
+		# `TaskCollaboration`.
+
+		self.assertEqual( node["sum"].getValue(), 3 )
+		self.assertEqual( node.numComputeCalls, 1 )
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( node["sum"].getValue(), 3 )
+		self.assertEqual( node.numComputeCalls, 2 )
+
+		# When enabled, results should survive the clearing of the
+		# in-memory cache.
+
+		Gaffer.ValuePlug.setPersistentCacheDirectory( str( self.temporaryDirectory() / "persistentCache" ) )
+		self.assertEqual( Gaffer.ValuePlug.getPersistentCacheDirectory(), str( self.temporaryDirectory() / "persistentCache" ) )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( node["sum"].getValue(), 3 )
+		self.assertEqual( node.numComputeCalls, 3 )
+		self.assertGreater( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( node["sum"].getValue(), 3 )
+		self.assertEqual( node.numComputeCalls, 3 )
+
+		# Unless we clear the persistent cache too.
+
+		Gaffer.ValuePlug.clearPersistentCache()
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( node["sum"].getValue(), 3 )
+		self.assertEqual( node.numComputeCalls, 4 )
+
+		# Reducing the size limit should evict entries.
+
+		self.assertGreater( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+		Gaffer.ValuePlug.setPersistentCacheSizeLimit( 0 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+
+		# Nodes using other policies should not use the persistent cache.
+
+		Gaffer.ValuePlug.setPersistentCacheSizeLimit( self.__originalPersistentCacheSizeLimit )
+		add = GafferTest.AddNode()
+		add["op1"].setValue( 3 )
+		self.assertEqual( add["sum"].getValue(), 3 )
+		self.assertEqual( Gaffer.ValuePlug.persistentCacheUsage(), 0 )
+
+	def testCacheStatistics( self ) :
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.resetCacheStatistics()
+
+		statistics = Gaffer.ValuePlug.cacheStatistics()
+		self.assertEqual( statistics.hits, 0 )
+		self.assertEqual( statistics.misses, 0 )
+		self.assertEqual( statistics.evictions, 0 )
+
+		node = GafferTest.AddNode()
+		node["op1"].setValue( 1 )
+		node["op2"].setValue( 2 )
+
+		self.assertEqual( node["sum"].getValue(), 3 )
+		statistics = Gaffer.ValuePlug.cacheStatistics()
+		self.assertEqual( statistics.hits, 0 )
+		self.assertGreater( statistics.misses, 0 )
+
+		self.assertEqual( node["sum"].getValue(), 3 )
+		statistics2 = Gaffer.ValuePlug.cacheStatistics()
+		self.assertEqual( statistics2.hits, 1 )
+		self.assertEqual( statistics2.misses, statistics.misses )
+
+		# Clearing isn't eviction, but reducing the limit is.
+
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		self.assertGreater( Gaffer.ValuePlug.cacheStatistics().evictions, 0 )
+
+		Gaffer.ValuePlug.resetCacheStatistics()
+		self.assertEqual( Gaffer.ValuePlug.cacheStatistics().evictions, 0 )
+
+	def testCacheStatisticsWithTaskCollaboration( self ) :
+
+		class TaskCollaborationAddNode( GafferTest.AddNode ) :
+
+			def computeCachePolicy( self, plug ) :
+
+				return Gaffer.ValuePlug.CachePolicy.TaskCollaboration
+
+		IECore.registerRunTimeTyped( TaskCollaborationAddNode )
+
+		node = TaskCollaborationAddNode()
+		node["op1"].setValue( 1 )
+		node["op2"].setValue( 2 )
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.resetCacheStatistics()
+
+		# Each lookup should be counted exactly once, even though a miss
+		# causes the cache to be checked again before the compute starts.
+
+		self.assertEqual( node["sum"].getValue(), 3 )
+		statistics = Gaffer.ValuePlug.cacheStatistics()
+		self.assertEqual( statistics.hits, 0 )
+		self.assertEqual( statistics.misses, 1 )
+
+		self.assertEqual( node["sum"].getValue(), 3 )
+		statistics = Gaffer.ValuePlug.cacheStatistics()
+		self.assertEqual( statistics.hits, 1 )
+		self.assertEqual( statistics.misses, 1 )
+
+	def testCacheEvictionPolicy( self ) :
+
+		self.assertEqual( Gaffer.ValuePlug.getCacheEvictionPolicy(), Gaffer.ValuePlug.CacheEvictionPolicy.LeastRecentlyUsed )
+
+		node = GafferTest.AddNode()
+		node["sum"].getValue()
+		node["sum"].getValue()
+		self.assertGreater( Gaffer.ValuePlug.cacheStatistics().hits, 0 )
+
+		# Changing policy resets the statistics, so they can be
+		# used to compare policies.
+
+		Gaffer.ValuePlug.setCacheEvictionPolicy( Gaffer.ValuePlug.CacheEvictionPolicy.CostAware )
+		self.assertEqual( Gaffer.ValuePlug.getCacheEvictionPolicy(), Gaffer.ValuePlug.CacheEvictionPolicy.CostAware )
+		self.assertEqual( Gaffer.ValuePlug.cacheStatistics().hits, 0 )
+
+		# Computes and cache lookups should behave as before.
+
+		Gaffer.ValuePlug.clearCache()
+		node["op1"].setValue( 10 )
+		self.assertEqual( node["sum"].getValue(), 10 )
+		self.assertEqual( node["sum"].getValue(), 10 )
+		self.assertEqual( Gaffer.ValuePlug.cacheStatistics().hits, 1 )
+
+	def testPlugCacheStatistics( self ) :
+
+		self.assertFalse( Gaffer.ValuePlug.getCacheIntrospectionEnabled() )
+
+		Gaffer.ValuePlug.clearCache()
+		Gaffer.ValuePlug.clearHashCache( now = True )
+		Gaffer.ValuePlug.resetPlugCacheStatistics()
+
+		node = GafferTest.AddNode()
+		node["op1"].setValue( 1 )
+		node["sum"].getValue()
+
+		# Nothing recorded while disabled.
+
+		self.assertEqual(
+			[ s for s in Gaffer.ValuePlug.plugCacheStatistics() if s.nodeType == "GafferTest::AddNode" and s.computeCache.hits + s.computeCache.misses ],
+			[]
+		)
+
+		Gaffer.ValuePlug.setCacheIntrospectionEnabled( True )
+		self.assertTrue( Gaffer.ValuePlug.getCacheIntrospectionEnabled() )
+
+		node["op1"].setValue( 2 )
+		self.assertEqual( node["sum"].getValue(), 2 )
+		self.assertEqual( node["sum"].getValue(), 2 )
+
+		def addNodeStatistics() :
+
+			s = [ x for x in Gaffer.ValuePlug.plugCacheStatistics() if x.nodeType == "GafferTest::AddNode" and x.plugName == "sum" ]
+			self.assertEqual( len( s ), 1 )
+			return s[0]
+
+		s = addNodeStatistics()
+		self.assertEqual( s.computeCache.hits, 1 )
+		self.assertEqual( s.computeCache.misses, 1 )
+		self.assertEqual( s.computeCache.evictions, 0 )
+		self.assertGreater( s.computeCache.memoryUsage, 0 )
+		self.assertEqual( s.hashCache.hits, 1 )
+		self.assertEqual( s.hashCache.misses, 1 )
+
+		# Clearing the cache releases memory, but isn't counted as eviction.
+
+		Gaffer.ValuePlug.clearCache()
+		s = addNodeStatistics()
+		self.assertEqual( s.computeCache.memoryUsage, 0 )
+		self.assertEqual( s.computeCache.evictions, 0 )
+
+		# Reducing the memory limit evicts.
+
+		node["sum"].getValue()
+		self.assertGreater( addNodeStatistics().computeCache.memoryUsage, 0 )
+		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+		s = addNodeStatistics()
+		self.assertEqual( s.computeCache.memoryUsage, 0 )
+		self.assertEqual( s.computeCache.evictions, 1 )
+
+		Gaffer.ValuePlug.resetPlugCacheStatistics()
+		s = addNodeStatistics()
+		self.assertEqual( s.computeCache.hits, 0 )
+		self.assertEqual( s.computeCache.misses, 0 )
+		self.assertEqual( s.computeCache.evictions, 0 )
+		self.assertEqual( s.hashCache.hits, 0 )
+
 	def setUp( self ) :
 
 		GafferTest.TestCase.setUp( self )
 
 		self.__originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.__originalCacheEvictionPolicy = Gaffer.ValuePlug.getCacheEvictionPolicy()
+		self.__originalCacheIntrospectionEnabled = Gaffer.ValuePlug.getCacheIntrospectionEnabled()
+		self.__originalPersistentCacheDirectory = Gaffer.ValuePlug.getPersistentCacheDirectory()
+		self.__originalPersistentCacheSizeLimit = Gaffer.ValuePlug.getPersistentCacheSizeLimit()
 
 	def tearDown( self ) :
 
 		GafferTest.TestCase.tearDown( self )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		Gaffer.ValuePlug.setCacheEvictionPolicy( self.__originalCacheEvictionPolicy )
+		Gaffer.ValuePlug.setCacheIntrospectionEnabled( self.__originalCacheIntrospectionEnabled )
+		Gaffer.ValuePlug.setPersistentCacheDirectory( self.__originalPersistentCacheDirectory )
+		Gaffer.ValuePlug.setPersistentCacheSizeLimit( self.__originalPersistentCacheSizeLimit )
 
 if __name__ == "__main__":
 	unittest.main()
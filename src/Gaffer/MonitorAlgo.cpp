@@ -42,11 +42,18 @@
 #include "Gaffer/PerformanceMonitor.h"
 #include "Gaffer/Plug.h"
 
+#include "IECore/Exception.h"
 #include "IECore/SimpleTypedData.h"
 
 #include "boost/lexical_cast.hpp"
 
+#include "fmt/format.h"
+
+#include <fstream>
 #include <iomanip>
+#include <numeric>
+#include <set>
+#include <unordered_map>
 
 using namespace Imath;
 using namespace IECore;
@@ -232,6 +239,7 @@ std::invoke_result_t<F, const HashCountMetric &> dispatchMetric( const F &f, Mon
 }
 
 const std::string g_contextAnnotationName = "contextMonitor";
+const std::string g_criticalPathAnnotationName = "performanceMonitor:criticalPath";
 
 struct AnnotationRegistrations
 {
@@ -259,11 +267,26 @@ struct AnnotationRegistrations
 			MetadataAlgo::Annotation( "" ),
 			/* user = */ false
 		);
+
+		MetadataAlgo::addAnnotationTemplate(
+			g_criticalPathAnnotationName,
+			MetadataAlgo::Annotation( "" ),
+			/* user = */ false
+		);
 	}
 };
 
 const AnnotationRegistrations g_annotationRegistrations;
 
+void removeCriticalPathAnnotations( Node &root )
+{
+	MetadataAlgo::removeAnnotation( &root, g_criticalPathAnnotationName );
+	for( const auto &node : Node::Range( root ) )
+	{
+		removeCriticalPathAnnotations( *node );
+	}
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -567,6 +590,235 @@ ContextMonitor::Statistics annotateContextWalk( Node &node, const ContextMonitor
 
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// Timeline output
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const IECore::InternedString g_hashType( "computeNode:hash" );
+
+std::string jsonString( const std::string &s )
+{
+	std::string result = "\"";
+	for( char c : s )
+	{
+		switch( c )
+		{
+			case '"' : result += "\\\""; break;
+			case '\\' : result += "\\\\"; break;
+			case '\n' : result += "\\n"; break;
+			case '\t' : result += "\\t"; break;
+			default :
+				if( static_cast<unsigned char>( c ) < 0x20 )
+				{
+					result += fmt::format( "\\u{:04x}", static_cast<int>( c ) );
+				}
+				else
+				{
+					result += c;
+				}
+		}
+	}
+	result += "\"";
+	return result;
+}
+
+// Trace timestamps are specified in microseconds.
+double microseconds( boost::chrono::nanoseconds d )
+{
+	return static_cast<double>( d.count() ) / 1000.0;
+}
+
+void writeTimeline( const PerformanceMonitor::Timeline &timeline, std::ostream &os )
+{
+	std::unordered_map<size_t, const PerformanceMonitor::Event *> eventsById;
+	std::set<int> threadIds;
+	for( const auto &event : timeline )
+	{
+		eventsById[event.id] = &event;
+		threadIds.insert( event.threadId );
+	}
+
+	os << std::fixed << std::setprecision( 3 );
+	os << "{\n\"displayTimeUnit\" : \"ns\",\n\"traceEvents\" : [\n";
+
+	os << "{ \"name\" : \"process_name\", \"ph\" : \"M\", \"pid\" : 1, \"args\" : { \"name\" : \"Gaffer\" } }";
+	for( int threadId : threadIds )
+	{
+		os << ",\n{ \"name\" : \"thread_name\", \"ph\" : \"M\", \"pid\" : 1, \"tid\" : " << threadId;
+		os << ", \"args\" : { \"name\" : \"Thread " << threadId << "\" } }";
+	}
+
+	for( const auto &event : timeline )
+	{
+		const Node *node = event.plug->node();
+		const std::string plugName = event.plug->relativeName( event.plug->ancestor( (IECore::TypeId)ScriptNodeTypeId ) );
+		const bool hash = event.type == g_hashType;
+
+		os << ",\n{ \"name\" : " << jsonString( plugName );
+		os << ", \"cat\" : \"" << ( hash ? "hash" : "compute" ) << "\"";
+		os << ", \"ph\" : \"X\", \"pid\" : 1, \"tid\" : " << event.threadId;
+		os << ", \"ts\" : " << microseconds( event.startTime );
+		os << ", \"dur\" : " << microseconds( event.endTime - event.startTime );
+		os << ", \"args\" : { \"nodeType\" : " << jsonString( node ? node->typeName() : "" );
+		os << ", \"context\" : \"" << event.contextHash.toString() << "\"";
+		os << ", \"id\" : " << event.id << ", \"parent\" : " << event.parentId << " } }";
+
+		// Connect processes to parents on other threads using flow
+		// events. These show the handoff of work between threads,
+		// and in particular, waits on collaborative tasks.
+		auto parentIt = eventsById.find( event.parentId );
+		if( parentIt != eventsById.end() && parentIt->second->threadId != event.threadId )
+		{
+			os << ",\n{ \"name\" : \"parent\", \"cat\" : \"flow\", \"ph\" : \"s\", \"id\" : " << event.id;
+			os << ", \"pid\" : 1, \"tid\" : " << parentIt->second->threadId;
+			os << ", \"ts\" : " << microseconds( event.startTime ) << " }";
+			os << ",\n{ \"name\" : \"parent\", \"cat\" : \"flow\", \"ph\" : \"f\", \"bp\" : \"e\", \"id\" : " << event.id;
+			os << ", \"pid\" : 1, \"tid\" : " << event.threadId;
+			os << ", \"ts\" : " << microseconds( event.startTime ) << " }";
+		}
+	}
+
+	os << "\n]\n}\n";
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Critical path analysis
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// The process tree for a timeline, with events referred to by their
+// index in the timeline.
+struct ProcessTree
+{
+
+	ProcessTree( const PerformanceMonitor::Timeline &timeline )
+		:	timeline( timeline ), children( timeline.size() ), exclusiveDurations( timeline.size() )
+	{
+		std::unordered_map<size_t, size_t> indices;
+		for( size_t i = 0; i < timeline.size(); ++i )
+		{
+			indices[timeline[i].id] = i;
+		}
+
+		// The timeline is sorted by start time, so children
+		// will also be sorted by start time.
+		for( size_t i = 0; i < timeline.size(); ++i )
+		{
+			auto it = indices.find( timeline[i].parentId );
+			if( it != indices.end() )
+			{
+				children[it->second].push_back( i );
+			}
+			else
+			{
+				roots.push_back( i );
+			}
+		}
+
+		for( size_t i = 0; i < timeline.size(); ++i )
+		{
+			exclusiveDurations[i] = exclusiveDuration( i );
+		}
+	}
+
+	const PerformanceMonitor::Timeline &timeline;
+	std::vector<std::vector<size_t>> children;
+	std::vector<size_t> roots;
+	std::vector<boost::chrono::nanoseconds> exclusiveDurations;
+
+	private :
+
+		// The duration of the event, minus the union of the
+		// intervals covered by its children. Children may run
+		// concurrently on other threads, so may overlap each other.
+		boost::chrono::nanoseconds exclusiveDuration( size_t index ) const
+		{
+			const PerformanceMonitor::Event &event = timeline[index];
+			boost::chrono::nanoseconds result = event.endTime - event.startTime;
+			boost::chrono::nanoseconds coveredUntil = event.startTime;
+			for( size_t c : children[index] )
+			{
+				const PerformanceMonitor::Event &child = timeline[c];
+				const auto start = std::max( child.startTime, coveredUntil );
+				const auto end = std::min( child.endTime, event.endTime );
+				if( end > start )
+				{
+					result -= end - start;
+					coveredUntil = end;
+				}
+			}
+			return result;
+		}
+
+};
+
+void traceCriticalPath( const ProcessTree &tree, size_t index, std::vector<size_t> &path )
+{
+	path.push_back( index );
+
+	std::vector<size_t> children = tree.children[index];
+	std::sort(
+		children.begin(), children.end(),
+		[&tree] ( size_t a, size_t b ) { return tree.timeline[a].endTime > tree.timeline[b].endTime; }
+	);
+
+	// Walk backwards in time from the end of the event, each time
+	// following the child that the event was last waiting for.
+	boost::chrono::nanoseconds time = tree.timeline[index].endTime;
+	for( size_t c : children )
+	{
+		if( tree.timeline[c].endTime <= time )
+		{
+			traceCriticalPath( tree, c, path );
+			time = tree.timeline[c].startTime;
+		}
+	}
+}
+
+void accumulateNodeDurations( const ProcessTree &tree, size_t index, MonitorAlgo::CriticalPath::NodeDurationsMap &nodeDurations, std::unordered_map<const Node *, int> &activeNodes )
+{
+	const PerformanceMonitor::Event &event = tree.timeline[index];
+	const Node *node = event.plug->node();
+	if( !node )
+	{
+		for( size_t c : tree.children[index] )
+		{
+			accumulateNodeDurations( tree, c, nodeDurations, activeNodes );
+		}
+		return;
+	}
+
+	MonitorAlgo::NodeDurations &durations = nodeDurations[node];
+	durations.exclusiveDuration += tree.exclusiveDurations[index];
+
+	int &active = activeNodes[node];
+	if( !active )
+	{
+		durations.inclusiveDuration += event.endTime - event.startTime;
+	}
+
+	active++;
+	for( size_t c : tree.children[index] )
+	{
+		accumulateNodeDurations( tree, c, nodeDurations, activeNodes );
+	}
+	activeNodes[node]--;
+}
+
+std::string nodeName( const Node *node )
+{
+	return node->relativeName( node->ancestor( (IECore::TypeId)ScriptNodeTypeId ) );
+}
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // Implementation of public functions
 //////////////////////////////////////////////////////////////////////////
@@ -615,12 +867,166 @@ std::string formatStatistics( const PerformanceMonitor &monitor, PerformanceMetr
 	return dispatchMetric<FormatStatistics>( FormatStatistics( monitor.allStatistics(), maxLines ), metric );
 }
 
+std::string formatTimeline( const PerformanceMonitor &monitor )
+{
+	std::stringstream ss;
+	writeTimeline( monitor.timeline(), ss );
+	return ss.str();
+}
+
+void saveTimeline( const PerformanceMonitor &monitor, const std::string &fileName )
+{
+	std::ofstream f( fileName );
+	if( !f.good() )
+	{
+		throw IECore::IOException( "Unable to open file \"" + fileName + "\"" );
+	}
+
+	writeTimeline( monitor.timeline(), f );
+
+	if( !f.good() )
+	{
+		throw IECore::IOException( "Failed to write to \"" + fileName + "\"" );
+	}
+}
+
+CriticalPath criticalPath( const PerformanceMonitor &monitor )
+{
+	CriticalPath result;
+
+	const PerformanceMonitor::Timeline &timeline = monitor.timeline();
+	if( timeline.empty() )
+	{
+		return result;
+	}
+
+	const ProcessTree tree( timeline );
+
+	std::unordered_map<const Node *, int> activeNodes;
+	for( size_t r : tree.roots )
+	{
+		accumulateNodeDurations( tree, r, result.nodeDurations, activeNodes );
+	}
+
+	const size_t longestRoot = *std::max_element(
+		tree.roots.begin(), tree.roots.end(),
+		[&timeline] ( size_t a, size_t b ) {
+			return timeline[a].endTime - timeline[a].startTime < timeline[b].endTime - timeline[b].startTime;
+		}
+	);
+
+	std::vector<size_t> path;
+	traceCriticalPath( tree, longestRoot, path );
+	// Trace order is already sorted by start time for the events at each
+	// level of nesting, but not across levels.
+	std::sort( path.begin(), path.end() );
+
+	for( size_t i : path )
+	{
+		const PerformanceMonitor::Event &event = timeline[i];
+		result.events.push_back( event );
+		if( const Node *node = event.plug->node() )
+		{
+			result.nodeDurations[node].criticalPath = true;
+		}
+	}
+
+	return result;
+}
+
+std::string formatCriticalPath( const PerformanceMonitor &monitor, size_t maxLines )
+{
+	const CriticalPath path = criticalPath( monitor );
+	if( path.events.empty() )
+	{
+		return "";
+	}
+
+	// The events on the path form a tree of their own, in which the
+	// exclusive duration of each event is the time it contributes to
+	// the path.
+	const ProcessTree tree( path.events );
+	const PerformanceMonitor::Event &root = path.events[tree.roots.front()];
+
+	std::stringstream ss;
+
+	ss << "Critical Path :\n\n";
+	std::vector<std::string> names = { "Duration", "Processes" };
+	std::vector<std::string> values = {
+		boost::lexical_cast<std::string>( boost::chrono::duration<double>( root.endTime - root.startTime ) ),
+		std::to_string( path.events.size() )
+	};
+	outputItems( names, values, ss );
+
+	// Show the longest steps on the path.
+
+	std::vector<size_t> steps( path.events.size() );
+	std::iota( steps.begin(), steps.end(), 0 );
+	std::stable_sort(
+		steps.begin(), steps.end(),
+		[&tree] ( size_t a, size_t b ) { return tree.exclusiveDurations[a] > tree.exclusiveDurations[b]; }
+	);
+	steps.resize( std::min( steps.size(), maxLines ) );
+
+	names.clear();
+	std::vector<boost::chrono::duration<double>> durations;
+	for( size_t i : steps )
+	{
+		const PerformanceMonitor::Event &event = path.events[i];
+		names.push_back(
+			event.plug->relativeName( event.plug->ancestor( (IECore::TypeId)ScriptNodeTypeId ) ) +
+			( event.type == g_hashType ? " (hash)" : " (compute)" )
+		);
+		durations.push_back( tree.exclusiveDurations[i] );
+	}
+
+	ss << "\nTop " << names.size() << " processes by time on critical path :\n\n";
+	outputItems( names, durations, ss );
+
+	// And the per-node durations.
+
+	using NodeAndDurations = std::pair<const Node *, NodeDurations>;
+	std::vector<NodeAndDurations> nodes;
+	for( const auto &d : path.nodeDurations )
+	{
+		nodes.push_back( NodeAndDurations( d.first.get(), d.second ) );
+	}
+
+	for( int inclusive = 0; inclusive < 2; ++inclusive )
+	{
+		std::stable_sort(
+			nodes.begin(), nodes.end(),
+			[inclusive] ( const NodeAndDurations &a, const NodeAndDurations &b ) {
+				return inclusive ? a.second.inclusiveDuration > b.second.inclusiveDuration : a.second.exclusiveDuration > b.second.exclusiveDuration;
+			}
+		);
+
+		names.clear();
+		durations.clear();
+		for( size_t i = 0; i < nodes.size() && i < maxLines; ++i )
+		{
+			names.push_back( nodeName( nodes[i].first ) + ( nodes[i].second.criticalPath ? " *" : "" ) );
+			durations.push_back( inclusive ? nodes[i].second.inclusiveDuration : nodes[i].second.exclusiveDuration );
+		}
+
+		ss << "\nTop " << names.size() << " nodes by " << ( inclusive ? "inclusive" : "exclusive" ) << " time (* denotes critical path) :\n\n";
+		outputItems( names, durations, ss );
+	}
+
+	return ss.str();
+}
+
 void annotate( Node &root, const PerformanceMonitor &monitor, bool persistent )
 {
 	for( int m = First; m <= Last; ++m )
 	{
 		annotate( root, monitor, static_cast<PerformanceMetric>( m ), persistent );
 	}
+
+	if( monitor.getRecordTimeline() )
+	{
+		annotateCriticalPath( root, monitor, persistent );
+	}
 }
 
 void annotate( Node &root, const PerformanceMonitor &monitor, PerformanceMetric metric, bool persistent )
@@ -633,8 +1039,54 @@ void annotate( Node &root, const ContextMonitor &monitor, bool persistent )
 	annotateContextWalk( root, monitor.allStatistics(), persistent );
 }
 
+void annotateCriticalPath( Node &root, const PerformanceMonitor &monitor, bool persistent )
+{
+	const CriticalPath path = criticalPath( monitor );
+
+	// Remove annotations from any previous path, so that they don't
+	// linger on nodes which are no longer on it.
+	removeCriticalPathAnnotations( root );
+
+	// Nodes on the path may be inside boxes, so we also annotate
+	// their ancestors to lead the user to them.
+	boost::unordered_map<Node *, boost::chrono::nanoseconds> annotatedNodes;
+	for( const auto &event : path.events )
+	{
+		const Node *node = event.plug->node();
+		if( !node || !root.isAncestorOf( node ) )
+		{
+			continue;
+		}
+		const NodeDurations &durations = path.nodeDurations.at( node );
+		for( Node *n = const_cast<Node *>( node ); n && n != &root; n = n->parent<Node>() )
+		{
+			annotatedNodes.insert( { n, boost::chrono::nanoseconds( 0 ) } );
+		}
+		annotatedNodes[const_cast<Node *>( node )] = durations.exclusiveDuration;
+	}
+
+	for( const auto &[node, exclusiveDuration] : annotatedNodes )
+	{
+		std::string text = "Critical path";
+		if( exclusiveDuration.count() )
+		{
+			text += "\n\nExclusive time : " + boost::lexical_cast<std::string>( boost::chrono::duration<double>( exclusiveDuration ) );
+			text += "\nInclusive time : " + boost::lexical_cast<std::string>( boost::chrono::duration<double>( path.nodeDurations.at( node ).inclusiveDuration ) );
+		}
+
+		MetadataAlgo::addAnnotation(
+			node,
+			g_criticalPathAnnotationName,
+			MetadataAlgo::Annotation( text, Color3f( 0.75, 0.1, 0.1 ) ),
+			persistent
+		);
+	}
+}
+
 void removePerformanceAnnotations( Node &root )
 {
+	MetadataAlgo::removeAnnotation( &root, g_criticalPathAnnotationName );
+
 	for( int m = Gaffer::MonitorAlgo::First; m <= Gaffer::MonitorAlgo::Last; ++m )
 	{
 		dispatchMetric(
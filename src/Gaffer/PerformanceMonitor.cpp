@@ -38,12 +38,19 @@
 
 #include "Gaffer/Plug.h"
 #include "Gaffer/Process.h"
+#include "Gaffer/ThreadMonitor.h"
+
+#include <algorithm>
+#include <limits>
 
 using namespace Gaffer;
 
 static IECore::InternedString g_hashType( "computeNode:hash" );
 static IECore::InternedString g_computeType( "computeNode:compute" );
 static PerformanceMonitor::Statistics g_emptyStatistics;
+// Placeholder in `ThreadData::eventStack` for processes that were not
+// recorded because `maxTimelineEvents` was exceeded.
+static const size_t g_unrecordedEvent = std::numeric_limits<size_t>::max();
 
 //////////////////////////////////////////////////////////////////////////
 // PerformanceMonitor::Statistics
@@ -82,7 +89,8 @@ bool PerformanceMonitor::Statistics::operator != ( const Statistics &rhs )
 // PerformanceMonitor
 //////////////////////////////////////////////////////////////////////////
 
-PerformanceMonitor::PerformanceMonitor()
+PerformanceMonitor::PerformanceMonitor( bool recordTimeline, size_t maxTimelineEvents )
+	:	m_recordTimeline( recordTimeline ), m_maxTimelineEvents( maxTimelineEvents ), m_startTime( boost::chrono::high_resolution_clock::now() ), m_nextEventId( 1 )
 {
 }
 
@@ -113,6 +121,21 @@ const PerformanceMonitor::Statistics &PerformanceMonitor::combinedStatistics() c
 	return m_combinedStatistics;
 }
 
+bool PerformanceMonitor::getRecordTimeline() const
+{
+	return m_recordTimeline;
+}
+
+size_t PerformanceMonitor::getMaxTimelineEvents() const
+{
+	return m_maxTimelineEvents;
+}
+
+const PerformanceMonitor::Timeline &PerformanceMonitor::timeline() const
+{
+	collate();
+	return m_timeline;
+}
 
 void PerformanceMonitor::processStarted( const Process *process )
 {
@@ -142,6 +165,45 @@ void PerformanceMonitor::processStarted( const Process *process )
 		s.computeCount++;
 		threadData.durationStack.push( &s.computeDuration );
 	}
+
+	if( !m_recordTimeline )
+	{
+		return;
+	}
+
+	const size_t id = m_nextEventId++;
+	if( id > m_maxTimelineEvents )
+	{
+		// Over the limit. We still need an entry on the stack
+		// to be popped by `processFinished()`.
+		threadData.eventStack.push( g_unrecordedEvent );
+		return;
+	}
+
+	Event event;
+	event.type = type;
+	event.plug = process->plug();
+	event.contextHash = process->context()->hash();
+	event.threadId = ThreadMonitor::thisThreadId();
+	event.id = id;
+	event.parentId = 0;
+	// The immediate parent may be a process we don't record, so
+	// search upwards for the first ancestor that we know about.
+	for( const Process *parent = process->parent(); parent; parent = parent->parent() )
+	{
+		RunningEvents::const_accessor accessor;
+		if( m_runningEvents.find( accessor, parent ) )
+		{
+			event.parentId = accessor->second;
+			break;
+		}
+	}
+	event.startTime = now - m_startTime;
+	event.endTime = event.startTime;
+
+	m_runningEvents.insert( RunningEvents::value_type( process, event.id ) );
+	threadData.eventStack.push( threadData.events.size() );
+	threadData.events.push_back( event );
 }
 
 void PerformanceMonitor::processFinished( const Process *process )
@@ -157,10 +219,26 @@ void PerformanceMonitor::processFinished( const Process *process )
 	*(threadData.durationStack.top()) += now - threadData.then;
 	threadData.durationStack.pop();
 	threadData.then = now;
+
+	if( !m_recordTimeline )
+	{
+		return;
+	}
+
+	const size_t eventIndex = threadData.eventStack.top();
+	threadData.eventStack.pop();
+	if( eventIndex == g_unrecordedEvent )
+	{
+		return;
+	}
+
+	threadData.events[eventIndex].endTime = now - m_startTime;
+	m_runningEvents.erase( process );
 }
 
 void PerformanceMonitor::collate() const
 {
+	bool newEvents = false;
 	tbb::enumerable_thread_specific<ThreadData, tbb::cache_aligned_allocator<ThreadData>, tbb::ets_key_per_instance>::iterator it, eIt;
 	for( it = m_threadData.begin(), eIt = m_threadData.end(); it != eIt; ++it )
 	{
@@ -171,5 +249,22 @@ void PerformanceMonitor::collate() const
 			m_combinedStatistics += mIt->second;
 		}
 		m.clear();
+
+		// Events are only transferred when none are still running,
+		// because `eventStack` holds indices into `events`.
+		if( !it->events.empty() && it->eventStack.empty() )
+		{
+			m_timeline.insert( m_timeline.end(), it->events.begin(), it->events.end() );
+			it->events.clear();
+			newEvents = true;
+		}
+	}
+
+	if( newEvents )
+	{
+		std::stable_sort(
+			m_timeline.begin(), m_timeline.end(),
+			[] ( const Event &a, const Event &b ) { return a.startTime < b.startTime; }
+		);
 	}
 }
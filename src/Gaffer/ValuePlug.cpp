@@ -43,15 +43,24 @@
 #include "Gaffer/Private/IECorePreview/LRUCache.h"
 #include "Gaffer/Process.h"
 
+#include "IECore/FileIndexedIO.h"
 #include "IECore/MessageHandler.h"
 
 #include "boost/bind/bind.hpp"
+#include "boost/functional/hash.hpp"
 
+#include "tbb/concurrent_hash_map.h"
 #include "tbb/enumerable_thread_specific.h"
+#include "tbb/spin_rw_mutex.h"
 
 #include "fmt/format.h"
 
 #include <atomic>
+#include <chrono>
+#include <filesystem>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
 #include <unordered_set>
 
 using namespace Gaffer;
@@ -174,6 +183,168 @@ ValuePlug::HashCacheMode defaultHashCacheMode()
 	return ValuePlug::HashCacheMode::Standard;
 }
 
+//////////////////////////////////////////////////////////////////////////
+// CacheIntrospection. This records cache statistics per plug, keyed by
+// node type and plug name so that the statistics remain meaningful after
+// the plugs themselves have been destroyed.
+//////////////////////////////////////////////////////////////////////////
+
+class CacheIntrospection
+{
+
+	public :
+
+		CacheIntrospection()
+			:	m_enabled( false )
+		{
+		}
+
+		bool enabled() const
+		{
+			return m_enabled.load( std::memory_order_relaxed );
+		}
+
+		void setEnabled( bool enabled )
+		{
+			m_enabled = enabled;
+		}
+
+		void recordComputeLookup( const ValuePlug *plug, bool hit )
+		{
+			Counters &c = counters( plug );
+			( hit ? c.computeHits : c.computeMisses )++;
+		}
+
+		void recordHashLookup( const ValuePlug *plug, bool hit )
+		{
+			Counters &c = counters( plug );
+			( hit ? c.hashHits : c.hashMisses )++;
+		}
+
+		void recordComputeInsertion( const ValuePlug *plug, const IECore::MurmurHash &hash, size_t cost )
+		{
+			Counters &c = counters( plug );
+			c.memoryUsage += cost;
+			CacheEntries::accessor a;
+			m_cacheEntries.insert( a, hash );
+			a->second = { &c, cost };
+		}
+
+		// Called when an entry is removed from the compute cache. We only
+		// know about entries inserted while introspection was enabled.
+		void recordComputeRemoval( const IECore::MurmurHash &hash, bool eviction )
+		{
+			if( m_cacheEntries.empty() )
+			{
+				return;
+			}
+			CacheEntries::accessor a;
+			if( !m_cacheEntries.find( a, hash ) )
+			{
+				return;
+			}
+			Counters *c = a->second.counters;
+			c->memoryUsage -= std::min<size_t>( c->memoryUsage, a->second.cost );
+			if( eviction )
+			{
+				c->computeEvictions++;
+			}
+			m_cacheEntries.erase( a );
+		}
+
+		std::vector<ValuePlug::PlugCacheStatistics> statistics() const
+		{
+			std::vector<ValuePlug::PlugCacheStatistics> result;
+			Mutex::scoped_lock lock( m_countersMutex, /* write = */ false );
+			for( const auto &[key, counters] : m_counters )
+			{
+				ValuePlug::PlugCacheStatistics s;
+				s.nodeType = key.first;
+				s.plugName = key.second;
+				s.computeCache.hits = counters->computeHits;
+				s.computeCache.misses = counters->computeMisses;
+				s.computeCache.evictions = counters->computeEvictions;
+				s.computeCache.memoryUsage = counters->memoryUsage;
+				s.hashCache.hits = counters->hashHits;
+				s.hashCache.misses = counters->hashMisses;
+				result.push_back( s );
+			}
+			return result;
+		}
+
+		void reset()
+		{
+			// We don't remove counters because they are referenced by
+			// `m_cacheEntries`. Memory usage isn't reset, because it still
+			// describes the current contents of the cache.
+			Mutex::scoped_lock lock( m_countersMutex, /* write = */ false );
+			for( auto &[key, counters] : m_counters )
+			{
+				counters->computeHits = 0;
+				counters->computeMisses = 0;
+				counters->computeEvictions = 0;
+				counters->hashHits = 0;
+				counters->hashMisses = 0;
+			}
+		}
+
+	private :
+
+		struct Counters
+		{
+			std::atomic_size_t computeHits = 0;
+			std::atomic_size_t computeMisses = 0;
+			std::atomic_size_t computeEvictions = 0;
+			std::atomic_size_t memoryUsage = 0;
+			std::atomic_size_t hashHits = 0;
+			std::atomic_size_t hashMisses = 0;
+		};
+
+		using Key = std::pair<std::string, std::string>;
+
+		Counters &counters( const ValuePlug *plug )
+		{
+			const Node *node = plug->node();
+			const Key key(
+				node ? node->typeName() : "",
+				node ? plug->relativeName( node ) : plug->getName().string()
+			);
+
+			// Counters are never removed, so it is safe to return a reference
+			// after releasing the lock.
+			Mutex::scoped_lock lock( m_countersMutex, /* write = */ false );
+			auto it = m_counters.find( key );
+			if( it == m_counters.end() )
+			{
+				lock.upgrade_to_writer();
+				it = m_counters.try_emplace( key, std::make_unique<Counters>() ).first;
+			}
+			return *it->second;
+		}
+
+		struct CacheEntry
+		{
+			Counters *counters;
+			size_t cost;
+		};
+
+		using CountersMap = std::unordered_map<Key, std::unique_ptr<Counters>, boost::hash<Key>>;
+		using Mutex = tbb::spin_rw_mutex;
+		using CacheEntries = tbb::concurrent_hash_map<IECore::MurmurHash, CacheEntry>;
+
+		std::atomic_bool m_enabled;
+		mutable Mutex m_countersMutex;
+		CountersMap m_counters;
+		CacheEntries m_cacheEntries;
+
+};
+
+CacheIntrospection &cacheIntrospection()
+{
+	static CacheIntrospection g_cacheIntrospection;
+	return g_cacheIntrospection;
+}
+
 } // namespace
 
 class ValuePlug::HashProcess : public Process
@@ -242,6 +413,7 @@ class ValuePlug::HashProcess : public Process
 			// we can repeat the process for `Checked` mode.
 
 			const bool forceMonitoring = Process::forceMonitoring( threadState, p, staticType );
+			const bool introspect = cacheIntrospection().enabled();
 
 			auto acquireHash = [&]( const HashCacheKey &cacheKey ) {
 
@@ -259,6 +431,10 @@ class ValuePlug::HashProcess : public Process
 				{
 					if( auto result = threadData.cache.getIfCached( cacheKey ) )
 					{
+						if( introspect )
+						{
+							cacheIntrospection().recordHashLookup( p, /* hit = */ true );
+						}
 						return *result;
 					}
 				}
@@ -269,6 +445,10 @@ class ValuePlug::HashProcess : public Process
 				if( cachePolicy == CachePolicy::Default || cachePolicy == CachePolicy::Standard )
 				{
 					result = HashProcess( p, plug, computeNode ).run();
+					if( introspect && !forceMonitoring )
+					{
+						cacheIntrospection().recordHashLookup( p, /* hit = */ false );
+					}
 				}
 				else
 				{
@@ -285,6 +465,10 @@ class ValuePlug::HashProcess : public Process
 					{
 						result = Process::acquireCollaborativeResult<HashProcess>( cacheKey, p, plug, computeNode );
 					}
+					if( introspect && !forceMonitoring )
+					{
+						cacheIntrospection().recordHashLookup( p, /* hit = */ bool( cachedValue ) );
+					}
 				}
 				// Update local cache and return result
 				threadData.cache.setIfUncached( cacheKey, result, cacheCostFunction );
@@ -476,6 +660,295 @@ ValuePlug::HashProcess::CacheType ValuePlug::HashProcess::g_cache( CacheType::Ge
 std::atomic<uint64_t> ValuePlug::HashProcess::g_legacyGlobalDirtyCount( 0 );
 ValuePlug::HashCacheMode ValuePlug::HashProcess::g_hashCacheMode( defaultHashCacheMode() );
 
+//////////////////////////////////////////////////////////////////////////
+// The PersistentCache stores the results of ComputeProcesses on disk, so
+// they can be shared between processes. Each result is stored in a separate
+// file named after its hash, and files are written to a temporary name and
+// then renamed, so that concurrent processes never see partial results.
+// The modification time of each file is updated when it is read, so that
+// eviction can remove the least recently used entries.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+class PersistentCache
+{
+
+	public :
+
+		PersistentCache()
+			:	m_directory( std::make_shared<const std::filesystem::path>() ),
+				m_sizeLimit( 1024ull * 1024 * 1024 * 10 ), m_usage( 0 ), m_evicting( false ), m_tempFileCount( 0 )
+		{
+		}
+
+		std::string getDirectory() const
+		{
+			return directory()->string();
+		}
+
+		void setDirectory( const std::string &directory )
+		{
+			// The directory is never modified once set, so that compute threads
+			// can read it without locking. Instead, we swap in a new one, scanning
+			// the new directory before taking the lock so that we hold it only
+			// briefly.
+			auto newDirectory = std::make_shared<const std::filesystem::path>( directory );
+			if( !newDirectory->empty() )
+			{
+				std::filesystem::create_directories( *newDirectory );
+			}
+			const size_t usage = scan( *newDirectory, nullptr );
+
+			std::lock_guard<std::mutex> lock( m_mutex );
+			std::atomic_store( &m_directory, ConstDirectoryPtr( newDirectory ) );
+			m_usage = usage;
+		}
+
+		size_t getSizeLimit() const
+		{
+			return m_sizeLimit;
+		}
+
+		void setSizeLimit( size_t bytes )
+		{
+			m_sizeLimit = bytes;
+			if( m_usage > m_sizeLimit )
+			{
+				evict();
+			}
+		}
+
+		size_t usage() const
+		{
+			return m_usage;
+		}
+
+		void clear()
+		{
+			std::vector<Entry> entries;
+			scan( *directory(), &entries );
+			for( const auto &entry : entries )
+			{
+				std::error_code errorCode;
+				std::filesystem::remove( entry.path, errorCode );
+			}
+			m_usage = 0;
+		}
+
+		bool enabled() const
+		{
+			return !directory()->empty();
+		}
+
+		IECore::ConstObjectPtr get( const IECore::MurmurHash &hash ) const
+		{
+			const std::filesystem::path path = entryPath( hash );
+			if( path.empty() )
+			{
+				return nullptr;
+			}
+
+			std::error_code errorCode;
+			if( !std::filesystem::is_regular_file( path, errorCode ) )
+			{
+				return nullptr;
+			}
+
+			IECore::ConstObjectPtr result;
+			try
+			{
+				IECore::ConstIndexedIOPtr io = new IECore::FileIndexedIO( path.string(), IECore::IndexedIO::rootPath, IECore::IndexedIO::Read );
+				result = IECore::Object::load( io, g_objectEntry );
+			}
+			catch( const std::exception &e )
+			{
+				// Most likely the file was removed by another process
+				// in the meantime, in which case we can just compute
+				// the result again.
+				IECore::msg( IECore::Msg::Debug, "ValuePlug", fmt::format( "Unable to read persistent cache entry \"{}\" : {}", path.string(), e.what() ) );
+				return nullptr;
+			}
+
+			// Mark as recently used.
+			std::filesystem::last_write_time( path, std::filesystem::file_time_type::clock::now(), errorCode );
+			return result;
+		}
+
+		void set( const IECore::MurmurHash &hash, const IECore::Object *object )
+		{
+			const std::filesystem::path path = entryPath( hash );
+			if( path.empty() )
+			{
+				return;
+			}
+
+			std::error_code errorCode;
+			if( std::filesystem::exists( path, errorCode ) )
+			{
+				// Written already by another thread or process.
+				return;
+			}
+
+			const std::filesystem::path tempPath = fmt::format(
+				"{}.{}.{}.tmp", path.string(),
+				std::chrono::steady_clock::now().time_since_epoch().count(),
+				m_tempFileCount++
+			);
+
+			try
+			{
+				std::filesystem::create_directories( path.parent_path() );
+				{
+					IECore::IndexedIOPtr io = new IECore::FileIndexedIO( tempPath.string(), IECore::IndexedIO::rootPath, IECore::IndexedIO::Write );
+					object->save( io, g_objectEntry );
+				}
+				std::filesystem::rename( tempPath, path );
+				m_usage += std::filesystem::file_size( path );
+			}
+			catch( const std::exception &e )
+			{
+				std::filesystem::remove( tempPath, errorCode );
+				IECore::msg( IECore::Msg::Warning, "ValuePlug", fmt::format( "Unable to write persistent cache entry \"{}\" : {}", path.string(), e.what() ) );
+				return;
+			}
+
+			if( m_usage > m_sizeLimit )
+			{
+				evict();
+			}
+		}
+
+	private :
+
+		struct Entry
+		{
+			std::filesystem::path path;
+			std::filesystem::file_time_type time;
+			uintmax_t size;
+		};
+
+		using ConstDirectoryPtr = std::shared_ptr<const std::filesystem::path>;
+
+		ConstDirectoryPtr directory() const
+		{
+			return std::atomic_load( &m_directory );
+		}
+
+		std::filesystem::path entryPath( const IECore::MurmurHash &hash ) const
+		{
+			const ConstDirectoryPtr d = directory();
+			if( d->empty() )
+			{
+				return std::filesystem::path();
+			}
+
+			// Spread entries across subdirectories to avoid having
+			// huge numbers of files in a single directory.
+			const std::string hashString = hash.toString();
+			return *d / hashString.substr( 0, 2 ) / ( hashString + ".fio" );
+		}
+
+		// Returns the total size of all entries in `directory`,
+		// optionally returning the entries themselves.
+		static size_t scan( const std::filesystem::path &directory, std::vector<Entry> *entries )
+		{
+			if( directory.empty() )
+			{
+				return 0;
+			}
+
+			size_t result = 0;
+			std::error_code errorCode;
+			for( std::filesystem::recursive_directory_iterator it( directory, errorCode ), eIt; it != eIt; it.increment( errorCode ) )
+			{
+				if( errorCode )
+				{
+					break;
+				}
+				if( !it->is_regular_file( errorCode ) || it->path().extension() != ".fio" )
+				{
+					continue;
+				}
+				const uintmax_t size = it->file_size( errorCode );
+				if( errorCode )
+				{
+					// Removed by another process.
+					continue;
+				}
+				result += size;
+				if( entries )
+				{
+					entries->push_back( { it->path(), it->last_write_time( errorCode ), size } );
+				}
+			}
+
+			return result;
+		}
+
+		// Removes least recently used entries until we are comfortably
+		// below the size limit. We go below the limit so that we don't
+		// need to evict again on every subsequent write.
+		void evict()
+		{
+			if( m_evicting.exchange( true ) )
+			{
+				// Another thread is evicting already.
+				return;
+			}
+
+			// We don't hold any locks while scanning and removing files, because
+			// this may take a long time on a network filesystem, and compute threads
+			// must be free to carry on reading and writing entries in the meantime.
+			std::vector<Entry> entries;
+			size_t usage = scan( *directory(), &entries );
+			std::sort(
+				entries.begin(), entries.end(),
+				[] ( const Entry &a, const Entry &b ) { return a.time < b.time; }
+			);
+
+			const size_t targetUsage = m_sizeLimit - m_sizeLimit / 10;
+			for( const auto &entry : entries )
+			{
+				if( usage <= targetUsage )
+				{
+					break;
+				}
+				std::error_code errorCode;
+				if( std::filesystem::remove( entry.path, errorCode ) )
+				{
+					usage -= std::min<size_t>( usage, entry.size );
+				}
+			}
+
+			m_usage = usage;
+			m_evicting = false;
+		}
+
+		static const IECore::IndexedIO::EntryID g_objectEntry;
+
+		// Serialises calls to `setDirectory()`.
+		std::mutex m_mutex;
+		// Accessed atomically via `directory()`.
+		ConstDirectoryPtr m_directory;
+		std::atomic_size_t m_sizeLimit;
+		std::atomic_size_t m_usage;
+		std::atomic_bool m_evicting;
+		std::atomic_size_t m_tempFileCount;
+
+};
+
+const IECore::IndexedIO::EntryID PersistentCache::g_objectEntry( "object" );
+
+PersistentCache &persistentCache()
+{
+	static PersistentCache g_persistentCache;
+	return g_persistentCache;
+}
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // The ComputeProcess manages the task of calling ComputeNode::compute()
 // and storing a cache of recently computed results.
@@ -505,7 +978,37 @@ class ValuePlug::ComputeProcess : public Process
 
 		static void clearCache()
 		{
+			g_clearing = true;
 			g_cache.clear();
+			g_clearing = false;
+		}
+
+		static void setCacheEvictionPolicy( CacheEvictionPolicy policy )
+		{
+			g_cache.setEvictionPolicy(
+				policy == CacheEvictionPolicy::CostAware ? CacheType::EvictionPolicy::CostAware : CacheType::EvictionPolicy::LeastRecentlyUsed
+			);
+		}
+
+		static CacheEvictionPolicy getCacheEvictionPolicy()
+		{
+			return g_cache.getEvictionPolicy() == CacheType::EvictionPolicy::CostAware ? CacheEvictionPolicy::CostAware : CacheEvictionPolicy::LeastRecentlyUsed;
+		}
+
+		static CacheStatistics cacheStatistics()
+		{
+			const CacheType::Statistics statistics = g_cache.statistics();
+			CacheStatistics result;
+			result.hits = statistics.hits;
+			result.misses = statistics.misses;
+			result.evictions = statistics.evictions;
+			result.memoryUsage = g_cache.currentCost();
+			return result;
+		}
+
+		static void resetCacheStatistics()
+		{
+			g_cache.resetStatistics();
 		}
 
 		static const IECore::Object *value( const ValuePlug *plug, IECore::ConstObjectPtr &owner, const IECore::MurmurHash *precomputedHash )
@@ -569,14 +1072,23 @@ class ValuePlug::ComputeProcess : public Process
 			// > calling `getValueInternal()`.
 			const IECore::MurmurHash hash = precomputedHash ? *precomputedHash : p->ValuePlug::hash();
 
+			const bool introspect = cacheIntrospection().enabled();
 			if( !Process::forceMonitoring( threadState, plug, staticType ) )
 			{
 				if( auto result = g_cache.getIfCached( hash ) )
 				{
+					if( introspect )
+					{
+						cacheIntrospection().recordComputeLookup( p, /* hit = */ true );
+					}
 					// Move avoids unnecessary additional addRef/removeRef.
 					owner = std::move( *result );
 					return owner.get();
 				}
+				if( introspect )
+				{
+					cacheIntrospection().recordComputeLookup( p, /* hit = */ false );
+				}
 			}
 
 			// The value isn't in the cache, so we'll need to compute it,
@@ -588,8 +1100,19 @@ class ValuePlug::ComputeProcess : public Process
 				// compute is in flight elsewhere. We assume the compute is
 				// lightweight enough and unlikely enough to be shared that in
 				// the worst case it's OK to do it redundantly on a few threads
-				// before it gets cached.
-				owner = ComputeProcess( p, plug, computeNode ).run();
+				// before it gets cached. We only time the compute if
+				// the cache needs the timing for its eviction policy.
+				std::chrono::nanoseconds computeTime( 0 );
+				if( g_cache.getEvictionPolicy() == CacheType::EvictionPolicy::CostAware )
+				{
+					const auto startTime = std::chrono::steady_clock::now();
+					owner = ComputeProcess( p, plug, computeNode ).run();
+					computeTime = std::chrono::steady_clock::now() - startTime;
+				}
+				else
+				{
+					owner = ComputeProcess( p, plug, computeNode ).run();
+				}
 				// Store the value in the cache, but only if it isn't there already.
 				// The check is useful because it's common for an upstream compute
 				// triggered by us to have already done the work, and calling
@@ -600,13 +1123,31 @@ class ValuePlug::ComputeProcess : public Process
 				// upstream node will already have computed the same result) and the
 				// attribute data itself consists of many small objects for which
 				// computing memory usage is slow.
-				g_cache.setIfUncached( hash, owner, cacheCostFunction );
+				if( introspect )
+				{
+					// Can't use `cacheCostFunction()` because the
+					// ComputeProcess is no longer current.
+					g_cache.setIfUncached(
+						hash, owner,
+						[p, &hash] ( const IECore::ConstObjectPtr &v ) {
+							const size_t cost = v->memoryUsage();
+							recordCacheInsertion( p, hash, cost );
+							return cost;
+						},
+						computeTime
+					);
+				}
+				else
+				{
+					g_cache.setIfUncached( hash, owner, cacheCostFunction, computeTime );
+				}
 				return owner.get();
 			}
 			else
 			{
+				const bool persistent = cachePolicy == CachePolicy::Persistent && persistentCache().enabled();
 				owner = acquireCollaborativeResult<ComputeProcess>(
-					hash, p, plug, computeNode
+					hash, p, plug, computeNode, &hash, persistent
 				);
 				return owner.get();
 			}
@@ -633,8 +1174,8 @@ class ValuePlug::ComputeProcess : public Process
 
 		// Interface required by `Process::acquireCollaborativeResult()`.
 
-		ComputeProcess( const ValuePlug *plug, const ValuePlug *destinationPlug, const ComputeNode *computeNode )
-			:	Process( staticType, plug, destinationPlug ), m_computeNode( computeNode )
+		ComputeProcess( const ValuePlug *plug, const ValuePlug *destinationPlug, const ComputeNode *computeNode, const IECore::MurmurHash *cacheKey = nullptr, bool persistent = false )
+			:	Process( staticType, plug, destinationPlug ), m_computeNode( computeNode ), m_cacheKey( cacheKey ), m_persistent( persistent )
 		{
 		}
 
@@ -642,6 +1183,14 @@ class ValuePlug::ComputeProcess : public Process
 		{
 			try
 			{
+				if( m_persistent )
+				{
+					if( IECore::ConstObjectPtr result = persistentCache().get( *m_cacheKey ) )
+					{
+						return result;
+					}
+				}
+
 				// Cast is safe because our constructor takes ValuePlugs.
 				const ValuePlug *valuePlug = static_cast<const ValuePlug *>( plug() );
 				if( const ValuePlug *input = valuePlug->getInput<ValuePlug>() )
@@ -667,6 +1216,10 @@ class ValuePlug::ComputeProcess : public Process
 				{
 					throw IECore::Exception( "Compute did not set plug value." );
 				}
+				if( m_persistent )
+				{
+					persistentCache().set( *m_cacheKey, m_result.get() );
+				}
 				// Move to avoid unnecessary reference count increment/decrement - we don't
 				// need `m_result` any more.
 				return std::move( m_result );
@@ -683,12 +1236,47 @@ class ValuePlug::ComputeProcess : public Process
 
 		static size_t cacheCostFunction( const IECore::ConstObjectPtr &v )
 		{
-			return v->memoryUsage();
+			const size_t cost = v->memoryUsage();
+			if( cacheIntrospection().enabled() )
+			{
+				// We are being called by `acquireCollaborativeResult()`, while
+				// the process that computed `v` is still current.
+				const Process *process = Process::current();
+				if( process && process->type() == staticType )
+				{
+					const ComputeProcess *computeProcess = static_cast<const ComputeProcess *>( process );
+					if( computeProcess->m_cacheKey )
+					{
+						recordCacheInsertion( static_cast<const ValuePlug *>( computeProcess->plug() ), *computeProcess->m_cacheKey, cost );
+					}
+				}
+			}
+			return cost;
 		}
 
 	private :
 
+		static void recordCacheInsertion( const ValuePlug *plug, const IECore::MurmurHash &hash, size_t cost )
+		{
+			// Values that exceed the limit aren't stored, and won't
+			// be passed to `cacheRemovalCallback()`.
+			if( cost <= g_cache.getMaxCost() )
+			{
+				cacheIntrospection().recordComputeInsertion( plug, hash, cost );
+			}
+		}
+
+		static void cacheRemovalCallback( const IECore::MurmurHash &hash, const IECore::ConstObjectPtr &value )
+		{
+			cacheIntrospection().recordComputeRemoval( hash, /* eviction = */ !g_clearing );
+		}
+
+		static thread_local bool g_clearing;
+
 		const ComputeNode *m_computeNode;
+		// Only provided when the result will be cached.
+		const IECore::MurmurHash *m_cacheKey;
+		bool m_persistent;
 		IECore::ConstObjectPtr m_result;
 
 };
@@ -696,7 +1284,8 @@ class ValuePlug::ComputeProcess : public Process
 const IECore::InternedString ValuePlug::ComputeProcess::staticType( ValuePlug::computeProcessType() );
 // Using a null `GetterFunction` because it will never get called, because we only ever call `getIfCached()`.
 // Note : The default size here is overridden by `startup/Gaffer/cache.py`.
-ValuePlug::ComputeProcess::CacheType ValuePlug::ComputeProcess::g_cache( CacheType::GetterFunction(), 1024 * 1024 * 1024 * 1, CacheType::RemovalCallback(), /* cacheErrors = */ false ); // 1 gig
+ValuePlug::ComputeProcess::CacheType ValuePlug::ComputeProcess::g_cache( CacheType::GetterFunction(), 1024 * 1024 * 1024 * 1, ValuePlug::ComputeProcess::cacheRemovalCallback, /* cacheErrors = */ false ); // 1 gig
+thread_local bool ValuePlug::ComputeProcess::g_clearing = false;
 
 //////////////////////////////////////////////////////////////////////////
 // SetValueAction implementation
@@ -1156,6 +1745,46 @@ void ValuePlug::clearCache()
 	ComputeProcess::clearCache();
 }
 
+void ValuePlug::setCacheEvictionPolicy( CacheEvictionPolicy policy )
+{
+	ComputeProcess::setCacheEvictionPolicy( policy );
+}
+
+ValuePlug::CacheEvictionPolicy ValuePlug::getCacheEvictionPolicy()
+{
+	return ComputeProcess::getCacheEvictionPolicy();
+}
+
+ValuePlug::CacheStatistics ValuePlug::cacheStatistics()
+{
+	return ComputeProcess::cacheStatistics();
+}
+
+void ValuePlug::resetCacheStatistics()
+{
+	ComputeProcess::resetCacheStatistics();
+}
+
+void ValuePlug::setCacheIntrospectionEnabled( bool enabled )
+{
+	cacheIntrospection().setEnabled( enabled );
+}
+
+bool ValuePlug::getCacheIntrospectionEnabled()
+{
+	return cacheIntrospection().enabled();
+}
+
+std::vector<ValuePlug::PlugCacheStatistics> ValuePlug::plugCacheStatistics()
+{
+	return cacheIntrospection().statistics();
+}
+
+void ValuePlug::resetPlugCacheStatistics()
+{
+	cacheIntrospection().reset();
+}
+
 size_t ValuePlug::getHashCacheSizeLimit()
 {
 	return HashProcess::getCacheSizeLimit();
@@ -1176,6 +1805,36 @@ size_t ValuePlug::hashCacheTotalUsage()
 	return HashProcess::totalCacheUsage();
 }
 
+std::string ValuePlug::getPersistentCacheDirectory()
+{
+	return persistentCache().getDirectory();
+}
+
+void ValuePlug::setPersistentCacheDirectory( const std::string &directory )
+{
+	persistentCache().setDirectory( directory );
+}
+
+size_t ValuePlug::getPersistentCacheSizeLimit()
+{
+	return persistentCache().getSizeLimit();
+}
+
+void ValuePlug::setPersistentCacheSizeLimit( size_t bytes )
+{
+	persistentCache().setSizeLimit( bytes );
+}
+
+size_t ValuePlug::persistentCacheUsage()
+{
+	return persistentCache().usage();
+}
+
+void ValuePlug::clearPersistentCache()
+{
+	persistentCache().clear();
+}
+
 void ValuePlug::setHashCacheMode( ValuePlug::HashCacheMode hashCacheMode )
 {
 	HashProcess::setHashCacheMode( hashCacheMode );
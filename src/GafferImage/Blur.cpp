@@ -41,14 +41,49 @@
 
 #include "Gaffer/StringPlug.h"
 
+#include <cmath>
+
 using namespace Imath;
 using namespace Gaffer;
 using namespace GafferImage;
 
-GAFFER_NODE_DEFINE_TYPE( Blur );
+namespace
+{
 
 const char *g_blurFilterName = "smoothGaussian";
 
+// The smoothGaussian filter has a support width of 3 at a filter scale of 1.
+// Within its support it is a gaussian, so its variance is proportional to
+// the square of its support radius. This lets us compose the filters used
+// in `Fast` mode so that their total variance matches the `Accurate` blur.
+const float g_filterSupportRadius = 1.5f;
+
+// In `Fast` mode we downsample by the largest integer factor that leaves at
+// least this much support radius (in pixels of the full resolution image)
+// for each pixel of the downsampled image. Larger values give more accuracy
+// but cost more.
+const float g_pyramidSupportRadius = 6.0f;
+
+// The support radius of the `Accurate` blur for a particular radius.
+float blurSupportRadius( float radius )
+{
+	return 1.0f + radius;
+}
+
+int pyramidScale( float radius )
+{
+	return std::max( 1, (int)( blurSupportRadius( radius ) / g_pyramidSupportRadius ) );
+}
+
+bool usePyramid( const V2f &radius )
+{
+	return pyramidScale( radius.x ) > 1 || pyramidScale( radius.y ) > 1;
+}
+
+} // namespace
+
+GAFFER_NODE_DEFINE_TYPE( Blur );
+
 size_t Blur::g_firstPlugIndex = 0;
 
 Blur::Blur( const std::string &name )
@@ -61,6 +96,7 @@ Blur::Blur( const std::string &name )
 	addChild( new V2fPlug( "radius", Plug::In, V2f( 0 ), V2f( 0 ) ) );
 	addChild( resample->boundingModePlug()->createCounterpart( "boundingMode", Plug::In ) );
 	addChild( new BoolPlug( "expandDataWindow" ) );
+	addChild( new IntPlug( "mode", Plug::In, Accurate, Accurate, Fast ) );
 
 	addChild( new V2fPlug( "__filterScale", Plug::Out ) );
 
@@ -78,6 +114,43 @@ Blur::Blur( const std::string &name )
 	resampledDataWindowPlug()->setInput( resample->outPlug()->dataWindowPlug() );
 	resampledChannelDataPlug()->setInput( resample->outPlug()->channelDataPlug() );
 
+	// `Fast` mode. We blur a downsampled copy of the image, and then upsample
+	// the result back to the original resolution.
+
+	addChild( new M33fPlug( "__downsampleMatrix", Plug::Out ) );
+	addChild( new M33fPlug( "__upsampleMatrix", Plug::Out ) );
+	addChild( new V2fPlug( "__pyramidResampleFilterScale", Plug::Out ) );
+	addChild( new V2fPlug( "__pyramidFilterScale", Plug::Out ) );
+	addChild( new FloatVectorDataPlug( "__pyramidChannelData", Plug::In, ImagePlug::blackTile(), Plug::Default & ~Plug::Serialisable ) );
+
+	ResamplePtr downsample = new Resample( "__downsample" );
+	addChild( downsample );
+	downsample->inPlug()->setInput( inPlug() );
+	downsample->matrixPlug()->setInput( downsampleMatrixPlug() );
+	downsample->filterPlug()->setValue( g_blurFilterName );
+	downsample->filterScalePlug()->setInput( pyramidResampleFilterScalePlug() );
+	downsample->boundingModePlug()->setInput( boundingModePlug() );
+	downsample->expandDataWindowPlug()->setValue( true );
+
+	ResamplePtr pyramidBlur = new Resample( "__pyramidBlur" );
+	addChild( pyramidBlur );
+	pyramidBlur->inPlug()->setInput( downsample->outPlug() );
+	pyramidBlur->filterPlug()->setValue( g_blurFilterName );
+	pyramidBlur->filterScalePlug()->setInput( pyramidFilterScalePlug() );
+	pyramidBlur->boundingModePlug()->setInput( boundingModePlug() );
+	pyramidBlur->expandDataWindowPlug()->setValue( true );
+
+	ResamplePtr upsample = new Resample( "__upsample" );
+	addChild( upsample );
+	upsample->inPlug()->setInput( pyramidBlur->outPlug() );
+	upsample->matrixPlug()->setInput( upsampleMatrixPlug() );
+	upsample->filterPlug()->setValue( g_blurFilterName );
+	upsample->filterScalePlug()->setInput( pyramidResampleFilterScalePlug() );
+	upsample->boundingModePlug()->setInput( boundingModePlug() );
+	upsample->expandDataWindowPlug()->setValue( true );
+
+	pyramidChannelDataPlug()->setInput( upsample->outPlug()->channelDataPlug() );
+
 	outPlug()->viewNamesPlug()->setInput( inPlug()->viewNamesPlug() );
 	outPlug()->formatPlug()->setInput( inPlug()->formatPlug() );
 	outPlug()->metadataPlug()->setInput( inPlug()->metadataPlug() );
@@ -118,44 +191,134 @@ const Gaffer::BoolPlug *Blur::expandDataWindowPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
 }
 
+Gaffer::IntPlug *Blur::modePlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
+const Gaffer::IntPlug *Blur::modePlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 3 );
+}
+
 Gaffer::V2fPlug *Blur::filterScalePlug()
 {
-	return getChild<V2fPlug>( g_firstPlugIndex + 3 );
+	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
 }
 
 const Gaffer::V2fPlug *Blur::filterScalePlug() const
 {
-	return getChild<V2fPlug>( g_firstPlugIndex + 3 );
+	return getChild<V2fPlug>( g_firstPlugIndex + 4 );
 }
 
 Gaffer::AtomicBox2iPlug *Blur::resampledDataWindowPlug()
 {
-	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 4 );
+	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 5 );
 }
 
 const Gaffer::AtomicBox2iPlug *Blur::resampledDataWindowPlug() const
 {
-	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 4 );
+	return getChild<AtomicBox2iPlug>( g_firstPlugIndex + 5 );
 }
 
 Gaffer::FloatVectorDataPlug *Blur::resampledChannelDataPlug()
 {
-	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 5 );
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 6 );
 }
 
 const Gaffer::FloatVectorDataPlug *Blur::resampledChannelDataPlug() const
 {
-	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 5 );
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 6 );
 }
 
 Resample *Blur::resample()
 {
-	return getChild<Resample>( g_firstPlugIndex + 6 );
+	return getChild<Resample>( g_firstPlugIndex + 7 );
 }
 
 const Resample *Blur::resample() const
 {
-	return getChild<Resample>( g_firstPlugIndex + 6 );
+	return getChild<Resample>( g_firstPlugIndex + 7 );
+}
+
+Gaffer::M33fPlug *Blur::downsampleMatrixPlug()
+{
+	return getChild<M33fPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::M33fPlug *Blur::downsampleMatrixPlug() const
+{
+	return getChild<M33fPlug>( g_firstPlugIndex + 8 );
+}
+
+Gaffer::M33fPlug *Blur::upsampleMatrixPlug()
+{
+	return getChild<M33fPlug>( g_firstPlugIndex + 9 );
+}
+
+const Gaffer::M33fPlug *Blur::upsampleMatrixPlug() const
+{
+	return getChild<M33fPlug>( g_firstPlugIndex + 9 );
+}
+
+Gaffer::V2fPlug *Blur::pyramidResampleFilterScalePlug()
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 10 );
+}
+
+const Gaffer::V2fPlug *Blur::pyramidResampleFilterScalePlug() const
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 10 );
+}
+
+Gaffer::V2fPlug *Blur::pyramidFilterScalePlug()
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 11 );
+}
+
+const Gaffer::V2fPlug *Blur::pyramidFilterScalePlug() const
+{
+	return getChild<V2fPlug>( g_firstPlugIndex + 11 );
+}
+
+Gaffer::FloatVectorDataPlug *Blur::pyramidChannelDataPlug()
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+const Gaffer::FloatVectorDataPlug *Blur::pyramidChannelDataPlug() const
+{
+	return getChild<FloatVectorDataPlug>( g_firstPlugIndex + 12 );
+}
+
+Resample *Blur::downsample()
+{
+	return getChild<Resample>( g_firstPlugIndex + 13 );
+}
+
+const Resample *Blur::downsample() const
+{
+	return getChild<Resample>( g_firstPlugIndex + 13 );
+}
+
+Resample *Blur::pyramidBlur()
+{
+	return getChild<Resample>( g_firstPlugIndex + 14 );
+}
+
+const Resample *Blur::pyramidBlur() const
+{
+	return getChild<Resample>( g_firstPlugIndex + 14 );
+}
+
+Resample *Blur::upsample()
+{
+	return getChild<Resample>( g_firstPlugIndex + 15 );
+}
+
+const Resample *Blur::upsample() const
+{
+	return getChild<Resample>( g_firstPlugIndex + 15 );
 }
 
 void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
@@ -172,11 +335,17 @@ void Blur::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs )
 	else if( input->parent<V2fPlug>() == radiusPlug() )
 	{
 		outputs.push_back( filterScalePlug()->getChild<ValuePlug>( input->getName() ) );
+		outputs.push_back( pyramidResampleFilterScalePlug()->getChild<ValuePlug>( input->getName() ) );
+		outputs.push_back( pyramidFilterScalePlug()->getChild<ValuePlug>( input->getName() ) );
+		outputs.push_back( downsampleMatrixPlug() );
+		outputs.push_back( upsampleMatrixPlug() );
 		outputs.push_back( outPlug()->dataWindowPlug() );
 		outputs.push_back( outPlug()->channelDataPlug() );
 	}
 	else if(
-		input == resampledChannelDataPlug()
+		input == resampledChannelDataPlug() ||
+		input == pyramidChannelDataPlug() ||
+		input == modePlug()
 	)
 	{
 		outputs.push_back( outPlug()->channelDataPlug() );
@@ -187,10 +356,18 @@ void Blur::hash( const ValuePlug *output, const Context *context, IECore::Murmur
 {
 	FlatImageProcessor::hash( output, context, h );
 
-	if( output->parent<ValuePlug>() == filterScalePlug() )
+	if(
+		output->parent<ValuePlug>() == filterScalePlug() ||
+		output->parent<ValuePlug>() == pyramidResampleFilterScalePlug() ||
+		output->parent<ValuePlug>() == pyramidFilterScalePlug()
+	)
 	{
 		radiusPlug()->getChild<ValuePlug>( output->getName() )->hash( h );
 	}
+	else if( output == downsampleMatrixPlug() || output == upsampleMatrixPlug() )
+	{
+		radiusPlug()->hash( h );
+	}
 }
 
 void Blur::compute( ValuePlug *output, const Context *context ) const
@@ -214,6 +391,55 @@ void Blur::compute( ValuePlug *output, const Context *context ) const
 		);
 		return;
 	}
+	else if( output->parent<ValuePlug>() == pyramidResampleFilterScalePlug() )
+	{
+		// When we're downsampling, the Resample nodes widen the filter to match the
+		// scale factor, so a filter scale of 1 gives us a well behaved gaussian for
+		// both the downsample and the upsample. When an axis isn't being downsampled,
+		// we use the narrowest filter that doesn't pick up adjacent pixels, so that
+		// it passes through unchanged.
+		const float radius = radiusPlug()->getChild<FloatPlug>( output->getName() )->getValue();
+		static_cast<FloatPlug *>( output )->setValue(
+			pyramidScale( radius ) > 1 ? 1.0f : 1.0f / g_filterSupportRadius
+		);
+		return;
+	}
+	else if( output->parent<ValuePlug>() == pyramidFilterScalePlug() )
+	{
+		// The variances of the downsample, blur and upsample filters add, so we choose
+		// the blur width so that the total variance matches the `Accurate` blur. In the
+		// downsampled image, the downsample and upsample filters each have a support radius
+		// of `g_filterSupportRadius`.
+		const float radius = radiusPlug()->getChild<FloatPlug>( output->getName() )->getValue();
+		const int scale = pyramidScale( radius );
+		float filterScale;
+		if( scale > 1 )
+		{
+			const float supportRadius = blurSupportRadius( radius ) / ( scale * g_filterSupportRadius );
+			filterScale = std::sqrt( std::max( supportRadius * supportRadius - 2.0f, 0.0f ) );
+		}
+		else
+		{
+			filterScale = blurSupportRadius( radius ) / g_filterSupportRadius;
+		}
+		static_cast<FloatPlug *>( output )->setValue(
+			std::max( filterScale, 1.0f / g_filterSupportRadius )
+		);
+		return;
+	}
+	else if( output == downsampleMatrixPlug() || output == upsampleMatrixPlug() )
+	{
+		const V2f radius = radiusPlug()->getValue();
+		V2f scale( pyramidScale( radius.x ), pyramidScale( radius.y ) );
+		if( output == downsampleMatrixPlug() )
+		{
+			scale = V2f( 1.0f ) / scale;
+		}
+		M33f matrix;
+		matrix.setScale( scale );
+		static_cast<M33fPlug *>( output )->setValue( matrix );
+		return;
+	}
 
 	FlatImageProcessor::compute( output, context );
 }
@@ -232,6 +458,9 @@ void Blur::hashDataWindow( const GafferImage::ImagePlug *parent, const Gaffer::C
 
 Imath::Box2i Blur::computeDataWindow( const Gaffer::Context *context, const ImagePlug *parent ) const
 {
+	// Note that we use the data window from the `Accurate` blur even in `Fast`
+	// mode. Pixels outside it receive a negligible contribution from the blur,
+	// and this keeps the data window independent of the mode.
 	if( radiusPlug()->getValue() != V2f( 0 ) && expandDataWindowPlug()->getValue() )
 	{
 		return resampledDataWindowPlug()->getValue();
@@ -244,24 +473,34 @@ Imath::Box2i Blur::computeDataWindow( const Gaffer::Context *context, const Imag
 
 void Blur::hashChannelData( const GafferImage::ImagePlug *parent, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) )
+	const V2f radius = radiusPlug()->getValue();
+	if( radius == V2f( 0 ) )
 	{
-		h = resampledChannelDataPlug()->hash();
+		h = inPlug()->channelDataPlug()->hash();
+	}
+	else if( modePlug()->getValue() == Fast && usePyramid( radius ) )
+	{
+		h = pyramidChannelDataPlug()->hash();
 	}
 	else
 	{
-		h = inPlug()->channelDataPlug()->hash();
+		h = resampledChannelDataPlug()->hash();
 	}
 }
 
 IECore::ConstFloatVectorDataPtr Blur::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
 {
-	if( radiusPlug()->getValue() != V2f( 0 ) )
+	const V2f radius = radiusPlug()->getValue();
+	if( radius == V2f( 0 ) )
 	{
-		return resampledChannelDataPlug()->getValue();
+		return inPlug()->channelDataPlug()->getValue();
+	}
+	else if( modePlug()->getValue() == Fast && usePyramid( radius ) )
+	{
+		return pyramidChannelDataPlug()->getValue();
 	}
 	else
 	{
-		return inPlug()->channelDataPlug()->getValue();
+		return resampledChannelDataPlug()->getValue();
 	}
 }
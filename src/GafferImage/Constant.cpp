@@ -193,6 +193,16 @@ IECore::ConstFloatVectorDataPtr Constant::computeChannelData( const std::string
 	}
 	const float value = colorPlug()->getChild( channelIndex )->getValue();
 
+	// Share the common black and white tiles rather than allocate our own.
+	if( value == 0.0f )
+	{
+		return ImagePlug::blackTile();
+	}
+	else if( value == 1.0f )
+	{
+		return ImagePlug::whiteTile();
+	}
+
 	FloatVectorDataPtr result = new FloatVectorData;
 	result->writable().resize( ImagePlug::tileSize() * ImagePlug::tileSize(), value );
 
@@ -55,6 +55,18 @@ namespace
 		}
 	};
 
+	inline float grade( float colour, float A, float B, float invGamma, bool blackClamp, bool whiteClamp )
+	{
+		const float c = A * colour + B;
+		colour = ( c >= 0.f && invGamma != 1.f ? (float)pow( c, invGamma ) : c );
+
+		// Clamp the white and blacks if necessary.
+		if ( blackClamp && colour < 0.f ) colour = 0.f;
+		if ( whiteClamp && colour > 1.f ) colour = 1.f;
+
+		return colour;
+	}
+
 }
 
 GAFFER_NODE_DEFINE_TYPE( Grade );
@@ -268,18 +280,37 @@ void Grade::processChannelData( const Gaffer::Context *context, const ImagePlug
 
 	while (outPtr != END)
 	{
-		// Calculate the colour of the graded pixel.
-		float colour = *outPtr;	// As the input has been copied to outData, grab the input colour from there.
-		const float c = A * colour + B;
-		colour = ( c >= 0.f && invGamma != 1.f ? (float)pow( c, invGamma ) : c );
-
-		// Clamp the white and blacks if necessary.
-		if ( blackClamp && colour < 0.f ) colour = 0.f;
-		if ( whiteClamp && colour > 1.f ) colour = 1.f;
+		// As the input has been copied to outData, grab the input colour from there,
+		// and write back the graded result.
+		*outPtr = grade( *outPtr, A, B, invGamma, blackClamp, whiteClamp );
+		outPtr++;
+	}
+}
 
-		// Write back the result.
-		*outPtr++ = colour;
+IECore::ConstFloatVectorDataPtr Grade::computeChannelData( const std::string &channelName, const Imath::V2i &tileOrigin, const Gaffer::Context *context, const ImagePlug *parent ) const
+{
+	// Black tiles are common in sparse images, and most grades leave black
+	// unchanged. In that case we can return the shared black tile rather than
+	// allocate and process a copy. This holds even when processing
+	// unpremultiplied, because unpremultiplying and premultiplying 0 gives 0.
+	ConstFloatVectorDataPtr inData = inPlug()->channelDataPlug()->getValue();
+	if( inData == ImagePlug::blackTile() )
+	{
+		float A, B, gamma;
+		bool whiteClamp, blackClamp;
+		{
+			GradeParametersScope s( context );
+			parameters( std::max( 0, ImageAlgo::colorIndex( channelName ) ), A, B, gamma );
+			whiteClamp = whiteClampPlug()->getValue();
+			blackClamp = blackClampPlug()->getValue();
+		}
+		if( grade( 0.0f, A, B, 1. / gamma, blackClamp, whiteClamp ) == 0.0f )
+		{
+			return inData;
+		}
 	}
+
+	return ChannelDataProcessor::computeChannelData( channelName, tileOrigin, context, parent );
 }
 
 void Grade::parameters( size_t channelIndex, float &a, float &b, float &gamma ) const
@@ -42,6 +42,7 @@
 
 #include "fmt/format.h"
 
+#include <algorithm>
 #include <set>
 #include <regex>
 
@@ -524,6 +525,23 @@ void GafferImage::ImageAlgo::throwIfSampleOffsetsMismatch( const IECore::IntVect
 	}
 }
 
+IECore::ConstFloatVectorDataPtr GafferImage::ImageAlgo::shareConstantTile( const IECore::ConstFloatVectorDataPtr &tile )
+{
+	const std::vector<float> &v = tile->readable();
+	if( (int)v.size() != ImagePlug::tilePixels() || ( v[0] != 0.0f && v[0] != 1.0f ) )
+	{
+		return tile;
+	}
+
+	const float value = v[0];
+	if( !std::all_of( v.begin(), v.end(), [value] ( float x ) { return x == value; } ) )
+	{
+		return tile;
+	}
+
+	return value == 0.0f ? ImagePlug::blackTile() : ImagePlug::whiteTile();
+}
+
 bool GafferImage::ImageAlgo::viewIsValid( const Gaffer::Context *context, const std::vector< std::string > &viewNames )
 {
 	const std::string &viewName = context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName );
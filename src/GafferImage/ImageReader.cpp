@@ -142,6 +142,8 @@ ImageReader::ImageReader( const std::string &name )
 
 	addChild( new IntPlug( "channelInterpretation", Plug::In, (int)ChannelInterpretation::Default, /* min */ (int)ChannelInterpretation::Legacy, /* max */ (int)ChannelInterpretation::Specification ) );
 
+	addChild( new IntPlug( "mipLevel", Plug::In, 0, /* min */ 0 ) );
+
 	addChild( new IntVectorDataPlug( "availableFrames", Plug::Out, new IntVectorData, Plug::Default & ~Plug::Serialisable ) );
 	addChild( new BoolPlug( "fileValid", Plug::Out, false, Plug::Default & ~Plug::Serialisable ) );
 
@@ -159,6 +161,7 @@ ImageReader::ImageReader( const std::string &name )
 	oiioReader->refreshCountPlug()->setInput( refreshCountPlug() );
 	oiioReader->missingFrameModePlug()->setInput( missingFrameModePlug() );
 	oiioReader->channelInterpretationPlug()->setInput( channelInterpretationPlug() );
+	oiioReader->mipLevelPlug()->setInput( mipLevelPlug() );
 	intermediateMetadataPlug()->setInput( oiioReader->outPlug()->metadataPlug() );
 	intermediateFileValidPlug()->setInput( oiioReader->fileValidPlug() );
 
@@ -266,84 +269,94 @@ const IntPlug *ImageReader::channelInterpretationPlug() const
 	return getChild<IntPlug>( g_firstChildIndex + 6 );
 }
 
+IntPlug *ImageReader::mipLevelPlug()
+{
+	return getChild<IntPlug>( g_firstChildIndex + 7 );
+}
+
+const IntPlug *ImageReader::mipLevelPlug() const
+{
+	return getChild<IntPlug>( g_firstChildIndex + 7 );
+}
+
 Gaffer::IntVectorDataPlug *ImageReader::availableFramesPlug()
 {
-	return getChild<IntVectorDataPlug>( g_firstChildIndex + 7 );
+	return getChild<IntVectorDataPlug>( g_firstChildIndex + 8 );
 }
 
 const Gaffer::IntVectorDataPlug *ImageReader::availableFramesPlug() const
 {
-	return getChild<IntVectorDataPlug>( g_firstChildIndex + 7 );
+	return getChild<IntVectorDataPlug>( g_firstChildIndex + 8 );
 }
 
 Gaffer::BoolPlug *ImageReader::fileValidPlug()
 {
-	return getChild<BoolPlug>( g_firstChildIndex + 8 );
+	return getChild<BoolPlug>( g_firstChildIndex + 9 );
 }
 
 const Gaffer::BoolPlug *ImageReader::fileValidPlug() const
 {
-	return getChild<BoolPlug>( g_firstChildIndex + 8 );
+	return getChild<BoolPlug>( g_firstChildIndex + 9 );
 }
 
 Gaffer::BoolPlug *ImageReader::intermediateFileValidPlug()
 {
-	return getChild<BoolPlug>( g_firstChildIndex + 9 );
+	return getChild<BoolPlug>( g_firstChildIndex + 10 );
 }
 
 const Gaffer::BoolPlug *ImageReader::intermediateFileValidPlug() const
 {
-	return getChild<BoolPlug>( g_firstChildIndex + 9 );
+	return getChild<BoolPlug>( g_firstChildIndex + 10 );
 }
 
 AtomicCompoundDataPlug *ImageReader::intermediateMetadataPlug()
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstChildIndex + 10 );
+	return getChild<AtomicCompoundDataPlug>( g_firstChildIndex + 11 );
 }
 
 const AtomicCompoundDataPlug *ImageReader::intermediateMetadataPlug() const
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstChildIndex + 10 );
+	return getChild<AtomicCompoundDataPlug>( g_firstChildIndex + 11 );
 }
 
 StringPlug *ImageReader::intermediateColorSpacePlug()
 {
-	return getChild<StringPlug>( g_firstChildIndex + 11 );
+	return getChild<StringPlug>( g_firstChildIndex + 12 );
 }
 
 const StringPlug *ImageReader::intermediateColorSpacePlug() const
 {
-	return getChild<StringPlug>( g_firstChildIndex + 11 );
+	return getChild<StringPlug>( g_firstChildIndex + 12 );
 }
 
 ImagePlug *ImageReader::intermediateImagePlug()
 {
-	return getChild<ImagePlug>( g_firstChildIndex + 12 );
+	return getChild<ImagePlug>( g_firstChildIndex + 13 );
 }
 
 const ImagePlug *ImageReader::intermediateImagePlug() const
 {
-	return getChild<ImagePlug>( g_firstChildIndex + 12 );
+	return getChild<ImagePlug>( g_firstChildIndex + 13 );
 }
 
 OpenImageIOReader *ImageReader::oiioReader()
 {
-	return getChild<OpenImageIOReader>( g_firstChildIndex + 13 );
+	return getChild<OpenImageIOReader>( g_firstChildIndex + 14 );
 }
 
 const OpenImageIOReader *ImageReader::oiioReader() const
 {
-	return getChild<OpenImageIOReader>( g_firstChildIndex + 13 );
+	return getChild<OpenImageIOReader>( g_firstChildIndex + 14 );
 }
 
 ColorSpace *ImageReader::colorSpace()
 {
-	return getChild<ColorSpace>( g_firstChildIndex + 14 );
+	return getChild<ColorSpace>( g_firstChildIndex + 15 );
 }
 
 const ColorSpace *ImageReader::colorSpace() const
 {
-	return getChild<ColorSpace>( g_firstChildIndex + 14 );
+	return getChild<ColorSpace>( g_firstChildIndex + 15 );
 }
 
 size_t ImageReader::supportedExtensions( std::vector<std::string> &extensions )
@@ -345,7 +345,12 @@ class FlatTileWriter
 
 			Imath::V2i outTileOrig( tilesWrite.min.x, tilesWrite.max.y - m_spec.tile_height );
 
-			for( ; outTileOrig.y >= tilesWrite.min.y; outTileOrig.y -= m_spec.tile_height )
+			// Output tiles are initialised to black, so there is nothing to copy
+			// from a black input tile. And if all the input tiles for an output
+			// tile are black, we never need to allocate it at all.
+			const bool black = data == ImagePlug::blackTile();
+
+			for( ; !black && outTileOrig.y >= tilesWrite.min.y; outTileOrig.y -= m_spec.tile_height )
 			{
 				for( outTileOrig.x = tilesWrite.min.x; outTileOrig.x < tilesWrite.max.x; outTileOrig.x += m_spec.tile_width )
 				{
@@ -443,7 +448,15 @@ class FlatTileWriter
 
 				if( m_tilesFilled[tileIndex] )
 				{
-					writeTile( tileOrigin, m_tilesData[tileIndex] );
+					if( !m_tilesData[tileIndex]->readable().empty() )
+					{
+						writeTile( tileOrigin, m_tilesData[tileIndex] );
+					}
+					else
+					{
+						// Every input tile was black, so we never allocated this one.
+						writeTile( tileOrigin, blackTile() );
+					}
 					m_tilesData[tileIndex].reset();
 				}
 				else if( !BufferAlgo::intersects( m_inputTilesBounds, outTileBounds( tileIndex ) ) )
@@ -44,6 +44,8 @@
 #include "IECore/BoxOps.h"
 
 #include "fmt/format.h"
+
+#include <algorithm>
 #include <limits>
 
 using namespace std;
@@ -62,19 +64,39 @@ enum SingleInputMode
 	Copy
 };
 
-struct OpAdd
+// Describes the result of an operation when one of the input alphas is
+// known to be 0 or 1 for every pixel in the tile. This allows us to pass
+// through an entire input tile rather than operate on every pixel, which
+// is common for the opaque and empty regions of layers in a comp.
+enum ConstantAlphaMode
+{
+	Compute,
+	ResultBlack,
+	ResultA,
+	ResultB
+};
+
+struct OpBase
+{
+	static const ConstantAlphaMode transparentA = Compute;
+	static const ConstantAlphaMode opaqueA = Compute;
+	static const ConstantAlphaMode transparentB = Compute;
+	static const ConstantAlphaMode opaqueB = Compute;
+};
+
+struct OpAdd : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A + B; }
 	static const SingleInputMode onlyA = Copy;
 	static const SingleInputMode onlyB = Copy;
 };
-struct OpAtop
+struct OpAtop : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A*b + B*(1.-a); }
 	static const SingleInputMode onlyA = Black;
 	static const SingleInputMode onlyB = Copy;
 };
-struct OpDivide
+struct OpDivide : public OpBase
 {
 // MSVC warns that the following lines could result in a division by zero.
 // (incorrectly marking the `for()` loop start as the problem line)
@@ -102,49 +124,58 @@ struct OpDivide
 	static const SingleInputMode onlyA = Operate;
 	static const SingleInputMode onlyB = Black;
 };
-struct OpIn
+struct OpIn : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A*b; }
 	static const SingleInputMode onlyA = Black;
 	static const SingleInputMode onlyB = Black;
+	static const ConstantAlphaMode transparentB = ResultBlack;
+	static const ConstantAlphaMode opaqueB = ResultA;
 };
-struct OpOut
+struct OpOut : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A*(1.-b); }
 	static const SingleInputMode onlyA = Copy;
 	static const SingleInputMode onlyB = Black;
+	static const ConstantAlphaMode transparentB = ResultA;
+	static const ConstantAlphaMode opaqueB = ResultBlack;
 };
-struct OpMask
+struct OpMask : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return B*a; }
 	static const SingleInputMode onlyA = Black;
 	static const SingleInputMode onlyB = Black;
+	static const ConstantAlphaMode transparentA = ResultBlack;
+	static const ConstantAlphaMode opaqueA = ResultB;
 };
-struct OpMatte
+struct OpMatte : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A*a + B*(1.-a); }
 	static const SingleInputMode onlyA = Operate;
 	static const SingleInputMode onlyB = Copy;
+	static const ConstantAlphaMode transparentA = ResultB;
+	static const ConstantAlphaMode opaqueA = ResultA;
 };
-struct OpMultiply
+struct OpMultiply : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A * B; }
 	static const SingleInputMode onlyA = Black;
 	static const SingleInputMode onlyB = Black;
 };
-struct OpOver
+struct OpOver : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A + B*(1.-a); }
 	static const SingleInputMode onlyA = Copy;
 	static const SingleInputMode onlyB = Copy;
+	static const ConstantAlphaMode opaqueA = ResultA;
 };
-struct OpSubtract
+struct OpSubtract : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A - B; }
 	static const SingleInputMode onlyA = Copy;
 	static const SingleInputMode onlyB = Operate;
 };
-struct OpDifference
+struct OpDifference : public OpBase
 {
 	static float operate( float A, float B, float a, float b)
 	{
@@ -162,19 +193,20 @@ struct OpDifference
 	static const SingleInputMode onlyA = Operate;
 	static const SingleInputMode onlyB = Operate;
 };
-struct OpUnder
+struct OpUnder : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return A*(1.-b) + B; }
 	static const SingleInputMode onlyA = Copy;
 	static const SingleInputMode onlyB = Copy;
+	static const ConstantAlphaMode opaqueB = ResultB;
 };
-struct OpMin
+struct OpMin : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return std::min( A, B ); }
 	static const SingleInputMode onlyA = Operate;
 	static const SingleInputMode onlyB = Operate;
 };
-struct OpMax
+struct OpMax : public OpBase
 {
 	static float operate( float A, float B, float a, float b){ return std::max( A, B ); }
 	static const SingleInputMode onlyA = Operate;
@@ -303,6 +335,81 @@ inline MergeRegion tileRegion( int i, const Box2i &boundA, const Box2i &boundB,
 	return (MergeRegion)(( InsideA * inA ) | ( InsideB * inB ));
 }
 
+// Returns true if every value in the tile is equal to `value`.
+bool tileIsConstant( const ConstFloatVectorDataPtr &data, float value )
+{
+	if( data == ImagePlug::blackTile() )
+	{
+		return value == 0.0f;
+	}
+	else if( data == ImagePlug::whiteTile() )
+	{
+		return value == 1.0f;
+	}
+
+	const std::vector<float> &v = data->readable();
+	return std::all_of( v.begin(), v.end(), [value] ( float x ) { return x == value; } );
+}
+
+// Returns the result of `Op` for a whole tile, given the alpha values of the
+// inputs. We only pay for the alpha scans if the op has a shortcut for them.
+template<class Op>
+ConstantAlphaMode constantAlphaMode( const ConstFloatVectorDataPtr &alphaDataA, const ConstFloatVectorDataPtr &alphaDataB )
+{
+	if( Op::transparentA != Compute && tileIsConstant( alphaDataA, 0.0f ) )
+	{
+		return Op::transparentA;
+	}
+	if( Op::opaqueA != Compute && tileIsConstant( alphaDataA, 1.0f ) )
+	{
+		return Op::opaqueA;
+	}
+	if( Op::transparentB != Compute && tileIsConstant( alphaDataB, 0.0f ) )
+	{
+		return Op::transparentB;
+	}
+	if( Op::opaqueB != Compute && tileIsConstant( alphaDataB, 1.0f ) )
+	{
+		return Op::opaqueB;
+	}
+	return Compute;
+}
+
+// Kernels for applying `Op` to a contiguous span of pixels. These are written
+// as simple indexed loops without branches, processing colour and alpha in
+// separate passes, so that the compiler can vectorise them. When `useA` or `useB`
+// is false, the corresponding input is outside its data window and is treated
+// as 0.
+template<class Op, bool useA, bool useB>
+void operateSpan( const float *A, const float *a, const float *B, const float *b, float *R, float *r, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		R[j] = Op::operate( useA ? A[j] : 0.0f, useB ? B[j] : 0.0f, useA ? a[j] : 0.0f, useB ? b[j] : 0.0f );
+	}
+	for( int j = 0; j < length; ++j )
+	{
+		r[j] = Op::operate( useA ? a[j] : 0.0f, useB ? b[j] : 0.0f, useA ? a[j] : 0.0f, useB ? b[j] : 0.0f );
+	}
+}
+
+// As above, but for the common case where we are accumulating into the merge
+// buffers, so the B input is also the output. Making this explicit lets the
+// compiler vectorise without having to prove that the result doesn't overlap
+// the input. Note that colour must be computed before alpha is overwritten.
+template<class Op, bool useA>
+void operateSpanInPlace( const float *A, const float *a, float *R, float *r, int length )
+{
+	for( int j = 0; j < length; ++j )
+	{
+		R[j] = Op::operate( useA ? A[j] : 0.0f, R[j], useA ? a[j] : 0.0f, r[j] );
+	}
+	for( int j = 0; j < length; ++j )
+	{
+		r[j] = Op::operate( useA ? a[j] : 0.0f, r[j], useA ? a[j] : 0.0f, r[j] );
+	}
+}
+
 struct MergeFunctor
 {
 	using ReturnType = void;
@@ -401,6 +508,40 @@ struct MergeFunctor
 		float *R = &mergeChannelBuffer->writable().front();
 		float *r = &mergeAlphaBuffer->writable().front();
 
+		const Box2i fullTile( V2i( 0 ), V2i( ImagePlug::tileSize() ) );
+		if( boundA == fullTile && boundB == fullTile )
+		{
+			// Both inputs cover the whole tile, but if either alpha is entirely
+			// transparent or opaque, the op may reduce to copying one of the inputs,
+			// which is much cheaper than operating on every pixel. Note that we
+			// still copy into the merge buffers rather than passing through the
+			// input directly, so that the result remains consistent with
+			// `PassthroughHashFunctor`, which can't afford to inspect the alpha.
+			const ConstantAlphaMode mode = constantAlphaMode<Op>( alphaDataA, alphaDataB );
+			if( mode != Compute )
+			{
+				const size_t size = ImagePlug::tilePixels() * sizeof( float );
+				if( mode == ResultBlack )
+				{
+					memset( R, 0, size );
+					memset( r, 0, size );
+				}
+				else if( mode == ResultA )
+				{
+					memcpy( R, A, size );
+					memcpy( r, a, size );
+				}
+				else if( R != B )
+				{
+					memcpy( R, B, size );
+					memcpy( r, b, size );
+				}
+				channelDataB = mergeChannelBuffer;
+				alphaDataB = mergeAlphaBuffer;
+				return;
+			}
+		}
+
 
 		// Iterate through all the pixels in the tile, using the wrapped
 		// pixelIndex which corresponds directly to the index in the
@@ -424,86 +565,53 @@ struct MergeFunctor
 			{
 				// If we are outside both inputs, or the Op is black when one input is
 				// black, then everything is this region is black
-				memset( R, 0, length * sizeof( float ) );
-				memset( r, 0, length * sizeof( float ) );
-				A += length; a += length;
-				B += length; b += length;
-				R += length; r += length;
+				memset( R + i, 0, length * sizeof( float ) );
+				memset( r + i, 0, length * sizeof( float ) );
 			}
 			else if( region == InsideB )
 			{
 				if( Op::onlyB == SingleInputMode::Copy )
 				{
-					if( R == B )
-					{
-						// We're already working in the merge buffers, so we don't need to do anything
-						// if input B is left untouched
-					}
-					else
+					// In a region with one input where we know the operator just passes through
+					// an input, we can just copy it over. If we're already working in the merge
+					// buffers, there is nothing to do.
+					if( R != B )
 					{
-						// In a region with one input where we know the operator just passes through
-						// an input, we can just copy it over.
-						// Note: that this does not actually currently improve performance measurably,
-						// the compiler probably does quite a good job of inlining Op::operate,
-						// noticing that it is a passthrough, and translating it into something memcpy'ish
-						// This structure still feels worthwhile since it's a bit more explicit about what
-						// is happening, and this structure could be useful if we pursue a bit of
-						// vectorization
-						memcpy( R, B, length * sizeof( float ) );
-						memcpy( r, b, length * sizeof( float ) );
+						memcpy( R + i, B + i, length * sizeof( float ) );
+						memcpy( r + i, b + i, length * sizeof( float ) );
 					}
-					A += length; a += length;
-					B += length; b += length;
-					R += length; r += length;
+				}
+				else if( R == B )
+				{
+					operateSpanInPlace<Op, /* useA = */ false>( nullptr, nullptr, R + i, r + i, length );
 				}
 				else
 				{
-					// Outside A dataWindow, so call operator with 0 substituted for A and a
-					for( int j = 0; j < length; j++ )
-					{
-						*R = Op::operate( 0.0f, *B, 0.0f, *b );
-						*r = Op::operate( 0.0f, *b, 0.0f, *b );
-						++B; ++b;
-						++R; ++r;
-					}
-					A += length; a += length;
+					operateSpan<Op, /* useA = */ false, /* useB = */ true>( nullptr, nullptr, B + i, b + i, R + i, r + i, length );
 				}
 			}
 			else if( region == InsideA )
 			{
 				if( Op::onlyA == SingleInputMode::Copy )
 				{
-					// In a region with one input where we know the operator just passes through
-					// an input, we can just copy it over.
-					memcpy( R, A, length * sizeof( float ) );
-					memcpy( r, a, length * sizeof( float ) );
-					A += length; a += length;
-					B += length; b += length;
-					R += length; r += length;
+					memcpy( R + i, A + i, length * sizeof( float ) );
+					memcpy( r + i, a + i, length * sizeof( float ) );
 				}
 				else
 				{
-					// Outside B dataWindow, so call operator with 0 substituted for B and b
-					for( int j = 0; j < length; j++ )
-					{
-						*R = Op::operate( *A, 0.0f, *a, 0.0f );
-						*r = Op::operate( *a, 0.0f, *a, 0.0f );
-						++A; ++a;
-						++R; ++r;
-					}
-					B += length; b += length;
+					operateSpan<Op, /* useA = */ true, /* useB = */ false>( A + i, a + i, nullptr, nullptr, R + i, r + i, length );
 				}
 			}
 			else
 			{
 				// Within both data windows, this is when we actually need to run the full operate()
-				for( int j = 0; j < length; j++ )
+				if( R == B )
+				{
+					operateSpanInPlace<Op, /* useA = */ true>( A + i, a + i, R + i, r + i, length );
+				}
+				else
 				{
-					*R = Op::operate( *A, *B, *a, *b );
-					*r = Op::operate( *a, *b, *a, *b );
-					++A; ++a;
-					++B; ++b;
-					++R; ++r;
+					operateSpan<Op, /* useA = */ true, /* useB = */ true>( A + i, a + i, B + i, b + i, R + i, r + i, length );
 				}
 			}
 			i += length;
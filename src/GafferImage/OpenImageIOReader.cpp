@@ -44,7 +44,10 @@
 #include "GafferImage/ImageAlgo.h"
 #include "GafferImage/ImageReader.h"
 
+#include "Gaffer/BackgroundTask.h"
 #include "Gaffer/Context.h"
+#include "Gaffer/ParallelAlgo.h"
+#include "Gaffer/ScriptNode.h"
 #include "Gaffer/StringPlug.h"
 
 #include "IECoreImage/OpenImageIOAlgo.h"
@@ -59,12 +62,17 @@
 
 #include <boost/algorithm/string.hpp>
 #include "boost/bind/bind.hpp"
+#include "boost/functional/hash.hpp"
 #include "boost/regex.hpp"
 
 #include "tbb/parallel_for.h"
 #include "tbb/enumerable_thread_specific.h"
+#include "tbb/task_arena.h"
 
+#include <atomic>
 #include <memory>
+#include <mutex>
+#include <unordered_set>
 
 OIIO_NAMESPACE_USING
 
@@ -709,15 +717,34 @@ Box2i expandToGrid( Box2i region, V2i gridOrigin, V2i gridSize )
 // Tile batches are selected using V3i "tileBatchOrigin".  The Z component is the subimage to load channels from.
 // The X and Y components are the pixel coordinates of the origin of the first tile.
 //
+// A File reads a single MIP level, which is used for all subimages. Everything else about the File, including
+// the views, data windows and tile batches, is derived from the specs for that level.
+//
 class File
 {
 
 	public:
 
 		// Create a File handle object for an image input and image spec
-		File( std::unique_ptr<ImageInput> imageInput, const std::string &infoFileName, ImageReader::ChannelInterpretation channelNaming )
-			: m_imageInput( std::move( imageInput ) )
+		File( std::unique_ptr<ImageInput> imageInput, const std::string &infoFileName, ImageReader::ChannelInterpretation channelNaming, int mipLevel )
+			: m_imageInput( std::move( imageInput ) ), m_mipLevel( 0 )
 		{
+			if( mipLevel > 0 )
+			{
+				// Clamp to the coarsest level available in every subimage, so that
+				// the data windows of the subimages remain consistent with each other.
+				m_mipLevel = mipLevel;
+				for( int subImageIndex = 0; m_imageInput->spec_dimensions( subImageIndex, 0 ).format != TypeUnknown; subImageIndex++ )
+				{
+					int numLevels = 1;
+					while( numLevels <= m_mipLevel && m_imageInput->spec_dimensions( subImageIndex, numLevels ).format != TypeUnknown )
+					{
+						numLevels++;
+					}
+					m_mipLevel = std::min( m_mipLevel, numLevels - 1 );
+				}
+			}
+
 			m_viewNamesData = new StringVectorData();
 			auto &viewNames = m_viewNamesData->writable();
 
@@ -725,7 +752,7 @@ class File
 			ImageSpec currentSpec;
 			for( int subImageIndex = 0; ; subImageIndex++ )
 			{
-				currentSpec = m_imageInput->spec( subImageIndex, 0 );
+				currentSpec = levelSpec( subImageIndex );
 				if( currentSpec.format == TypeUnknown )
 				{
 					// Gone past last subimage
@@ -945,7 +972,7 @@ class File
 		{
 			const View& view = lookupView( c );
 
-			const ImageSpec spec = m_imageInput->spec( tileBatchOrigin.z, 0 );
+			const ImageSpec spec = levelSpec( tileBatchOrigin.z );
 
 			const int tileBatchNumTileChannels = spec.nchannels * view.tileBatchSize.y * view.tileBatchSize.x;
 			const int tileBatchNumTiles = view.tileBatchSize.y * view.tileBatchSize.x;
@@ -1213,6 +1240,26 @@ class File
 				);
 			}
 
+			if( !spec.deep )
+			{
+				// Sparse images often contain many tiles that are entirely black. Replace
+				// these with the shared black tile, so that we don't hold duplicates in the
+				// cache, and so that downstream nodes can recognise them cheaply.
+				for( int subIndex = 0; subIndex < tileBatchNumTileChannels; subIndex++ )
+				{
+					if( !tileChannelPointers[ subIndex ] )
+					{
+						continue;
+					}
+
+					ConstFloatVectorDataPtr tile = ImageAlgo::shareConstantTile(
+						static_cast<const FloatVectorData *>( resultChannels->members()[ subIndex ].get() )
+					);
+					// As above, the const_cast is safe because our output is treated as const.
+					resultChannels->members()[ subIndex ] = const_cast<FloatVectorData *>( tile.get() );
+				}
+			}
+
 			if( spec.deep )
 			{
 				// For a deep image, all we can actually do in the initial pass is set initial sample counts
@@ -1327,7 +1374,7 @@ class File
 
 				// Tell OIIO to do the actual read/decompress to the temp buffer
 				if( !m_imageInput->read_scanlines(
-					tileBatchOrigin.z, 0,
+					tileBatchOrigin.z, m_mipLevel,
 					regionRect.min.y, regionRect.max.y, 0, 0, spec.nchannels, TypeDesc::FLOAT, &buffer[0]
 				) )
 				{
@@ -1347,7 +1394,7 @@ class File
 				// just the sample counts, so this read will pull in all the data, and we need
 				// to remember it for later.
 				if( !m_imageInput->read_native_deep_scanlines(
-					tileBatchOrigin.z, 0,
+					tileBatchOrigin.z, m_mipLevel,
 					regionRect.min.y, regionRect.max.y, 0, 0, spec.nchannels, *deepRectData
 				) )
 				{
@@ -1383,7 +1430,7 @@ class File
 
 				// Tell OIIO to do the actual read/decompress to the temp buffer
 				if( ! m_imageInput->read_tiles(
-					tileBatchOrigin.z, 0,
+					tileBatchOrigin.z, m_mipLevel,
 					regionRect.min.x, regionRect.max.x, regionRect.min.y, regionRect.max.y,
 					0, 1, 0, spec.nchannels, TypeDesc::FLOAT, &buffer[0]
 				) )
@@ -1404,7 +1451,7 @@ class File
 				// just the sample counts, so this read will pull in all the data, and we need
 				// to remember it for later.
 				if( !m_imageInput->read_native_deep_tiles (
-					tileBatchOrigin.z, 0,
+					tileBatchOrigin.z, m_mipLevel,
 					regionRect.min.x, regionRect.max.x, regionRect.min.y, regionRect.max.y,
 					0, 1, 0, spec.nchannels, *deepRectData
 				) )
@@ -1521,6 +1568,32 @@ class File
 			return channelIndex * tilePlaneSize + subXY.y * view.tileBatchSize.x + subXY.x;
 		}
 
+		// Returns the spec for a subimage at the MIP level we are reading. Not all
+		// formats scale the display window to match the level, so we do that ourselves
+		// where necessary to keep it consistent with the data window.
+		ImageSpec levelSpec( int subImage ) const
+		{
+			ImageSpec spec = m_imageInput->spec( subImage, m_mipLevel );
+			if( !m_mipLevel || spec.format == TypeUnknown )
+			{
+				return spec;
+			}
+
+			const ImageSpec topSpec = m_imageInput->spec_dimensions( subImage, 0 );
+			if(
+				spec.full_width == topSpec.full_width && spec.full_height == topSpec.full_height &&
+				( spec.width != topSpec.width || spec.height != topSpec.height )
+			)
+			{
+				const int levelScale = 1 << m_mipLevel;
+				spec.full_x = coordinateDivide( topSpec.full_x, levelScale );
+				spec.full_y = coordinateDivide( topSpec.full_y, levelScale );
+				spec.full_width = std::max( 1, topSpec.full_width / levelScale );
+				spec.full_height = std::max( 1, topSpec.full_height / levelScale );
+			}
+			return spec;
+		}
+
 		inline const View &lookupView( const Context *c ) const
 		{
 			std::string viewName = c->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName );
@@ -1569,6 +1642,7 @@ class File
 		}
 
 		std::unique_ptr<ImageInput> m_imageInput;
+		int m_mipLevel;
 		StringVectorDataPtr m_viewNamesData;
 		std::map<std::string, std::unique_ptr< View > > m_views;
 };
@@ -1584,13 +1658,41 @@ struct CacheEntry
 };
 
 
-CacheEntry fileCacheGetter( const std::pair< std::string, ImageReader::ChannelInterpretation> &fileNameAndChannelInterpretation, size_t &cost, const IECore::Canceller *canceller )
+struct FileCacheKey
+{
+
+	FileCacheKey( const std::string &fileName, ImageReader::ChannelInterpretation channelInterpretation, int mipLevel )
+		:	fileName( fileName ), channelInterpretation( channelInterpretation ), mipLevel( mipLevel )
+	{
+	}
+
+	bool operator == ( const FileCacheKey &other ) const
+	{
+		return fileName == other.fileName && channelInterpretation == other.channelInterpretation && mipLevel == other.mipLevel;
+	}
+
+	std::string fileName;
+	ImageReader::ChannelInterpretation channelInterpretation;
+	int mipLevel;
+
+};
+
+size_t hash_value( const FileCacheKey &key )
+{
+	size_t result = 0;
+	boost::hash_combine( result, key.fileName );
+	boost::hash_combine( result, (int)key.channelInterpretation );
+	boost::hash_combine( result, key.mipLevel );
+	return result;
+}
+
+CacheEntry fileCacheGetter( const FileCacheKey &key, size_t &cost, const IECore::Canceller *canceller )
 {
 	cost = 1;
 
 	CacheEntry result;
 
-	const std::string &fileName = fileNameAndChannelInterpretation.first;
+	const std::string &fileName = key.fileName;
 
 	std::unique_ptr<ImageInput> imageInput( ImageInput::create( fileName ) );
 	if( !imageInput )
@@ -1606,12 +1708,12 @@ CacheEntry fileCacheGetter( const std::pair< std::string, ImageReader::ChannelIn
 		return result;
 	}
 
-	result.file.reset( new File( std::move( imageInput ), fileName, fileNameAndChannelInterpretation.second ) );
+	result.file.reset( new File( std::move( imageInput ), fileName, key.channelInterpretation, key.mipLevel ) );
 
 	return result;
 }
 
-using FileHandleCache = IECorePreview::LRUCache< std::pair< std::string, ImageReader::ChannelInterpretation >, CacheEntry>;
+using FileHandleCache = IECorePreview::LRUCache<FileCacheKey, CacheEntry>;
 
 FileHandleCache *fileCache()
 {
@@ -1619,6 +1721,36 @@ FileHandleCache *fileCache()
 	return c;
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Read-ahead
+//////////////////////////////////////////////////////////////////////////
+
+std::atomic_int g_readAheadFrames( 0 );
+
+std::atomic_size_t g_cancelledReadAheads( 0 );
+std::atomic_size_t g_staleReadAheads( 0 );
+
+// Read-ahead is mostly waiting on I/O, and is speculative, so we limit the
+// number of threads it can occupy to avoid starving the foreground computes
+// that playback is actually waiting on.
+const int g_readAheadConcurrency = 4;
+
+tbb::task_arena &readAheadArena()
+{
+	// We reserve an additional slot for the thread scheduling the reads, so
+	// that it never waits for a worker to become free.
+	static tbb::task_arena a( g_readAheadConcurrency + 1, /* reserved_for_masters = */ 1 );
+	return a;
+}
+
+// The number of scheduled reads we remember in order to avoid scheduling
+// duplicates. This doesn't need to be precise, because a duplicate read
+// will just find the tile batch already in the compute cache.
+const size_t g_maxScheduledReadAheads = 10000;
+
+// The maximum number of reads waiting to be launched, or in progress.
+const size_t g_maxPendingReadAheads = 1000;
+
 boost::container::flat_set<ustring> g_metadataBlacklist = {
 	// These two attributes are used by OIIO/EXR to specify the names of
 	// subimages. We don't want to load them because :
@@ -1654,8 +1786,58 @@ GAFFER_NODE_DEFINE_TYPE( OpenImageIOReader );
 
 size_t OpenImageIOReader::g_firstPlugIndex = 0;
 
+struct OpenImageIOReader::ReadAheadTasks
+{
+
+	struct Request
+	{
+		ConstContextPtr context;
+		std::string channelName;
+		V2i tileOrigin;
+		IECore::MurmurHash key;
+	};
+
+	// Protects `scheduled` and `requests`, which are
+	// accessed from the compute threads.
+	std::mutex mutex;
+	std::unordered_set<IECore::MurmurHash> scheduled;
+	std::vector<Request> requests;
+
+	// Only accessed on the UI thread. BackgroundTask maintains
+	// global state which may only be modified on that thread.
+	std::vector<std::unique_ptr<BackgroundTask>> tasks;
+
+	~ReadAheadTasks()
+	{
+		for( auto &task : tasks )
+		{
+			task->cancelAndWait();
+		}
+		discardFinished();
+	}
+
+	void discardFinished()
+	{
+		tasks.erase(
+			std::remove_if(
+				tasks.begin(), tasks.end(),
+				[] ( const std::unique_ptr<BackgroundTask> &task ) {
+					const BackgroundTask::Status status = task->status();
+					if( status == BackgroundTask::Cancelled )
+					{
+						g_cancelledReadAheads++;
+					}
+					return status != BackgroundTask::Pending && status != BackgroundTask::Running;
+				}
+			),
+			tasks.end()
+		);
+	}
+
+};
+
 OpenImageIOReader::OpenImageIOReader( const std::string &name )
-	:	ImageNode( name )
+	:	ImageNode( name ), m_readAheadTasks( new ReadAheadTasks )
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild(
@@ -1670,6 +1852,7 @@ OpenImageIOReader::OpenImageIOReader( const std::string &name )
 	addChild( new IntVectorDataPlug( "availableFrames", Plug::Out, new IntVectorData ) );
 	addChild( new BoolPlug( "fileValid", Plug::Out ) );
 	addChild( new IntPlug( "channelInterpretation", Plug::In, (int)ImageReader::ChannelInterpretation::Default, /* min */ (int)ImageReader::ChannelInterpretation::Legacy, /* max */ (int)ImageReader::ChannelInterpretation::Specification ) );
+	addChild( new IntPlug( "mipLevel", Plug::In, 0, /* min */ 0 ) );
 	addChild( new ObjectVectorPlug( "__tileBatch", Plug::Out, new ObjectVector ) );
 
 	plugSetSignal().connect( boost::bind( &OpenImageIOReader::plugSet, this, ::_1 ) );
@@ -1739,14 +1922,24 @@ const Gaffer::IntPlug *OpenImageIOReader::channelInterpretationPlug() const
 	return getChild<IntPlug>( g_firstPlugIndex + 5 );
 }
 
+Gaffer::IntPlug *OpenImageIOReader::mipLevelPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 6 );
+}
+
+const Gaffer::IntPlug *OpenImageIOReader::mipLevelPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 6 );
+}
+
 Gaffer::ObjectVectorPlug *OpenImageIOReader::tileBatchPlug()
 {
-	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 6 );
+	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 7 );
 }
 
 const Gaffer::ObjectVectorPlug *OpenImageIOReader::tileBatchPlug() const
 {
-	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 6 );
+	return getChild<ObjectVectorPlug>( g_firstPlugIndex + 7 );
 }
 
 void OpenImageIOReader::setOpenFilesLimit( size_t maxOpenFiles )
@@ -1759,6 +1952,30 @@ size_t OpenImageIOReader::getOpenFilesLimit()
 	return fileCache()->getMaxCost();
 }
 
+void OpenImageIOReader::setReadAheadFrames( int frames )
+{
+	g_readAheadFrames = std::max( frames, 0 );
+}
+
+int OpenImageIOReader::getReadAheadFrames()
+{
+	return g_readAheadFrames;
+}
+
+OpenImageIOReader::ReadAheadStatistics OpenImageIOReader::readAheadStatistics()
+{
+	ReadAheadStatistics result;
+	result.cancelled = g_cancelledReadAheads;
+	result.stale = g_staleReadAheads;
+	return result;
+}
+
+void OpenImageIOReader::resetReadAheadStatistics()
+{
+	g_cancelledReadAheads = 0;
+	g_staleReadAheads = 0;
+}
+
 size_t OpenImageIOReader::supportedExtensions( std::vector<std::string> &extensions )
 {
 	std::string attr;
@@ -1792,12 +2009,15 @@ void OpenImageIOReader::affects( const Gaffer::Plug *input, AffectedPlugsContain
 		outputs.push_back( availableFramesPlug() );
 	}
 
-	if( input == fileNamePlug() || input == refreshCountPlug() || input == channelInterpretationPlug() )
+	if( input == fileNamePlug() || input == refreshCountPlug() || input == channelInterpretationPlug() || input == mipLevelPlug() )
 	{
 		outputs.push_back( fileValidPlug() );
 	}
 
-	if( input == fileNamePlug() || input == refreshCountPlug() || input == missingFrameModePlug() || input == channelInterpretationPlug() )
+	if(
+		input == fileNamePlug() || input == refreshCountPlug() || input == missingFrameModePlug() ||
+		input == channelInterpretationPlug() || input == mipLevelPlug()
+	)
 	{
 		outputs.push_back( tileBatchPlug() );
 		for( ValuePlug::Iterator it( outPlug() ); !it.done(); ++it )
@@ -1820,6 +2040,7 @@ void OpenImageIOReader::hash( const ValuePlug *output, const Context *context, I
 	{
 		refreshCountPlug()->hash( h );
 		channelInterpretationPlug()->hash( h );
+		mipLevelPlug()->hash( h );
 		hashFileName( context, h );
 	}
 	else if( output == availableFramesPlug() )
@@ -1839,6 +2060,7 @@ void OpenImageIOReader::hash( const ValuePlug *output, const Context *context, I
 		refreshCountPlug()->hash( h );
 		missingFrameModePlug()->hash( h );
 		channelInterpretationPlug()->hash( h );
+		mipLevelPlug()->hash( h );
 	}
 }
 
@@ -1854,11 +2076,12 @@ void OpenImageIOReader::compute( ValuePlug *output, const Context *context ) con
 		}
 
 		ImageReader::ChannelInterpretation channelNaming = (ImageReader::ChannelInterpretation)channelInterpretationPlug()->getValue();
+		const int mipLevel = mipLevelPlug()->getValue();
 
 		const std::string resolvedFileName = context->substitute( fileName );
 
 		FileHandleCache *cache = fileCache();
-		CacheEntry cacheEntry = cache->get( std::make_pair( resolvedFileName, channelNaming ) );
+		CacheEntry cacheEntry = cache->get( FileCacheKey( resolvedFileName, channelNaming, mipLevel ) );
 
 		static_cast<BoolPlug *>( output )->setValue( bool( cacheEntry.file ) );
 	}
@@ -1954,6 +2177,7 @@ void OpenImageIOReader::hashViewNames( const GafferImage::ImagePlug *parent, con
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	channelInterpretationPlug()->hash( h );  // Affects whether "main" is interpreted as "default"
 }
 
@@ -1973,6 +2197,7 @@ void OpenImageIOReader::hashFormat( const GafferImage::ImagePlug *output, const
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	GafferImage::Format format = FormatPlug::getDefaultFormat( context );
 	h.append( format.getDisplayWindow() );
 	h.append( format.getPixelAspect() );
@@ -2005,6 +2230,7 @@ void OpenImageIOReader::hashDataWindow( const GafferImage::ImagePlug *output, co
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
 }
 
@@ -2028,6 +2254,7 @@ void OpenImageIOReader::hashMetadata( const GafferImage::ImagePlug *output, cons
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	fileValidPlug()->hash( h );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
 }
@@ -2097,6 +2324,7 @@ void OpenImageIOReader::hashChannelNames( const GafferImage::ImagePlug *output,
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	channelInterpretationPlug()->hash( h );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
 }
@@ -2117,6 +2345,7 @@ void OpenImageIOReader::hashDeep( const GafferImage::ImagePlug *output, const Ga
 	hashFileName( context, h );
 	refreshCountPlug()->hash( h );
 	missingFrameModePlug()->hash( h );
+	mipLevelPlug()->hash( h );
 	h.append( context->get<std::string>( ImagePlug::viewNameContextName, ImagePlug::defaultViewName ) );
 }
 
@@ -2142,6 +2371,7 @@ void OpenImageIOReader::hashSampleOffsets( const GafferImage::ImagePlug *output,
 		hashFileName( context, h );
 		refreshCountPlug()->hash( h );
 		missingFrameModePlug()->hash( h );
+		mipLevelPlug()->hash( h );
 		channelInterpretationPlug()->hash( h );
 	}
 }
@@ -2197,6 +2427,7 @@ void OpenImageIOReader::hashChannelData( const GafferImage::ImagePlug *output, c
 		hashFileName( context, h );
 		refreshCountPlug()->hash( h );
 		missingFrameModePlug()->hash( h );
+		mipLevelPlug()->hash( h );
 		channelInterpretationPlug()->hash( h );
 	}
 }
@@ -2228,6 +2459,11 @@ IECore::ConstFloatVectorDataPtr OpenImageIOReader::computeChannelData( const std
 	int subIndex;
 	file->findTile( context, channelName, tileOrigin, tileBatchOrigin, subIndex );
 
+	if( g_readAheadFrames )
+	{
+		readAhead( c.context(), channelName, tileOrigin, tileBatchOrigin );
+	}
+
 	c.set( g_tileBatchOriginContextName, &tileBatchOrigin );
 
 	ConstObjectVectorPtr tileBatch = tileBatchPlug()->getValue();
@@ -2248,6 +2484,158 @@ void OpenImageIOReader::plugSet( Gaffer::Plug *plug )
 	}
 }
 
+void OpenImageIOReader::readAhead( const Gaffer::Context *context, const std::string &channelName, const Imath::V2i &tileOrigin, const Imath::V3i &tileBatchOrigin ) const
+{
+	if( !ParallelAlgo::canCallOnUIThread() )
+	{
+		// We need the UI thread to launch the BackgroundTasks that
+		// do the reading, so read-ahead is only available in the GUI.
+		return;
+	}
+
+	const int frames = g_readAheadFrames;
+
+	// We're called for every channel of every tile, but only want to schedule
+	// each tile batch once. The dirty count stands in for a hash of our inputs,
+	// so that edits to the node cause batches to be scheduled again.
+	IECore::MurmurHash key = context->hash();
+	key.append( tileBatchOrigin );
+	key.append( frames );
+	key.append( (uint64_t)tileBatchPlug()->dirtyCount() );
+
+	bool launch;
+	{
+		std::lock_guard<std::mutex> lock( m_readAheadTasks->mutex );
+		if( m_readAheadTasks->scheduled.size() >= g_maxScheduledReadAheads )
+		{
+			m_readAheadTasks->scheduled.clear();
+		}
+		if(
+			m_readAheadTasks->requests.size() >= g_maxPendingReadAheads ||
+			!m_readAheadTasks->scheduled.insert( key ).second
+		)
+		{
+			return;
+		}
+
+		launch = m_readAheadTasks->requests.empty();
+		const float frame = context->getFrame();
+		for( int i = 1; i <= frames; ++i )
+		{
+			ContextPtr readAheadContext = new Context( *context, /* omitCanceller = */ true );
+			readAheadContext->setFrame( frame + i );
+			m_readAheadTasks->requests.push_back( { readAheadContext, channelName, tileOrigin, key } );
+		}
+	}
+
+	if( launch )
+	{
+		// We can't create BackgroundTasks on this thread, because their
+		// bookkeeping isn't threadsafe. So we hand our requests to the UI
+		// thread, which is also the only thread that can edit the graph
+		// and cancel them.
+		ParallelAlgo::callOnUIThread(
+			[reader = ConstOpenImageIOReaderPtr( this )] {
+				reader->launchReadAheads();
+			}
+		);
+	}
+}
+
+void OpenImageIOReader::launchReadAheads() const
+{
+	std::vector<ReadAheadTasks::Request> requests;
+	{
+		std::lock_guard<std::mutex> lock( m_readAheadTasks->mutex );
+		requests.swap( m_readAheadTasks->requests );
+	}
+
+	m_readAheadTasks->discardFinished();
+	auto &tasks = m_readAheadTasks->tasks;
+
+	// BackgroundTask warns if the subject isn't in a script, so we
+	// only provide one when it is. Reads for nodes outside a script
+	// are still cancelled by the destruction of the node.
+	const Plug *subject = ancestor<ScriptNode>() ? tileBatchPlug() : nullptr;
+
+	for( auto it = requests.begin(); it != requests.end(); ++it )
+	{
+		if( tasks.size() >= g_maxPendingReadAheads )
+		{
+			// Read-ahead is speculative, so we'd rather drop requests
+			// than let a backlog build up. But we must forget that we
+			// scheduled them, so that they can be requested again later.
+			std::lock_guard<std::mutex> lock( m_readAheadTasks->mutex );
+			for( ; it != requests.end(); ++it )
+			{
+				m_readAheadTasks->scheduled.erase( it->key );
+			}
+			break;
+		}
+
+		const ReadAheadTasks::Request &request = *it;
+
+		// BackgroundTask enqueues work into the current arena, so we
+		// construct it within ours to limit the concurrency.
+		readAheadArena().execute(
+			[&] {
+				tasks.push_back(
+					std::make_unique<BackgroundTask>(
+						subject,
+						[this, request] ( const IECore::Canceller &canceller ) {
+							const uint64_t dirtyCount = tileBatchPlug()->dirtyCount();
+							Context::EditableScope scope( request.context.get() );
+							scope.setCanceller( &canceller );
+							readAheadTileBatch( scope.context(), request.channelName, request.tileOrigin );
+							if( tileBatchPlug()->dirtyCount() != dirtyCount )
+							{
+								g_staleReadAheads++;
+							}
+						}
+					)
+				);
+			}
+		);
+	}
+}
+
+void OpenImageIOReader::readAheadTileBatch( const Gaffer::Context *context, const std::string &channelName, const Imath::V2i &tileOrigin ) const
+{
+	try
+	{
+		FilePtr file = std::static_pointer_cast<File>( retrieveFile( context ) );
+		if( !file )
+		{
+			return;
+		}
+
+		const Box2i dataWindow = outPlug()->dataWindowPlug()->getValue();
+		if( !BufferAlgo::intersects( dataWindow, Box2i( tileOrigin, tileOrigin + V2i( ImagePlug::tileSize() ) ) ) )
+		{
+			return;
+		}
+
+		V3i tileBatchOrigin;
+		int subIndex;
+		file->findTile( context, channelName, tileOrigin, tileBatchOrigin, subIndex );
+
+		Context::EditableScope scope( context );
+		scope.set( g_tileBatchOriginContextName, &tileBatchOrigin );
+		tileBatchPlug()->getValue();
+	}
+	catch( const IECore::Cancelled & )
+	{
+		// Let BackgroundTask know we were cancelled.
+		throw;
+	}
+	catch( const std::exception & )
+	{
+		// Read-ahead is speculative, and the frame may well be missing or
+		// different. Any genuine error will be reported when the frame is
+		// actually requested.
+	}
+}
+
 // Returns the file handle container for the current context, by evaluating the appropriate plugs.
 // Throws if the file is invalid, and returns null if the filename is empty.
 std::shared_ptr<void> OpenImageIOReader::retrieveFile( const Context *context, bool holdForBlack ) const
@@ -2266,11 +2654,12 @@ std::shared_ptr<void> OpenImageIOReader::retrieveFile( const Context *context, b
 		mode = Hold;
 	}
 	ImageReader::ChannelInterpretation channelNaming = (ImageReader::ChannelInterpretation)channelInterpretationPlug()->getValue();
+	const int mipLevel = mipLevelPlug()->getValue();
 
 	const std::string resolvedFileName = context->substitute( fileName );
 
 	FileHandleCache *cache = fileCache();
-	CacheEntry cacheEntry = cache->get( std::make_pair( resolvedFileName, channelNaming ) );
+	CacheEntry cacheEntry = cache->get( FileCacheKey( resolvedFileName, channelNaming, mipLevel ) );
 	if( !cacheEntry.file )
 	{
 		if( mode == OpenImageIOReader::Black )
@@ -2300,7 +2689,7 @@ std::shared_ptr<void> OpenImageIOReader::retrieveFile( const Context *context, b
 				holdScope.setFrame( *fIt );
 
 				const std::string resolvedFileNameHeld = holdScope.context()->substitute( fileName );
-				cacheEntry = cache->get( std::make_pair( resolvedFileNameHeld, channelNaming ) );
+				cacheEntry = cache->get( FileCacheKey( resolvedFileNameHeld, channelNaming, mipLevel ) );
 			}
 
 			// if we got here, there was no suitable file sequence, or we weren't able to open the held frame
@@ -134,10 +134,23 @@ void GafferImageModule::bindIO()
 			.staticmethod( "setOpenFilesLimit" )
 			.def( "getOpenFilesLimit", &OpenImageIOReader::getOpenFilesLimit )
 			.staticmethod( "getOpenFilesLimit" )
+			.def( "setReadAheadFrames", &OpenImageIOReader::setReadAheadFrames )
+			.staticmethod( "setReadAheadFrames" )
+			.def( "getReadAheadFrames", &OpenImageIOReader::getReadAheadFrames )
+			.staticmethod( "getReadAheadFrames" )
+			.def( "readAheadStatistics", &OpenImageIOReader::readAheadStatistics )
+			.staticmethod( "readAheadStatistics" )
+			.def( "resetReadAheadStatistics", &OpenImageIOReader::resetReadAheadStatistics )
+			.staticmethod( "resetReadAheadStatistics" )
 			.def( "supportedExtensions", &supportedExtensions<OpenImageIOReader> )
 			.staticmethod( "supportedExtensions" )
 		;
 
+		class_<OpenImageIOReader::ReadAheadStatistics>( "ReadAheadStatistics" )
+			.def_readonly( "cancelled", &OpenImageIOReader::ReadAheadStatistics::cancelled )
+			.def_readonly( "stale", &OpenImageIOReader::ReadAheadStatistics::stale )
+		;
+
 		enum_<OpenImageIOReader::MissingFrameMode>( "MissingFrameMode" )
 			.value( "Error", OpenImageIOReader::Error )
 			.value( "Black", OpenImageIOReader::Black )
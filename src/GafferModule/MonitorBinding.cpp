@@ -132,6 +132,96 @@ dict contextMonitorVariableHashes( const ContextMonitor::Statistics &s, IECore::
 	return result;
 }
 
+std::string formatTimelineWrapper( const PerformanceMonitor &monitor )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return MonitorAlgo::formatTimeline( monitor );
+}
+
+void saveTimelineWrapper( const PerformanceMonitor &monitor, const std::string &fileName )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	MonitorAlgo::saveTimeline( monitor, fileName );
+}
+
+list timeline( const PerformanceMonitor &monitor )
+{
+	list result;
+	for( const auto &event : monitor.timeline() )
+	{
+		result.append( event );
+	}
+	return result;
+}
+
+PlugPtr eventPlug( const PerformanceMonitor::Event &event )
+{
+	return boost::const_pointer_cast<Plug>( event.plug );
+}
+
+std::string eventType( const PerformanceMonitor::Event &event )
+{
+	return event.type.string();
+}
+
+boost::chrono::nanoseconds::rep eventStartTime( const PerformanceMonitor::Event &event )
+{
+	return event.startTime.count();
+}
+
+boost::chrono::nanoseconds::rep eventEndTime( const PerformanceMonitor::Event &event )
+{
+	return event.endTime.count();
+}
+
+CriticalPath criticalPathWrapper( const PerformanceMonitor &monitor )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return MonitorAlgo::criticalPath( monitor );
+}
+
+std::string formatCriticalPathWrapper( const PerformanceMonitor &monitor, size_t maxLines )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return MonitorAlgo::formatCriticalPath( monitor, maxLines );
+}
+
+list criticalPathEvents( const CriticalPath &path )
+{
+	list result;
+	for( const auto &event : path.events )
+	{
+		result.append( event );
+	}
+	return result;
+}
+
+dict criticalPathNodeDurations( const CriticalPath &path )
+{
+	dict result;
+	for( const auto &[node, durations] : path.nodeDurations )
+	{
+		result[boost::const_pointer_cast<Node>( node )] = durations;
+	}
+	return result;
+}
+
+boost::chrono::nanoseconds::rep nodeDurationsInclusiveDuration( const NodeDurations &d )
+{
+	return d.inclusiveDuration.count();
+}
+
+boost::chrono::nanoseconds::rep nodeDurationsExclusiveDuration( const NodeDurations &d )
+{
+	return d.exclusiveDuration.count();
+}
+
+void annotateCriticalPathWrapper( Node &root, const PerformanceMonitor &monitor, bool persistent )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	MonitorAlgo::annotateCriticalPath( root, monitor, persistent );
+}
+
 void annotateWrapper1( Node &root, const PerformanceMonitor &monitor, bool persistent )
 {
 	IECorePython::ScopedGILRelease gilRelease;
@@ -240,6 +330,23 @@ void GafferModule::bindMonitor()
 			)
 		);
 
+		def( "formatTimeline", &formatTimelineWrapper, arg( "monitor" ) );
+		def( "saveTimeline", &saveTimelineWrapper, ( arg( "monitor" ), arg( "fileName" ) ) );
+
+		class_<NodeDurations>( "NodeDurations", no_init )
+			.add_property( "inclusiveDuration", &nodeDurationsInclusiveDuration )
+			.add_property( "exclusiveDuration", &nodeDurationsExclusiveDuration )
+			.def_readonly( "criticalPath", &NodeDurations::criticalPath )
+		;
+
+		class_<CriticalPath>( "CriticalPath", no_init )
+			.add_property( "events", &criticalPathEvents )
+			.add_property( "nodeDurations", &criticalPathNodeDurations )
+		;
+
+		def( "criticalPath", &criticalPathWrapper, arg( "monitor" ) );
+		def( "formatCriticalPath", &formatCriticalPathWrapper, ( arg( "monitor" ), arg( "maxLines" ) = 50 ) );
+
 		def(
 			"annotate",
 			&annotateWrapper1,
@@ -258,6 +365,12 @@ void GafferModule::bindMonitor()
 			( arg( "node" ), arg( "monitor" ), arg( "persistent" ) = true )
 		);
 
+		def(
+			"annotateCriticalPath",
+			&annotateCriticalPathWrapper,
+			( arg( "node" ), arg( "monitor" ), arg( "persistent" ) = true )
+		);
+
 		def( "removePerformanceAnnotations", &removePerformanceAnnotationsWrapper, arg( "root" ) );
 		def( "removeContextAnnotations", &removeContextAnnotationsWrapper, arg( "root" ) );
 	}
@@ -271,10 +384,24 @@ void GafferModule::bindMonitor()
 
 	{
 		scope s = IECorePython::RefCountedClass<PerformanceMonitor, Monitor>( "PerformanceMonitor" )
-			.def( init<>() )
+			.def( init<bool, size_t>( ( arg( "recordTimeline" ) = false, arg( "maxTimelineEvents" ) = std::numeric_limits<size_t>::max() ) ) )
 			.def( "allStatistics", &allStatistics<PerformanceMonitor> )
 			.def( "plugStatistics", &PerformanceMonitor::plugStatistics, return_value_policy<copy_const_reference>() )
 			.def( "combinedStatistics", &PerformanceMonitor::combinedStatistics, return_value_policy<copy_const_reference>() )
+			.def( "getRecordTimeline", &PerformanceMonitor::getRecordTimeline )
+			.def( "getMaxTimelineEvents", &PerformanceMonitor::getMaxTimelineEvents )
+			.def( "timeline", &timeline )
+		;
+
+		class_<PerformanceMonitor::Event>( "Event", no_init )
+			.add_property( "type", &eventType )
+			.add_property( "plug", &eventPlug )
+			.def_readonly( "contextHash", &PerformanceMonitor::Event::contextHash )
+			.def_readonly( "threadId", &PerformanceMonitor::Event::threadId )
+			.def_readonly( "id", &PerformanceMonitor::Event::id )
+			.def_readonly( "parentId", &PerformanceMonitor::Event::parentId )
+			.add_property( "startTime", &eventStartTime )
+			.add_property( "endTime", &eventEndTime )
 		;
 
 		class_<PerformanceMonitor::Statistics>( "Statistics" )
@@ -49,6 +49,8 @@
 #include "Gaffer/Reference.h"
 #include "Gaffer/Metadata.h"
 
+#include "fmt/format.h"
+
 using namespace boost::python;
 using namespace GafferBindings;
 using namespace Gaffer;
@@ -103,6 +105,52 @@ void hash2( ValuePlug *plug, IECore::MurmurHash &h )
 	plug->hash( h);
 }
 
+// The persistent cache functions perform filesystem operations that may
+// take some time, so we release the GIL to allow other threads to proceed.
+
+void setPersistentCacheDirectory( const std::string &directory )
+{
+	IECorePython::ScopedGILRelease r;
+	ValuePlug::setPersistentCacheDirectory( directory );
+}
+
+void setPersistentCacheSizeLimit( size_t bytes )
+{
+	IECorePython::ScopedGILRelease r;
+	ValuePlug::setPersistentCacheSizeLimit( bytes );
+}
+
+size_t persistentCacheUsage()
+{
+	IECorePython::ScopedGILRelease r;
+	return ValuePlug::persistentCacheUsage();
+}
+
+void clearPersistentCache()
+{
+	IECorePython::ScopedGILRelease r;
+	ValuePlug::clearPersistentCache();
+}
+
+std::string cacheStatisticsRepr( const ValuePlug::CacheStatistics &s )
+{
+	return fmt::format(
+		"Gaffer.ValuePlug.CacheStatistics( hits = {}, misses = {}, evictions = {}, memoryUsage = {} )",
+		s.hits, s.misses, s.evictions, s.memoryUsage
+	);
+}
+
+boost::python::list plugCacheStatistics()
+{
+	const std::vector<ValuePlug::PlugCacheStatistics> statistics = ValuePlug::plugCacheStatistics();
+	boost::python::list result;
+	for( const auto &s : statistics )
+	{
+		result.append( s );
+	}
+	return result;
+}
+
 
 } // namespace
 
@@ -133,6 +181,22 @@ void GafferModule::bindValuePlug()
 		.staticmethod( "cacheMemoryUsage" )
 		.def( "clearCache", &ValuePlug::clearCache )
 		.staticmethod( "clearCache" )
+		.def( "setCacheEvictionPolicy", &ValuePlug::setCacheEvictionPolicy )
+		.staticmethod( "setCacheEvictionPolicy" )
+		.def( "getCacheEvictionPolicy", &ValuePlug::getCacheEvictionPolicy )
+		.staticmethod( "getCacheEvictionPolicy" )
+		.def( "cacheStatistics", &ValuePlug::cacheStatistics )
+		.staticmethod( "cacheStatistics" )
+		.def( "resetCacheStatistics", &ValuePlug::resetCacheStatistics )
+		.staticmethod( "resetCacheStatistics" )
+		.def( "setCacheIntrospectionEnabled", &ValuePlug::setCacheIntrospectionEnabled )
+		.staticmethod( "setCacheIntrospectionEnabled" )
+		.def( "getCacheIntrospectionEnabled", &ValuePlug::getCacheIntrospectionEnabled )
+		.staticmethod( "getCacheIntrospectionEnabled" )
+		.def( "plugCacheStatistics", &plugCacheStatistics )
+		.staticmethod( "plugCacheStatistics" )
+		.def( "resetPlugCacheStatistics", &ValuePlug::resetPlugCacheStatistics )
+		.staticmethod( "resetPlugCacheStatistics" )
 		.def( "getHashCacheSizeLimit", &ValuePlug::getHashCacheSizeLimit )
 		.staticmethod( "getHashCacheSizeLimit" )
 		.def( "setHashCacheSizeLimit", &ValuePlug::setHashCacheSizeLimit )
@@ -145,10 +209,42 @@ void GafferModule::bindValuePlug()
 		.staticmethod( "getHashCacheMode" )
 		.def( "setHashCacheMode", &ValuePlug::setHashCacheMode )
 		.staticmethod( "setHashCacheMode" )
+		.def( "getPersistentCacheDirectory", &ValuePlug::getPersistentCacheDirectory )
+		.staticmethod( "getPersistentCacheDirectory" )
+		.def( "setPersistentCacheDirectory", &setPersistentCacheDirectory )
+		.staticmethod( "setPersistentCacheDirectory" )
+		.def( "getPersistentCacheSizeLimit", &ValuePlug::getPersistentCacheSizeLimit )
+		.staticmethod( "getPersistentCacheSizeLimit" )
+		.def( "setPersistentCacheSizeLimit", &setPersistentCacheSizeLimit )
+		.staticmethod( "setPersistentCacheSizeLimit" )
+		.def( "persistentCacheUsage", &persistentCacheUsage )
+		.staticmethod( "persistentCacheUsage" )
+		.def( "clearPersistentCache", &clearPersistentCache )
+		.staticmethod( "clearPersistentCache" )
 		.def( "dirtyCount", &ValuePlug::dirtyCount )
 		.def( "__repr__", &repr )
 	;
 
+	enum_<ValuePlug::CacheEvictionPolicy>( "CacheEvictionPolicy" )
+		.value( "LeastRecentlyUsed", ValuePlug::CacheEvictionPolicy::LeastRecentlyUsed )
+		.value( "CostAware", ValuePlug::CacheEvictionPolicy::CostAware )
+	;
+
+	class_<ValuePlug::CacheStatistics>( "CacheStatistics" )
+		.def_readonly( "hits", &ValuePlug::CacheStatistics::hits )
+		.def_readonly( "misses", &ValuePlug::CacheStatistics::misses )
+		.def_readonly( "evictions", &ValuePlug::CacheStatistics::evictions )
+		.def_readonly( "memoryUsage", &ValuePlug::CacheStatistics::memoryUsage )
+		.def( "__repr__", &cacheStatisticsRepr )
+	;
+
+	class_<ValuePlug::PlugCacheStatistics>( "PlugCacheStatistics" )
+		.def_readonly( "nodeType", &ValuePlug::PlugCacheStatistics::nodeType )
+		.def_readonly( "plugName", &ValuePlug::PlugCacheStatistics::plugName )
+		.def_readonly( "computeCache", &ValuePlug::PlugCacheStatistics::computeCache )
+		.def_readonly( "hashCache", &ValuePlug::PlugCacheStatistics::hashCache )
+	;
+
 	enum_<ValuePlug::HashCacheMode>( "HashCacheMode" )
 		.value( "Standard", ValuePlug::HashCacheMode::Standard )
 		.value( "Checked", ValuePlug::HashCacheMode::Checked )
@@ -162,6 +258,7 @@ void GafferModule::bindValuePlug()
 		.value( "TaskIsolation", ValuePlug::CachePolicy::TaskIsolation )
 		.value( "Default", ValuePlug::CachePolicy::Default )
 		.value( "Legacy", ValuePlug::CachePolicy::Legacy )
+		.value( "Persistent", ValuePlug::CachePolicy::Persistent )
 	;
 
 	Serialisation::registerSerialiser( Gaffer::ValuePlug::staticTypeId(), new ValuePlugSerialiser );
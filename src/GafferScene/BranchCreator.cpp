@@ -46,6 +46,7 @@
 
 #include "IECore/NullObject.h"
 
+#include "tbb/parallel_for.h"
 #include "tbb/spin_mutex.h"
 
 #include "fmt/format.h"
@@ -65,6 +66,26 @@ using namespace GafferScene;
 namespace
 {
 
+// Packing for values of `BranchCreator::locationPlug()`. We store the
+// depth of the location in the upper bits, and the filter result for it in the
+// lower bits.
+const int g_locationMatchBits = 3;
+
+int packLocation( size_t depth, unsigned match )
+{
+	return ( (int)depth << g_locationMatchBits ) | ( match & ( PathMatcher::ExactMatch | PathMatcher::DescendantMatch ) );
+}
+
+size_t locationDepth( int location )
+{
+	return location >> g_locationMatchBits;
+}
+
+unsigned locationMatch( int location )
+{
+	return location & ( ( 1 << g_locationMatchBits ) - 1 );
+}
+
 void mergeSetNames( const InternedStringVectorData *toAdd, vector<InternedString> &result )
 {
 	if( !toAdd )
@@ -304,8 +325,65 @@ class BranchCreator::BranchesData : public IECore::Data
 			);
 		}
 
+		// Calls `f( destination, sourcePaths )` in parallel for every destination,
+		// returning a value of type T. Values from each location are combined with
+		// the values from its descendants using `combine( value, descendantValue )`,
+		// in a tree reduction that follows the same order as `visitDestinations()`.
+		// The result is therefore deterministic, provided that `f` and `combine` are.
+		template<typename T, typename F, typename C>
+		T parallelReduceDestinations( F &&f, C &&combine ) const
+		{
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated ); // Prevents outer tasks silently cancelling our tasks
+			return parallelReduceDestinationsWalk<T>( f, combine, ThreadState::current(), ScenePath(), m_root.get(), taskGroupContext );
+		}
+
 	private :
 
+		template<typename T, typename F, typename C>
+		T parallelReduceDestinationsWalk( F &f, C &combine, const ThreadState &threadState, const ScenePlug::ScenePath &path, const Location *location, tbb::task_group_context &taskGroupContext ) const
+		{
+			T result = location->sourcePaths ? f( path, *location->sourcePaths ) : T();
+			if( location->children.empty() )
+			{
+				return result;
+			}
+
+			vector<const Location::ChildMap::value_type *> children;
+			children.reserve( location->children.size() );
+			for( const auto &child : location->children )
+			{
+				children.push_back( &child );
+			}
+
+			vector<T> childResults( children.size() );
+			auto loopBody = [&] ( const tbb::blocked_range<size_t> &range ) {
+				ThreadState::Scope threadStateScope( threadState );
+				ScenePlug::ScenePath childPath = path; childPath.push_back( InternedString() );
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					childPath.back() = children[i]->first;
+					childResults[i] = parallelReduceDestinationsWalk<T>( f, combine, threadState, childPath, children[i]->second.get(), taskGroupContext );
+				}
+			};
+
+			const tbb::blocked_range<size_t> loopRange( 0, children.size() );
+			if( children.size() > 1 )
+			{
+				tbb::parallel_for( loopRange, loopBody, taskGroupContext );
+			}
+			else
+			{
+				loopBody( loopRange );
+			}
+
+			for( auto &childResult : childResults )
+			{
+				combine( result, childResult );
+			}
+
+			return result;
+		}
+
 		template<typename F>
 		void visitLocationsWalk( F &&f, const ScenePlug::ScenePath &path, Location *location ) const
 		{
@@ -409,6 +487,8 @@ BranchCreator::BranchCreator( const std::string &name )
 
 	addChild( new ObjectPlug( "__branches", Gaffer::Plug::Out, IECore::NullObject::defaultNullObject() ) );
 	addChild( new ObjectPlug( "__mapping", Gaffer::Plug::Out, IECore::NullObject::defaultNullObject() ) );
+	addChild( new IntPlug( "__location", Gaffer::Plug::Out ) );
+	addChild( new BoolPlug( "__hasBranchDescendants", Gaffer::Plug::Out ) );
 
 	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
 	outPlug()->childBoundsPlug()->setFlags( Plug::AcceptsDependencyCycles, true );
@@ -458,6 +538,26 @@ const Gaffer::ObjectPlug *BranchCreator::mappingPlug() const
 	return getChild<ObjectPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::IntPlug *BranchCreator::locationPlug()
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::IntPlug *BranchCreator::locationPlug() const
+{
+	return getChild<IntPlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::BoolPlug *BranchCreator::hasBranchDescendantsPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::BoolPlug *BranchCreator::hasBranchDescendantsPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
 void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	FilteredSceneProcessor::affects( input, outputs );
@@ -465,6 +565,8 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 	if( BranchesData::affectedBy( this, input ) )
 	{
 		outputs.push_back( branchesPlug() );
+		outputs.push_back( locationPlug() );
+		outputs.push_back( hasBranchDescendantsPlug() );
 	}
 
 	if(
@@ -478,6 +580,8 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 
 	if(
 		input == branchesPlug() ||
+		input == locationPlug() ||
+		input == hasBranchDescendantsPlug() ||
 		input == mappingPlug() ||
 		input == inPlug()->boundPlug() ||
 		input == outPlug()->childBoundsPlug() ||
@@ -489,6 +593,7 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 
 	if(
 		input == branchesPlug() ||
+		input == locationPlug() ||
 		input == mappingPlug() ||
 		input == inPlug()->transformPlug() ||
 		affectsBranchTransform( input )
@@ -499,6 +604,7 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 
 	if(
 		input == branchesPlug() ||
+		input == locationPlug() ||
 		input == mappingPlug() ||
 		input == inPlug()->attributesPlug() ||
 		affectsBranchAttributes( input )
@@ -509,6 +615,7 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 
 	if(
 		input == branchesPlug() ||
+		input == locationPlug() ||
 		input == mappingPlug() ||
 		input == inPlug()->objectPlug() ||
 		affectsBranchObject( input )
@@ -519,6 +626,7 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 
 	if(
 		input == branchesPlug() ||
+		input == locationPlug() ||
 		input == mappingPlug() ||
 		input == inPlug()->childNamesPlug() ||
 		affectsBranchChildNames( input )
@@ -577,6 +685,14 @@ void BranchCreator::hash( const Gaffer::ValuePlug *output, const Gaffer::Context
 	{
 		hashMapping( context, h );
 	}
+	else if( output == locationPlug() )
+	{
+		hashLocation( context, h );
+	}
+	else if( output == hasBranchDescendantsPlug() )
+	{
+		hashHasBranchDescendants( context, h );
+	}
 }
 
 void BranchCreator::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
@@ -589,6 +705,14 @@ void BranchCreator::compute( Gaffer::ValuePlug *output, const Gaffer::Context *c
 	{
 		static_cast<Gaffer::ObjectPlug *>( output )->setValue( computeMapping( context ) );
 	}
+	else if( output == locationPlug() )
+	{
+		static_cast<Gaffer::IntPlug *>( output )->setValue( computeLocation( context ) );
+	}
+	else if( output == hasBranchDescendantsPlug() )
+	{
+		static_cast<Gaffer::BoolPlug *>( output )->setValue( computeHasBranchDescendants( context ) );
+	}
 	else
 	{
 		FilteredSceneProcessor::compute( output, context );
@@ -605,8 +729,14 @@ void BranchCreator::hashBound( const ScenePath &path, const Gaffer::Context *con
 		case Branch :
 			hashBranchBound( sourcePath, branchPath, context, h );
 			break;
-		case Destination :
 		case Ancestor :
+			if( localBranches() && !hasBranchDescendantsPlug()->getValue() )
+			{
+				h = inPlug()->boundPlug()->hash();
+				break;
+			}
+			[[fallthrough]];
+		case Destination :
 			FilteredSceneProcessor::hashBound( path, context, parent, h );
 			inPlug()->boundPlug()->hash( h );
 			outPlug()->childBoundsPlug()->hash( h );
@@ -631,8 +761,15 @@ Imath::Box3f BranchCreator::computeBound( const ScenePath &path, const Gaffer::C
 	{
 		case Branch :
 			return computeBranchBound( sourcePath, branchPath, context );
-		case Destination :
-		case Ancestor : {
+		case Ancestor :
+			if( localBranches() && !hasBranchDescendantsPlug()->getValue() )
+			{
+				// The filter can't rule out destinations below us, but
+				// there aren't actually any.
+				return inPlug()->boundPlug()->getValue();
+			}
+			[[fallthrough]];
+		case Destination : {
 			Box3f result = inPlug()->boundPlug()->getValue();
 			result.extendBy( outPlug()->childBoundsPlug()->getValue() );
 			return result;
@@ -967,20 +1104,25 @@ void BranchCreator::hashSet( const IECore::InternedString &setName, const Gaffer
 	FilteredSceneProcessor::hashSet( setName, context, parent, h );
 	inPlug()->setPlug()->hash( h );
 
-	/// \todo Parallelise.
-	branches->visitDestinations(
-		[&setName, &context, &h, this] ( const ScenePath &destination, const BranchesData::Location::SourcePaths &sourcePaths ) {
+	const MurmurHash branchesHash = branches->parallelReduceDestinations<MurmurHash>(
+		[&setName, &context, this] ( const ScenePath &destination, const BranchesData::Location::SourcePaths &sourcePaths ) {
+			MurmurHash result;
 			for( const auto &sourcePath : sourcePaths )
 			{
 				MurmurHash branchSetHash;
 				hashBranchSet( sourcePath, setName, context, branchSetHash );
-				h.append( branchSetHash );
+				result.append( branchSetHash );
 			}
 			ScenePlug::PathScope pathScope( context, &destination );
-			mappingPlug()->hash( h );
-			h.append( destination.data(), destination.size() );
+			mappingPlug()->hash( result );
+			result.append( destination.data(), destination.size() );
+			return result;
+		},
+		[] ( MurmurHash &result, const MurmurHash &descendantResult ) {
+			result.append( descendantResult );
 		}
 	);
+	h.append( branchesHash );
 }
 
 IECore::ConstPathMatcherDataPtr BranchCreator::computeSet( const IECore::InternedString &setName, const Gaffer::Context *context, const ScenePlug *parent ) const
@@ -996,30 +1138,35 @@ IECore::ConstPathMatcherDataPtr BranchCreator::computeSet( const IECore::Interne
 	PathMatcherDataPtr outputSetData = inputSetData->copy();
 	PathMatcher &outputSet = outputSetData->writable();
 
-	/// \todo Parallelise.
-	branches->visitDestinations(
-		[&setName, &context, &outputSet, this] ( const ScenePath &destination, const BranchesData::Location::SourcePaths &sourcePaths ) {
-			vector<ConstPathMatcherDataPtr> branchSets = { nullptr };
-			for( const auto &sourcePath : sourcePaths )
-			{
-				branchSets.push_back( computeBranchSet( sourcePath, setName, context ) );
+	const bool modified = outputSet.addPaths(
+		branches->parallelReduceDestinations<PathMatcher>(
+			[&setName, &context, this] ( const ScenePath &destination, const BranchesData::Location::SourcePaths &sourcePaths ) {
+				vector<ConstPathMatcherDataPtr> branchSets = { nullptr };
+				for( const auto &sourcePath : sourcePaths )
+				{
+					branchSets.push_back( computeBranchSet( sourcePath, setName, context ) );
+				}
+				ScenePlug::PathScope pathScope( context, &destination );
+				Private::ConstChildNamesMapPtr mapping = boost::static_pointer_cast<const Private::ChildNamesMap>( mappingPlug()->getValue() );
+				PathMatcher result;
+				result.addPaths( mapping->set( branchSets ), destination );
+				return result;
+			},
+			[] ( PathMatcher &result, const PathMatcher &descendantResult ) {
+				result.addPaths( descendantResult );
 			}
-			ScenePlug::PathScope pathScope( context, &destination );
-			Private::ConstChildNamesMapPtr mapping = boost::static_pointer_cast<const Private::ChildNamesMap>( mappingPlug()->getValue() );
-			outputSet.addPaths( mapping->set( branchSets ), destination );
-		}
+		)
 	);
 
-	return outputSetData;
+	return modified ? outputSetData : inputSetData;
 }
 
 Gaffer::ValuePlug::CachePolicy BranchCreator::hashCachePolicy( const Gaffer::ValuePlug *output ) const
 {
 	if( output == outPlug()->setPlug() )
 	{
-		// Technically we do not _need_ TaskIsolation because we have not yet
-		// multithreaded `hashSet()`. But we still benefit from requesting it
-		// because it means the hash is stored in the global cache, where it is
+		// `hashSet()` spawns tasks. We use TaskIsolation rather than TaskCollaboration
+		// because it also means the hash is stored in the global cache, where it is
 		// shared between all threads and is almost guaranteed not to be evicted.
 		return ValuePlug::CachePolicy::TaskIsolation;
 	}
@@ -1032,7 +1179,7 @@ Gaffer::ValuePlug::CachePolicy BranchCreator::hashCachePolicy( const Gaffer::Val
 
 Gaffer::ValuePlug::CachePolicy BranchCreator::computeCachePolicy( const Gaffer::ValuePlug *output ) const
 {
-	if( output == branchesPlug() )
+	if( output == branchesPlug() || output == outPlug()->setPlug() )
 	{
 		return ValuePlug::CachePolicy::TaskCollaboration;
 	}
@@ -1168,9 +1315,8 @@ void BranchCreator::hashMapping( const Gaffer::Context *context, IECore::MurmurH
 		inPlug()->childNamesPlug()->hash( h );
 	}
 
-	ConstBranchesDataPtr branchesData = branches( Context::current() );
 	const ScenePlug::ScenePath &destinationPath = context->get<ScenePlug::ScenePath>( ScenePlug::scenePathContextName );
-	for( const auto &sourcePath : branchesData->sourcePaths( destinationPath ) )
+	for( const auto &sourcePath : sourcePaths( destinationPath ) )
 	{
 		MurmurHash branchChildNamesHash;
 		hashBranchChildNames( sourcePath, ScenePath(), context, branchChildNamesHash );
@@ -1190,9 +1336,8 @@ IECore::ConstDataPtr BranchCreator::computeMapping( const Gaffer::Context *conte
 		childNames.push_back( new InternedStringVectorData );
 	}
 
-	ConstBranchesDataPtr branchesData = branches( Context::current() );
 	const ScenePlug::ScenePath &destinationPath = context->get<ScenePlug::ScenePath>( ScenePlug::scenePathContextName );
-	for( const auto &sourcePath : branchesData->sourcePaths( destinationPath ) )
+	for( const auto &sourcePath : sourcePaths( destinationPath ) )
 	{
 		childNames.push_back( computeBranchChildNames( sourcePath, ScenePath(), context ) );
 	}
@@ -1206,33 +1351,284 @@ BranchCreator::ConstBranchesDataPtr BranchCreator::branches( const Gaffer::Conte
 	return static_pointer_cast<const BranchesData>( branchesPlug()->getValue() );
 }
 
+bool BranchCreator::localBranches() const
+{
+	return
+		filterPlug()->getInput() &&
+		destinationPlug()->isSetToDefault() &&
+		destinationPlug()->defaultValue() == "${scene:path}"
+	;
+}
+
+void BranchCreator::hashLocation( const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	// Mirrors the early-outs in `computeLocation()`, so that we only
+	// hash the filter and input scene where they are actually used.
+
+	const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+	if( path.empty() )
+	{
+		filterHash( context, h );
+		return;
+	}
+
+	int parentLocation;
+	{
+		const ScenePath parentPath( path.begin(), path.end() - 1 );
+		ScenePlug::PathScope parentScope( context, &parentPath );
+		parentLocation = locationPlug()->getValue();
+		if(
+			locationDepth( parentLocation ) != path.size() - 1 ||
+			!( locationMatch( parentLocation ) & PathMatcher::DescendantMatch )
+		)
+		{
+			h = locationPlug()->hash();
+			return;
+		}
+	}
+
+	if( locationMatch( parentLocation ) & PathMatcher::ExactMatch )
+	{
+		if( !inPlug()->existsPlug()->getValue() )
+		{
+			h.append( parentLocation );
+			return;
+		}
+	}
+
+	filterHash( context, h );
+	h.append( (uint64_t)path.size() );
+	h.append( parentLocation );
+}
+
+int BranchCreator::computeLocation( const Gaffer::Context *context ) const
+{
+	const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+	if( path.empty() )
+	{
+		return packLocation( 0, filterValue( context ) );
+	}
+
+	int parentLocation;
+	{
+		const ScenePath parentPath( path.begin(), path.end() - 1 );
+		ScenePlug::PathScope parentScope( context, &parentPath );
+		parentLocation = locationPlug()->getValue();
+	}
+
+	if(
+		locationDepth( parentLocation ) != path.size() - 1 ||
+		!( locationMatch( parentLocation ) & PathMatcher::DescendantMatch )
+	)
+	{
+		// No destinations below our parent, so there can't be any
+		// here either.
+		return parentLocation;
+	}
+
+	if( locationMatch( parentLocation ) & PathMatcher::ExactMatch )
+	{
+		// Parent is a destination, so we may be on a branch rather than
+		// in the input scene. The filter is only meaningful for the latter.
+		if( !inPlug()->existsPlug()->getValue() )
+		{
+			return parentLocation;
+		}
+	}
+
+	const unsigned match = filterValue( context );
+	if( match & ( PathMatcher::ExactMatch | PathMatcher::DescendantMatch ) )
+	{
+		return packLocation( path.size(), match );
+	}
+
+	return parentLocation;
+}
+
+void BranchCreator::hashHasBranchDescendants( const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+	const int location = locationPlug()->getValue();
+	if(
+		locationDepth( location ) != path.size() ||
+		!( locationMatch( location ) & PathMatcher::DescendantMatch )
+	)
+	{
+		h.append( false );
+		return;
+	}
+
+	ConstInternedStringVectorDataPtr childNamesData = inPlug()->childNamesPlug()->getValue();
+	childNamesData->hash( h );
+
+	// See `SceneAlgo::matchingPathsHash()` for documentation of this hashing strategy.
+	std::atomic<uint64_t> h1( 0 ), h2( 0 );
+	const vector<InternedString> &childNames = childNamesData->readable();
+	const ThreadState &threadState = ThreadState::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, childNames.size() ),
+		[&] ( const tbb::blocked_range<size_t> &range ) {
+
+			ScenePlug::PathScope pathScope( threadState );
+			ScenePath childPath = path;
+			childPath.push_back( InternedString() ); // Room for the child name
+
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				childPath.back() = childNames[i];
+				pathScope.setPath( &childPath );
+
+				IECore::MurmurHash childHash = locationPlug()->hash();
+				const int childLocation = locationPlug()->getValue();
+				if(
+					locationDepth( childLocation ) == childPath.size() &&
+					!( locationMatch( childLocation ) & PathMatcher::ExactMatch )
+				)
+				{
+					hasBranchDescendantsPlug()->hash( childHash );
+				}
+				childHash.append( childNames[i] );
+
+				h1 += childHash.h1();
+				h2 += childHash.h2();
+			}
+		},
+		taskGroupContext
+	);
+
+	h.append( MurmurHash( h1, h2 ) );
+}
+
+bool BranchCreator::computeHasBranchDescendants( const Gaffer::Context *context ) const
+{
+	const ScenePath &path = context->get<ScenePath>( ScenePlug::scenePathContextName );
+	const int location = locationPlug()->getValue();
+	if(
+		locationDepth( location ) != path.size() ||
+		!( locationMatch( location ) & PathMatcher::DescendantMatch )
+	)
+	{
+		// The filter has ruled out any destinations below us.
+		return false;
+	}
+
+	ConstInternedStringVectorDataPtr childNamesData = inPlug()->childNamesPlug()->getValue();
+	const vector<InternedString> &childNames = childNamesData->readable();
+
+	std::atomic_bool result( false );
+	const ThreadState &threadState = ThreadState::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, childNames.size() ),
+		[&] ( const tbb::blocked_range<size_t> &range ) {
+
+			ScenePlug::PathScope pathScope( threadState );
+			ScenePath childPath = path;
+			childPath.push_back( InternedString() ); // Room for the child name
+
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				childPath.back() = childNames[i];
+				pathScope.setPath( &childPath );
+
+				const int childLocation = locationPlug()->getValue();
+				if( locationDepth( childLocation ) != childPath.size() )
+				{
+					continue;
+				}
+
+				if(
+					( locationMatch( childLocation ) & PathMatcher::ExactMatch ) ||
+					hasBranchDescendantsPlug()->getValue()
+				)
+				{
+					result = true;
+					taskGroupContext.cancel_group_execution();
+					return;
+				}
+			}
+		},
+		taskGroupContext
+	);
+
+	return result;
+}
+
+std::vector<ScenePlug::ScenePath> BranchCreator::sourcePaths( const ScenePath &destination ) const
+{
+	if( localBranches() )
+	{
+		return { destination };
+	}
+	return branches( Context::current() )->sourcePaths( destination );
+}
+
 BranchCreator::LocationType BranchCreator::sourceAndBranchPaths( const ScenePath &path, ScenePath &sourcePath, ScenePath &branchPath, IECore::ConstInternedStringVectorDataPtr *newChildNames ) const
 {
-	ConstBranchesDataPtr branchesData = branches( Context::current() );
-	const BranchesData::Location *location = branchesData->locationOrAncestor( path );
+	// Find the deepest destination or ancestor of a destination at
+	// or above `path`.
 
-	if( newChildNames && location->depth == path.size() )
+	size_t depth;
+	bool exists;
+	bool hasChildren;
+	const BranchesData::Location::SourcePaths *locationSourcePaths = nullptr;
+
+	ConstBranchesDataPtr branchesData;
+	BranchesData::Location::SourcePaths localSourcePaths;
+	if( localBranches() )
 	{
-		*newChildNames = location->newChildNames;
+		int location;
+		{
+			ScenePlug::PathScope pathScope( Context::current(), &path );
+			location = locationPlug()->getValue();
+		}
+		depth = locationDepth( location );
+		exists = true;
+		// This is conservative, in that the filter may have a DescendantMatch
+		// without there actually being any matching descendants. But that
+		// just means we'll treat some locations as Ancestors rather than
+		// PassThroughs, which yields the same result.
+		hasChildren = locationMatch( location ) & PathMatcher::DescendantMatch;
+		if( locationMatch( location ) & PathMatcher::ExactMatch )
+		{
+			localSourcePaths.push_back( ScenePath( path.begin(), path.begin() + depth ) );
+			locationSourcePaths = &localSourcePaths;
+		}
 	}
+	else
+	{
+		branchesData = branches( Context::current() );
+		const BranchesData::Location *location = branchesData->locationOrAncestor( path );
+		depth = location->depth;
+		exists = location->exists;
+		hasChildren = !location->children.empty();
+		locationSourcePaths = location->sourcePaths.get();
+		if( newChildNames && depth == path.size() )
+		{
+			*newChildNames = location->newChildNames;
+		}
+	}
+
+	// Classify.
 
-	if( location->sourcePaths )
+	if( locationSourcePaths )
 	{
-		if( location->depth < path.size() )
+		if( depth < path.size() )
 		{
 			Private::ConstChildNamesMapPtr mapping;
 			{
-				const ScenePath destinationPath( path.begin(), path.begin() + location->depth );
+				const ScenePath destinationPath( path.begin(), path.begin() + depth );
 				ScenePlug::PathScope pathScope( Context::current(), &destinationPath );
 				mapping = boost::static_pointer_cast<const Private::ChildNamesMap>( mappingPlug()->getValue() );
 			}
 
-			const Private::ChildNamesMap::Input input = mapping->input( path[location->depth] );
+			const Private::ChildNamesMap::Input input = mapping->input( path[depth] );
 			if( input.index >= 1 )
 			{
-				branchPath.assign( path.begin() + location->depth, path.end() );
+				branchPath.assign( path.begin() + depth, path.end() );
 				branchPath[0] = input.name;
-				sourcePath = (*location->sourcePaths)[input.index-1];
+				sourcePath = (*locationSourcePaths)[input.index-1];
 				return Branch;
 			}
 			else
@@ -1242,13 +1638,13 @@ BranchCreator::LocationType BranchCreator::sourceAndBranchPaths( const ScenePath
 		}
 		else
 		{
-			return location->exists ? Destination : NewDestination;
+			return exists ? Destination : NewDestination;
 		}
 	}
 
-	if( path.size() == location->depth && !location->children.empty() )
+	if( path.size() == depth && hasChildren )
 	{
-		return location->exists ? Ancestor : NewAncestor;
+		return exists ? Ancestor : NewAncestor;
 	}
 	else
 	{
@@ -210,8 +210,10 @@ IECore::ConstPathMatcherDataPtr Encapsulate::computeSet( const IECore::InternedS
 		return inputSetData;
 	}
 
+	// See comments in `Prune::computeSet()`.
 	PathMatcherDataPtr outputSetData = inputSetData->copy();
 	PathMatcher &outputSet = outputSetData->writable();
+	bool modified = false;
 
 	FilterPlug::SceneScope sceneScope( context, inPlug() );
 
@@ -227,7 +229,7 @@ IECore::ConstPathMatcherDataPtr Encapsulate::computeSet( const IECore::InternedS
 			cIt++;
 			while( cIt->size() > pIt->size() )
 			{
-				outputSet.prune( *cIt );
+				modified = outputSet.prune( *cIt ) || modified;
 				cIt.prune();
 				++cIt;
 			}
@@ -250,5 +252,5 @@ IECore::ConstPathMatcherDataPtr Encapsulate::computeSet( const IECore::InternedS
 		}
 	}
 
-	return outputSetData;
+	return modified ? outputSetData : inputSetData;
 }
@@ -192,7 +192,7 @@ void CapturingRenderer::pause()
 {
 	IECore::MessageHandler::Scope s( m_messageHandler.get() );
 
-	if( m_rendering )
+	if( !m_rendering )
 	{
 		IECore::msg( IECore::Msg::Warning, "CapturingRenderer::pause", "Not rendering" );
 	}
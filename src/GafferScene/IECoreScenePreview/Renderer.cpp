@@ -36,8 +36,12 @@
 
 #include "GafferScene/Private/IECoreScenePreview/Renderer.h"
 
+#include "Gaffer/Private/IECorePreview/LRUCache.h"
+
 #include "IECore/Exception.h"
 
+#include <limits>
+
 using namespace std;
 using namespace IECoreScenePreview;
 
@@ -61,13 +65,59 @@ CreatorMap &creators()
 	return *g_creators;
 }
 
+struct SharedDataCacheGetterKey
+{
+
+	SharedDataCacheGetterKey()
+		:	creator( nullptr )
+	{
+	}
+
+	SharedDataCacheGetterKey( const IECore::MurmurHash &key, const Renderer::SharedDataCreator &creator )
+		:	key( key ), creator( &creator )
+	{
+	}
+
+	operator const IECore::MurmurHash & () const
+	{
+		return key;
+	}
+
+	IECore::MurmurHash key;
+	const Renderer::SharedDataCreator *creator;
+
+};
+
+using SharedDataCacheBase = IECorePreview::LRUCache<IECore::MurmurHash, IECore::ConstRefCountedPtr, IECorePreview::LRUCachePolicy::TaskParallel, SharedDataCacheGetterKey>;
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
 // Renderer
 //////////////////////////////////////////////////////////////////////////
 
+// Data is held for the lifetime of the renderer, so we never evict, and we
+// don't cache errors because they may be due to cancellation.
+struct Renderer::SharedDataCache : public SharedDataCacheBase
+{
+
+	SharedDataCache()
+		:	SharedDataCacheBase(
+				[] ( const SharedDataCacheGetterKey &key, size_t &cost, const IECore::Canceller *canceller ) {
+					cost = 1;
+					return (*key.creator)();
+				},
+				std::numeric_limits<size_t>::max(),
+				SharedDataCacheBase::RemovalCallback(),
+				/* cacheErrors = */ false
+			)
+	{
+	}
+
+};
+
 Renderer::Renderer()
+	:	m_sharedDataCache( new SharedDataCache )
 {
 
 }
@@ -87,6 +137,16 @@ IECore::DataPtr Renderer::command( const IECore::InternedString name, const IECo
 	throw IECore::NotImplementedException( "Renderer::command" );
 }
 
+IECore::ConstRefCountedPtr Renderer::sharedData( const IECore::MurmurHash &key, const SharedDataCreator &creator, const IECore::Canceller *canceller )
+{
+	return m_sharedDataCache->get( SharedDataCacheGetterKey( key, creator ), canceller );
+}
+
+void Renderer::clearSharedData()
+{
+	m_sharedDataCache->clear();
+}
+
 Renderer::AttributesInterface::~AttributesInterface()
 {
 
@@ -80,6 +80,11 @@ void sampleChannel( const ImagePlug *image, const Box2i &displayWindow, const st
 	);
 }
 
+// Size of the regions we generate points for in parallel, measured in pixels.
+// This must not depend on the number of threads, so that we generate the same
+// points in the same order every time.
+const float g_bucketSize = 256.0f;
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -101,6 +106,7 @@ ImageScatter::ImageScatter( const std::string &name )
 	addChild( new StringPlug( "primitiveVariables" ) );
 	addChild( new FloatPlug( "width", Plug::In, 1.0f ) );
 	addChild( new StringPlug( "widthChannel" ) );
+	addChild( new BoolPlug( "parallel", Plug::In, false ) );
 }
 
 ImageScatter::~ImageScatter()
@@ -177,6 +183,16 @@ const Gaffer::StringPlug *ImageScatter::widthChannelPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 6 );
 }
 
+Gaffer::BoolPlug *ImageScatter::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 7 );
+}
+
+const Gaffer::BoolPlug *ImageScatter::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 7 );
+}
+
 void ImageScatter::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	ObjectSource::affects( input, outputs );
@@ -192,7 +208,8 @@ void ImageScatter::affects( const Plug *input, AffectedPlugsContainer &outputs )
 		input == imagePlug()->channelDataPlug() ||
 		input == densityPlug() ||
 		input == widthPlug() ||
-		input == primitiveVariablesPlug()
+		input == primitiveVariablesPlug() ||
+		input == parallelPlug()
 	)
 	{
 		outputs.push_back( sourcePlug() );
@@ -226,6 +243,7 @@ void ImageScatter::hashSource( const Gaffer::Context *context, IECore::MurmurHas
 	h.append( format.getPixelAspect() );
 	densitySampler.hash( h );
 	densityPlug()->hash( h );
+	parallelPlug()->hash( h );
 
 	widthPlug()->hash( h );
 	h.append( widthChannel );
@@ -287,23 +305,103 @@ IECore::ConstObjectPtr ImageScatter::computeSource( const Context *context ) con
 		return densitySampler.sample( offset.x + p.x * scale / pixelAspect, offset.y + p.y * scale );
 	};
 
+	const Box2f bound( V2f( 0 ), V2f( outputArea.size() ) / scale );
+	// Scale density to be in points per pixel
+	const float density = densityPlug()->getValue() * scale * scale;
+
 	V3fVectorDataPtr positionsData = new V3fVectorData;
 	positionsData->setInterpretation( IECore::GeometricData::Point );
 	vector<V3f> &positions = positionsData->writable();
-	auto emitter = [&] ( const V2f &p ) {
-		positions.push_back( V3f( offset.x + p.x * scale, offset.y + p.y * scale, 0.0f ) );
-	};
 
-	/// \todo It would be nice to multithread this, but it could also be pretty
-	/// handy that the order of the points we're outputting matches the
-	/// progressive order in which they are generated.
-	PointDistribution::defaultInstance()(
-		Box2f( V2f( 0 ), V2f( outputArea.size() ) / scale ),
-		// Scale density to be in points per pixel
-		densityPlug()->getValue() * scale * scale,
-		densityFunction,
-		emitter
-	);
+	if( !parallelPlug()->getValue() )
+	{
+		// Generate the points serially, so that their order matches the
+		// progressive order in which PointDistribution generates them.
+		auto emitter = [&] ( const V2f &p ) {
+			positions.push_back( V3f( offset.x + p.x * scale, offset.y + p.y * scale, 0.0f ) );
+		};
+		PointDistribution::defaultInstance()( bound, density, densityFunction, emitter );
+	}
+	else
+	{
+		// Split the area into buckets, and generate the points for each bucket
+		// in parallel. The bucket layout depends only on the format, so the
+		// output is the same regardless of the number of threads used. Within
+		// each bucket, points retain the progressive order in which they are
+		// generated, and the buckets themselves are stitched together in a fixed
+		// order.
+
+		const float bucketSize = g_bucketSize / scale;
+		const V2i numBuckets(
+			std::max( 1, (int)ceilf( bound.size().x / bucketSize ) ),
+			std::max( 1, (int)ceilf( bound.size().y / bucketSize ) )
+		);
+
+		vector<vector<V2f>> bucketPoints( numBuckets.x * numBuckets.y );
+
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, bucketPoints.size() ),
+			[&] ( const tbb::blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					const V2i bucketIndex( i % numBuckets.x, i / numBuckets.x );
+					const Box2f bucketBound(
+						bound.min + V2f( bucketIndex ) * bucketSize,
+						V2f(
+							bucketIndex.x == numBuckets.x - 1 ? bound.max.x : bound.min.x + ( bucketIndex.x + 1 ) * bucketSize,
+							bucketIndex.y == numBuckets.y - 1 ? bound.max.y : bound.min.y + ( bucketIndex.y + 1 ) * bucketSize
+						)
+					);
+
+					vector<V2f> &points = bucketPoints[i];
+					auto emitter = [&] ( const V2f &p ) {
+						// PointDistribution includes points lying exactly on the
+						// bound. Treat the shared edges as belonging to the next
+						// bucket along, so that they're not output twice.
+						if(
+							( p.x >= bucketBound.max.x && bucketIndex.x != numBuckets.x - 1 ) ||
+							( p.y >= bucketBound.max.y && bucketIndex.y != numBuckets.y - 1 )
+						)
+						{
+							return;
+						}
+						points.push_back( p );
+					};
+
+					PointDistribution::defaultInstance()( bucketBound, density, densityFunction, emitter );
+				}
+			},
+			taskGroupContext
+		);
+
+		// Stitch the buckets together into a single list of positions.
+
+		vector<size_t> bucketOffsets( bucketPoints.size() + 1, 0 );
+		for( size_t i = 0; i < bucketPoints.size(); ++i )
+		{
+			bucketOffsets[i+1] = bucketOffsets[i] + bucketPoints[i].size();
+		}
+
+		positions.resize( bucketOffsets.back() );
+
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, bucketPoints.size() ),
+			[&] ( const tbb::blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					V3f *out = positions.data() + bucketOffsets[i];
+					for( const auto &p : bucketPoints[i] )
+					{
+						*out++ = V3f( offset.x + p.x * scale, offset.y + p.y * scale, 0.0f );
+					}
+					// Free memory as we go.
+					vector<V2f>().swap( bucketPoints[i] );
+				}
+			},
+			taskGroupContext
+		);
+	}
 
 	// Make a PointsPrimitive from the positions
 
@@ -61,6 +61,7 @@
 #include "boost/unordered_set.hpp"
 
 #include "tbb/blocked_range.h"
+#include "tbb/enumerable_thread_specific.h"
 #include "tbb/parallel_for.h"
 #include "tbb/parallel_reduce.h"
 #include "tbb/spin_mutex.h"
@@ -242,23 +243,25 @@ struct AccessPrototypeContextVariable
 	}
 };
 
-// A functor for use with IECore::dispatch that adds to a hash, based on a PrototypeContextVariable
-// struct.  This is only used to count the number of unique hashes, so we can take some shortcuts, for
-// example, we ignore the offsetMode, because adding the offsets to a different global time doesn't change
-// the number of unique offsets.  We also ignore the name of the context variable, since we always process
-// the same PrototypeContextVariables in the same order
+// A functor for use with IECore::dispatch that computes hashes for a contiguous range of points, based on a
+// PrototypeContextVariable struct.  This is only used to count the number of unique hashes, so we can take some
+// shortcuts, for example, we ignore the offsetMode, because adding the offsets to a different global time doesn't
+// change the number of unique offsets.  We also ignore the name of the context variable, since we always process
+// the same PrototypeContextVariables in the same order. We dispatch once per range rather than once per point,
+// so that the quantization happens in a tight loop over the raw values.
 struct UniqueHashPrototypeContextVariable
 {
 	template< class T>
-	void operator()( const TypedData<vector<T>> *data, const PrototypeContextVariable &v, size_t index, MurmurHash &contextHash )
-
+	void operator()( const TypedData<vector<T>> *data, const PrototypeContextVariable &v, size_t begin, size_t end, MurmurHash *hashes )
 	{
-		T raw = PrimitiveVariable::IndexedView<T>( *v.primVar )[index];
-		T value = quantize( raw, v.quantize );
-		contextHash.append( value );
+		const PrimitiveVariable::IndexedView<T> view( *v.primVar );
+		for( size_t i = begin; i < end; ++i )
+		{
+			hashes[i - begin].append( quantize( view[i], v.quantize ) );
+		}
 	}
 
-	void operator()( const Data *data, const PrototypeContextVariable &v, int index, MurmurHash &contextHash )
+	void operator()( const Data *data, const PrototypeContextVariable &v, size_t begin, size_t end, MurmurHash *hashes )
 	{
 		throw IECore::Exception( "Context variable prim vars must contain vector data" );
 	}
@@ -748,41 +751,94 @@ class Instancer::EngineData : public Data
 		// sources
 		std::unique_ptr<PrototypeHashes> uniquePrototypeHashes() const
 		{
-			std::vector< boost::unordered_set< IECore::MurmurHash > > variableHashAccumulate( m_prototypeContextVariables.size() );
-			boost::unordered_set< IECore::MurmurHash > totalHashAccumulate;
+			struct HashAccumulator
+			{
+				std::vector< boost::unordered_set< IECore::MurmurHash > > variableHashes;
+				boost::unordered_set< IECore::MurmurHash > totalHashes;
+			};
+
+			const size_t numVariables = m_prototypeContextVariables.size();
+			HashAccumulator exemplar;
+			exemplar.variableHashes.resize( numVariables );
+			tbb::enumerable_thread_specific<HashAccumulator> threadAccumulators( exemplar );
+
+			// Hash blocks of points in parallel, accumulating unique hashes per thread.
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, numPoints(), 1000 ),
+				[&] ( const tbb::blocked_range<size_t> &r )
+				{
+					std::vector<int> protoIndices( r.size() );
+					bool anyValid = false;
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						protoIndices[i - r.begin()] = prototypeIndex( i );
+						anyValid = anyValid || protoIndices[i - r.begin()] != -1;
+					}
+
+					if( !anyValid )
+					{
+						return;
+					}
 
-			size_t n = numPoints();
-			for( size_t i = 0; i < n; i++ )
+					// Hashes for each variable, stored contiguously, one block of `r.size()` per variable.
+					std::vector<IECore::MurmurHash> variableHashes( numVariables * r.size() );
+					for( size_t j = 0; j < numVariables; ++j )
+					{
+						hashPrototypeContextVariable( r.begin(), r.end(), m_prototypeContextVariables[j], variableHashes.data() + j * r.size() );
+					}
+
+					HashAccumulator &accumulator = threadAccumulators.local();
+					for( size_t i = 0; i < r.size(); ++i )
+					{
+						if( protoIndices[i] == -1 )
+						{
+							continue;
+						}
+
+						IECore::MurmurHash totalHash;
+						const InternedStringVectorData &rootPath = *m_roots[ protoIndices[i] ];
+
+						// Note that we are rehashing the root path for every point, even though they are heavily
+						// reused.  This seems suboptimal, but is simpler, and the more complex version doesn't
+						// appear to make any performance difference in practice
+						totalHash.append( &(rootPath.readable())[0], rootPath.readable().size() );
+						for( size_t j = 0; j < numVariables; ++j )
+						{
+							const IECore::MurmurHash &h = variableHashes[j * r.size() + i];
+							accumulator.variableHashes[j].insert( h );
+							totalHash.append( h );
+						}
+						accumulator.totalHashes.insert( totalHash );
+					}
+				},
+				taskGroupContext
+			);
+
+			// Merge the results from each thread.
+
+			HashAccumulator merged;
+			merged.variableHashes.resize( numVariables );
+			for( auto &accumulator : threadAccumulators )
 			{
-				int protoIndex = prototypeIndex( i );
-				if( protoIndex == -1 )
+				if( merged.totalHashes.empty() )
 				{
+					merged = std::move( accumulator );
 					continue;
 				}
-
-				IECore::MurmurHash totalHash;
-				const InternedStringVectorData &rootPath = *m_roots[ protoIndex ];
-
-				// Note that we are rehashing the root path for every point, even though they are heavily
-				// reused.  This seems suboptimal, but is simpler, and the more complex version doesn't
-				// appear to make any performance difference in practice
-				totalHash.append( &(rootPath.readable())[0], rootPath.readable().size() );
-				for( unsigned int j = 0; j < m_prototypeContextVariables.size(); j++ )
+				for( size_t j = 0; j < numVariables; ++j )
 				{
-					IECore::MurmurHash r; // TODO - if we're using this in inner loops, the constructor should probably be inlined?
-					hashPrototypeContextVariable( i, m_prototypeContextVariables[j], r );
-					variableHashAccumulate[j].insert( r );
-					totalHash.append( r );
+					merged.variableHashes[j].merge( accumulator.variableHashes[j] );
 				}
-				totalHashAccumulate.insert( totalHash );
+				merged.totalHashes.merge( accumulator.totalHashes );
 			}
 
 			auto result = std::make_unique<PrototypeHashes>();
-			for( unsigned int j = 0; j < m_prototypeContextVariables.size(); j++ )
+			for( size_t j = 0; j < numVariables; ++j )
 			{
-				(*result)[ m_prototypeContextVariables[j].name ] = variableHashAccumulate[j];
+				(*result)[ m_prototypeContextVariables[j].name ] = std::move( merged.variableHashes[j] );
 			}
-			(*result)[ "" ] = totalHashAccumulate;
+			(*result)[ "" ] = std::move( merged.totalHashes );
 
 			return result;
 		}
@@ -825,12 +881,16 @@ class Instancer::EngineData : public Data
 	protected :
 
 		// Needs to match setPrototypeContextVariables above, except that it operates on one
-		// PrototypeContextVariable at a time instead of iterating through them
-		void hashPrototypeContextVariable( size_t pointIndex, const PrototypeContextVariable &v, IECore::MurmurHash &result ) const
+		// PrototypeContextVariable at a time instead of iterating through them, and appends to
+		// the hashes for a contiguous range of points.
+		void hashPrototypeContextVariable( size_t begin, size_t end, const PrototypeContextVariable &v, IECore::MurmurHash *hashes ) const
 		{
 			if( v.seedMode )
 			{
-				result.append( seedForPoint( pointIndex, m_ids, v.numSeeds, v.seedScramble ) );
+				for( size_t i = begin; i < end; ++i )
+				{
+					hashes[i - begin].append( seedForPoint( i, m_ids, v.numSeeds, v.seedScramble ) );
+				}
 				return;
 			}
 
@@ -841,7 +901,7 @@ class Instancer::EngineData : public Data
 
 			try
 			{
-				IECore::dispatch( v.primVar->data.get(), UniqueHashPrototypeContextVariable(), v, pointIndex, result );
+				IECore::dispatch( v.primVar->data.get(), UniqueHashPrototypeContextVariable(), v, begin, end, hashes );
 			}
 			catch( QuantizeException & )
 			{
@@ -2861,19 +2921,16 @@ void Instancer::PrototypeScope::setPrototype( const EngineData *engine, const Sc
 namespace
 {
 
-// It shouldn't be necessary for this to be refcounted - but LRUCache is set up to make it impossible
-// to get a pointer to the internal storage, since things could be evicted. We are disabling evictions,
-// but we're still stuck with needing a shared pointer of some sort.
-struct Prototype : public IECore::RefCounted
+// The renderer-independent data for a prototype.
+struct PrototypeData : public IECore::RefCounted
 {
-	Prototype(
+	PrototypeData(
 		const ScenePlug *prototypesPlug, const ScenePlug::ScenePath *prototypeRoot,
 		const std::vector<float> &sampleTimes, const IECore::MurmurHash &hash,
 		const GafferScene::Private::RendererAlgo::RenderOptions &renderOptions,
-		const Context *prototypeContext,
-		IECoreScenePreview::Renderer *renderer,
-		bool prepareRendererAttributes
+		const Context *prototypeContext, const ConstCompoundObjectPtr &attributes
 	)
+		:	m_attributes( attributes )
 	{
 		const float onFrameTime = prototypeContext->getFrame();
 
@@ -2881,12 +2938,6 @@ struct Prototype : public IECore::RefCounted
 
 		scope.set( ScenePlug::scenePathContextName, prototypeRoot );
 
-		m_attributes = prototypesPlug->attributesPlug()->getValue();
-		if( prepareRendererAttributes )
-		{
-			m_rendererAttributes = renderer->attributes( m_attributes.get() );
-		}
-
 		for( unsigned int i = 0; i < sampleTimes.size(); i++ )
 		{
 			scope.setFrame( sampleTimes[i] );
@@ -2944,10 +2995,103 @@ struct Prototype : public IECore::RefCounted
 	std::vector<const Object *> m_objectPointers;
 	std::vector<float> m_objectSampleTimes;
 	ConstCompoundObjectPtr m_attributes;
-	IECoreScenePreview::Renderer::AttributesInterfacePtr m_rendererAttributes;
 	std::vector<M44f> m_transforms;
 };
 
+typedef boost::intrusive_ptr< const PrototypeData > ConstPrototypeDataPtr;
+
+// Returns a hash of the content of a PrototypeData for a prototype without
+// children, to be evaluated with the scene path and on-frame time in `scope`.
+IECore::MurmurHash prototypeDataHash(
+	const ScenePlug *prototypesPlug, const std::vector<float> &sampleTimes,
+	const GafferScene::Private::RendererAlgo::RenderOptions &renderOptions,
+	const CompoundObject *attributes, Context::EditableScope &scope
+)
+{
+	const float onFrameTime = scope.context()->getFrame();
+
+	IECore::MurmurHash result;
+	result.append( "Instancer:PrototypeData" );
+	result.append( prototypesPlug->attributesPlug()->hash() );
+	renderOptions.includedPurposes->hash( result );
+
+	result.append( (uint64_t)sampleTimes.size() );
+	for( float sampleTime : sampleTimes )
+	{
+		scope.setFrame( sampleTime );
+		result.append( prototypesPlug->transformPlug()->hash() );
+	}
+
+	std::vector<float> deformationTimes;
+	GafferScene::Private::RendererAlgo::deformationMotionTimes( renderOptions, attributes, deformationTimes );
+	result.append( (uint64_t)deformationTimes.size() );
+	if( deformationTimes.empty() )
+	{
+		scope.setFrame( onFrameTime );
+		result.append( prototypesPlug->objectPlug()->hash() );
+	}
+	for( float deformationTime : deformationTimes )
+	{
+		scope.setFrame( deformationTime );
+		result.append( deformationTime );
+		result.append( prototypesPlug->objectPlug()->hash() );
+	}
+
+	scope.setFrame( onFrameTime );
+	return result;
+}
+
+// It shouldn't be necessary for this to be refcounted - but LRUCache is set up to make it impossible
+// to get a pointer to the internal storage, since things could be evicted. We are disabling evictions,
+// but we're still stuck with needing a shared pointer of some sort.
+struct Prototype : public IECore::RefCounted
+{
+	Prototype(
+		const ScenePlug *prototypesPlug, const ScenePlug::ScenePath *prototypeRoot,
+		const std::vector<float> &sampleTimes, const IECore::MurmurHash &hash,
+		const GafferScene::Private::RendererAlgo::RenderOptions &renderOptions,
+		const Context *prototypeContext,
+		IECoreScenePreview::Renderer *renderer,
+		bool prepareRendererAttributes
+	)
+	{
+		Context::EditableScope scope( prototypeContext );
+		scope.set( ScenePlug::scenePathContextName, prototypeRoot );
+
+		const ConstCompoundObjectPtr attributes = prototypesPlug->attributesPlug()->getValue();
+
+		if( prototypesPlug->childNamesPlug()->getValue()->readable().empty() )
+		{
+			// Register the prototype with the renderer, keyed by its content, so
+			// that it is only prepared once and only costs memory once, no matter
+			// how many capsules or frames output it to the same renderer.
+			m_data = boost::static_pointer_cast<const PrototypeData>(
+				renderer->sharedData(
+					prototypeDataHash( prototypesPlug, sampleTimes, renderOptions, attributes.get(), scope ),
+					[&] () -> IECore::ConstRefCountedPtr {
+						return new PrototypeData( prototypesPlug, prototypeRoot, sampleTimes, hash, renderOptions, prototypeContext, attributes );
+					},
+					prototypeContext->canceller()
+				)
+			);
+		}
+		else
+		{
+			// Prototypes with children are output as sub-capsules which are specific
+			// to this capsule, so can't be shared.
+			m_data = new PrototypeData( prototypesPlug, prototypeRoot, sampleTimes, hash, renderOptions, prototypeContext, attributes );
+		}
+
+		if( prepareRendererAttributes )
+		{
+			m_rendererAttributes = renderer->attributes( m_data->m_attributes.get() );
+		}
+	}
+
+	ConstPrototypeDataPtr m_data;
+	IECoreScenePreview::Renderer::AttributesInterfacePtr m_rendererAttributes;
+};
+
 typedef boost::intrusive_ptr< const Prototype > ConstPrototypePtr;
 
 struct PrototypeCacheGetterKey
@@ -3144,7 +3288,7 @@ void Instancer::InstancerCapsule::render( IECoreScenePreview::Renderer *renderer
 					proto = prototypeCache.get( PrototypeCacheGetterKey( protoIndex, prototypeScope.context() ) ).get();
 				}
 
-				if( !proto->m_object.size() )
+				if( !proto->m_data->m_object.size() )
 				{
 					// No object to render. This could happen if the protype didn't meet the
 					// RenderOptions::purposeIncluded test.
@@ -3160,7 +3304,7 @@ void Instancer::InstancerCapsule::render( IECoreScenePreview::Renderer *renderer
 					// and our result is only read in this function, and never written, we can
 					// directly reference the input members in our result without copying. Be
 					// careful not to modify them though!
-					currentAttributes->members() = proto->m_attributes->members();
+					currentAttributes->members() = proto->m_data->m_attributes->members();
 
 					engines[0]->instanceAttributes( pointIndex, *currentAttributes );
 					attribsStorage = renderer->attributes( currentAttributes.get() );
@@ -3196,29 +3340,29 @@ void Instancer::InstancerCapsule::render( IECoreScenePreview::Renderer *renderer
 				name.resize( std::to_chars( &name[prefixLen], &(*name.end()), instanceId ).ptr - &name[0] );
 
 				IECoreScenePreview::Renderer::ObjectInterfacePtr objectInterface;
-				if( proto->m_objectSampleTimes.size() )
+				if( proto->m_data->m_objectSampleTimes.size() )
 				{
 					objectInterface = renderer->object(
-						name, proto->m_objectPointers, proto->m_objectSampleTimes, attribs
+						name, proto->m_data->m_objectPointers, proto->m_data->m_objectSampleTimes, attribs
 					);
 				}
 				else
 				{
 					objectInterface = renderer->object(
-						name, proto->m_object[0].get(), attribs
+						name, proto->m_data->m_object[0].get(), attribs
 					);
 				}
 
 				if( sampleTimes.size() == 1 )
 				{
-					objectInterface->transform( proto->m_transforms[0] * engines[0]->instanceTransform( pointIndex ) );
+					objectInterface->transform( proto->m_data->m_transforms[0] * engines[0]->instanceTransform( pointIndex ) );
 				}
 				else
 				{
 					for( unsigned int i = 0; i < engines.size(); i++ )
 					{
 						int curPointIndex = i == 0 ? pointIndex : engines[i]->pointIndex( instanceId );
-						pointTransforms[i] = proto->m_transforms[i] * engines[i]->instanceTransform( curPointIndex );
+						pointTransforms[i] = proto->m_data->m_transforms[i] * engines[i]->instanceTransform( curPointIndex );
 					}
 
 					objectInterface->transform( pointTransforms, sampleTimes );
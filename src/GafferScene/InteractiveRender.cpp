@@ -143,6 +143,18 @@ class InteractiveRender::RenderMessageHandler : public MessageHandler
 
 static InternedString g_rendererContextName( "scene:renderer" );
 
+// When enabled, the initial scene is streamed to the renderer, starting with
+// the cameras, lights and the locations nearest to the camera. This is
+// currently opt-in, because it requires a UIThreadCallHandler to resume
+// streaming after cancellation.
+static bool streamingFromEnv()
+{
+	const char *s = getenv( "GAFFERSCENE_INTERACTIVERENDER_STREAMING" );
+	return s && !strcmp( s, "1" );
+}
+
+static const bool g_streaming = streamingFromEnv();
+
 size_t InteractiveRender::g_firstPlugIndex = 0;
 
 GAFFER_NODE_DEFINE_TYPE( InteractiveRender );
@@ -321,6 +333,9 @@ void InteractiveRender::plugSet( const Gaffer::Plug *plug )
 
 void InteractiveRender::update()
 {
+	// Any streaming must be finished before we can make edits of our own.
+	cancelStreaming();
+
 	ConstContextPtr context = effectiveContext();
 	Context::Scope scope( context.get() );
 
@@ -338,6 +353,7 @@ void InteractiveRender::update()
 	// If we've got this far, we know we want to be running or paused.
 	// Start a render if we don't have one.
 
+	const bool newRender = !m_renderer;
 	if( !m_renderer )
 	{
 		m_messageHandler->clear();
@@ -387,6 +403,38 @@ void InteractiveRender::update()
 
 	{
 		IECore::MessageHandler::Scope messageScope( m_messageHandler.get() );
+		if( newRender && g_streaming )
+		{
+			// Output the most important parts of the scene and start
+			// rendering immediately. The RenderController outputs the
+			// rest in the background.
+			auto resumable = std::make_shared<std::atomic_bool>( true );
+			m_streamingResumable = resumable;
+			m_streamingTask = m_controller->updateStreaming(
+				[this, resumable] ( BackgroundTask::Status status ) {
+					if( status == BackgroundTask::Cancelled && *resumable )
+					{
+						// Cancelled by an edit to the graph. That edit may not affect
+						// the scene, in which case there would be nothing to trigger
+						// another update, so we schedule one ourselves.
+						ParallelAlgo::callOnUIThread(
+							[node = InteractiveRenderPtr( this )] {
+								try
+								{
+									node->update();
+								}
+								catch( const std::exception &e )
+								{
+									node->m_messageHandler->handle( IECore::MessageHandler::Error, "InteractiveRender", e.what() );
+								}
+							}
+						);
+					}
+				}
+			);
+			m_state = requiredState;
+			return;
+		}
 		m_controller->update();
 	}
 
@@ -412,11 +460,27 @@ Gaffer::ConstContextPtr InteractiveRender::effectiveContext()
 
 void InteractiveRender::stop()
 {
+	cancelStreaming();
 	m_controller.reset();
 	m_renderer.reset();
 	m_state = Stopped;
 }
 
+void InteractiveRender::cancelStreaming()
+{
+	if( m_streamingResumable )
+	{
+		*m_streamingResumable = false;
+		m_streamingResumable.reset();
+	}
+
+	if( m_streamingTask )
+	{
+		m_streamingTask->cancelAndWait();
+		m_streamingTask.reset();
+	}
+}
+
 // Called on a background thread when data is received on the driver.
 // We need to update `messagesPlug()`, but all graph edits must
 // be performed on the UI thread, so we can't do it directly.
@@ -381,8 +381,10 @@ IECore::ConstPathMatcherDataPtr Isolate::computeSet( const IECore::InternedStrin
 		return inputSetData;
 	}
 
+	// See comments in `Prune::computeSet()`.
 	PathMatcherDataPtr outputSetData = inputSetData->copy();
 	PathMatcher &outputSet = outputSetData->writable();
+	bool modified = false;
 
 	FilterPlug::SceneScope sceneScope( context, inPlug() );
 	sceneScope.remove( ScenePlug::setNameContextName );
@@ -418,14 +420,14 @@ IECore::ConstPathMatcherDataPtr Isolate::computeSet( const IECore::InternedStrin
 				// Not going to keep anything below
 				// here, so we can prune traversal
 				// entirely.
-				outputSet.prune( *pIt );
+				modified = outputSet.prune( *pIt ) || modified;
 				pIt.prune();
 			}
 			++pIt;
 		}
 	}
 
-	return outputSetData;
+	return modified ? outputSetData : inputSetData;
 }
 
 bool Isolate::mayPruneChildren( const ScenePath &path, const Gaffer::Context *context, const SetsToKeep &setsToKeep ) const
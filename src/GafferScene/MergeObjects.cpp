@@ -1477,8 +1477,10 @@ IECore::ConstPathMatcherDataPtr MergeObjects::computeSet( const IECore::Interned
 		return inputSetData;
 	}
 
+	// See comments in `Prune::computeSet()`.
 	PathMatcherDataPtr outputSetData = inputSetData->copy();
 	PathMatcher &outputSet = outputSetData->writable();
+	bool modified = false;
 
 	ConstTreeDataPtr treeData = tree( treePlug(), context );
 
@@ -1542,7 +1544,7 @@ IECore::ConstPathMatcherDataPtr MergeObjects::computeSet( const IECore::Interned
 			// This path and all below it are pruned, so we can
 			// ignore it and prune the traversal to the descendant
 			// paths.
-			outputSet.prune( *pIt );
+			modified = outputSet.prune( *pIt ) || modified;
 			pIt.prune();
 			++pIt;
 		}
@@ -1564,7 +1566,7 @@ IECore::ConstPathMatcherDataPtr MergeObjects::computeSet( const IECore::Interned
 		}
 	}
 
-	return outputSetData;
+	return modified ? outputSetData : inputSetData;
 }
 
 Gaffer::ValuePlug::CachePolicy MergeObjects::hashCachePolicy( const Gaffer::ValuePlug *output ) const
@@ -271,8 +271,13 @@ IECore::ConstPathMatcherDataPtr Prune::computeSet( const IECore::InternedString
 		return inputSetData;
 	}
 
+	// Copying is cheap because PathMatcher shares its internal nodes
+	// until they are modified. We track whether or not we actually modify
+	// anything so that we can return the input set itself otherwise,
+	// rather than an identical copy of it.
 	PathMatcherDataPtr outputSetData = inputSetData->copy();
 	PathMatcher &outputSet = outputSetData->writable();
+	bool modified = false;
 
 	FilterPlug::SceneScope sceneScope( context, inPlug() );
 	sceneScope.remove( ScenePlug::setNameContextName );
@@ -286,7 +291,7 @@ IECore::ConstPathMatcherDataPtr Prune::computeSet( const IECore::InternedString
 			// This path and all below it are pruned, so we can
 			// ignore it and prune the traversal to the descendant
 			// paths.
-			outputSet.prune( *pIt );
+			modified = outputSet.prune( *pIt ) || modified;
 			pIt.prune();
 			++pIt;
 		}
@@ -308,5 +313,5 @@ IECore::ConstPathMatcherDataPtr Prune::computeSet( const IECore::InternedString
 		}
 	}
 
-	return outputSetData;
+	return modified ? outputSetData : inputSetData;
 }
@@ -46,8 +46,6 @@
 #include "boost/multi_index/member.hpp"
 #include "boost/multi_index_container.hpp"
 
-#include "tbb/enumerable_thread_specific.h"
-
 #include "fmt/args.h"
 #include "fmt/format.h"
 
@@ -769,18 +767,18 @@ void Rename::hashSet( const IECore::InternedString &setName, const Gaffer::Conte
 	const MurmurHash inputSetHash = inPlug()->setPlug()->hash();
 	ConstPathMatcherDataPtr inputSetData = inPlug()->setPlug()->getValue( &inputSetHash );
 
-	using ThreadLocalHash = tbb::enumerable_thread_specific<IECore::MurmurHash>;
-
 	struct LocationProcessor
 	{
 
-		LocationProcessor( const Rename *rename, const PathMatcher &inputSet, ThreadLocalHash &hash )
-			:	m_rename( rename ), m_parent( nullptr ), m_inputSet( inputSet ), m_hash( hash )
+		using Result = IECore::MurmurHash;
+
+		LocationProcessor( const Rename *rename, const PathMatcher &inputSet )
+			:	m_rename( rename ), m_parent( nullptr ), m_inputSet( inputSet )
 		{
 		}
 
 		LocationProcessor( const LocationProcessor &parent )
-			:	m_rename( parent.m_rename ), m_parent( &parent ), m_inputSet( parent.m_inputSet ), m_hash( parent.m_hash )
+			:	m_rename( parent.m_rename ), m_parent( &parent ), m_inputSet( parent.m_inputSet )
 		{
 		}
 
@@ -799,11 +797,8 @@ void Rename::hashSet( const IECore::InternedString &setName, const Gaffer::Conte
 				auto it = nameMap.find( path.back() );
 				if( it != nameMap.end() )
 				{
-					MurmurHash renameHash;
-					renameHash.append( path );
-					renameHash.append( it->outputName );
-					MurmurHash &hash = m_hash.local();
-					hash = MurmurHash( hash.h1() + renameHash.h1(), hash.h2() + renameHash.h2() );
+					m_hash.append( path );
+					m_hash.append( it->outputName );
 				}
 			}
 
@@ -818,28 +813,39 @@ void Rename::hashSet( const IECore::InternedString &setName, const Gaffer::Conte
 			}
 		}
 
+		MurmurHash gatherChildren( const ScenePlug::ScenePath &path, vector<MurmurHash> &childHashes )
+		{
+			if( childHashes.empty() )
+			{
+				return m_hash;
+			}
+
+			// Children are visited in a deterministic order,
+			// so we can just append their hashes in turn.
+			MurmurHash result = m_hash;
+			for( const auto &childHash : childHashes )
+			{
+				if( childHash != MurmurHash() )
+				{
+					result.append( childHash );
+				}
+			}
+			return result;
+		}
+
 		private :
 
 			const Rename *m_rename;
 			const LocationProcessor *m_parent;
 			const PathMatcher &m_inputSet;
-			ThreadLocalHash &m_hash;
+			MurmurHash m_hash;
 			ConstNameMapDataPtr m_nameMap;
 
 	};
 
 	ScenePlug::GlobalScope globalScope( context );
-	ThreadLocalHash threadLocalHash;
-	LocationProcessor processor( this, inputSetData->readable(), threadLocalHash );
-	SceneAlgo::parallelProcessLocations( inPlug(), processor );
-
-	const MurmurHash renamesHash = threadLocalHash.combine(
-		[] ( const MurmurHash &a, const MurmurHash &b ) {
-			// See SceneAlgo's ThreadablePathHashAccumulator for further discussion of
-			// this "sum of hashes" strategy for deterministic parallel hashing.
-			return MurmurHash( a.h1() + b.h1(), a.h2() + b.h2() );
-		}
-	);
+	LocationProcessor processor( this, inputSetData->readable() );
+	const MurmurHash renamesHash = SceneAlgo::parallelReduceLocations( inPlug(), processor );
 
 	if( renamesHash != MurmurHash() )
 	{
@@ -862,25 +868,22 @@ IECore::ConstPathMatcherDataPtr Rename::computeSet( const IECore::InternedString
 		return inputSetData;
 	}
 
-	// Thread-local PathMatcher so we can build an output set in a thread-safe
-	// manner.
-	/// \todo If `parallelProcessLocations()` supported a `gatherChildren()`
-	/// method, we could build a single set recursively, passing subtrees from
-	/// child to parent.
-	using ThreadLocalSet = tbb::enumerable_thread_specific<IECore::PathMatcher>;
-
+	// We build the output set recursively, with each location
+	// gathering the subtrees built by its children.
 	struct LocationProcessor
 	{
 
-		LocationProcessor( const Rename *rename, const PathMatcher &inputSet, ThreadLocalSet &outputSet )
-			:	m_rename( rename ), m_parent( nullptr ), m_inputSet( inputSet ), m_outputSet( outputSet )
+		using Result = IECore::PathMatcher;
+
+		LocationProcessor( const Rename *rename, const PathMatcher &inputSet )
+			:	m_rename( rename ), m_parent( nullptr ), m_inputSet( inputSet )
 		{
 		}
 
 		// Constructor used for child locations, allowing us to inherit stuff
 		// from the parent processor.
 		LocationProcessor( const LocationProcessor &parent )
-			:	m_rename( parent.m_rename ), m_parent( &parent ), m_inputSet( parent.m_inputSet ), m_outputSet( parent.m_outputSet )
+			:	m_rename( parent.m_rename ), m_parent( &parent ), m_inputSet( parent.m_inputSet )
 		{
 		}
 
@@ -919,7 +922,7 @@ IECore::ConstPathMatcherDataPtr Rename::computeSet( const IECore::InternedString
 			{
 				if( setMatch & PathMatcher::ExactMatch )
 				{
-					m_outputSet.local().addPath( m_outputPath );
+					m_outputSet.addPath( m_outputPath );
 				}
 				// Get child map ready for use in our children, and return
 				// `true` to continue recursion.
@@ -931,34 +934,32 @@ IECore::ConstPathMatcherDataPtr Rename::computeSet( const IECore::InternedString
 				// No descendants being renamed. We can directly reference
 				// the entire subtree of the set from this point down, and
 				// have no need to recurse any further.
-				m_outputSet.local().addPaths( m_inputSet.subTree( path ), m_outputPath );
+				m_outputSet.addPaths( m_inputSet.subTree( path ), m_outputPath );
 				return false;
 			}
 		}
 
+		PathMatcher gatherChildren( const ScenePlug::ScenePath &path, vector<PathMatcher> &childSets )
+		{
+			for( const auto &childSet : childSets )
+			{
+				m_outputSet.addPaths( childSet );
+			}
+			return std::move( m_outputSet );
+		}
+
 		private :
 
 			const Rename *m_rename;
 			const LocationProcessor *m_parent;
 			const PathMatcher &m_inputSet;
-			ThreadLocalSet &m_outputSet;
+			PathMatcher m_outputSet;
 			ScenePlug::ScenePath m_outputPath;
 			ConstNameMapDataPtr m_nameMap;
 
 	};
 
 	ScenePlug::GlobalScope globalScope( context );
-	ThreadLocalSet outputSets;
-	LocationProcessor processor( this, inputSet, outputSets );
-	SceneAlgo::parallelProcessLocations( inPlug(), processor );
-
-	return new PathMatcherData(
-		outputSets.combine(
-			[] ( const PathMatcher &a, const PathMatcher &b ) {
-				PathMatcher c = a;
-				c.addPaths( b );
-				return c;
-			}
-		)
-	);
+	LocationProcessor processor( this, inputSet );
+	return new PathMatcherData( SceneAlgo::parallelReduceLocations( inPlug(), processor ) );
 }
@@ -42,12 +42,15 @@
 
 #include "Gaffer/ParallelAlgo.h"
 
+#include "IECoreScene/Camera.h"
 #include "IECoreScene/CurvesPrimitive.h"
 #include "IECoreScene/VisibleRenderable.h"
 
 #include "IECore/Interpolator.h"
 #include "IECore/NullObject.h"
 
+#include "Imath/ImathBoxAlgo.h"
+
 #include "boost/algorithm/string/predicate.hpp"
 #include "boost/bind/bind.hpp"
 #include "boost/container/flat_set.hpp"
@@ -55,10 +58,13 @@
 #include "boost/multi_index/ordered_index.hpp"
 #include "boost/multi_index_container.hpp"
 
-#include "tbb/task.h"
+#include "tbb/parallel_for.h"
+#include "tbb/task_group.h"
 
 #include "fmt/format.h"
 
+#include <queue>
+
 using namespace std;
 using namespace boost::placeholders;
 using namespace Imath;
@@ -230,6 +236,152 @@ struct ObjectInterfaceHandle : public boost::noncopyable
 
 };
 
+// Streaming
+// =========
+
+const InternedString g_camerasSetName( "__cameras" );
+const InternedString g_lightsSetName( "__lights" );
+const InternedString g_lightFiltersSetName( "__lightFilters" );
+
+// Returns true if `bound` (in camera space) may be visible within `screenWindow`,
+// and if so, fills `distance` with the distance from the camera to the bound.
+bool visibleToCamera( const Box3f &bound, const Box2f &screenWindow, bool perspective, float &distance )
+{
+	if( bound.isEmpty() || bound.min.z >= 0 )
+	{
+		// Empty, or entirely behind the camera.
+		return false;
+	}
+
+	distance = closestPointInBox( V3f( 0 ), bound ).length();
+
+	if( !perspective )
+	{
+		return Box2f( V2f( bound.min.x, bound.min.y ), V2f( bound.max.x, bound.max.y ) ).intersects( screenWindow );
+	}
+
+	if( bound.max.z >= 0 )
+	{
+		// Straddles the camera plane. Treat it conservatively as visible.
+		return true;
+	}
+
+	Box2f projected;
+	for( int i = 0; i < 8; ++i )
+	{
+		const V3f corner(
+			i & 1 ? bound.max.x : bound.min.x,
+			i & 2 ? bound.max.y : bound.min.y,
+			i & 4 ? bound.max.z : bound.min.z
+		);
+		projected.extendBy( V2f( corner.x, corner.y ) / -corner.z );
+	}
+
+	return projected.intersects( screenWindow );
+}
+
+// Returns up to `maxLocations` locations with objects which are potentially
+// visible to the render camera, taking the crop window into account. Locations
+// are visited in order of their distance from the camera, so the nearest are
+// found first. Must be called with a context suitable for computing `scene`.
+IECore::PathMatcher locationsNearestCamera( const ScenePlug *scene, const CompoundObject *globals, size_t maxLocations )
+{
+	IECore::PathMatcher result;
+
+	const StringData *cameraOption = globals->member<StringData>( g_cameraGlobalName );
+	if( !maxLocations || !cameraOption || cameraOption->readable().empty() )
+	{
+		return result;
+	}
+
+	ScenePlug::ScenePath cameraPath;
+	ScenePlug::stringToPath( cameraOption->readable(), cameraPath );
+	if( !scene->exists( cameraPath ) )
+	{
+		return result;
+	}
+
+	ConstCameraPtr sceneCamera = runTimeCast<const Camera>( scene->object( cameraPath ) );
+	if( !sceneCamera )
+	{
+		return result;
+	}
+
+	CameraPtr camera = sceneCamera->copy();
+	SceneAlgo::applyCameraGlobals( camera.get(), globals, scene );
+
+	Box2f screenWindow = camera->frustum();
+	if( camera->hasCropWindow() )
+	{
+		// Crop window is in raster space, with Y pointing down.
+		const Box2f &crop = camera->getCropWindow();
+		const V2f size = screenWindow.size();
+		screenWindow = Box2f(
+			V2f( screenWindow.min.x + crop.min.x * size.x, screenWindow.max.y - crop.max.y * size.y ),
+			V2f( screenWindow.min.x + crop.max.x * size.x, screenWindow.max.y - crop.min.y * size.y )
+		);
+	}
+
+	const bool perspective = camera->getProjection() == "perspective";
+	const M44f worldToCamera = scene->fullTransform( cameraPath ).inverse();
+
+	struct Location
+	{
+		float distance;
+		ScenePlug::ScenePath path;
+		M44f transform;
+		// Reversed, so that `std::priority_queue` gives us the nearest first.
+		bool operator < ( const Location &rhs ) const { return distance > rhs.distance; }
+	};
+
+	std::priority_queue<Location> queue;
+	queue.push( { 0.0f, ScenePlug::ScenePath(), M44f() } );
+
+	// Limit the number of locations we visit, so that a deep hierarchy
+	// with few objects can't make the search more expensive than the
+	// update we're trying to accelerate.
+	size_t numLocations = 0;
+	size_t numVisited = 0;
+	const size_t maxVisited = maxLocations * 10;
+
+	ScenePlug::PathScope pathScope( Context::current() );
+	while( !queue.empty() && numLocations < maxLocations && numVisited++ < maxVisited )
+	{
+		const Location location = queue.top();
+		queue.pop();
+
+		pathScope.setPath( &location.path );
+		if( !location.path.empty() && !visible( scene->attributesPlug()->getValue().get() ) )
+		{
+			continue;
+		}
+
+		if( !runTimeCast<const NullObject>( scene->objectPlug()->getValue().get() ) )
+		{
+			result.addPath( location.path );
+			numLocations++;
+		}
+
+		ConstInternedStringVectorDataPtr childNamesData = scene->childNamesPlug()->getValue();
+		ScenePlug::ScenePath childPath = location.path;
+		childPath.push_back( InternedString() ); // Space for child name
+		for( const auto &childName : childNamesData->readable() )
+		{
+			childPath.back() = childName;
+			pathScope.setPath( &childPath );
+			const M44f childTransform = scene->transformPlug()->getValue() * location.transform;
+			const Box3f bound = transform( scene->boundPlug()->getValue(), childTransform * worldToCamera );
+			float distance;
+			if( visibleToCamera( bound, screenWindow, perspective, distance ) )
+			{
+				queue.push( { distance, childPath, childTransform } );
+			}
+		}
+	}
+
+	return result;
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -1187,40 +1339,42 @@ class RenderController::SceneGraph
 
 };
 
-// TBB task used to perform multithreaded updates on our SceneGraph.
-class RenderController::SceneGraphUpdateTask : public tbb::task
+// Functor used to perform multithreaded updates on our SceneGraph. Children
+// are updated in parallel using `tbb::parallel_for()`, with all tasks
+// belonging to a single `task_group_context`. This is isolated from any
+// outer context, so that cancellation of outer tasks doesn't silently
+// cancel ours.
+class RenderController::SceneGraphUpdateTask
 {
 
 	public :
 
 		SceneGraphUpdateTask(
 			RenderController *controller,
-			SceneGraph *sceneGraph,
 			SceneGraph::Type sceneGraphType,
 			unsigned changedGlobalComponents,
 			const ThreadState &threadState,
-			const ScenePlug::ScenePath &scenePath,
 			const ProgressCallback &callback,
-			const PathMatcher *pathsToUpdate
+			const PathMatcher *pathsToUpdate,
+			tbb::task_group_context &taskGroupContext
 		)
 			:	m_controller( controller ),
-				m_sceneGraph( sceneGraph ),
 				m_sceneGraphType( sceneGraphType ),
 				m_changedGlobalComponents( changedGlobalComponents ),
 				m_threadState( threadState ),
-				m_scenePath( scenePath ),
 				m_callback( callback ),
-				m_pathsToUpdate( pathsToUpdate )
+				m_pathsToUpdate( pathsToUpdate ),
+				m_taskGroupContext( taskGroupContext )
 		{
 		}
 
-		task *execute() override
+		void operator()( SceneGraph *sceneGraph, const ScenePlug::ScenePath &scenePath ) const
 		{
 
-			const unsigned pathsToUpdateMatch = m_pathsToUpdate ? m_pathsToUpdate->match( m_scenePath ) : (unsigned)PathMatcher::EveryMatch;
+			const unsigned pathsToUpdateMatch = m_pathsToUpdate ? m_pathsToUpdate->match( scenePath ) : (unsigned)PathMatcher::EveryMatch;
 			if( !pathsToUpdateMatch )
 			{
-				return nullptr;
+				return;
 			}
 
 			// Figure out if this location belongs in the type
@@ -1228,22 +1382,22 @@ class RenderController::SceneGraphUpdateTask : public tbb::task
 			// belong, and neither do any of its descendants,
 			// we can just early out.
 
-			const unsigned sceneGraphMatch = this->sceneGraphMatch();
+			const unsigned sceneGraphMatch = this->sceneGraphMatch( scenePath );
 			if( !( sceneGraphMatch & ( IECore::PathMatcher::ExactMatch | IECore::PathMatcher::DescendantMatch ) ) )
 			{
-				m_sceneGraph->clear();
-				return nullptr;
+				sceneGraph->clear();
+				return;
 			}
 
 			// Set up a context to compute the scene at the right
 			// location.
 
-			ScenePlug::PathScope pathScope( m_threadState, &m_scenePath );
+			ScenePlug::PathScope pathScope( m_threadState, &scenePath );
 
 			// Update the scene graph at this location.
 
-			const bool changesMade = m_sceneGraph->update(
-				m_scenePath,
+			const bool changesMade = sceneGraph->update(
+				scenePath,
 				m_changedGlobalComponents,
 				sceneGraphMatch & IECore::PathMatcher::ExactMatch ? m_sceneGraphType : SceneGraph::NoType,
 				m_controller
@@ -1254,23 +1408,33 @@ class RenderController::SceneGraphUpdateTask : public tbb::task
 				m_callback( BackgroundTask::Running );
 			}
 
-			// Spawn subtasks to apply updates to each child.
+			// Apply updates to each child, in parallel.
 
-			const auto &children = m_sceneGraph->children();
-			if( m_sceneGraph->expanded() && children.size() )
+			const auto &children = sceneGraph->children();
+			if( sceneGraph->expanded() && children.size() )
 			{
-				set_ref_count( 1 + children.size() );
+				using ChildRange = tbb::blocked_range<size_t>;
+				const ChildRange loopRange( 0, children.size() );
 
-				ScenePlug::ScenePath childPath = m_scenePath;
-				childPath.push_back( IECore::InternedString() ); // space for the child name
-				for( const auto &child : children )
+				auto loopBody = [&] ( const ChildRange &range ) {
+					ScenePlug::ScenePath childPath = scenePath;
+					childPath.push_back( IECore::InternedString() ); // space for the child name
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						childPath.back() = children[i]->name();
+						(*this)( children[i].get(), childPath );
+					}
+				};
+
+				if( children.size() > 1 )
 				{
-					childPath.back() = child->name();
-					SceneGraphUpdateTask *t = new( allocate_child() ) SceneGraphUpdateTask( m_controller, child.get(), m_sceneGraphType, m_changedGlobalComponents, m_threadState, childPath, m_callback, m_pathsToUpdate );
-					spawn( *t );
+					tbb::parallel_for( loopRange, loopBody, m_taskGroupContext );
+				}
+				else
+				{
+					// Serial execution
+					loopBody( loopRange );
 				}
-
-				wait_for_all();
 			}
 			else
 			{
@@ -1282,34 +1446,27 @@ class RenderController::SceneGraphUpdateTask : public tbb::task
 
 			if( pathsToUpdateMatch & ( PathMatcher::AncestorMatch | PathMatcher::ExactMatch ) )
 			{
-				m_sceneGraph->allChildrenUpdated();
+				sceneGraph->allChildrenUpdated();
 			}
-
-			return nullptr;
 		}
 
 	private :
 
-		const ScenePlug *scene()
-		{
-			return m_controller->m_scene.get();
-		}
-
 		/// \todo Fast path for when sets were not dirtied.
-		unsigned sceneGraphMatch() const
+		unsigned sceneGraphMatch( const ScenePlug::ScenePath &scenePath ) const
 		{
 			switch( m_sceneGraphType )
 			{
 				case SceneGraph::CameraType :
-					return m_controller->m_renderSets.camerasSet().match( m_scenePath );
+					return m_controller->m_renderSets.camerasSet().match( scenePath );
 				case SceneGraph::LightType :
-					return m_controller->m_renderSets.lightsSet().match( m_scenePath );
+					return m_controller->m_renderSets.lightsSet().match( scenePath );
 				case SceneGraph::LightFilterType :
-					return m_controller->m_renderSets.lightFiltersSet().match( m_scenePath );
+					return m_controller->m_renderSets.lightFiltersSet().match( scenePath );
 				case SceneGraph::ObjectType :
 				{
-					unsigned m = m_controller->m_renderSets.lightsSet().match( m_scenePath ) |
-					             m_controller->m_renderSets.camerasSet().match( m_scenePath );
+					unsigned m = m_controller->m_renderSets.lightsSet().match( scenePath ) |
+					             m_controller->m_renderSets.camerasSet().match( scenePath );
 					if( m & IECore::PathMatcher::ExactMatch )
 					{
 						return IECore::PathMatcher::AncestorMatch | IECore::PathMatcher::DescendantMatch;
@@ -1325,13 +1482,12 @@ class RenderController::SceneGraphUpdateTask : public tbb::task
 		}
 
 		RenderController *m_controller;
-		SceneGraph *m_sceneGraph;
 		SceneGraph::Type m_sceneGraphType;
 		unsigned m_changedGlobalComponents;
 		const ThreadState &m_threadState;
-		ScenePlug::ScenePath m_scenePath;
 		const ProgressCallback &m_callback;
 		const PathMatcher *m_pathsToUpdate;
+		tbb::task_group_context &m_taskGroupContext;
 
 };
 
@@ -1568,6 +1724,7 @@ void RenderController::update( const ProgressCallback &callback )
 	}
 
 	m_updateRequested = false;
+	cancelBackgroundTask();
 
 	Context::EditableScope scopedContext( m_context.get() );
 	scopedContext.set( "scene:renderer", &m_renderer->name().string() );
@@ -1610,14 +1767,67 @@ void RenderController::updateMatchingPaths( const IECore::PathMatcher &pathsToUp
 		return;
 	}
 
+	cancelBackgroundTask();
+
 	Context::EditableScope scopedContext( m_context.get() );
 	scopedContext.set( "scene:renderer", &m_renderer->name().string() );
 
 	updateInternal( callback, &pathsToUpdate );
 }
 
+std::shared_ptr<Gaffer::BackgroundTask> RenderController::updateStreaming( const ProgressCallback &callback, size_t maxPriorityLocations )
+{
+	if( !m_scene || !m_context )
+	{
+		return nullptr;
+	}
+
+	m_updateRequested = false;
+	cancelBackgroundTask();
+
+	Context::EditableScope scopedContext( m_context.get() );
+	scopedContext.set( "scene:renderer", &m_renderer->name().string() );
+
+	// Output everything needed for a usable render, prioritising
+	// the locations the camera is most likely to see.
+
+	IECore::PathMatcher priorityPaths;
+	for( const auto &setName : { g_camerasSetName, g_lightsSetName, g_lightFiltersSetName } )
+	{
+		priorityPaths.addPaths( m_scene->set( setName )->readable() );
+	}
+	priorityPaths.addPaths(
+		locationsNearestCamera( m_scene.get(), m_scene->globals().get(), maxPriorityLocations )
+	);
+
+	updateInternal( callback, &priorityPaths, /* signalCompletion = */ false );
+	m_renderer->render();
+
+	// Stream the rest of the scene in the background.
+
+	m_backgroundTask = ParallelAlgo::callOnBackgroundThread(
+		// Subject
+		m_scene.get(),
+		[this, callback] {
+			m_renderer->pause();
+			updateInternal( callback );
+			m_renderer->render();
+		}
+	);
+
+	return m_backgroundTask;
+}
+
 void RenderController::updateInternal( const ProgressCallback &callback, const IECore::PathMatcher *pathsToUpdate, bool signalCompletion )
 {
+	if( !pathsToUpdate )
+	{
+		// Release data shared between capsules, so that data for content that
+		// has since been edited doesn't accumulate throughout an interactive
+		// render. Anything still needed will be registered again.
+		m_renderer->clearSharedData();
+	}
+
 	try
 	{
 		// Update globals
@@ -1701,10 +1911,10 @@ void RenderController::updateInternal( const ProgressCallback &callback, const I
 			}
 
 			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
-			SceneGraphUpdateTask *task = new( tbb::task::allocate_root( taskGroupContext ) ) SceneGraphUpdateTask(
-				this, sceneGraph, (SceneGraph::Type)i, m_changedGlobalComponents, ThreadState::current(), ScenePlug::ScenePath(), callback, pathsToUpdate
+			const SceneGraphUpdateTask updateTask(
+				this, (SceneGraph::Type)i, m_changedGlobalComponents, ThreadState::current(), callback, pathsToUpdate, taskGroupContext
 			);
-			tbb::task::spawn_root_and_wait( *task );
+			updateTask( sceneGraph, ScenePlug::ScenePath() );
 
 			if( i == SceneGraph::LightFilterType && m_lightLinks && m_lightLinks->lightFilterLinksDirty() )
 			{
@@ -68,6 +68,7 @@
 #include "IECore/NullObject.h"
 
 #include "boost/algorithm/string/predicate.hpp"
+#include "boost/functional/hash.hpp"
 #include "boost/unordered_map.hpp"
 
 #include "tbb/concurrent_unordered_set.h"
@@ -77,6 +78,9 @@
 
 #include "fmt/format.h"
 
+#include <algorithm>
+#include <map>
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -261,6 +265,137 @@ IECore::PathMatcher GafferScene::SceneAlgo::findAllWithAttribute( const ScenePlu
 	);
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Hashing
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+IECore::MurmurHash hierarchyHashWalk( const ScenePlug *scene, const ThreadState &threadState, const ScenePlug::ScenePath &path, tbb::task_group_context &taskGroupContext )
+{
+	ScenePlug::PathScope pathScope( threadState, &path );
+
+	IECore::MurmurHash result;
+	result.append( scene->objectPlug()->hash() );
+	result.append( scene->attributesPlug()->hash() );
+	result.append( scene->transformPlug()->hash() );
+	result.append( scene->boundPlug()->hash() );
+	result.append( scene->childNamesPlug()->hash() );
+
+	ConstInternedStringVectorDataPtr childNamesData = scene->childNamesPlug()->getValue();
+	const vector<InternedString> &childNames = childNamesData->readable();
+	if( childNames.empty() )
+	{
+		return result;
+	}
+
+	// Children are hashed in parallel, but combined in order so
+	// that the result is deterministic.
+	vector<IECore::MurmurHash> childHashes( childNames.size() );
+	const tbb::blocked_range<size_t> loopRange( 0, childNames.size() );
+
+	auto loopBody = [&] ( const tbb::blocked_range<size_t> &range ) {
+		ScenePlug::ScenePath childPath = path;
+		childPath.push_back( InternedString() ); // Space for the child name
+		for( size_t i = range.begin(); i != range.end(); ++i )
+		{
+			childPath.back() = childNames[i];
+			childHashes[i] = hierarchyHashWalk( scene, threadState, childPath, taskGroupContext );
+		}
+	};
+
+	if( childNames.size() > 1 )
+	{
+		tbb::parallel_for( loopRange, loopBody, taskGroupContext );
+	}
+	else
+	{
+		loopBody( loopRange );
+	}
+
+	for( const auto &h : childHashes )
+	{
+		result.append( h );
+	}
+
+	return result;
+}
+
+struct HierarchyHashCacheGetterKey
+{
+
+	HierarchyHashCacheGetterKey()
+		:	scene( nullptr ), root( nullptr ), threadState( nullptr )
+	{
+	}
+
+	HierarchyHashCacheGetterKey( const ScenePlug *scene, const ScenePlug::ScenePath &root )
+		:	scene( scene ), root( &root ), threadState( &ThreadState::current() )
+	{
+		// We can't know the hierarchy hash without computing it, so we key
+		// the cache using the dirty counts of the scene instead. These are
+		// incremented whenever anything upstream changes, in the same way
+		// that they are used to invalidate the ValuePlug hash cache.
+		Plug::flushDirtyPropagationScope();
+		hash.append( (uint64_t)scene );
+		for( const auto &plug : ValuePlug::Range( *scene ) )
+		{
+			hash.append( plug->dirtyCount() );
+		}
+		hash.append( threadState->context()->hash() );
+		if( root.size() )
+		{
+			hash.append( root.data(), root.size() );
+		}
+		else
+		{
+			hash.append( 0 );
+		}
+	}
+
+	operator const IECore::MurmurHash & () const
+	{
+		return hash;
+	}
+
+	const ScenePlug *scene;
+	const ScenePlug::ScenePath *root;
+	const ThreadState *threadState;
+	IECore::MurmurHash hash;
+
+};
+
+using HierarchyHashCache = IECorePreview::LRUCache<IECore::MurmurHash, IECore::MurmurHash, IECorePreview::LRUCachePolicy::TaskParallel, HierarchyHashCacheGetterKey>;
+
+HierarchyHashCache g_hierarchyHashCache(
+	[] ( const HierarchyHashCacheGetterKey &key, size_t &cost, const IECore::Canceller *canceller ) {
+		cost = 1;
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated ); // Prevents outer tasks silently cancelling our tasks
+		return hierarchyHashWalk( key.scene, *key.threadState, *key.root, taskGroupContext );
+	},
+	10000,
+	HierarchyHashCache::RemovalCallback(),
+	/* cacheErrors = */ false
+);
+
+} // namespace
+
+IECore::MurmurHash GafferScene::SceneAlgo::hierarchyHash( const ScenePlug *scene, const ScenePlug::ScenePath &root )
+{
+	if( ValuePlug::getHashCacheMode() != ValuePlug::HashCacheMode::Standard )
+	{
+		// Our cache key relies on dirty counts in the same way as the
+		// Standard hash cache mode. The other modes exist to work around
+		// (or check for) problems with that scheme, so we don't trust it
+		// here either, and compute the hash from scratch.
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		return hierarchyHashWalk( scene, ThreadState::current(), root, taskGroupContext );
+	}
+
+	return g_hierarchyHashCache.get( HierarchyHashCacheGetterKey( scene, root ), Context::current()->canceller() );
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Globals
 //////////////////////////////////////////////////////////////////////////
@@ -381,6 +516,121 @@ IECore::ConstCompoundDataPtr GafferScene::SceneAlgo::sets( const ScenePlug *scen
 	return result;
 }
 
+size_t GafferScene::SceneAlgo::SetMemberships::PathHash::operator()( const ScenePlug::ScenePath &path ) const
+{
+	// InternedStrings are unique, so we can hash their addresses
+	// rather than their contents.
+	size_t result = 0;
+	for( const auto &name : path )
+	{
+		boost::hash_combine( result, name.c_str() );
+	}
+	return result;
+}
+
+GafferScene::SceneAlgo::SetMemberships::SetMemberships( const IECore::CompoundData *sets )
+{
+	std::vector<const PathMatcher *> setsVector;
+	std::vector<InternedString> setNames;
+	setsVector.reserve( sets->readable().size() );
+	setNames.reserve( sets->readable().size() );
+	for( const auto &[name, data] : sets->readable() )
+	{
+		const PathMatcherData *pathMatcherData = runTimeCast<const PathMatcherData>( data.get() );
+		if( !pathMatcherData )
+		{
+			throw IECore::Exception(
+				fmt::format(
+					"Set \"{}\" has type \"{}\" but should be \"PathMatcherData\".",
+					name.string(), data ? data->typeName() : "None"
+				)
+			);
+		}
+		setsVector.push_back( &pathMatcherData->readable() );
+		setNames.push_back( name );
+	}
+
+	// Invert each set in parallel, accumulating the indices of the
+	// sets containing each location in per-thread maps.
+
+	using IndexMap = std::unordered_map<ScenePlug::ScenePath, std::vector<size_t>, PathHash>;
+	tbb::enumerable_thread_specific<IndexMap> threadMaps;
+
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	parallel_for(
+
+		tbb::blocked_range<size_t>( 0, setsVector.size() ),
+
+		[&setsVector, &threadMaps]( const tbb::blocked_range<size_t> &r ) {
+
+			IndexMap &map = threadMaps.local();
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				for( PathMatcher::Iterator it = setsVector[i]->begin(), eIt = setsVector[i]->end(); it != eIt; ++it )
+				{
+					map[*it].push_back( i );
+				}
+			}
+
+		},
+
+		taskGroupContext // Prevents outer tasks silently cancelling our tasks
+
+	);
+
+	// Merge the per-thread maps, and store each distinct
+	// combination of sets once.
+
+	IndexMap merged;
+	for( auto &map : threadMaps )
+	{
+		if( merged.empty() )
+		{
+			merged.swap( map );
+			continue;
+		}
+		for( auto &[path, indices] : map )
+		{
+			auto &mergedIndices = merged[path];
+			mergedIndices.insert( mergedIndices.end(), indices.begin(), indices.end() );
+		}
+	}
+
+	std::map<std::vector<size_t>, size_t> combinations;
+	m_locations.reserve( merged.size() );
+	for( auto &[path, indices] : merged )
+	{
+		std::sort( indices.begin(), indices.end() );
+		auto [it, inserted] = combinations.insert( { indices, m_combinations.size() } );
+		if( inserted )
+		{
+			SetNames names;
+			names.reserve( indices.size() );
+			for( auto i : indices )
+			{
+				names.push_back( setNames[i] );
+			}
+			m_combinations.push_back( std::move( names ) );
+		}
+		m_locations[path] = it->second;
+	}
+}
+
+GafferScene::SceneAlgo::SetMemberships::~SetMemberships()
+{
+}
+
+const GafferScene::SceneAlgo::SetMemberships::SetNames &GafferScene::SceneAlgo::SetMemberships::setNames( const ScenePlug::ScenePath &path ) const
+{
+	auto it = m_locations.find( path );
+	if( it == m_locations.end() )
+	{
+		static const SetNames g_empty;
+		return g_empty;
+	}
+	return m_combinations[it->second];
+}
+
 //////////////////////////////////////////////////////////////////////////
 // History
 //////////////////////////////////////////////////////////////////////////
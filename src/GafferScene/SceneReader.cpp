@@ -50,6 +50,8 @@
 
 #include "fmt/format.h"
 
+#include <filesystem>
+
 using namespace std;
 using namespace boost::placeholders;
 using namespace Imath;
@@ -139,11 +141,15 @@ ValuePlug::CachePolicy cachePolicyFromEnv( const char *name )
 		{
 			return ValuePlug::CachePolicy::Default;
 		}
+		else if( !strcmp( cp, "Persistent" ) )
+		{
+			return ValuePlug::CachePolicy::Persistent;
+		}
 		else
 		{
 			IECore::msg(
 				IECore::Msg::Warning, "SceneReader",
-				fmt::format( "Invalid value \"{}\" for {}. Must be Standard, TaskCollaboration, TaskIsolation or Legacy.", cp, name )
+				fmt::format( "Invalid value \"{}\" for {}. Must be Standard, TaskCollaboration, TaskIsolation, Legacy or Persistent.", cp, name )
 			);
 		}
 	}
@@ -155,6 +161,29 @@ const ValuePlug::CachePolicy g_objectCachePolicy = cachePolicyFromEnv( "GAFFERSC
 const ValuePlug::CachePolicy g_setNamesCachePolicy = cachePolicyFromEnv( "GAFFERSCENE_SCENEREADER_SETNAMES_CACHEPOLICY" );
 const ValuePlug::CachePolicy g_setCachePolicy = cachePolicyFromEnv( "GAFFERSCENE_SCENEREADER_SET_CACHEPOLICY" );
 
+// Our hashes identify the file by name only, relying on `refreshCount` to
+// account for edits. That is sufficient for the in-memory cache, but not for
+// the persistent cache, which is shared with other processes that know nothing
+// of our `refreshCount`. So for persistent plugs we also hash the modification
+// time of the file.
+void hashFileModificationTime( const StringPlug *fileNamePlug, ValuePlug::CachePolicy cachePolicy, const Gaffer::Context *context, IECore::MurmurHash &h )
+{
+	if( cachePolicy != ValuePlug::CachePolicy::Persistent )
+	{
+		return;
+	}
+
+	ScenePlug::GlobalScope globalScope( context );
+	const std::string fileName = fileNamePlug->getValue();
+
+	std::error_code errorCode;
+	const std::filesystem::file_time_type modificationTime = std::filesystem::last_write_time( fileName, errorCode );
+	if( !errorCode )
+	{
+		h.append( (uint64_t)modificationTime.time_since_epoch().count() );
+	}
+}
+
 } // namespace
 
 SceneReader::SceneReader( const std::string &name )
@@ -471,6 +500,7 @@ void SceneReader::hashObject( const ScenePath &path, const Gaffer::Context *cont
 
 	h.append( refreshCount );
 	s->hash( SceneInterface::ObjectHash, timeAsDouble( context ), h );
+	hashFileModificationTime( fileNamePlug(), g_objectCachePolicy, context, h );
 }
 
 IECore::ConstObjectPtr SceneReader::computeObject( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
@@ -578,6 +608,7 @@ void SceneReader::hashSetNames( const Gaffer::Context *context, const ScenePlug
 	SceneNode::hashSetNames( context, parent, h );
 	fileNamePlug()->hash( h );
 	refreshCountPlug()->hash( h );
+	hashFileModificationTime( fileNamePlug(), g_setNamesCachePolicy, context, h );
 }
 
 IECore::ConstInternedStringVectorDataPtr SceneReader::computeSetNames( const Gaffer::Context *context, const ScenePlug *parent ) const
@@ -616,6 +647,7 @@ void SceneReader::hashSet( const IECore::InternedString &setName, const Gaffer::
 	// Technically speaking, we should also call `outPlug()->setNamesPlug()->hash( h )` here,
 	// but it doesn't append anything we haven't already appended.
 	h.append( setName );
+	hashFileModificationTime( fileNamePlug(), g_setCachePolicy, context, h );
 }
 
 static void loadSetWalk( const SceneInterface *s, const InternedString &setName, const Gaffer::Context *context, PathMatcher &set, const vector<InternedString> &path )
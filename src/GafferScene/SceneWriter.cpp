@@ -44,9 +44,20 @@
 
 #include "IECoreScene/SceneInterface.h"
 
-#include "tbb/mutex.h"
+#include "IECore/MessageHandler.h"
 
+#include "boost/noncopyable.hpp"
+
+#include "tbb/concurrent_queue.h"
+
+#include "fmt/format.h"
+
+#include <atomic>
+#include <exception>
 #include <filesystem>
+#include <functional>
+#include <memory>
+#include <thread>
 #include <unordered_map>
 
 using namespace std;
@@ -58,32 +69,178 @@ using namespace GafferScene;
 namespace
 {
 
+size_t queueDepthFromEnv()
+{
+	const char *d = getenv( "GAFFERSCENE_SCENEWRITER_QUEUEDEPTH" );
+	if( !d )
+	{
+		return 1000;
+	}
+
+	const int depth = atoi( d );
+	if( depth < 1 )
+	{
+		IECore::msg(
+			IECore::Msg::Warning, "SceneWriter",
+			fmt::format( "Invalid value \"{}\" for GAFFERSCENE_SCENEWRITER_QUEUEDEPTH. Must be a positive integer.", d )
+		);
+		return 1000;
+	}
+
+	return depth;
+}
+
+const size_t g_queueDepth = queueDepthFromEnv();
+
+// SceneInterface writing is not thread-safe, so all writing is performed
+// by a single dedicated thread, which executes tasks from a bounded queue.
+// This allows the compute threads to get on with the next locations (and
+// the next frame) without contending for a lock, while the queue bound
+// limits the memory used by payloads awaiting writing.
+class WriterThread : boost::noncopyable
+{
+
+	public :
+
+		using Task = std::function<void ()>;
+
+		WriterThread( size_t queueDepth )
+			:	m_failed( false )
+		{
+			m_queue.set_capacity( queueDepth );
+			m_thread = std::thread( [this] { run(); } );
+		}
+
+		~WriterThread()
+		{
+			if( m_thread.joinable() )
+			{
+				m_queue.push( Task() );
+				m_thread.join();
+			}
+		}
+
+		// Queues a task for execution on the writer thread, blocking if
+		// the queue is full. If a previous task has failed, rethrows its
+		// exception so that the compute threads stop promptly. The task
+		// is queued regardless, so that whatever it holds is always
+		// released on the writer thread.
+		void push( Task &&task )
+		{
+			m_queue.push( std::move( task ) );
+			if( m_failed )
+			{
+				std::rethrow_exception( m_exception );
+			}
+		}
+
+		// As above, but without rethrowing, for use in destructors.
+		// If a previous task has failed the task won't be executed,
+		// but it will still be destroyed on the writer thread.
+		void pushNoThrow( Task &&task )
+		{
+			m_queue.push( std::move( task ) );
+		}
+
+		// Waits for all tasks to complete, rethrowing any exception.
+		void finish()
+		{
+			m_queue.push( Task() );
+			m_thread.join();
+			if( m_failed )
+			{
+				std::rethrow_exception( m_exception );
+			}
+		}
+
+	private :
+
+		void run()
+		{
+			while( true )
+			{
+				Task task;
+				m_queue.pop( task );
+				if( !task )
+				{
+					return;
+				}
+
+				if( m_failed )
+				{
+					// Keep draining the queue so that producers
+					// don't block, but don't write any more.
+					continue;
+				}
+
+				try
+				{
+					task();
+				}
+				catch( ... )
+				{
+					m_exception = std::current_exception();
+					m_failed = true;
+				}
+			}
+		}
+
+		tbb::concurrent_bounded_queue<Task> m_queue;
+		std::thread m_thread;
+		std::exception_ptr m_exception;
+		std::atomic_bool m_failed;
+
+};
+
+// The SceneInterface for a location, which is only known once the writer
+// thread has created it. Only accessed on the writer thread, including
+// when the SceneInterface is released, because some implementations
+// perform writing at that point.
+struct OutputLocation
+{
+	SceneInterfacePtr output;
+};
+
+using OutputLocationPtr = std::shared_ptr<OutputLocation>;
+
 struct LocationWriter
 {
 
-	LocationWriter( SceneInterface *rootOutput, const CompoundData *sets, float time, tbb::mutex &mutex )
-		: m_parent( nullptr ), m_rootOutput( rootOutput ), m_sets( sets ), m_time( time ), m_mutex( mutex )
+	LocationWriter( const OutputLocationPtr &rootLocation, const SceneAlgo::SetMemberships *setMemberships, float time, WriterThread &writerThread )
+		:	m_parent( nullptr ), m_rootLocation( rootLocation ), m_setMemberships( setMemberships ), m_time( time ), m_writerThread( writerThread )
 	{
 	}
 
 	// Called by `parallelProcessLocations()` to create child functors for each location.
 	LocationWriter( const LocationWriter &parent )
-		: m_parent( &parent ), m_rootOutput( parent.m_rootOutput ), m_sets( parent.m_sets ), m_time( parent.m_time ), m_mutex( parent.m_mutex )
+		:	m_parent( &parent ), m_rootLocation( parent.m_rootLocation ), m_setMemberships( parent.m_setMemberships ), m_time( parent.m_time ), m_writerThread( parent.m_writerThread )
 	{
 	}
 
 	~LocationWriter()
 	{
-		// Some implementations of SceneInterface may perform writing when we release
-		// the SceneInterfaces, so we need to hold the lock while freeing them.
-		tbb::mutex::scoped_lock scopedLock( m_mutex );
-		m_childOutputs.clear();
+		// We are destroyed once our subtree has been visited, so the writes
+		// for our children are already queued, and we can queue the release
+		// of their SceneInterfaces after them.
+		if( m_childLocations.empty() )
+		{
+			return;
+		}
+
+		m_writerThread.pushNoThrow(
+			[childLocations = std::move( m_childLocations )] () {
+				for( const auto &[childName, childLocation] : childLocations )
+				{
+					childLocation->output = nullptr;
+				}
+			}
+		);
 	}
 
 	bool operator()( const ScenePlug *scene, const ScenePlug::ScenePath &scenePath )
 	{
-		// First read all the scene data for this location. We don't need the lock
-		// for this so we can read multiple locations in parallel.
+		// First read all the scene data for this location. This is done in
+		// parallel on the compute threads.
 
 		ConstCompoundObjectPtr attributes = scene->attributesPlug()->getValue();
 
@@ -110,64 +267,74 @@ struct LocationWriter
 		}
 
 		SceneInterface::NameList locationSets;
-		if( m_sets )
+		if( m_setMemberships )
 		{
-			const CompoundDataMap &setsMap = m_sets->readable();
-			locationSets.reserve( setsMap.size() );
-
-			for( const auto &[name, data] : setsMap )
-			{
-				auto pathMatcher = static_cast<const PathMatcherData *>( data.get() );
-				if( pathMatcher->readable().match( scenePath ) & IECore::PathMatcher::ExactMatch )
-				{
-					locationSets.push_back( name );
-				}
-			}
+			locationSets = m_setMemberships->setNames( scenePath );
 		}
 
 		ConstInternedStringVectorDataPtr childNames = scene->childNamesPlug()->getValue();
 
-		// Now write the scene data to the output SceneInterface. We require
-		// a lock for this as SceneInterface writing is not thread-safe.
-
-		tbb::mutex::scoped_lock scopedLock( m_mutex );
+		// Make placeholders for the child outputs, so that child functors
+		// can queue their own writes before ours has been performed.
 
-		SceneInterface *output = m_parent ? m_parent->m_childOutputs.at( scenePath.back() ).get() : m_rootOutput;
-
-		if( object->typeId() != IECore::NullObjectTypeId && scenePath.size() > 0 )
+		vector<pair<InternedString, OutputLocationPtr>> childLocations;
+		childLocations.reserve( childNames->readable().size() );
+		for( const auto &childName : childNames->readable() )
 		{
-			output->writeObject( object.get(), m_time );
+			childLocations.push_back( { childName, std::make_shared<OutputLocation>() } );
+			m_childLocations[childName] = childLocations.back().second;
 		}
 
-		output->writeBound( Imath::Box3d( Imath::V3f( bound.min ), Imath::V3f( bound.max ) ), m_time );
+		// Now queue the writing of the scene data to the output SceneInterface.
 
-		if( transformData )
-		{
-			output->writeTransform( transformData.get(), m_time );
-		}
+		m_writerThread.push(
+			[
+				location = m_parent ? m_parent->m_childLocations.at( scenePath.back() ) : m_rootLocation,
+				writeObject = object->typeId() != IECore::NullObjectTypeId && scenePath.size() > 0,
+				object, bound, transformData, attributes, globals,
+				locationSets = std::move( locationSets ),
+				childLocations = std::move( childLocations ),
+				time = m_time
+			] () {
 
-		for( CompoundObject::ObjectMap::const_iterator it = attributes->members().begin(), eIt = attributes->members().end(); it != eIt; it++ )
-		{
-			output->writeAttribute( it->first, it->second.get(), m_time );
-		}
+				SceneInterface *output = location->output.get();
 
-		if( globals && !globals->members().empty() )
-		{
-			output->writeAttribute( "gaffer:globals", globals.get(), m_time );
-		}
+				if( writeObject )
+				{
+					output->writeObject( object.get(), time );
+				}
 
-		if( !locationSets.empty() )
-		{
-			output->writeTags( locationSets );
-		}
+				output->writeBound( Imath::Box3d( Imath::V3f( bound.min ), Imath::V3f( bound.max ) ), time );
 
-		for( const auto &childName : childNames->readable() )
-		{
-			// `SceneAlgo::parallelProcessLocations()` may visit children in any
-			// order. Pre-create SceneInterface children here so that they are
-			// created in the correct order.
-			m_childOutputs[childName] = output->child( childName, SceneInterface::CreateIfMissing );
-		}
+				if( transformData )
+				{
+					output->writeTransform( transformData.get(), time );
+				}
+
+				for( CompoundObject::ObjectMap::const_iterator it = attributes->members().begin(), eIt = attributes->members().end(); it != eIt; it++ )
+				{
+					output->writeAttribute( it->first, it->second.get(), time );
+				}
+
+				if( globals && !globals->members().empty() )
+				{
+					output->writeAttribute( "gaffer:globals", globals.get(), time );
+				}
+
+				if( !locationSets.empty() )
+				{
+					output->writeTags( locationSets );
+				}
+
+				for( const auto &[childName, childLocation] : childLocations )
+				{
+					// `SceneAlgo::parallelProcessLocations()` may visit children in any
+					// order. Pre-create SceneInterface children here so that they are
+					// created in the correct order.
+					childLocation->output = output->child( childName, SceneInterface::CreateIfMissing );
+				}
+			}
+		);
 
 		return true;
 	}
@@ -175,11 +342,11 @@ struct LocationWriter
 	private :
 
 		const LocationWriter *m_parent;
-		SceneInterface *m_rootOutput;
-		unordered_map<IECore::InternedString, SceneInterfacePtr> m_childOutputs;
-		const CompoundData *m_sets;
+		OutputLocationPtr m_rootLocation;
+		unordered_map<IECore::InternedString, OutputLocationPtr> m_childLocations;
+		const SceneAlgo::SetMemberships *m_setMemberships;
 		float m_time;
-		tbb::mutex &m_mutex;
+		WriterThread &m_writerThread;
 
 };
 
@@ -243,9 +410,16 @@ IECore::MurmurHash SceneWriter::hash( const Gaffer::Context *context ) const
 
 	IECore::MurmurHash h = TaskNode::hash( context );
 	h.append( fileNamePlug()->hash() );
-	/// \todo hash the actual scene when we have a hierarchyHash
-	h.append( (uint64_t)scenePlug );
-	h.append( context->hash() );
+	h.append( SceneAlgo::hierarchyHash( scenePlug ) );
+	h.append( scenePlug->setNamesHash() );
+	ConstInternedStringVectorDataPtr setNamesData = scenePlug->setNamesPlug()->getValue();
+	for( const auto &setName : setNamesData->readable() )
+	{
+		h.append( scenePlug->setHash( setName ) );
+	}
+	// The time is written into the file alongside the scene,
+	// so must be accounted for separately.
+	h.append( context->getTime() );
 
 	return h;
 }
@@ -264,8 +438,14 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 		throw IECore::Exception( "No input scene" );
 	}
 
+	// Declared before the writer thread, so that it is destroyed after it,
+	// and is therefore never released while writing is still in progress.
 	SceneInterfacePtr output;
-	tbb::mutex mutex;
+	std::string outputFileName;
+	bool useSetsAPI = true;
+
+	WriterThread writerThread( g_queueDepth );
+
 	ContextPtr context = new Context( *Context::current() );
 	Context::Scope scopedContext( context.get() );
 
@@ -274,27 +454,52 @@ void SceneWriter::executeSequence( const std::vector<float> &frames ) const
 		context->setFrame( *it );
 
 		ConstCompoundDataPtr sets;
-		bool useSetsAPI = true;
 		const std::string fileName = fileNamePlug()->getValue();
-		if( !output || output->fileName() != fileName )
+		if( !output || outputFileName != fileName )
 		{
+			if( output )
+			{
+				// Hand our reference to the previous file to the writer thread,
+				// so that it is closed only once all its writes are complete.
+				writerThread.push( [previousOutput = std::move( output )] () {} );
+			}
 			createDirectories( fileName );
 			output = SceneInterface::create( fileName, IndexedIO::Write );
+			outputFileName = fileName;
 			sets = SceneAlgo::sets( scene );
 			useSetsAPI = SceneReader::useSetsAPI( output.get() );
 		}
 
-		LocationWriter locationWriter( output.get(), !useSetsAPI ? sets.get() : nullptr, context->getTime(), mutex );
+		// Locations for this frame are computed while the writer thread is
+		// still writing the locations for previous frames.
+
+		auto rootLocation = std::make_shared<OutputLocation>();
+		rootLocation->output = output;
+
+		// When writing tags we need to know the sets containing each
+		// location, so invert the sets up front to avoid matching every
+		// location against every set.
+		SceneAlgo::ConstSetMembershipsPtr setMemberships = !useSetsAPI && sets ? new SceneAlgo::SetMemberships( sets.get() ) : nullptr;
+
+		LocationWriter locationWriter( rootLocation, setMemberships.get(), context->getTime(), writerThread );
 		SceneAlgo::parallelProcessLocations( scene, locationWriter );
 
-		if( useSetsAPI && sets )
-		{
-			for( const auto &[name, data] : sets->readable() )
-			{
-				output->writeSet( name, static_cast<const PathMatcherData *>( data.get() )->readable() );
+		writerThread.push(
+			[output, rootLocation, sets = useSetsAPI ? sets : ConstCompoundDataPtr()] () {
+				rootLocation->output = nullptr;
+				if( sets )
+				{
+					for( const auto &[name, data] : sets->readable() )
+					{
+						output->writeSet( name, static_cast<const PathMatcherData *>( data.get() )->readable() );
+					}
+				}
 			}
-		}
+		);
 	}
+
+	writerThread.push( [finalOutput = std::move( output )] () {} );
+	writerThread.finish();
 }
 
 bool SceneWriter::requiresSequenceExecution() const
@@ -366,8 +366,14 @@ IECore::ConstPathMatcherDataPtr Set::computeSet( const IECore::InternedString &s
 			ConstPathMatcherDataPtr inputSet = inPlug()->setPlug()->getValue();
 			if( !inputSet->readable().isEmpty() )
 			{
+				// Copying is cheap because PathMatcher shares its internal
+				// nodes until they are modified. If nothing is added, we
+				// return the input set itself rather than a separate copy.
 				PathMatcherDataPtr result = inputSet->copy();
-				result->writable().addPaths( pathMatcher->readable() );
+				if( !result->writable().addPaths( pathMatcher->readable() ) )
+				{
+					return inputSet;
+				}
 				return result;
 			}
 			// Input set empty - fall through to create mode.
@@ -384,7 +390,10 @@ IECore::ConstPathMatcherDataPtr Set::computeSet( const IECore::InternedString &s
 				return inputSet;
 			}
 			PathMatcherDataPtr result = inputSet->copy();
-			result->writable().removePaths( pathMatcher->readable() );
+			if( !result->writable().removePaths( pathMatcher->readable() ) )
+			{
+				return inputSet;
+			}
 			return result;
 		}
 	}
@@ -123,6 +123,15 @@ std::shared_ptr<Gaffer::BackgroundTask> updateInBackground( RenderController &r,
 	}
 }
 
+std::shared_ptr<Gaffer::BackgroundTask> updateStreaming( RenderController &r, object &pythonCallback, size_t maxPriorityLocations )
+{
+	RenderController::ProgressCallback callback = progressCallbackFromPython( pythonCallback );
+	{
+		IECorePython::ScopedGILRelease gilRelease;
+		return r.updateStreaming( callback, maxPriorityLocations );
+	}
+}
+
 void updateMatchingPaths( RenderController &r, const IECore::PathMatcher &pathsToUpdate, object &pythonCallback )
 {
 	RenderController::ProgressCallback callback = progressCallbackFromPython( pythonCallback );
@@ -167,6 +176,7 @@ void GafferSceneModule::bindRenderController()
 		.def( "update", &update, ( arg( "callback" ) = object() ) )
 		.def( "updateMatchingPaths", &updateMatchingPaths, ( arg( "pathsToUpdate" ), arg( "callback" ) = object() ) )
 		.def( "updateInBackground", &updateInBackground, ( arg( "callback" ) = object(), arg( "priorityPaths" ) = IECore::PathMatcher() ) )
+		.def( "updateStreaming", &updateStreaming, ( arg( "callback" ) = object(), arg( "maxPriorityLocations" ) = 10000 ) )
 		.def( "pathForID", &pathForID )
 		.def( "pathsForIDs", &RenderController::pathsForIDs )
 		.def( "idForPath", &RenderController::idForPath, ( arg( "path" ), arg( "createIfNecessary" ) = false ) )
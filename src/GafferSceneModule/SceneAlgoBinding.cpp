@@ -149,6 +149,12 @@ IECore::PathMatcher findAllWithAttributeWrapper( const ScenePlug &scene, Interne
 	return SceneAlgo::findAllWithAttribute( &scene, name, value, root );
 }
 
+IECore::MurmurHash hierarchyHashWrapper( const ScenePlug &scene, const ScenePlug::ScenePath &root )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return SceneAlgo::hierarchyHash( &scene, root );
+}
+
 Imath::V2f shutterWrapper( const IECore::CompoundObject &globals, const ScenePlug &scene )
 {
 	IECorePython::ScopedGILRelease r;
@@ -178,6 +184,22 @@ IECore::CompoundDataPtr setsWrapper2( const ScenePlug &scene, object pythonSetNa
 	return copy ? result->copy() : boost::const_pointer_cast<IECore::CompoundData>( result );
 }
 
+SceneAlgo::SetMembershipsPtr setMembershipsConstructor( const IECore::CompoundData &sets )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return new SceneAlgo::SetMemberships( &sets );
+}
+
+list setMembershipsSetNames( const SceneAlgo::SetMemberships &setMemberships, const ScenePlug::ScenePath &path )
+{
+	list result;
+	for( const auto &name : setMemberships.setNames( path ) )
+	{
+		result.append( name.string() );
+	}
+	return result;
+}
+
 ScenePlugPtr historyGetScene( SceneAlgo::History &h )
 {
 	return h.scene;
@@ -386,6 +408,8 @@ void bindSceneAlgo()
 	def( "findAll", &findAllWrapper, ( arg( "scene" ), arg( "predicate" ), arg( "root" ) = "/" ) );
 	def( "findAllWithAttribute", &findAllWithAttributeWrapper, ( arg( "scene" ), arg( "name" ), arg( "value" ) = object(), arg( "root" ) = "/" ) );
 
+	def( "hierarchyHash", &hierarchyHashWrapper, ( arg( "scene" ), arg( "root" ) = "/" ) );
+
 	def( "shutter", &shutterWrapper );
 	def( "setExists", &setExistsWrapper );
 	def(
@@ -399,6 +423,11 @@ void bindSceneAlgo()
 		( arg( "scene" ), arg( "setNames" ), arg( "_copy" ) = true )
 	);
 
+	IECorePython::RefCountedClass<SceneAlgo::SetMemberships, IECore::RefCounted>( "SetMemberships" )
+		.def( "__init__", make_constructor( setMembershipsConstructor, default_call_policies(), ( arg( "sets" ) ) ) )
+		.def( "setNames", &setMembershipsSetNames )
+	;
+
 	// History
 
 	{
@@ -0,0 +1,108 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2026, Cinesite VFX Ltd. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferSceneTest/SceneAlgoTest.h"
+
+#include "GafferScene/SceneAlgo.h"
+
+#include "IECore/Exception.h"
+
+using namespace std;
+using namespace IECore;
+using namespace GafferScene;
+
+namespace
+{
+
+struct LocationPathsFunctor
+{
+
+	using Result = vector<string>;
+
+	LocationPathsFunctor( const PathMatcher &prunePaths, size_t depth )
+		:	m_prunePaths( prunePaths ), m_depth( depth ), m_used( false )
+	{
+	}
+
+	LocationPathsFunctor( const LocationPathsFunctor &parent )
+		:	m_prunePaths( parent.m_prunePaths ), m_depth( parent.m_depth + 1 ), m_used( false )
+	{
+	}
+
+	bool operator()( const ScenePlug *scene, const ScenePlug::ScenePath &path )
+	{
+		if( m_used )
+		{
+			throw IECore::Exception( "Functor used for more than one location" );
+		}
+		if( path.size() != m_depth )
+		{
+			throw IECore::Exception( "Functor not copied from parent location" );
+		}
+		m_used = true;
+		return !( m_prunePaths.match( path ) & PathMatcher::ExactMatch );
+	}
+
+	Result gatherChildren( const ScenePlug::ScenePath &path, vector<Result> &childResults )
+	{
+		if( path.size() != m_depth || !m_used )
+		{
+			throw IECore::Exception( "Unexpected functor for gatherChildren()" );
+		}
+
+		Result result = { ScenePlug::pathToString( path ) };
+		for( auto &childResult : childResults )
+		{
+			result.insert( result.end(), childResult.begin(), childResult.end() );
+		}
+		return result;
+	}
+
+	private :
+
+		const PathMatcher &m_prunePaths;
+		const size_t m_depth;
+		bool m_used;
+
+};
+
+} // namespace
+
+IECore::StringVectorDataPtr GafferSceneTest::parallelReduceLocationPaths( const GafferScene::ScenePlug *scene, const IECore::PathMatcher &prunePaths, const GafferScene::ScenePlug::ScenePath &root )
+{
+	LocationPathsFunctor f( prunePaths, root.size() );
+	return new StringVectorData( SceneAlgo::parallelReduceLocations( scene, f, root ) );
+}
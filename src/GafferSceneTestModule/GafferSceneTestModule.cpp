@@ -39,6 +39,7 @@
 
 #include "GafferSceneTest/ContextSanitiser.h"
 #include "GafferSceneTest/CompoundObjectSource.h"
+#include "GafferSceneTest/SceneAlgoTest.h"
 #include "GafferSceneTest/ScenePlugTest.h"
 #include "GafferSceneTest/TestLight.h"
 #include "GafferSceneTest/TestLightFilter.h"
@@ -58,6 +59,12 @@ static void traverseSceneWrapper( const GafferScene::ScenePlug *scenePlug )
 	traverseScene( scenePlug );
 }
 
+static IECore::StringVectorDataPtr parallelReduceLocationPathsWrapper( const GafferScene::ScenePlug *scenePlug, const IECore::PathMatcher &prunePaths, const GafferScene::ScenePlug::ScenePath &root )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return parallelReduceLocationPaths( scenePlug, prunePaths, root );
+}
+
 BOOST_PYTHON_MODULE( _GafferSceneTest )
 {
 
@@ -78,5 +85,9 @@ BOOST_PYTHON_MODULE( _GafferSceneTest )
 	def( "connectTraverseSceneToPreDispatchSignal", &connectTraverseSceneToPreDispatchSignal );
 
 	def( "testManyStringToPathCalls", &testManyStringToPathCalls );
+	def(
+		"parallelReduceLocationPaths", &parallelReduceLocationPathsWrapper,
+		( arg( "scene" ), arg( "prunePaths" ) = IECore::PathMatcher(), arg( "root" ) = "/" )
+	);
 
 }
@@ -800,6 +800,133 @@ void testLRUCacheSetIfUncached( const std::string &policy )
 	DispatchTest<TestLRUCacheSetIfUncached>()( policy );
 }
 
+template<template<typename> class Policy>
+struct TestLRUCacheCostAwareEviction
+{
+
+	void operator()()
+	{
+		using Cache = IECorePreview::LRUCache<int, int, Policy>;
+
+		for( auto evictionPolicy : { Cache::EvictionPolicy::LeastRecentlyUsed, Cache::EvictionPolicy::CostAware } )
+		{
+			Cache cache(
+				[]( int key, size_t &cost, const IECore::Canceller *canceller ) {
+					cost = 1000;
+					return key;
+				},
+				10000
+			);
+			cache.setEvictionPolicy( evictionPolicy );
+			GAFFERTEST_ASSERT( cache.getEvictionPolicy() == evictionPolicy );
+
+			// Add an item that was expensive to compute, followed
+			// by a stream of cheap items that overflow the cache.
+
+			cache.set( 0, 0, 1000, std::chrono::milliseconds( 10 ) );
+			for( int i = 1; i < 30; ++i )
+			{
+				GAFFERTEST_ASSERTEQUAL( cache.get( i ), i );
+			}
+
+			// The LRU policy should have evicted the expensive item,
+			// but the cost-aware policy should have retained it.
+
+			GAFFERTEST_ASSERTEQUAL( cache.cached( 0 ), evictionPolicy == Cache::EvictionPolicy::CostAware );
+			GAFFERTEST_ASSERT( cache.currentCost() <= 10000 );
+
+			// But clearing should remove everything, regardless of cost.
+
+			cache.set( 0, 0, 1000, std::chrono::milliseconds( 10 ) );
+			cache.clear();
+			GAFFERTEST_ASSERT( !cache.cached( 0 ) );
+			GAFFERTEST_ASSERT( cache.currentCost() == 0 );
+		}
+	}
+
+};
+
+void testLRUCacheCostAwareEviction( const std::string &policy )
+{
+	DispatchTest<TestLRUCacheCostAwareEviction>()( policy );
+}
+
+template<template<typename> class Policy>
+struct TestLRUCacheStatistics
+{
+
+	void operator()()
+	{
+		using Cache = IECorePreview::LRUCache<int, int, Policy>;
+
+		Cache cache(
+			[]( int key, size_t &cost, const IECore::Canceller *canceller ) {
+				cost = 1;
+				return key;
+			},
+			10
+		);
+
+		auto statistics = cache.statistics();
+		GAFFERTEST_ASSERTEQUAL( statistics.hits, 0 );
+		GAFFERTEST_ASSERTEQUAL( statistics.misses, 0 );
+		GAFFERTEST_ASSERTEQUAL( statistics.evictions, 0 );
+
+		for( int i = 0; i < 10; ++i )
+		{
+			cache.get( i );
+		}
+		for( int i = 0; i < 10; ++i )
+		{
+			cache.get( i );
+			cache.getIfCached( i );
+		}
+		GAFFERTEST_ASSERT( !cache.getIfCached( 10 ) );
+
+		statistics = cache.statistics();
+		GAFFERTEST_ASSERTEQUAL( statistics.hits, 20 );
+		GAFFERTEST_ASSERTEQUAL( statistics.misses, 11 );
+		GAFFERTEST_ASSERTEQUAL( statistics.evictions, 0 );
+
+		// Lookups may opt out of being recorded.
+
+		GAFFERTEST_ASSERT( !cache.getIfCached( 10, /* recordStatistics = */ false ) );
+		GAFFERTEST_ASSERTEQUAL( *cache.getIfCached( 0, /* recordStatistics = */ false ), 0 );
+
+		statistics = cache.statistics();
+		GAFFERTEST_ASSERTEQUAL( statistics.hits, 20 );
+		GAFFERTEST_ASSERTEQUAL( statistics.misses, 11 );
+
+		for( int i = 10; i < 15; ++i )
+		{
+			cache.get( i );
+		}
+
+		statistics = cache.statistics();
+		GAFFERTEST_ASSERTEQUAL( statistics.misses, 16 );
+		GAFFERTEST_ASSERTEQUAL( statistics.evictions, 5 );
+
+		// Clearing isn't considered to be eviction.
+
+		cache.clear();
+		GAFFERTEST_ASSERTEQUAL( cache.statistics().evictions, 5 );
+
+		// Changing policy resets the statistics.
+
+		cache.setEvictionPolicy( Cache::EvictionPolicy::CostAware );
+		statistics = cache.statistics();
+		GAFFERTEST_ASSERTEQUAL( statistics.hits, 0 );
+		GAFFERTEST_ASSERTEQUAL( statistics.misses, 0 );
+		GAFFERTEST_ASSERTEQUAL( statistics.evictions, 0 );
+	}
+
+};
+
+void testLRUCacheStatistics( const std::string &policy )
+{
+	DispatchTest<TestLRUCacheStatistics>()( policy );
+}
+
 } // namespace
 
 void GafferTestModule::bindLRUCacheTest()
@@ -815,4 +942,6 @@ void GafferTestModule::bindLRUCacheTest()
 	def( "testLRUCacheUncacheableItem", &testLRUCacheUncacheableItem );
 	def( "testLRUCacheGetIfCached", &testLRUCacheGetIfCached );
 	def( "testLRUCacheSetIfUncached", &testLRUCacheSetIfUncached );
+	def( "testLRUCacheCostAwareEviction", &testLRUCacheCostAwareEviction );
+	def( "testLRUCacheStatistics", &testLRUCacheStatistics );
 }
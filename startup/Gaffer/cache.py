@@ -34,8 +34,12 @@
 #
 ##########################################################################
 
+import os
+
 import psutil
 
+import IECore
+
 import Gaffer
 
 # Set cache memory limit to 8 gigs, capped at 3/4 of the total
@@ -44,3 +48,31 @@ import Gaffer
 Gaffer.ValuePlug.setCacheMemoryLimit(
 	min( 1024**3 * 8, psutil.virtual_memory().total * 3 // 4 )
 )
+
+# Enable the persistent cache if a directory has been provided for it.
+
+if "GAFFER_PERSISTENT_CACHE_DIRECTORY" in os.environ :
+	if "GAFFER_PERSISTENT_CACHE_SIZE_LIMIT" in os.environ :
+		Gaffer.ValuePlug.setPersistentCacheSizeLimit(
+			1024**2 * int( os.environ["GAFFER_PERSISTENT_CACHE_SIZE_LIMIT"] )
+		)
+	Gaffer.ValuePlug.setPersistentCacheDirectory( os.environ["GAFFER_PERSISTENT_CACHE_DIRECTORY"] )
+
+# Optionally choose a different eviction policy for the compute cache.
+
+if "GAFFER_CACHE_EVICTION_POLICY" in os.environ :
+	policyName = os.environ["GAFFER_CACHE_EVICTION_POLICY"]
+	policy = Gaffer.ValuePlug.CacheEvictionPolicy.names.get( policyName )
+	if policy is None :
+		IECore.msg(
+			IECore.Msg.Level.Warning, "GAFFER_CACHE_EVICTION_POLICY",
+			"Unknown policy \"{}\". Using \"LeastRecentlyUsed\" instead.".format( policyName )
+		)
+		policy = Gaffer.ValuePlug.CacheEvictionPolicy.LeastRecentlyUsed
+	Gaffer.ValuePlug.setCacheEvictionPolicy( policy )
+
+# Optionally adjust the cache limits automatically in response to
+# memory pressure.
+
+if os.environ.get( "GAFFER_ADAPTIVE_CACHE_LIMITS", "0" ) != "0" :
+	Gaffer.AdaptiveCacheLimits().start()
@@ -35,6 +35,7 @@
 ##########################################################################
 
 import functools
+import os
 
 import IECore
 
@@ -54,7 +55,11 @@ def __performanceMonitor( menu, createIfMissing = False ) :
 		return monitor
 
 	if createIfMissing :
-		monitor = Gaffer.PerformanceMonitor()
+		# Recording a timeline allows `annotate()` to highlight the nodes
+		# on the critical path, but it uses memory for every process, so
+		# is opt-in, and limited in size.
+		recordTimeline = os.environ.get( "GAFFER_PERFORMANCE_MONITOR_TIMELINE", "0" ) not in ( "", "0" )
+		monitor = Gaffer.PerformanceMonitor( recordTimeline = recordTimeline, maxTimelineEvents = 1000000 )
 		monitor.__running = False
 		script.__performanceMonitor = monitor
 		return monitor